@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+"""
+Measure the speed of the abbreviation checkers on a fixture of (link text,
+article title) pairs and check that they agree with `check_abbr_reference` on
+the fixture and on a set of random pairs. Reports the throughput in pairs per
+second.
+
+The compiled checker from the _abbrev extension is included if it is built
+(e.g. with `python setup.py build_ext --inplace`).
+
+Run from the repository root:
+
+    python benchmarks/check_abbr.py [-r REPEAT] [-n RANDOM] [FIXTURE]
+
+"""
+
+from __future__ import unicode_literals
+import os
+import sys
+import time
+import codecs
+import random
+import argparse
+
+bench_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(bench_dir, '..', 'wikibrev'))
+import abbrev_processor
+from abbrev_processor import check_abbr, py_check_abbr, check_abbr_reference
+
+checkers = [('reference', check_abbr_reference), ('python', py_check_abbr)]
+if check_abbr is not py_check_abbr:
+    import _abbrev
+    checkers.append(('compiled', check_abbr))
+
+# characters that the tokenizer treats in special ways
+special_chars = list(' \t\n-._()0129,\'') + ['\xa0', '\x1c', '\x85', '\u3000', '\u2013', '\xe9',
+                                               '\xdf', '\u0394', '\u0130', '\u0663', '\xb2', '\u2167']
+
+
+def read_pairs(path):
+    with codecs.open(path, 'r', 'utf-8') as f:
+        return [tuple(line.rstrip('\n').split('\t')) for line in f]
+
+def random_pairs(pairs, n, rnd):
+    """
+    Generate `n` pairs by mixing the words of the fixture with special
+    characters and abbreviating some of the results.
+    """
+    words = sorted(set(w for pair in pairs for txt in pair for w in txt.split()))
+    def random_text():
+        if rnd.random() < 0.3:
+            return ''.join(rnd.choice(special_chars + words[:20]) for i in range(rnd.randrange(8)))
+        return rnd.choice(['', ' ', '-', '_', '\xa0']).join(rnd.choice(words) for i in range(rnd.randrange(1, 5)))
+    result = []
+    for i in range(n):
+        exp = random_text()
+        if rnd.random() < 0.5:
+            abbr = ''.join(w[:rnd.randrange(1, 3)] for w in exp.split()) + rnd.choice(['', 's', '.', ' (x)'])
+        else:
+            abbr = random_text()
+        result.append((abbr, exp) if rnd.random() < 0.5 else (exp, abbr))
+    return result
+
+def clear_memos():
+    abbrev_processor.normalized_memo.clear()
+    if len(checkers) > 2:
+        _abbrev.normalized_memo.clear()
+
+def measure(func, pairs, repeat):
+    """
+    Run `func` on all pairs `repeat` times and return the number of pairs per
+    second. The memos of normalized strings are cleared before every pass so
+    that only repetitions within the fixture can hit them.
+    """
+    elapsed = 0
+    for i in range(repeat):
+        clear_memos()
+        t = time.time()
+        for (a, b) in pairs:
+            func(a, b)
+        elapsed += time.time() - t
+    return len(pairs) * repeat / elapsed
+
+
+if __name__ == '__main__':
+    argparser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    argparser.add_argument('fixture', nargs='?', default=os.path.join(bench_dir, 'fixtures', 'abbr_pairs.tsv'),
+                           help='a TSV file of pairs (default: fixtures/abbr_pairs.tsv)')
+    argparser.add_argument('-r', '--repeat', type=int, default=200, help='the number of passes over the fixture (default: 200)')
+    argparser.add_argument('-n', '--random', type=int, default=200000, help='the number of random pairs to check (default: 200000)')
+    args = argparser.parse_args()
+
+    pairs = read_pairs(args.fixture)
+    accepted = 0
+    for (a, b) in pairs + random_pairs(pairs, args.random, random.Random(0)):
+        expected = check_abbr_reference(a, b)
+        for (name, func) in checkers[1:]:
+            if func(a, b) != expected:
+                print >>sys.stderr, 'FAIL: %s checker differs for' % name, repr(a), repr(b)
+                sys.exit(1)
+        accepted += expected
+
+    print 'pairs:', len(pairs), 'fixture +', args.random, 'random (%d accepted)' % accepted
+    for (name, func) in checkers:
+        print '%s:' % name, measure(func, pairs, args.repeat), 'pairs per second'
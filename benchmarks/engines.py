@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+"""
+Check that all the link extraction engines extract the same links as
+`WikiHTMLParser`. The engines are run on the pages of a synthetic corpus (see
+`_pyzim`) and on mutated copies of them with unclosed tags, script and style
+content, truncated constructs and nested forbidden regions; the first page
+where an engine differs from `WikiHTMLParser` is reported.
+
+The compiled engine is included if the _linkscan extension is built (e.g.
+with `python setup.py build_ext --inplace`).
+
+Run from the repository root:
+
+    python benchmarks/engines.py [-n PAGES] [-m MUTANTS] [-s SEED]
+
+"""
+
+from __future__ import unicode_literals
+import os
+import sys
+import random
+import argparse
+
+bench_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(bench_dir, '..', 'wikibrev'))
+from link_extractor import engines
+from _pyzim import File
+from parser_reuse import make_page
+
+# snippets inserted into the pages, by kind
+snippets = {
+    'unclosed': [
+        '<span><b>unclosed ', '<div class="box">', '<i>', '</div>', '</span></b>', '</a>', '</p>',
+        '<a href="Open_Link">OL', '<li><ul><li>', '<table><tr><td>', '</td></tr>', '<a>', '<a name="x">',
+    ],
+    'cdata': [
+        '<script>var s = "<a href=\'Script_Link\'>SL</a>"; if (a < b && c) {}</script>',
+        '<style>a > b { color: red } p:before { content: "</p>" }</style>',
+        '<script></p><a href="In_Script">IS</a></div></script>',
+        '<SCRIPT type="text/javascript">x = "</a>";</SCRIPT >',
+        '<script>document.write("</scr" + "ipt>")</script >',
+        '<style><!-- a { } --></style>',
+        '<script>',
+        '<style>',
+    ],
+    'truncated': [
+        '<a href="Cut', '<a href="X">', '<!-- comment', '&amp', '&#12', '&#x', '&', '<', '</', '</a', '<a',
+        '<!DOCTYPE', '<?pi', '<a href=\'Q\' class=', '<b class="c"/', '</script', '<![CDATA[ x',
+    ],
+    'forbidden': [
+        '<div class="hatnote"><div id="cite_note-1"><a href="Nested_Note">NN</a></div>'
+        '<a href="After_Inner">AI</a></div><a href="After_Outer">AO</a>',
+        '<sup class="reference"><span class="hatnote"><a href="Deep_Ref">DR</a></span>'
+        '<a href="Still_Ref">SR</a></sup><a href="Out_Ref">OR</a>',
+        '<div id="coordinates"><div><a href="Coord_Link">CL</a></div>',
+        '<head><a href="Head_Link">HL</a></head><a href="Body_Link">BL</a>',
+        '<span class="reference"><b><i><a href="Unclosed_Ref">UR</a></span><a href="Past_Ref">PR</a>',
+        '<div class="reference hatnote"></div class="reference"><a href="Past_Closed">PC</a>',
+        '<script><div class="hatnote"></script><a href="After_Script">AS</a>',
+    ],
+    'markup': [
+        '<a href=\'Single_Quoted\'>SQ</a>', '<a href=Unquoted_Url>UU</a>', '<A HREF="Upper_Case">UC</A>',
+        '<a href="Amp_&amp;_Url">A&amp;U</a>', '<a href="Empty_Link"/>', '<br/>', '<br>', '<hr />',
+        '<a href="Sp_Ace" >S A</a >', '<a\nhref="New_Line"\n>NL</a>', '<a href="#Fragment">Fr</a>',
+        '<a class="external text" href="External_Link">EL</a>', '<!DOCTYPE html>', '<!-- <a href="C">C</a> -->',
+        '<?php echo 1 ?>', '<![CDATA[ <a href="Cd">CD</a> ]]>', '</ >', '</3>', '</>', '< a>', '<3',
+        '<a href="Ent&eacute;">&Eacute;nt&#233;&#xE9; ref</a>', '<a href="K&amp;R_Book">K&R</a>',
+        '<a href="Non_Ascii_\u010c\u0161">N\xe1 \u0416</a>', '<a href="X" href="Twice_Href">TH</a>',
+        '<a href="Broken"attr="x">BA</a>', '<a href="Text_Tags">T<b>e</b>x<i>t</i> Tags</a>',
+        '<p id="cite_x">', '<a href="Lt_Text">a < b</a>', '<a href="Gt">b > a</a>',
+    ],
+}
+
+
+def synthetic_pages(n, seed):
+    """
+    Return the pages of the first `n` articles of a synthetic corpus that are
+    not redirects.
+    """
+    corpus = File('synthetic:articles=%d,seed=%d' % (n, seed))
+    return [corpus.blob_data(a.cluster_id, a.blob_id) for a in corpus.articles() if a.redirect_index is None]
+
+def mutate(page, rnd):
+    """
+    Insert random snippets into a page and truncate some of the results.
+    """
+    for i in range(rnd.randrange(1, 6)):
+        snippet = rnd.choice(snippets[rnd.choice(sorted(snippets))])
+        pos = rnd.randrange(len(page) + 1)
+        if rnd.random() < 0.2: # also inside tags and entities
+            page = page[:pos] + snippet + page[pos:]
+        else:
+            pos = page.find('<', pos)
+            if pos < 0:
+                pos = len(page)
+            page = page[:pos] + snippet + page[pos:]
+    x = rnd.random()
+    if x < 0.2:
+        page = page[:rnd.randrange(len(page) + 1)]
+    elif x < 0.4:
+        page = page + rnd.choice(snippets['truncated'])
+    return page
+
+
+if __name__ == '__main__':
+    argparser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    argparser.add_argument('-n', '--pages', type=int, default=1000, help='the number of articles of the synthetic corpus (default: 1000)')
+    argparser.add_argument('-m', '--mutants', type=int, default=20, help='the number of mutated copies of each page (default: 20)')
+    argparser.add_argument('-s', '--seed', type=int, default=0, help='the seed of the corpus and of the mutations (default: 0)')
+    args = argparser.parse_args()
+
+    rnd = random.Random(args.seed)
+    pages = synthetic_pages(args.pages, args.seed) + [make_page(rnd) for i in range(args.pages // 10)]
+    pages += [mutate(page, rnd) for i in range(args.mutants) for page in pages]
+    pages += [''.join(rnd.choice(snippets[kind]) for kind in sorted(snippets) for j in range(3)) for i in range(1000)]
+
+    names = ['htmlparser'] + sorted(name for name in engines if name != 'htmlparser')
+    parsers = [engines[name]() for name in names] # reused for all pages, like in the workers
+    n_links = 0
+    n_errors = 0
+    for (index, page) in enumerate(pages):
+        data = page.encode('utf-8')
+        results = []
+        for (i, name) in enumerate(names):
+            try:
+                results.append(parsers[i].parse_page(index, data)['links'])
+            except Exception as e:
+                # the page would stop the extraction; all the engines must fail
+                # in the same way, and a failed parser is not reused
+                results.append(repr(e))
+                parsers[i] = engines[name]()
+        for (name, result) in zip(names[1:], results[1:]):
+            if result != results[0]:
+                print >>sys.stderr, 'FAIL: %s differs from htmlparser on page %d' % (name, index)
+                print >>sys.stderr, 'page:', repr(page)
+                print >>sys.stderr, 'htmlparser:', results[0]
+                print >>sys.stderr, '%s:' % name, result
+                sys.exit(1)
+        if isinstance(results[0], list):
+            n_links += len(results[0])
+        else:
+            n_errors += 1
+
+    print 'engines:', ', '.join(names)
+    print 'pages:', len(pages)
+    print 'links:', n_links
+    print 'pages with parse errors:', n_errors
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Measure the throughput of gzip compression and decompression of a large file
+with the line-based copies used before and with `compress_file` and
+`decompress_file` from autozip, and check that all of them produce the same
+data. Reports the throughput in MiB per second of uncompressed data.
+
+Run from the repository root:
+
+    python benchmarks/gzip_copy.py [-s SIZE] [-t THREADS] [-d DIR]
+
+"""
+
+import os
+import sys
+import time
+import gzip
+import random
+import shutil
+import hashlib
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'wikibrev'))
+from autozip import compress_file, decompress_file
+
+MiB = 1024 * 1024
+
+
+def make_file(path, size, rnd):
+    """
+    Write `size` MiB of data that looks a bit like SQLite pages: text with
+    some binary noise in between, including plenty of newline bytes.
+    """
+    words = ['%s%d' % (w, i) for w in ['Alpha', 'beta', 'Gamma_(film)', 'NATO', 'United States'] for i in range(200)]
+    pool = []
+    for i in range(64):
+        page = [rnd.choice(words) + chr(rnd.randrange(256)) * rnd.randrange(3) for j in range(2000)]
+        pool.append(''.join(page))
+    with open(path, 'wb') as f:
+        written = 0
+        while written < size * MiB:
+            chunk = ''.join(rnd.choice(pool) for i in range(64))[:size * MiB - written]
+            f.write(chunk)
+            written += len(chunk)
+
+def md5(path, opener=open):
+    h = hashlib.md5()
+    with opener(path, 'rb') as f:
+        for data in iter(lambda: f.read(MiB), ''):
+            h.update(data)
+    return h.hexdigest()
+
+def old_decompress(fname_in, fname_out):
+    with open(fname_out, 'wb') as f_out:
+        with gzip.open(fname_in, 'rb') as f_in:
+            f_out.writelines(f_in)
+
+def old_compress(fname_in, fname_out):
+    f_in = open(fname_in, 'rb')
+    f_out = gzip.open(fname_out, 'wb')
+    f_out.writelines(f_in)
+    f_out.close()
+    f_in.close()
+
+def measure(name, func, size, *args):
+    t = time.time()
+    func(*args)
+    elapsed = time.time() - t
+    print '%s: %.1f MiB/s (%.1f s)' % (name, size / elapsed, elapsed)
+
+
+if __name__ == '__main__':
+    argparser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    argparser.add_argument('-s', '--size', type=int, default=2048, help='the size of the test file in MiB (default: 2048)')
+    argparser.add_argument('-t', '--threads', type=int, default=4, help='the number of compression threads (default: 4)')
+    argparser.add_argument('-d', '--dir', default=None, help='the directory for the test files')
+    args = argparser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(dir=args.dir)
+    try:
+        raw = os.path.join(tmpdir, 'raw')
+        make_file(raw, args.size, random.Random(0))
+        expected = md5(raw)
+
+        paths = dict((name, os.path.join(tmpdir, name)) for name in ['old.gz', 'new.gz', 'threaded.gz', 'out'])
+        measure('compress, line-based', old_compress, args.size, raw, paths['old.gz'])
+        measure('compress, chunked', compress_file, args.size, raw, paths['new.gz'])
+        measure('compress, %d threads' % args.threads, compress_file, args.size, raw, paths['threaded.gz'], args.threads)
+        for name in ['old.gz', 'new.gz', 'threaded.gz']:
+            print '%s: %.1f MiB' % (name, os.path.getsize(paths[name]) / float(MiB))
+
+        measure('decompress, line-based', old_decompress, args.size, paths['old.gz'], paths['out'])
+        measure('decompress, chunked', decompress_file, args.size, paths['old.gz'], paths['out'])
+
+        for name in ['old.gz', 'new.gz', 'threaded.gz']:
+            if md5(paths[name], gzip.open) != expected:
+                print >>sys.stderr, 'FAIL: %s does not decompress to the original data' % name
+                sys.exit(1)
+        if md5(paths['out']) != expected:
+            print >>sys.stderr, 'FAIL: decompress_file output differs from the original data'
+            sys.exit(1)
+    finally:
+        shutil.rmtree(tmpdir)
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+"""
+Write a synthetic corpus (see `_pyzim`) into a directory of HTML files, which
+wikibrev reads in place of a ZIM dump. The extraction from the directory gives
+the same abbreviations as from the synthetic corpus itself.
+
+Run from the repository root:
+
+    python benchmarks/make_fixture.py [-n ARTICLES] [-l LINKS] [-r REDIRECTS] [-s SEED] DIR
+
+"""
+
+import os
+import sys
+import codecs
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'wikibrev'))
+import _pyzim
+
+
+def write_fixture(path, spec):
+    """
+    Write the synthetic corpus given by `spec` into the directory `path`.
+    """
+    corpus = _pyzim.File(_pyzim.synthetic_prefix + spec)
+    if not os.path.exists(path):
+        os.makedirs(path)
+    with codecs.open(os.path.join(path, 'redirects.tsv'), 'w', 'utf-8') as redirects:
+        for a in corpus.articles():
+            if a.redirect_index is not None:
+                target = corpus.title(a.redirect_index).replace(u' ', u'_')
+                redirects.write(u'%s\t%s\t%s\n' % (a.url, target, a.title))
+            else:
+                with codecs.open(os.path.join(path, a.url.encode('utf-8') + '.html'), 'w', 'utf-8') as f:
+                    f.write(a.data)
+    return len(corpus)
+
+
+if __name__ == '__main__':
+    argparser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    argparser.add_argument('dir', metavar='DIR', help='the output directory')
+    argparser.add_argument('-n', '--articles', type=int, default=10000, help='the number of articles, including redirects (default: 10000)')
+    argparser.add_argument('-l', '--links', type=int, default=20, help='the average number of links per page (default: 20)')
+    argparser.add_argument('-r', '--redirects', type=float, default=0.2, help='the ratio of redirects (default: 0.2)')
+    argparser.add_argument('-s', '--seed', type=int, default=0, help='the random seed (default: 0)')
+    args = argparser.parse_args()
+
+    spec = 'articles=%d,links=%d,redirects=%s,seed=%d' % (args.articles, args.links, args.redirects, args.seed)
+    print 'wrote', write_fixture(args.dir, spec), 'articles to', args.dir
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""
+Feed a large number of synthetic pages through a single link extractor
+instance and check that its memory use stays flat, i.e. that no state leaks
+from one page to the next. Reports the throughput in pages per second.
+
+Run from the repository root:
+
+    python benchmarks/parser_reuse.py [-n PAGES] [-e ENGINE]
+
+"""
+
+from __future__ import unicode_literals
+import os
+import sys
+import time
+import random
+import resource
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'wikibrev'))
+from link_extractor import engines
+
+
+def make_page(rnd):
+    """
+    Generate a Wikipedia-like page, including unclosed elements, forbidden
+    regions and truncated pages.
+    """
+    parts = ['<html><head><title>Page</title></head><body>']
+    for i in range(rnd.randrange(2, 10)):
+        parts.append('<p>')
+        for j in range(rnd.randrange(1, 5)):
+            words = ['Word%d' % rnd.randrange(1000) for k in range(rnd.randrange(1, 4))]
+            parts.append('<a href="%s">%s</a> text ' % ('_'.join(words), ' '.join(words)))
+            parts.append('<a href="%s">%s</a>, ' % ('_'.join(words), ''.join(w[0] for w in words)))
+        if rnd.random() < 0.3:
+            parts.append('<sup class="reference"><a href="#cite_note-%d">[%d]</a></sup>' % (i, i))
+        if rnd.random() < 0.2:
+            parts.append('<div class="hatnote"><a href="Other">Other uses</a></div>')
+        if rnd.random() < 0.2:
+            parts.append('<span><b>unclosed')
+        parts.append('</p>')
+    if rnd.random() < 0.5: # some pages are cut short
+        parts.append('</body></html>')
+    return ''.join(parts)
+
+def max_rss_kb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+if __name__ == '__main__':
+    argparser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    argparser.add_argument('-n', '--pages', type=int, default=100000, help='the number of pages (default: 100000)')
+    argparser.add_argument('-e', '--engine', choices=sorted(engines), default='htmlparser', help='the engine to test (default: htmlparser)')
+    argparser.add_argument('--max-growth', type=int, default=8192, help='the allowed growth of the peak RSS after warm-up, in kB (default: 8192)')
+    args = argparser.parse_args()
+
+    rnd = random.Random(0)
+    pages = [make_page(rnd) for i in range(200)]
+    parser = engines[args.engine]()
+
+    warmup = min(args.pages // 10, 10000)
+    rss_warm = None
+    n_links = 0
+    t = time.time()
+    for i in range(args.pages):
+        if i == warmup:
+            rss_warm = max_rss_kb()
+        n_links += len(parser.parse_page(i, pages[i % len(pages)])['links'])
+    elapsed = time.time() - t
+    rss_end = max_rss_kb()
+
+    print 'engine:', args.engine
+    print 'pages:', args.pages
+    print 'links:', n_links
+    print 'speed:', args.pages / elapsed, 'pages per second'
+    print 'peak RSS after warm-up:', rss_warm, 'kB'
+    print 'peak RSS at the end:', rss_end, 'kB'
+    print 'element stack size:', len(parser.elem_stack)
+
+    if rss_end - rss_warm > args.max_growth:
+        print >>sys.stderr, 'FAIL: memory grew by', rss_end - rss_warm, 'kB'
+        sys.exit(1)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+"""
+Check that `zim2db --resume` continues a killed extraction correctly. A
+synthetic corpus (see `_pyzim`) is extracted, the process is killed with
+SIGKILL once the checkpoint reaches a given point (while reading the
+articles, checking the redirects and early and late while parsing the
+articles) and the extraction is resumed; the schema and the rows of all
+tables must be equal to those of an uninterrupted extraction. This is done
+with the default settings, with `-d` and with `--aggregate-links`.
+
+Run from the repository root:
+
+    python benchmarks/resume.py [-n ARTICLES] [-t THREADS] [-s SEED] [-v]
+
+"""
+
+from __future__ import unicode_literals
+import os
+import sys
+import time
+import shutil
+import signal
+import sqlite3
+import argparse
+import tempfile
+import subprocess
+from contextlib import closing
+
+from shards import wikibrev_main, variants, run_wikibrev, compare_databases
+
+# the phases of an extraction, in order (see `link_extractor.create_checkpoint`)
+phases = ['articles', 'redirects', 'links']
+
+# the (phase, fraction of the corpus) pairs at which the extraction is killed
+kill_points = [('articles', 0.5), ('redirects', 0.0), ('links', 0.1), ('links', 0.7)]
+
+cluster_size = 16 # the number of articles per cluster of a synthetic corpus
+
+
+def read_checkpoint(path):
+    """
+    Return the (phase, position) saved in the database at `path`, or None if
+    there is none (yet or any more).
+    """
+    if not os.path.exists(path): # connecting would create it
+        return None
+    try:
+        with closing(sqlite3.connect(path, timeout=0)) as dbconn:
+            return dbconn.execute('select phase, position from extract_checkpoint').fetchone()
+    except sqlite3.OperationalError: # not created yet, dropped or locked
+        return None
+
+def run_killed(args, path, point, verbose=False):
+    """
+    Run `wikibrev zim2db` with `args` and kill it (with its workers) as soon as
+    the checkpoint in the database at `path` reaches `point`. Return the last
+    checkpoint seen, or None if the extraction finished first.
+    """
+    with open(os.devnull, 'w') as devnull:
+        out_f = None if verbose else devnull
+        proc = subprocess.Popen([sys.executable, wikibrev_main] + args, stdin=devnull, stdout=out_f,
+                                stderr=out_f, preexec_fn=os.setsid)
+    checkpoint = None
+    while proc.poll() is None:
+        checkpoint = read_checkpoint(path) or checkpoint
+        if checkpoint is not None and (phases.index(checkpoint[0]), checkpoint[1]) >= point:
+            os.killpg(proc.pid, signal.SIGKILL)
+            proc.wait()
+            return checkpoint
+        time.sleep(0.005)
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, args)
+    return None
+
+def check_resume(corpus, tmpdir, options, ref_path, point, verbose=False):
+    """
+    Extract `corpus` with `options`, killed at `point` and resumed, and
+    return the checkpoint at which it was killed and the differences from the
+    database at `ref_path`.
+    """
+    path = os.path.join(tmpdir, 'resumed.db')
+    checkpoint = run_killed(['zim2db', corpus, path] + options, path, point, verbose)
+    run_wikibrev(['zim2db', corpus, path, '--resume'] + options, verbose)
+    diffs = compare_databases(path, ref_path)
+    os.remove(path)
+    return (checkpoint, diffs)
+
+
+if __name__ == '__main__':
+    argparser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    argparser.add_argument('-n', '--articles', type=int, default=5000, help='the number of articles in the corpus (default: 5000)')
+    argparser.add_argument('-t', '--threads', type=int, default=2, help='the number of threads of each run (default: 2)')
+    argparser.add_argument('-s', '--seed', type=int, default=0, help='the seed of the corpus (default: 0)')
+    argparser.add_argument('-v', '--verbose', action='store_true', help='show the output of the runs')
+    args = argparser.parse_args()
+
+    corpus = 'synthetic:articles=%d,redirects=0.3,seed=%d' % (args.articles, args.seed)
+    # frequent commits, so that there are many checkpoints to kill at
+    run_options = ['-t', str(args.threads), '--commit-rows', '100', '--commit-seconds', '0.05']
+    failed = False
+    for options in variants:
+        name = ' '.join(options) or 'default'
+        tmpdir = tempfile.mkdtemp()
+        try:
+            ref_path = os.path.join(tmpdir, 'single.db')
+            run_wikibrev(['zim2db', corpus, ref_path] + options + run_options, args.verbose)
+            for (phase, fraction) in kill_points:
+                # the links are checkpointed by cluster when reading the clusters directly
+                units = args.articles // cluster_size if phase == 'links' and '-d' in options else args.articles
+                point = (phases.index(phase), int(fraction * units))
+                (checkpoint, diffs) = check_resume(corpus, tmpdir, options + run_options, ref_path, point,
+                                                   args.verbose)
+                if checkpoint is None:
+                    print >>sys.stderr, 'WARNING: %s: the extraction finished before %s %d' % (name, phase, point[1])
+                    killed = 'not killed'
+                else:
+                    killed = 'killed at %s %d' % checkpoint
+                for diff in diffs:
+                    print >>sys.stderr, 'FAIL: %s, %s: %s' % (name, killed, diff)
+                failed = failed or bool(diffs)
+                print '%s, %s: %s' % (name, killed, 'different' if diffs else 'same')
+        finally:
+            shutil.rmtree(tmpdir)
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+"""
+Check that `zim2db --shard` and `merge-db` give the same database as a
+single-shot `zim2db`. A synthetic corpus (see `_pyzim`) is extracted in one
+run and as 4 shards, which are merged in a shuffled order; the schemas and
+the rows of all tables of the two databases must be equal. This is done with
+the default settings, with `-d` and with `--aggregate-links`.
+
+Run from the repository root:
+
+    python benchmarks/shards.py [-n ARTICLES] [-t THREADS] [-s SEED] [-v]
+
+"""
+
+from __future__ import unicode_literals
+import os
+import sys
+import random
+import shutil
+import sqlite3
+import argparse
+import tempfile
+import subprocess
+from contextlib import closing
+
+bench_dir = os.path.dirname(os.path.abspath(__file__))
+wikibrev_main = os.path.join(bench_dir, '..', 'wikibrev', '__init__.py')
+
+# the option sets that each check is run with
+variants = [[], ['-d'], ['--aggregate-links']]
+
+
+def run_wikibrev(args, verbose=False):
+    """
+    Run the wikibrev command with `args` and raise an error if it fails. Its
+    output is only shown if `verbose` is True.
+    """
+    with open(os.devnull, 'w') as devnull:
+        out_f = None if verbose else devnull
+        subprocess.check_call([sys.executable, wikibrev_main] + args, stdin=devnull, stdout=out_f, stderr=out_f)
+
+def schema(db):
+    """
+    Return the sorted (type, name, table, SQL) rows of the schema of a
+    database.
+    """
+    return sorted(db.execute('select type, name, tbl_name, sql from sqlite_master'))
+
+def compare_databases(path, ref_path):
+    """
+    Compare the schema and the rows of every table (in any order) of the
+    database at `path` with those of the one at `ref_path` and return a list
+    of the differences found.
+    """
+    diffs = []
+    with closing(sqlite3.connect(path)) as dbconn, closing(sqlite3.connect(ref_path)) as ref_conn:
+        if schema(dbconn) != schema(ref_conn):
+            return ['schema: %r != %r' % (schema(dbconn), schema(ref_conn))]
+        tables = [name for (kind, name, table, sql) in schema(dbconn) if kind == 'table']
+        for table in tables:
+            rows = sorted(dbconn.execute('select * from "%s"' % table))
+            ref_rows = sorted(ref_conn.execute('select * from "%s"' % table))
+            if rows != ref_rows:
+                only = sorted(set(rows) - set(ref_rows))[:3]
+                only_ref = sorted(set(ref_rows) - set(rows))[:3]
+                diffs.append('table %s: %d rows, %d expected; e.g. extra %r, missing %r' %
+                             (table, len(rows), len(ref_rows), only, only_ref))
+    return diffs
+
+def check_shards(corpus, tmpdir, options, n_shards, rnd, verbose=False):
+    """
+    Build the database of `corpus` with `options` in one run and from
+    `n_shards` shards and return the differences between the two.
+    """
+    ref_path = os.path.join(tmpdir, 'single.db')
+    run_wikibrev(['zim2db', corpus, ref_path] + options, verbose)
+    shard_paths = []
+    for k in range(1, n_shards + 1):
+        path = os.path.join(tmpdir, 'shard%d.db' % k)
+        run_wikibrev(['zim2db', corpus, path, '--shard', '%d/%d' % (k, n_shards)] + options, verbose)
+        shard_paths.append(path)
+    rnd.shuffle(shard_paths)
+    merged_path = os.path.join(tmpdir, 'merged.db')
+    run_wikibrev(['merge-db', merged_path] + shard_paths, verbose)
+    return compare_databases(merged_path, ref_path)
+
+
+if __name__ == '__main__':
+    argparser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    argparser.add_argument('-n', '--articles', type=int, default=3000, help='the number of articles in the corpus (default: 3000)')
+    argparser.add_argument('-t', '--threads', type=int, default=2, help='the number of threads of each run (default: 2)')
+    argparser.add_argument('-s', '--seed', type=int, default=0, help='the seed of the corpus and of the order of the shards (default: 0)')
+    argparser.add_argument('-v', '--verbose', action='store_true', help='show the output of the runs')
+    args = argparser.parse_args()
+
+    corpus = 'synthetic:articles=%d,redirects=0.3,seed=%d' % (args.articles, args.seed)
+    rnd = random.Random(args.seed)
+    failed = False
+    for options in variants:
+        name = ' '.join(options) or 'default'
+        tmpdir = tempfile.mkdtemp()
+        try:
+            diffs = check_shards(corpus, tmpdir, options + ['-t', str(args.threads)], 4, rnd, args.verbose)
+        finally:
+            shutil.rmtree(tmpdir)
+        for diff in diffs:
+            print >>sys.stderr, 'FAIL: %s: %s' % (name, diff)
+        failed = failed or bool(diffs)
+        print '%s: %s' % (name, 'different' if diffs else 'same')
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+"""
+Run the stages of the pipeline on a synthetic corpus (see `_pyzim`) and report
+their throughput, peak RSS and output size as JSON. If a baseline (an earlier
+JSON report) is given, fail when a stage is slower or bigger than in the
+baseline by more than a threshold.
+
+The stages are: parsing pages with each engine, building the URL map and
+resolving links, `check_abbr`, `extract_links` (which also checks the
+redirects) and `make_abbrevs` (also with aggregated links), `database_to_text`
+and compressing and decompressing the database with autozip (skipped if the
+`magic` module is not installed). Each stage runs in its own process, so that
+its peak RSS (including its workers) is its own. The single-process stages are
+run several times and the fastest run counts.
+
+Run from the repository root:
+
+    python benchmarks/suite.py [-n ARTICLES] [-p PAGES] [-t THREADS] [-r REPEAT] [-o OUTPUT] [-b BASELINE] [--threshold RATIO]
+
+"""
+
+from __future__ import unicode_literals
+import os
+import sys
+import time
+import json
+import shutil
+import sqlite3
+import resource
+import argparse
+import tempfile
+import multiprocessing
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'wikibrev'))
+import unzim
+import link_extractor
+import abbrev_processor
+from url_map import UrlMap
+from link_extractor import engines, extract_links
+from abbrev_processor import make_abbrevs, database_to_file
+
+# the metrics for which a lower value is a regression; for the others, a higher one
+throughput_suffix = '_per_s'
+size_metrics = ['peak_rss_kb', 'db_size_bytes', 'gz_size_bytes']
+
+
+def read_pages(corpus, n_pages):
+    """
+    Return the (index, data) pairs of the first `n_pages` pages in a corpus.
+    """
+    pages = []
+    for a in corpus.articles():
+        if len(pages) >= n_pages:
+            break
+        if a.redirect_index is None:
+            pages.append((a.index, a.data))
+    return pages
+
+def best_time(config, func):
+    """
+    Call `func` `config['repeat']` times and return the shortest time and the
+    result of the last call.
+    """
+    best = None
+    for i in range(config['repeat']):
+        t = time.time()
+        result = func()
+        elapsed = time.time() - t
+        best = elapsed if best is None else min(best, elapsed)
+    return (best, result)
+
+def stage_parse(config, engine):
+    pages = read_pages(unzim.File(config['corpus']), config['pages'])
+    parser = engines[engine]()
+    (elapsed, n_links) = best_time(config, lambda: sum(len(parser.parse_page(index, data)['links'])
+                                                       for (index, data) in pages))
+    return {'seconds': elapsed, 'articles_per_s': len(pages) / elapsed, 'links_per_s': n_links / elapsed}
+
+def stage_resolve(config):
+    corpus = unzim.File(config['corpus'])
+    articles = [(a.long_url.split('/')[-1], a.index) for a in corpus.articles()]
+    def build_map():
+        url_map = UrlMap()
+        for (url, index) in articles:
+            url_map.add(url, index)
+        url_map.freeze()
+        return url_map
+    (map_elapsed, url_map) = best_time(config, build_map)
+
+    pages = read_pages(corpus, config['pages'])
+    parser = engines['htmlparser']()
+    links = [link for (index, data) in pages for link in parser.parse_page(index, data)['links']]
+    link_extractor.thread_init('htmlparser', url_map, config['corpus'])
+    def resolve():
+        resolved = []
+        link_extractor.resolve_links(links, resolved)
+        return resolved
+    (elapsed, resolved) = best_time(config, resolve)
+    return {'seconds': map_elapsed + elapsed, 'map_articles_per_s': len(articles) / map_elapsed,
+            'links_per_s': len(links) / elapsed, 'resolved_ratio': len(resolved) / float(max(len(links), 1))}
+
+def stage_check_abbr(config):
+    corpus = unzim.File(config['corpus'])
+    titles = dict((a.long_url.split('/')[-1], a.title) for a in corpus.articles())
+    pages = read_pages(corpus, config['pages'])
+    parser = engines['htmlparser']()
+    pairs = [(text, titles[url]) for (index, data) in pages
+             for (index, url, text) in parser.parse_page(index, data)['links'] if url in titles]
+    def check():
+        abbrev_processor.normalized_memo.clear()
+        return sum(1 for (a, b) in pairs if abbrev_processor.check_abbr(a, b))
+    (elapsed, accepted) = best_time(config, check)
+    return {'seconds': elapsed, 'pairs_per_s': len(pairs) / elapsed, 'accepted': accepted}
+
+def stage_extract(config, db_path, aggregate=False):
+    t = time.time()
+    extract_links(config['corpus'], db_path, config['threads'], aggregate=aggregate)
+    elapsed = time.time() - t
+    with sqlite3.connect(db_path) as dbconn:
+        if aggregate:
+            n_links = dbconn.execute('select sum(count) from link_count').fetchone()[0]
+        else:
+            n_links = dbconn.execute('select count(*) from link').fetchone()[0]
+    return {'seconds': elapsed, 'articles_per_s': config['articles'] / elapsed, 'links_per_s': n_links / elapsed,
+            'db_size_bytes': os.path.getsize(db_path)}
+
+def stage_make_abbrevs(config, db_path, aggregate=False):
+    link_query = abbrev_processor.link_count_query if aggregate else abbrev_processor.link_query
+    with sqlite3.connect(db_path) as dbconn:
+        n_pairs = dbconn.execute('select count(*) from (%s)' % link_query, (0, 2 ** 62)).fetchone()[0]
+    t = time.time()
+    make_abbrevs(db_path, config['threads'])
+    elapsed = time.time() - t
+    with sqlite3.connect(db_path) as dbconn:
+        n_abbrevs = dbconn.execute('select count(*) from abbrev').fetchone()[0]
+    return {'seconds': elapsed, 'pairs_per_s': n_pairs / elapsed, 'abbrevs': n_abbrevs,
+            'db_size_bytes': os.path.getsize(db_path)}
+
+def stage_database_to_text(config, db_path, tmpdir):
+    with sqlite3.connect(db_path) as dbconn:
+        n_abbrevs = dbconn.execute('select count(distinct abbr || char(9) || exp) from abbrev').fetchone()[0]
+    t = time.time()
+    database_to_file(db_path, os.path.join(tmpdir, 'abbrevs.tsv'))
+    elapsed = time.time() - t
+    return {'seconds': elapsed, 'abbrevs_per_s': n_abbrevs / elapsed}
+
+def stage_autozip(config, db_path, tmpdir):
+    try:
+        from autozip import AutoZip, compress_file
+    except ImportError as e:
+        return {'skipped': unicode(e)}
+    size_mib = os.path.getsize(db_path) / (1024.0 * 1024)
+    gz_path = os.path.join(tmpdir, 'db.db.gz')
+    t = time.time()
+    compress_file(db_path, gz_path, config['threads'])
+    compress_elapsed = time.time() - t
+    t = time.time()
+    zipped = AutoZip(gz_path, tmpdir, readonly=True)
+    with zipped:
+        pass
+    elapsed = time.time() - t
+    return {'seconds': compress_elapsed + elapsed, 'compress_mib_per_s': size_mib / compress_elapsed,
+            'decompress_mib_per_s': size_mib / elapsed, 'gz_size_bytes': os.path.getsize(gz_path)}
+
+def stage_main(queue, func, args, verbose):
+    if not verbose:
+        sys.stderr = open(os.devnull, 'w')
+    try:
+        result = func(*args)
+    except Exception as e:
+        result = {'error': repr(e)}
+    result['peak_rss_kb'] = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                                resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    queue.put(result)
+
+def run_stage(func, args, verbose=False):
+    """
+    Run a stage in a child process and return its results.
+    """
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=stage_main, args=(queue, func, args, verbose))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+def find_regressions(results, baseline, threshold):
+    """
+    Return the (stage, metric, baseline value, value) tuples of the metrics that
+    are worse than in the baseline by more than `threshold` (a ratio).
+    """
+    regressions = []
+    for (stage, old_metrics) in sorted(baseline['stages'].items()):
+        metrics = results['stages'].get(stage, {})
+        for (metric, old) in sorted(old_metrics.items()):
+            new = metrics.get(metric)
+            if new is None or not old:
+                continue
+            if metric.endswith(throughput_suffix):
+                worse = new < old * (1 - threshold)
+            elif metric in size_metrics:
+                worse = new > old * (1 + threshold)
+            else:
+                continue
+            if worse:
+                regressions.append((stage, metric, old, new))
+    return regressions
+
+
+if __name__ == '__main__':
+    argparser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    argparser.add_argument('-n', '--articles', type=int, default=10000, help='the number of articles in the corpus (default: 10000)')
+    argparser.add_argument('-p', '--pages', type=int, default=2000, help='the number of pages for the single-process stages (default: 2000)')
+    argparser.add_argument('-t', '--threads', type=int, default=4, help='the number of threads for the pipeline stages (default: 4)')
+    argparser.add_argument('-r', '--repeat', type=int, default=5, help='the number of runs of the single-process stages, of which the fastest counts (default: 5)')
+    argparser.add_argument('-s', '--seed', type=int, default=0, help='the seed of the corpus (default: 0)')
+    argparser.add_argument('-o', '--output', default=None, help='write the results to this JSON file (default: standard output)')
+    argparser.add_argument('-b', '--baseline', default=None, help='a JSON file with earlier results to compare with')
+    argparser.add_argument('--threshold', type=float, default=0.1, help='the allowed regression against the baseline, as a ratio (default: 0.1)')
+    argparser.add_argument('-v', '--verbose', action='store_true', help='show the output of the stages')
+    args = argparser.parse_args()
+
+    config = {'corpus': 'synthetic:articles=%d,seed=%d' % (args.articles, args.seed),
+              'articles': args.articles, 'pages': args.pages, 'threads': args.threads,
+              'repeat': args.repeat}
+    tmpdir = tempfile.mkdtemp()
+    db_path = os.path.join(tmpdir, 'db.db')
+    aggregated_db_path = os.path.join(tmpdir, 'aggregated.db')
+    stages = [('parse_' + engine, stage_parse, (config, engine)) for engine in sorted(engines)] + [
+        ('resolve', stage_resolve, (config,)),
+        ('check_abbr', stage_check_abbr, (config,)),
+        ('extract_links', stage_extract, (config, db_path)),
+        ('make_abbrevs', stage_make_abbrevs, (config, db_path)),
+        ('extract_links_aggregated', stage_extract, (config, aggregated_db_path, True)),
+        ('make_abbrevs_aggregated', stage_make_abbrevs, (config, aggregated_db_path, True)),
+        ('database_to_text', stage_database_to_text, (config, db_path, tmpdir)),
+        ('autozip', stage_autozip, (config, db_path, tmpdir)),
+    ]
+    results = {'config': config, 'stages': {}}
+    try:
+        for (name, func, stage_args) in stages:
+            print >>sys.stderr, 'running', name
+            results['stages'][name] = run_stage(func, stage_args, args.verbose)
+    finally:
+        shutil.rmtree(tmpdir)
+
+    report = json.dumps(results, indent=2, sort_keys=True)
+    if args.output is None:
+        print report
+    else:
+        with open(args.output, 'w') as f:
+            f.write(report + '\n')
+
+    failed = [name for (name, result) in results['stages'].items() if 'error' in result]
+    for name in failed:
+        print >>sys.stderr, 'FAIL: stage %s: %s' % (name, results['stages'][name]['error'])
+
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline['config'] != config:
+            print >>sys.stderr, 'WARNING: the baseline was made with a different configuration:', baseline['config']
+        regressions = find_regressions(results, baseline, args.threshold)
+        for (stage, metric, old, new) in regressions:
+            print >>sys.stderr, 'FAIL: %s %s regressed from %.4g to %.4g' % (stage, metric, old, new)
+        failed += regressions
+
+    if failed:
+        sys.exit(1)
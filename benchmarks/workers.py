@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""
+Run `extract_links` on a synthetic corpus (see `_pyzim`) with worker
+processes and with worker threads, for several numbers of workers and each
+engine, and report the throughput and peak RSS of each run as JSON.
+
+Threads share the URL map and the article data with the main process, but
+only run in parallel where the GIL is released: when reading blobs from a ZIM
+dump with `-d` and when parsing with the `compiled` engine. On the synthetic
+corpus with the Python engines, they show what the GIL costs.
+
+Run from the repository root:
+
+    python benchmarks/workers.py [-n ARTICLES] [-t THREADS ...] [-e ENGINE ...] [-d] [-o OUTPUT]
+
+"""
+
+from __future__ import unicode_literals
+import os
+import sys
+import time
+import json
+import shutil
+import sqlite3
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'wikibrev'))
+from link_extractor import engines, worker_kinds, extract_links
+from suite import run_stage
+
+
+def stage_extract(config, db_path, engine, workers, n_threads):
+    t = time.time()
+    extract_links(config['corpus'], db_path, n_threads, direct_read=config['direct_read'], engine=engine,
+                  workers=workers)
+    elapsed = time.time() - t
+    with sqlite3.connect(db_path) as dbconn:
+        n_links = dbconn.execute('select count(*) from link').fetchone()[0]
+    os.remove(db_path)
+    return {'seconds': elapsed, 'articles_per_s': config['articles'] / elapsed, 'links_per_s': n_links / elapsed}
+
+
+if __name__ == '__main__':
+    argparser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    argparser.add_argument('-n', '--articles', type=int, default=10000, help='the number of articles in the corpus (default: 10000)')
+    argparser.add_argument('-t', '--threads', type=int, nargs='+', default=[1, 4, 16], help='the numbers of workers to run with (default: 1 4 16)')
+    argparser.add_argument('-e', '--engine', nargs='+', choices=sorted(engines), default=sorted(engines), help='the engines to run with (default: all)')
+    argparser.add_argument('-d', '--direct-read', action='store_true', help='let the workers read the articles themselves')
+    argparser.add_argument('-s', '--seed', type=int, default=0, help='the seed of the corpus (default: 0)')
+    argparser.add_argument('-o', '--output', default=None, help='write the results to this JSON file (default: standard output)')
+    argparser.add_argument('-v', '--verbose', action='store_true', help='show the output of the runs')
+    args = argparser.parse_args()
+
+    config = {'corpus': 'synthetic:articles=%d,seed=%d' % (args.articles, args.seed),
+              'articles': args.articles, 'direct_read': args.direct_read}
+    tmpdir = tempfile.mkdtemp()
+    db_path = os.path.join(tmpdir, 'db.db')
+    results = {'config': config, 'runs': {}}
+    try:
+        for engine in args.engine:
+            for workers in worker_kinds:
+                for n_threads in args.threads:
+                    name = '%s_%s_%d' % (engine, workers, n_threads)
+                    print >>sys.stderr, 'running', name
+                    results['runs'][name] = run_stage(stage_extract, (config, db_path, engine, workers, n_threads),
+                                                      args.verbose)
+    finally:
+        shutil.rmtree(tmpdir)
+
+    report = json.dumps(results, indent=2, sort_keys=True)
+    if args.output is None:
+        print report
+    else:
+        with open(args.output, 'w') as f:
+            f.write(report + '\n')
+
+    failed = [name for (name, result) in results['runs'].items() if 'error' in result]
+    for name in failed:
+        print >>sys.stderr, 'FAIL: run %s: %s' % (name, results['runs'][name]['error'])
+    if failed:
+        sys.exit(1)
@@ -14,6 +14,17 @@ extensions = [Extension(
     ],
     libraries=['zim', 'stdc++'],
     language='c++'
+), Extension(
+    'wikibrev._abbrev',
+    sources=[
+        'wikibrev/_abbrev.pyx' if HAVE_CYTHON else 'wikibrev/_abbrev.c'
+    ]
+), Extension(
+    'wikibrev._linkscan',
+    sources=[
+        'wikibrev/_linkscan.pyx' if HAVE_CYTHON else 'wikibrev/_linkscan.cpp'
+    ],
+    language='c++'
 )]
 
 if HAVE_CYTHON:
@@ -5,31 +5,14 @@ import codecs
 import argparse
 import tempfile
 import shutil
-import gzip
-import sqlite3
 from contextlib import closing
-from autozip import AutoZip
+from autozip import AutoZip, compress_file, write_sidecar, buffer_size
 from ask import ask_yes_no
-from link_extractor import extract_links
-from abbrev_processor import make_abbrevs
-
-
-def compress_file(fname_in, fname_out):
-    f_in = open(fname_in, 'rb')
-    f_out = gzip.open(fname_out, 'wb')
-    f_out.writelines(f_in)
-    f_out.close()
-    f_in.close()
-
-def database_to_text(dbpath, out_f):
-    with closing(sqlite3.connect(dbpath)) as dbconn:
-        db = dbconn.cursor()
-        abbrevs = db.execute('select distinct abbr, exp from abbrev order by lower(abbr) asc')
-        for (abbr, exp) in abbrevs:
-            out_f.write(abbr)
-            out_f.write('\t')
-            out_f.write(exp)
-            out_f.write('\n')
+from link_extractor import extract_links, update_links, merge_shards, engines, worker_kinds
+from abbrev_processor import make_abbrevs, database_to_text, database_to_file
+from abbrev_stream import extract_abbrevs
+from metrics import metrics, start_profile, stop_profile
+
 
 def ask_overwrite(fname):
     if os.path.exists(fname):
@@ -40,6 +23,26 @@ def ask_overwrite(fname):
             return False
     return True
 
+def partial_path(tmp, fname):
+    """
+    Return the path of the uncompressed database built for the compressed
+    database `fname`. It is kept until the database is compressed, so that an
+    interrupted extraction can be resumed.
+    """
+    return os.path.join(tmp or tempfile.gettempdir(), os.path.basename(fname) + '.part')
+
+def shard_spec(value):
+    """
+    Parse a K/N shard specification.
+    """
+    try:
+        (number, count) = [int(x) for x in value.split('/')]
+    except ValueError:
+        raise argparse.ArgumentTypeError('expected K/N, got %r' % value)
+    if not 1 <= number <= count:
+        raise argparse.ArgumentTypeError('K must be between 1 and N, got %r' % value)
+    return (number, count)
+
 UTF8Writer = codecs.getwriter('utf8')
 sys.stdout = UTF8Writer(sys.stdout)
 sys.stderr = UTF8Writer(sys.stderr)
@@ -49,6 +52,9 @@ parser = argparse.ArgumentParser(
         Collect abbreviations from Wikipedia.
         """)
 parser.add_argument('--tmp', default=None, help='temporary files directory path')
+parser.add_argument('--zip-threads', type=int, default=1, help='the number of threads to use for gzip compression (default: 1)')
+parser.add_argument('--metrics', metavar='FILE', default=None, help='write the counters and timers of the stages to FILE as JSON lines')
+parser.add_argument('--profile', metavar='FILE', default=None, help='profile the main process and the workers and save the merged statistics to FILE')
 subparsers = parser.add_subparsers(title='actions', dest='action')
 
 parser_links = subparsers.add_parser('zim2db',
@@ -59,12 +65,32 @@ parser_links.add_argument('input', metavar='INPUT', help='a ZIM dump')
 parser_links.add_argument('output', metavar='OUTPUT', help='the resulting SQLite database')
 parser_links.add_argument('-c', '--compress', action='store_true', help='compress the database using gzip')
 parser_links.add_argument('-t', '--threads', type=int, default=8, help='the number of threads to use (default: 8)')
+parser_links.add_argument('-b', '--batch-size', type=int, default=50, help='the number of articles sent to a thread at once (default: 50)')
+parser_links.add_argument('-d', '--direct-read', action='store_true', help='let the threads read the articles from the ZIM dump themselves, in cluster order')
+parser_links.add_argument('-e', '--engine', choices=sorted(engines), default='htmlparser', help='the link extraction engine to use (default: htmlparser)')
+parser_links.add_argument('-w', '--workers', choices=worker_kinds, default='processes', help='run the threads as processes or as threads of one process (default: processes)')
+parser_links.add_argument('--bulk-load', action='store_true', help='load the data into unindexed tables without journaling and build the indexes at the end')
+parser_links.add_argument('--max-inflight-mb', type=int, default=256, help='the maximum size of the article data sent to the threads and not yet processed, in MiB; does not apply with -d, where the threads read the articles themselves (default: 256)')
+parser_links.add_argument('--commit-rows', type=int, default=100000, help='commit the database after this many rows (default: 100000)')
+parser_links.add_argument('--commit-seconds', type=float, default=10, help='commit the database at least this often, in seconds (default: 10)')
+parser_links.add_argument('--aggregate-links', action='store_true', help='store the number of articles with each link instead of the links of each article (the database cannot be updated with zim-update)')
+parser_links.add_argument('--resume', action='store_true', help='continue an interrupted extraction into OUTPUT from its last checkpoint')
+parser_links.add_argument('--shard', type=shard_spec, metavar='K/N', help='only process the K-th of N ranges of articles into a shard database for merge-db')
+
+parser_merge = subparsers.add_parser('merge-db',
+        help="""
+        Merge the shard databases produced by zim2db --shard into one database of articles and links.
+        """)
+parser_merge.add_argument('output', metavar='OUTPUT', help='the resulting SQLite database')
+parser_merge.add_argument('shards', metavar='SHARD', nargs='+', help='the shard databases')
+parser_merge.add_argument('-c', '--compress', action='store_true', help='compress the database using gzip')
 
 parser_abbrevs = subparsers.add_parser('db2abbr-db',
         help="""
         Read a database of articles and links and add abbreviations to it.
         """)
 parser_abbrevs.add_argument('input', metavar='INPUT', help='a SQLite database, possibly compressed using gzip')
+parser_abbrevs.add_argument('-t', '--threads', type=int, default=8, help='the number of threads to use (default: 8)')
 
 parser_links_abbrevs = subparsers.add_parser('zim2abbr-db',
         help="""
@@ -74,6 +100,31 @@ parser_links_abbrevs.add_argument('input', metavar='INPUT', help='a ZIM dump')
 parser_links_abbrevs.add_argument('output', metavar='OUTPUT', help='the resulting SQLite database')
 parser_links_abbrevs.add_argument('-c', '--compress', action='store_true', help='compress the database using gzip')
 parser_links_abbrevs.add_argument('-t', '--threads', type=int, default=8, help='the number of threads to use (default: 8)')
+parser_links_abbrevs.add_argument('-b', '--batch-size', type=int, default=50, help='the number of articles sent to a thread at once (default: 50)')
+parser_links_abbrevs.add_argument('-d', '--direct-read', action='store_true', help='let the threads read the articles from the ZIM dump themselves, in cluster order')
+parser_links_abbrevs.add_argument('-e', '--engine', choices=sorted(engines), default='htmlparser', help='the link extraction engine to use (default: htmlparser)')
+parser_links_abbrevs.add_argument('-w', '--workers', choices=worker_kinds, default='processes', help='run the threads as processes or as threads of one process (default: processes)')
+parser_links_abbrevs.add_argument('--bulk-load', action='store_true', help='load the data into unindexed tables without journaling and build the indexes at the end')
+parser_links_abbrevs.add_argument('--max-inflight-mb', type=int, default=256, help='the maximum size of the article data sent to the threads and not yet processed, in MiB; does not apply with -d, where the threads read the articles themselves (default: 256)')
+parser_links_abbrevs.add_argument('--commit-rows', type=int, default=100000, help='commit the database after this many rows (default: 100000)')
+parser_links_abbrevs.add_argument('--commit-seconds', type=float, default=10, help='commit the database at least this often, in seconds (default: 10)')
+parser_links_abbrevs.add_argument('--aggregate-links', action='store_true', help='store the number of articles with each link instead of the links of each article (the database cannot be updated with zim-update)')
+parser_links_abbrevs.add_argument('--resume', action='store_true', help='continue an interrupted extraction into OUTPUT from its last checkpoint')
+
+parser_update = subparsers.add_parser('zim-update',
+        help="""
+        Update a database of articles, links and abbreviations from a newer ZIM dump.
+        """)
+parser_update.add_argument('input', metavar='INPUT', help='a ZIM dump')
+parser_update.add_argument('db', metavar='DB', help='a database created by zim2abbr-db, possibly compressed using gzip')
+parser_update.add_argument('-t', '--threads', type=int, default=8, help='the number of threads to use (default: 8)')
+parser_update.add_argument('-b', '--batch-size', type=int, default=50, help='the number of articles sent to a thread at once (default: 50)')
+parser_update.add_argument('-d', '--direct-read', action='store_true', help='let the threads read the articles from the ZIM dump themselves, in cluster order')
+parser_update.add_argument('-e', '--engine', choices=sorted(engines), default='htmlparser', help='the link extraction engine to use (default: htmlparser)')
+parser_update.add_argument('-w', '--workers', choices=worker_kinds, default='processes', help='run the threads as processes or as threads of one process (default: processes)')
+parser_update.add_argument('--max-inflight-mb', type=int, default=256, help='the maximum size of the article data sent to the threads and not yet processed, in MiB; does not apply with -d, where the threads read the articles themselves (default: 256)')
+parser_update.add_argument('--commit-rows', type=int, default=100000, help='commit the database after this many rows (default: 100000)')
+parser_update.add_argument('--commit-seconds', type=float, default=10, help='commit the database at least this often, in seconds (default: 10)')
 
 parser_list = subparsers.add_parser('abbr-db2list',
         help="""
@@ -81,6 +132,7 @@ parser_list = subparsers.add_parser('abbr-db2list',
         """)
 parser_list.add_argument('input', metavar='INPUT', help='an SQLite database')
 parser_list.add_argument('output', metavar='OUTPUT', nargs='?', default='-', help='an output file')
+parser_list.add_argument('--counts', action='store_true', help='add the number of links and redirects in which each abbreviation was found')
 
 parser_links_abbrevs_list = subparsers.add_parser('zim2list',
         help="""
@@ -89,46 +141,122 @@ parser_links_abbrevs_list = subparsers.add_parser('zim2list',
 parser_links_abbrevs_list.add_argument('input', metavar='INPUT', help='a ZIM dump')
 parser_links_abbrevs_list.add_argument('output', metavar='OUTPUT', nargs='?', default='-', help='an output file')
 parser_links_abbrevs_list.add_argument('-t', '--threads', type=int, default=8, help='the number of threads to use (default: 8)')
+parser_links_abbrevs_list.add_argument('-b', '--batch-size', type=int, default=50, help='the number of articles sent to a thread at once (default: 50)')
+parser_links_abbrevs_list.add_argument('-d', '--direct-read', action='store_true', help='let the threads read the articles from the ZIM dump themselves, in cluster order')
+parser_links_abbrevs_list.add_argument('-e', '--engine', choices=sorted(engines), default='htmlparser', help='the link extraction engine to use (default: htmlparser)')
+parser_links_abbrevs_list.add_argument('-w', '--workers', choices=worker_kinds, default='processes', help='run the threads as processes or as threads of one process (default: processes)')
+parser_links_abbrevs_list.add_argument('--bulk-load', action='store_true', help='load the data into unindexed tables without journaling and build the indexes at the end')
+parser_links_abbrevs_list.add_argument('--max-inflight-mb', type=int, default=256, help='the maximum size of the article data sent to the threads and not yet processed, in MiB; does not apply with -d, where the threads read the articles themselves (default: 256)')
+parser_links_abbrevs_list.add_argument('--commit-rows', type=int, default=100000, help='commit the database after this many rows (default: 100000)')
+parser_links_abbrevs_list.add_argument('--commit-seconds', type=float, default=10, help='commit the database at least this often, in seconds (default: 10)')
+parser_links_abbrevs_list.add_argument('-s', '--stream', action='store_true', help='check the links for abbreviations while extracting them, without building a database')
+parser_links_abbrevs_list.add_argument('--counts', action='store_true', help='add the number of links and redirects in which each abbreviation was found')
+parser_links_abbrevs_list.add_argument('--redirects-only', action='store_true', help='only check the titles of the redirects against those of their targets, without parsing any articles')
+parser_links_abbrevs_list.add_argument('-m', '--sort-memory', type=int, default=256, help='the memory for sorting the abbreviations in streaming mode, in MiB (default: 256)')
 
 args = parser.parse_args()
+if getattr(args, 'resume', False) and args.bulk_load:
+    parser.error('--resume cannot be used with --bulk-load')
+if getattr(args, 'shard', None) is not None and (args.resume or args.compress):
+    parser.error('--shard cannot be used with --resume or --compress')
+if getattr(args, 'stream', False) and args.counts:
+    parser.error('--counts cannot be used with --stream')
 
 tmpdir = tempfile.mkdtemp(dir=args.tmp)
+if args.metrics is not None:
+    metrics.open(args.metrics)
+if args.profile is not None:
+    start_profile()
 
 try:
     if args.action == 'zim2db':
-        if not ask_overwrite(args.output):
+        if not args.resume and not ask_overwrite(args.output):
             sys.exit(0)
 
         if not args.compress:
-            extract_links(args.input, args.output, args.threads)
+            extract_links(args.input, args.output, args.threads, args.batch_size, args.direct_read, args.engine,
+                          args.bulk_load, args.resume, args.shard, args.max_inflight_mb, args.commit_rows,
+                          args.commit_seconds, args.workers, args.aggregate_links)
         else:
-            dbpath = os.path.join(tmpdir, 'db.db')
-            extract_links(args.input, dbpath, args.threads)
+            dbpath = partial_path(args.tmp, args.output)
+            if not args.resume and os.path.exists(dbpath):
+                os.remove(dbpath)
+            extract_links(args.input, dbpath, args.threads, args.batch_size, args.direct_read, args.engine,
+                          args.bulk_load, args.resume, None, args.max_inflight_mb, args.commit_rows, args.commit_seconds,
+                          args.workers, args.aggregate_links)
+            print >>sys.stderr
+            print >>sys.stderr, 'Compressing database'
+            compress_file(dbpath, args.output, args.zip_threads)
+            os.remove(dbpath)
+
+    elif args.action == 'merge-db':
+        if not ask_overwrite(args.output):
+            sys.exit(0)
+
+        dbpath = os.path.join(tmpdir, 'db.db') if args.compress else args.output
+        if not merge_shards(dbpath, args.shards):
+            sys.exit(1)
+        if args.compress:
             print >>sys.stderr
             print >>sys.stderr, 'Compressing database'
-            compress_file(dbpath, args.output)
+            compress_file(dbpath, args.output, args.zip_threads)
 
     elif args.action == 'db2abbr-db':
-        with AutoZip(args.input, tmpdir) as dbpath:
-            make_abbrevs(dbpath)
+        zipped = AutoZip(args.input, tmpdir, threads=args.zip_threads)
+        with zipped as dbpath:
+            make_abbrevs(dbpath, args.threads)
+            if zipped.is_compressed():
+                # export the abbreviations for abbr-db2list
+                export_path = os.path.join(tmpdir, 'abbrev.tsv')
+                database_to_file(dbpath, export_path)
+        # the sidecar is stamped with the final archive
+        if zipped.is_compressed():
+            write_sidecar(args.input, 'abbrev', export_path)
 
     elif args.action == 'zim2abbr-db':
-        if not ask_overwrite(args.output):
+        if not args.resume and not ask_overwrite(args.output):
             sys.exit(0)
 
         if args.compress:
-            dbpath = os.path.join(tmpdir, 'abbr-db.db')
+            dbpath = partial_path(args.tmp, args.output)
+            if not args.resume and os.path.exists(dbpath):
+                os.remove(dbpath)
         else:
             dbpath = args.output
 
-        extract_links(args.input, dbpath, args.threads)
+        extract_links(args.input, dbpath, args.threads, args.batch_size, args.direct_read, args.engine,
+                      args.bulk_load, args.resume, None, args.max_inflight_mb, args.commit_rows, args.commit_seconds,
+                      args.workers, args.aggregate_links)
         print >>sys.stderr
-        make_abbrevs(dbpath)
+        make_abbrevs(dbpath, args.threads)
 
         if args.compress:
             print >>sys.stderr
             print >>sys.stderr, 'Compressing database'
-            compress_file(dbpath, args.output)
+            compress_file(dbpath, args.output, args.zip_threads)
+            export_path = os.path.join(tmpdir, 'abbrev.tsv')
+            database_to_file(dbpath, export_path)
+            write_sidecar(args.output, 'abbrev', export_path)
+            os.remove(dbpath)
+
+    elif args.action == 'zim-update':
+        zipped = AutoZip(args.db, tmpdir, threads=args.zip_threads)
+        with zipped as dbpath:
+            # the new database replaces the old one once it is complete
+            new_path = dbpath + '.update'
+            if os.path.exists(new_path):
+                os.remove(new_path)
+            if not update_links(args.input, dbpath, new_path, args.threads, args.batch_size, args.direct_read,
+                                args.engine, args.max_inflight_mb, args.commit_rows, args.commit_seconds, args.workers):
+                sys.exit(1)
+            print >>sys.stderr
+            make_abbrevs(new_path, args.threads, old_path=dbpath)
+            os.rename(new_path, dbpath)
+            if zipped.is_compressed():
+                export_path = os.path.join(tmpdir, 'abbrev.tsv')
+                database_to_file(dbpath, export_path)
+        if zipped.is_compressed():
+            write_sidecar(args.db, 'abbrev', export_path)
 
     elif args.action == 'abbr-db2list':
         if args.output == '-':
@@ -138,8 +266,15 @@ try:
                 sys.exit(0)
             out_f = UTF8Writer(open(args.output, 'w'))
 
-        with AutoZip(args.input, tmpdir, readonly=True) as dbpath:
-            database_to_text(dbpath, out_f)
+        zipped = AutoZip(args.input, tmpdir, readonly=True)
+        # the sidecar has no counts
+        sidecar = None if args.counts else zipped.open_sidecar('abbrev')
+        if sidecar is not None:
+            with closing(sidecar):
+                shutil.copyfileobj(codecs.getreader('utf8')(sidecar), out_f, buffer_size)
+        else:
+            with zipped as dbpath:
+                database_to_text(dbpath, out_f, args.counts)
 
         if out_f is not sys.stdout:
             out_f.close()
@@ -152,16 +287,26 @@ try:
                 sys.exit(0)
             out_f = UTF8Writer(open(args.output, 'w'))
 
-        dbpath = os.path.join(tmpdir, 'abbr-db.db')
+        if args.stream:
+            extract_abbrevs(args.input, out_f, tmpdir, args.threads, args.batch_size, args.direct_read, args.engine,
+                            args.sort_memory, args.max_inflight_mb, args.workers, args.redirects_only)
+        else:
+            dbpath = os.path.join(tmpdir, 'abbr-db.db')
 
-        extract_links(args.input, dbpath, args.threads)
-        print >>sys.stderr
-        make_abbrevs(dbpath)
-        print >>sys.stderr
-        database_to_text(dbpath, out_f)
+            # the database is temporary, so the links are only counted
+            extract_links(args.input, dbpath, args.threads, args.batch_size, args.direct_read, args.engine, args.bulk_load,
+                          False, None, args.max_inflight_mb, args.commit_rows, args.commit_seconds, args.workers, True,
+                          args.redirects_only)
+            print >>sys.stderr
+            make_abbrevs(dbpath, args.threads)
+            print >>sys.stderr
+            database_to_text(dbpath, out_f, args.counts)
 
         if out_f is not sys.stdout:
             out_f.close()
 
 finally:
+    if args.profile is not None:
+        stop_profile(args.profile)
+    metrics.close()
     shutil.rmtree(tmpdir)
@@ -0,0 +1,195 @@
+"""
+Compiled versions of `normalize` and `check_abbr` from `abbrev_processor`.
+They must give exactly the same results as the pure-Python versions there,
+which are used when this module is not available.
+"""
+
+from cpython.unicode cimport (PyUnicode_AS_UNICODE, PyUnicode_FromUnicode,
+    Py_UNICODE_ISALNUM, Py_UNICODE_ISDECIMAL, Py_UNICODE_ISSPACE,
+    Py_UNICODE_TOLOWER)
+from libc.stdlib cimport malloc, free
+import re
+
+# the same as abbrev_processor.re_brackets
+re_brackets = re.compile(r'\s*\(.*\)\s*')
+
+memo_size = 100000
+normalized_memo = {}
+
+
+# The regular expressions in abbrev_processor.tokenize are compiled without
+# re.UNICODE, so \s, \d and \w only match ASCII characters there.
+
+cdef inline bint is_ascii_space(Py_UNICODE c):
+    return c == u' ' or (c >= 9 and c <= 13)
+
+cdef inline bint is_ascii_alnum(Py_UNICODE c):
+    return (c >= u'a' and c <= u'z') or (c >= u'A' and c <= u'Z') or (c >= u'0' and c <= u'9')
+
+cdef inline bint is_word(Py_UNICODE c):
+    # \w with re.UNICODE
+    return Py_UNICODE_ISALNUM(c) or c == u'_'
+
+cdef Py_ssize_t tokenized_length(Py_UNICODE* s, Py_ssize_t n):
+    """
+    Return len(tokenize(s)) without building the string. tokenize puts a
+    space before every token, strips the result and collapses whitespace.
+    Tokens never contain ASCII whitespace, so this only strips the tokens
+    that consist of a single (Unicode) whitespace character from both ends.
+    """
+    cdef Py_ssize_t i = 0, j, tok_len
+    cdef Py_ssize_t n_tokens = 0, n_chars = 0, n_pending = 0
+    cdef bint space
+    while True:
+        while i < n and is_ascii_space(s[i]):
+            i += 1
+        if i == n:
+            break
+        j = i + 1
+        if is_ascii_alnum(s[i]) or s[i] == u'-':
+            while j < n and (is_ascii_alnum(s[j]) or s[j] == u'-'):
+                j += 1
+            if j < n and s[j] == u'.':
+                j += 1
+            space = False
+        else:
+            space = Py_UNICODE_ISSPACE(s[i])
+        tok_len = j - i
+        i = j
+        if space:
+            if n_tokens > 0:
+                n_pending += 1
+        else:
+            n_tokens += n_pending + 1
+            n_chars += n_pending + tok_len
+            n_pending = 0
+    if n_tokens == 0:
+        return 0
+    return n_chars + n_tokens - 1
+
+cdef tuple _normalize(unicode txt):
+    cdef Py_ssize_t n = len(txt), i
+    cdef Py_UNICODE* s = PyUnicode_AS_UNICODE(txt)
+    cdef Py_UNICODE* letters
+    cdef Py_UNICODE* alnum
+    cdef Py_UNICODE c, low
+    cdef Py_ssize_t n_letters = 0, n_alnum = 0, word_start = -1
+    cdef list words = []
+
+    letters = <Py_UNICODE*>malloc(2 * n * sizeof(Py_UNICODE) + 1)
+    if letters == NULL:
+        raise MemoryError()
+    alnum = letters + n
+    try:
+        # Words are the runs of word characters in the tokenized string.
+        # Runs of ASCII alphanumeric characters stay together in one token
+        # and any other word character is a token of its own.
+        for i in range(n):
+            c = s[i]
+            if not is_word(c):
+                if word_start >= 0:
+                    words.append(PyUnicode_FromUnicode(alnum + word_start, n_alnum - word_start))
+                    word_start = -1
+                continue
+            low = <Py_UNICODE>Py_UNICODE_TOLOWER(c)
+            if not Py_UNICODE_ISDECIMAL(c) and c != u'_':
+                letters[n_letters] = low
+                n_letters += 1
+            if is_ascii_alnum(c):
+                if word_start < 0:
+                    word_start = n_alnum
+                alnum[n_alnum] = low
+                n_alnum += 1
+            else:
+                if word_start >= 0:
+                    words.append(PyUnicode_FromUnicode(alnum + word_start, n_alnum - word_start))
+                    word_start = -1
+                alnum[n_alnum] = low
+                n_alnum += 1
+                words.append(PyUnicode_FromUnicode(alnum + n_alnum - 1, 1))
+        if word_start >= 0:
+            words.append(PyUnicode_FromUnicode(alnum + word_start, n_alnum - word_start))
+
+        return (tokenized_length(s, n),
+                PyUnicode_FromUnicode(letters, n_letters),
+                PyUnicode_FromUnicode(alnum, n_alnum),
+                words)
+    finally:
+        free(letters)
+
+def normalize(txt):
+    """
+    Return the representation of `txt` used by `check_abbr`. See
+    `abbrev_processor.normalize`.
+    """
+    try:
+        return normalized_memo[txt]
+    except KeyError:
+        pass
+
+    norm = _normalize(unicode(txt))
+
+    if len(normalized_memo) >= memo_size:
+        normalized_memo.clear()
+    normalized_memo[txt] = norm
+    return norm
+
+cdef bint match(unicode abbr_alnum, list exp_words):
+    """
+    Return True if `abbr_alnum` is a subsequence of the concatenated
+    `exp_words` and its first character is the first character of a word.
+    """
+    cdef Py_UNICODE* a = PyUnicode_AS_UNICODE(abbr_alnum)
+    cdef Py_ssize_t n = len(abbr_alnum), j = 0, k, m
+    cdef Py_UNICODE* w
+    cdef unicode word
+    for word in exp_words:
+        w = PyUnicode_AS_UNICODE(word)
+        m = len(word)
+        k = 0
+        if j == 0:
+            if w[0] != a[0]:
+                continue
+            j = 1
+            k = 1
+        while k < m:
+            if a[j] == w[k]:
+                j += 1
+                if j == n:
+                    return True
+            k += 1
+    return False
+
+def check_abbr(abbr, exp):
+    """
+    Return True if `abbr` is an abbreviation of `exp`. See
+    `abbrev_processor.check_abbr`.
+    """
+    if u'(' in abbr:
+        abbr = re_brackets.sub(u'', abbr)
+    if u'(' in exp:
+        exp = re_brackets.sub(u'', exp)
+
+    if len(abbr) == len(exp):
+        return False
+
+    if len(abbr) > len(exp):
+        abbr, exp = exp, abbr
+
+    cdef Py_ssize_t abbr_len
+    cdef unicode abbr_letters, abbr_alnum
+    abbr_len, abbr_letters, abbr_alnum, _ = normalize(abbr)
+
+    if abbr_len < 2 or len(abbr_letters) == 0 or len(abbr_alnum) < abbr_len:
+        return False
+
+    cdef unicode exp_letters
+    cdef list exp_words
+    _, exp_letters, _, exp_words = normalize(exp)
+
+    if abbr_letters in exp_letters:
+        return False
+    if abbr_alnum in exp_words:
+        return False
+
+    return match(abbr_alnum, exp_words)
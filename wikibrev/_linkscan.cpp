@@ -0,0 +1,11207 @@
+/* Generated by Cython 0.29.36 */
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
+    #error Cython requires Python 2.6+ or Python 3.3+.
+#else
+#define CYTHON_ABI "0_29_36"
+#define CYTHON_HEX_VERSION 0x001D24F0
+#define CYTHON_FUTURE_DIVISION 0
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef HAVE_LONG_LONG
+  #if PY_VERSION_HEX >= 0x02070000
+    #define HAVE_LONG_LONG
+  #endif
+#endif
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#ifdef PYPY_VERSION
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PYSTON_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_ASYNC_SLOTS
+  #define CYTHON_USE_ASYNC_SLOTS 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #elif !defined(CYTHON_USE_PYTYPE_LOOKUP)
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #if PY_MAJOR_VERSION < 3
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
+  #endif
+  #ifndef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
+  #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+#endif
+#if !defined(CYTHON_FAST_PYCCALL)
+#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_MAYBE_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_MAYBE_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#ifdef _MSC_VER
+    #ifndef _MSC_STDINT_H_
+        #if _MSC_VER < 1300
+           typedef unsigned char     uint8_t;
+           typedef unsigned int      uint32_t;
+        #else
+           typedef unsigned __int8   uint8_t;
+           typedef unsigned __int32  uint32_t;
+        #endif
+    #endif
+#else
+   #include <stdint.h>
+#endif
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus) && __cplusplus >= 201103L
+    #if __has_cpp_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH [[fallthrough]]
+    #elif __has_cpp_attribute(clang::fallthrough)
+      #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+    #elif __has_cpp_attribute(gnu::fallthrough)
+      #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__ ) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+
+#ifndef __cplusplus
+  #error "Cython files generated with the C++ option must be compiled with a C++ compiler."
+#endif
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #else
+    #define CYTHON_INLINE inline
+  #endif
+#endif
+template<typename T>
+void __Pyx_call_destructor(T& x) {
+    x.~T();
+}
+template<typename T>
+class __Pyx_FakeReference {
+  public:
+    __Pyx_FakeReference() : ptr(NULL) { }
+    __Pyx_FakeReference(const T& ref) : ptr(const_cast<T*>(&ref)) { }
+    T *operator->() { return ptr; }
+    T *operator&() { return ptr; }
+    operator T&() { return *ptr; }
+    template<typename U> bool operator ==(U other) { return *ptr == other; }
+    template<typename U> bool operator !=(U other) { return *ptr != other; }
+  private:
+    T *ptr;
+};
+
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#if PY_MAJOR_VERSION < 3
+  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyClass_Type
+#else
+  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
+  #define __Pyx_DefaultClassType PyType_Type
+#endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
+  #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+#endif
+#if CYTHON_FAST_PYCCALL
+#define __Pyx_PyFastCFunction_Check(func)\
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
+#else
+#define __Pyx_PyFastCFunction_Check(func) 0
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
+#if CYTHON_COMPILING_IN_PYSTON
+  #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if !CYTHON_FAST_THREAD_STATE || PY_VERSION_HEX < 0x02070000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x03060000
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#elif PY_VERSION_HEX >= 0x03000000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+#endif
+#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
+#include "pythread.h"
+#define Py_tss_NEEDS_INIT 0
+typedef int Py_tss_t;
+static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
+  *key = PyThread_create_key();
+  return 0;
+}
+static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
+  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
+  *key = Py_tss_NEEDS_INIT;
+  return key;
+}
+static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
+  PyObject_Free(key);
+}
+static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
+  return *key != Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
+  PyThread_delete_key(*key);
+  *key = Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
+  return PyThread_set_key_value(*key, value);
+}
+static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
+  return PyThread_get_key_value(*key);
+}
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStr(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+#else
+#define __Pyx_PyDict_GetItemStr(dict, name)  PyDict_GetItem(dict, name)
+#endif
+#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
+  #define CYTHON_PEP393_ENABLED 1
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+#else
+  #define CYTHON_PEP393_ENABLED 0
+  #define PyUnicode_1BYTE_KIND  1
+  #define PyUnicode_2BYTE_KIND  2
+  #define PyUnicode_4BYTE_KIND  4
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
+  #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
+  #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyByteArray_Check)
+  #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
+  #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+#endif
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
+#else
+  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
+#endif
+#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
+  #define PyObject_ASCII(o)            PyObject_Repr(o)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBaseString_Type            PyUnicode_Type
+  #define PyStringObject               PyUnicodeObject
+  #define PyString_Type                PyUnicode_Type
+  #define PyString_Check               PyUnicode_Check
+  #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
+  #define PyObject_Unicode             PyObject_Str
+#endif
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
+  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
+#else
+  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
+  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
+#endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+#else
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyIntObject                  PyLongObject
+  #define PyInt_Type                   PyLong_Type
+  #define PyInt_Check(op)              PyLong_Check(op)
+  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
+  #define PyInt_FromString             PyLong_FromString
+  #define PyInt_FromUnicode            PyLong_FromUnicode
+  #define PyInt_FromLong               PyLong_FromLong
+  #define PyInt_FromSize_t             PyLong_FromSize_t
+  #define PyInt_FromSsize_t            PyLong_FromSsize_t
+  #define PyInt_AsLong                 PyLong_AsLong
+  #define PyInt_AS_LONG                PyLong_AS_LONG
+  #define PyInt_AsSsize_t              PyLong_AsSsize_t
+  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
+  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+  #define PyNumber_Int                 PyNumber_Long
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBoolObject                 PyLongObject
+#endif
+#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
+  #ifndef PyUnicode_InternFromString
+    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+  #endif
+#endif
+#if PY_VERSION_HEX < 0x030200A4
+  typedef long Py_hash_t;
+  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
+#else
+  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
+#else
+  #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
+#endif
+#if CYTHON_USE_ASYNC_SLOTS
+  #if PY_VERSION_HEX >= 0x030500B1
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+  #else
+    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+  #endif
+#else
+  #define __Pyx_PyType_AsAsync(obj) NULL
+#endif
+#ifndef __Pyx_PyAsyncMethodsStruct
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+    } __Pyx_PyAsyncMethodsStruct;
+#endif
+
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#ifdef NAN
+#define __PYX_NAN() ((float) NAN)
+#else
+static CYTHON_INLINE float __PYX_NAN() {
+  float value;
+  memset(&value, 0xFF, sizeof(value));
+  return value;
+}
+#endif
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
+#ifndef __PYX_EXTERN_C
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
+
+#define __PYX_HAVE__wikibrev___linkscan
+#define __PYX_HAVE_API__wikibrev___linkscan
+/* Early includes */
+#include <string.h>
+#include <string>
+#include "ios"
+#include "new"
+#include "stdexcept"
+#include "typeinfo"
+#include <vector>
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
+                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
+
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#else
+    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
+#endif
+#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyObject_AsWritableString(s)    ((char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
+    const Py_UNICODE *u_end = u;
+    while (*u_end++) ;
+    return (size_t)(u_end - u - 1);
+}
+#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
+#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
+#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#else
+#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#endif
+#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#else
+#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
+#endif
+#define __Pyx_PyNumber_Float(x) (PyFloat_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Float(x))
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+static int __Pyx_sys_getdefaultencoding_not_ascii;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    PyObject* ascii_chars_u = NULL;
+    PyObject* ascii_chars_b = NULL;
+    const char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    if (strcmp(default_encoding_c, "ascii") == 0) {
+        __Pyx_sys_getdefaultencoding_not_ascii = 0;
+    } else {
+        char ascii_chars[128];
+        int c;
+        for (c = 0; c < 128; c++) {
+            ascii_chars[c] = c;
+        }
+        __Pyx_sys_getdefaultencoding_not_ascii = 1;
+        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
+        if (!ascii_chars_u) goto bad;
+        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
+        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
+            PyErr_Format(
+                PyExc_ValueError,
+                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
+                default_encoding_c);
+            goto bad;
+        }
+        Py_DECREF(ascii_chars_u);
+        Py_DECREF(ascii_chars_b);
+    }
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    Py_XDECREF(ascii_chars_u);
+    Py_XDECREF(ascii_chars_b);
+    return -1;
+}
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#else
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+static char* __PYX_DEFAULT_STRING_ENCODING;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
+    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
+    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    return -1;
+}
+#endif
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+
+static PyObject *__pyx_m = NULL;
+static PyObject *__pyx_d;
+static PyObject *__pyx_b;
+static PyObject *__pyx_cython_runtime = NULL;
+static PyObject *__pyx_empty_tuple;
+static PyObject *__pyx_empty_bytes;
+static PyObject *__pyx_empty_unicode;
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * __pyx_cfilenm= __FILE__;
+static const char *__pyx_filename;
+
+
+static const char *__pyx_f[] = {
+  "wikibrev/_linkscan.pyx",
+  "stringsource",
+};
+/* ForceInitThreads.proto */
+#ifndef __PYX_FORCE_INIT_THREADS
+  #define __PYX_FORCE_INIT_THREADS 0
+#endif
+
+/* NoFastGil.proto */
+#define __Pyx_PyGILState_Ensure PyGILState_Ensure
+#define __Pyx_PyGILState_Release PyGILState_Release
+#define __Pyx_FastGIL_Remember()
+#define __Pyx_FastGIL_Forget()
+#define __Pyx_FastGilFuncInit()
+
+
+/*--- Type declarations ---*/
+struct __pyx_t_8wikibrev_9_linkscan_Attr;
+struct __pyx_t_8wikibrev_9_linkscan_Scanner;
+
+/* "wikibrev/_linkscan.pyx":115
+ * 
+ * 
+ * cdef struct Attr:             # <<<<<<<<<<<<<<
+ *     bint present
+ *     Py_ssize_t start
+ */
+struct __pyx_t_8wikibrev_9_linkscan_Attr {
+  int present;
+  Py_ssize_t start;
+  Py_ssize_t end;
+};
+
+/* "wikibrev/_linkscan.pyx":120
+ *     Py_ssize_t end
+ * 
+ * cdef struct Scanner:             # <<<<<<<<<<<<<<
+ *     const char* d
+ *     Py_ssize_t n
+ */
+struct __pyx_t_8wikibrev_9_linkscan_Scanner {
+  char const *d;
+  Py_ssize_t n;
+  int fallback;
+  int is_link;
+  std::string link_url;
+  std::string link_text;
+  std::vector<std::string>  elem_stack;
+  int forb_depth;
+  std::vector<std::string>  urls;
+  std::vector<std::string>  texts;
+};
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, int);
+    void (*DECREF)(void*, PyObject*, int);
+    void (*GOTREF)(void*, PyObject*, int);
+    void (*GIVEREF)(void*, PyObject*, int);
+    void* (*SetupContext)(const char*, int, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+#ifdef WITH_THREAD
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+          }
+#else
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
+#endif
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* WriteUnraisableException.proto */
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil);
+
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
+#endif
+
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* ListCompAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len)) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* IncludeCppStringH.proto */
+#include <string>
+
+/* decode_c_string_utf16.proto */
+static CYTHON_INLINE PyObject *__Pyx_PyUnicode_DecodeUTF16(const char *s, Py_ssize_t size, const char *errors) {
+    int byteorder = 0;
+    return PyUnicode_DecodeUTF16(s, size, errors, &byteorder);
+}
+static CYTHON_INLINE PyObject *__Pyx_PyUnicode_DecodeUTF16LE(const char *s, Py_ssize_t size, const char *errors) {
+    int byteorder = -1;
+    return PyUnicode_DecodeUTF16(s, size, errors, &byteorder);
+}
+static CYTHON_INLINE PyObject *__Pyx_PyUnicode_DecodeUTF16BE(const char *s, Py_ssize_t size, const char *errors) {
+    int byteorder = 1;
+    return PyUnicode_DecodeUTF16(s, size, errors, &byteorder);
+}
+
+/* decode_c_bytes.proto */
+static CYTHON_INLINE PyObject* __Pyx_decode_c_bytes(
+         const char* cstring, Py_ssize_t length, Py_ssize_t start, Py_ssize_t stop,
+         const char* encoding, const char* errors,
+         PyObject* (*decode_func)(const char *s, Py_ssize_t size, const char *errors));
+
+/* decode_cpp_string.proto */
+static CYTHON_INLINE PyObject* __Pyx_decode_cpp_string(
+         std::string cppstring, Py_ssize_t start, Py_ssize_t stop,
+         const char* encoding, const char* errors,
+         PyObject* (*decode_func)(const char *s, Py_ssize_t size, const char *errors)) {
+    return __Pyx_decode_c_bytes(
+        cppstring.data(), cppstring.size(), start, stop, encoding, errors, decode_func);
+}
+
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* CLineInTraceback.proto */
+#ifdef CYTHON_CLINE_IN_TRACEBACK
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#else
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#endif
+
+/* CodeObjectCache.proto */
+typedef struct {
+    PyCodeObject* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+};
+static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static PyCodeObject *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* CppExceptionConversion.proto */
+#ifndef __Pyx_CppExn2PyErr
+#include <new>
+#include <typeinfo>
+#include <stdexcept>
+#include <ios>
+static void __Pyx_CppExn2PyErr() {
+  try {
+    if (PyErr_Occurred())
+      ; // let the latest Python exn pass through and ignore the current one
+    else
+      throw;
+  } catch (const std::bad_alloc& exn) {
+    PyErr_SetString(PyExc_MemoryError, exn.what());
+  } catch (const std::bad_cast& exn) {
+    PyErr_SetString(PyExc_TypeError, exn.what());
+  } catch (const std::bad_typeid& exn) {
+    PyErr_SetString(PyExc_TypeError, exn.what());
+  } catch (const std::domain_error& exn) {
+    PyErr_SetString(PyExc_ValueError, exn.what());
+  } catch (const std::invalid_argument& exn) {
+    PyErr_SetString(PyExc_ValueError, exn.what());
+  } catch (const std::ios_base::failure& exn) {
+    PyErr_SetString(PyExc_IOError, exn.what());
+  } catch (const std::out_of_range& exn) {
+    PyErr_SetString(PyExc_IndexError, exn.what());
+  } catch (const std::overflow_error& exn) {
+    PyErr_SetString(PyExc_OverflowError, exn.what());
+  } catch (const std::range_error& exn) {
+    PyErr_SetString(PyExc_ArithmeticError, exn.what());
+  } catch (const std::underflow_error& exn) {
+    PyErr_SetString(PyExc_ArithmeticError, exn.what());
+  } catch (const std::exception& exn) {
+    PyErr_SetString(PyExc_RuntimeError, exn.what());
+  }
+  catch (...)
+  {
+    PyErr_SetString(PyExc_RuntimeError, "Unknown exception");
+  }
+}
+#endif
+
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#endif
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(void);
+
+/* InitStrings.proto */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
+
+
+/* Module declarations from 'libc.string' */
+
+/* Module declarations from 'libcpp.string' */
+
+/* Module declarations from 'libcpp.vector' */
+
+/* Module declarations from 'cpython.buffer' */
+
+/* Module declarations from 'wikibrev._linkscan' */
+static CYTHON_INLINE int __pyx_f_8wikibrev_9_linkscan_is_space(char); /*proto*/
+static CYTHON_INLINE int __pyx_f_8wikibrev_9_linkscan_is_letter(char); /*proto*/
+static CYTHON_INLINE int __pyx_f_8wikibrev_9_linkscan_is_alnum(char); /*proto*/
+static CYTHON_INLINE int __pyx_f_8wikibrev_9_linkscan_is_hex(char); /*proto*/
+static CYTHON_INLINE int __pyx_f_8wikibrev_9_linkscan_is_word(char); /*proto*/
+static CYTHON_INLINE char __pyx_f_8wikibrev_9_linkscan_ascii_lower(char); /*proto*/
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_unicode_space_len(unsigned char const *, Py_ssize_t, Py_ssize_t); /*proto*/
+static void __pyx_f_8wikibrev_9_linkscan_strip(char const *, Py_ssize_t *, Py_ssize_t *); /*proto*/
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_find(char const *, char, Py_ssize_t, Py_ssize_t); /*proto*/
+static CYTHON_INLINE int __pyx_f_8wikibrev_9_linkscan_starts_with(char const *, Py_ssize_t, Py_ssize_t, char const *, Py_ssize_t); /*proto*/
+static int __pyx_f_8wikibrev_9_linkscan_equals_lower(char const *, Py_ssize_t, Py_ssize_t, char const *, Py_ssize_t); /*proto*/
+static int __pyx_f_8wikibrev_9_linkscan_is_ascii(char const *, Py_ssize_t, Py_ssize_t); /*proto*/
+static void __pyx_f_8wikibrev_9_linkscan_text(struct __pyx_t_8wikibrev_9_linkscan_Scanner *, Py_ssize_t, Py_ssize_t); /*proto*/
+static int __pyx_f_8wikibrev_9_linkscan_has_word(char const *, Py_ssize_t, Py_ssize_t, char const *, Py_ssize_t); /*proto*/
+static int __pyx_f_8wikibrev_9_linkscan_has_class(char const *, Py_ssize_t, Py_ssize_t, char const *, Py_ssize_t); /*proto*/
+static int __pyx_f_8wikibrev_9_linkscan_is_forbidden_id(char const *, Py_ssize_t, Py_ssize_t); /*proto*/
+static void __pyx_f_8wikibrev_9_linkscan_start_tag(struct __pyx_t_8wikibrev_9_linkscan_Scanner *, std::string const &, struct __pyx_t_8wikibrev_9_linkscan_Attr *, struct __pyx_t_8wikibrev_9_linkscan_Attr *, struct __pyx_t_8wikibrev_9_linkscan_Attr *); /*proto*/
+static void __pyx_f_8wikibrev_9_linkscan_end_tag(struct __pyx_t_8wikibrev_9_linkscan_Scanner *, std::string const &); /*proto*/
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_skip_trailer(char const *, Py_ssize_t, Py_ssize_t); /*proto*/
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_bare_value_end(char const *, Py_ssize_t, Py_ssize_t); /*proto*/
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_match_value(char const *, Py_ssize_t, Py_ssize_t, struct __pyx_t_8wikibrev_9_linkscan_Attr *); /*proto*/
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_match_attr(char const *, Py_ssize_t, Py_ssize_t, struct __pyx_t_8wikibrev_9_linkscan_Attr *, struct __pyx_t_8wikibrev_9_linkscan_Attr *); /*proto*/
+static CYTHON_INLINE int __pyx_f_8wikibrev_9_linkscan_is_tag_name_char(char); /*proto*/
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_locate_starttag_end(char const *, Py_ssize_t, Py_ssize_t); /*proto*/
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_scan_starttag(struct __pyx_t_8wikibrev_9_linkscan_Scanner *, Py_ssize_t, std::string *); /*proto*/
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_match_endtag(char const *, Py_ssize_t, Py_ssize_t, Py_ssize_t *); /*proto*/
+static std::string __pyx_f_8wikibrev_9_linkscan_lower_name(struct __pyx_t_8wikibrev_9_linkscan_Scanner *, Py_ssize_t, Py_ssize_t); /*proto*/
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_scan_endtag(struct __pyx_t_8wikibrev_9_linkscan_Scanner *, Py_ssize_t, int, int *); /*proto*/
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_search_cdata_end(char const *, Py_ssize_t, Py_ssize_t, std::string const &); /*proto*/
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_search_comment_end(char const *, Py_ssize_t, Py_ssize_t); /*proto*/
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_match_charref(char const *, Py_ssize_t, Py_ssize_t); /*proto*/
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_match_entityref(char const *, Py_ssize_t, Py_ssize_t); /*proto*/
+static void __pyx_f_8wikibrev_9_linkscan_scan(struct __pyx_t_8wikibrev_9_linkscan_Scanner *); /*proto*/
+static CYTHON_INLINE PyObject *__pyx_convert_PyObject_string_to_py_std__in_string(std::string const &); /*proto*/
+static CYTHON_INLINE PyObject *__pyx_convert_PyUnicode_string_to_py_std__in_string(std::string const &); /*proto*/
+static CYTHON_INLINE PyObject *__pyx_convert_PyStr_string_to_py_std__in_string(std::string const &); /*proto*/
+static CYTHON_INLINE PyObject *__pyx_convert_PyBytes_string_to_py_std__in_string(std::string const &); /*proto*/
+static CYTHON_INLINE PyObject *__pyx_convert_PyByteArray_string_to_py_std__in_string(std::string const &); /*proto*/
+#define __Pyx_MODULE_NAME "wikibrev._linkscan"
+extern int __pyx_module_is_main_wikibrev___linkscan;
+int __pyx_module_is_main_wikibrev___linkscan = 0;
+
+/* Implementation of 'wikibrev._linkscan' */
+static PyObject *__pyx_builtin_range;
+static const char __pyx_k_i[] = "i";
+static const char __pyx_k_s[] = "s";
+static const char __pyx_k_data[] = "data";
+static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_name[] = "__name__";
+static const char __pyx_k_page[] = "page";
+static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_range[] = "range";
+static const char __pyx_k_utf_8[] = "utf-8";
+static const char __pyx_k_encode[] = "encode";
+static const char __pyx_k_scan_links[] = "scan_links";
+static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_wikibrev__linkscan[] = "wikibrev._linkscan";
+static const char __pyx_k_wikibrev__linkscan_pyx[] = "wikibrev/_linkscan.pyx";
+static const char __pyx_k_A_compiled_version_of_the_token[] = "\nA compiled version of the tokenizer of `link_extractor.WikiLinkScanner` and of\nthe part of `WikiLinkHandler` that tracks the open elements and the links. It\nscans the UTF-8 encoded page without the GIL, so that worker threads can scan\npages at the same time.\n\n`scan_links` must find exactly the links that `WikiLinkScanner` would pass to\n`WikiLinkHandler.add_link`. Pages with constructs that it does not reproduce\n(character references in the kept attributes, attributes without a value,\nnon-ASCII tag or attribute names and marked sections) are left to\n`WikiLinkScanner`.\n";
+static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_s_data;
+static PyObject *__pyx_n_s_encode;
+static PyObject *__pyx_n_s_i;
+static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_name;
+static PyObject *__pyx_n_s_page;
+static PyObject *__pyx_n_s_range;
+static PyObject *__pyx_n_s_s;
+static PyObject *__pyx_n_s_scan_links;
+static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_kp_s_utf_8;
+static PyObject *__pyx_n_s_wikibrev__linkscan;
+static PyObject *__pyx_kp_s_wikibrev__linkscan_pyx;
+static PyObject *__pyx_pf_8wikibrev_9_linkscan_scan_links(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_data); /* proto */
+static PyObject *__pyx_tuple_;
+static PyObject *__pyx_codeobj__2;
+/* Late includes */
+
+/* "wikibrev/_linkscan.pyx":24
+ * # strings use the Unicode whitespace.
+ * 
+ * cdef inline bint is_space(char c) nogil:             # <<<<<<<<<<<<<<
+ *     return c == b' ' or (c >= 9 and c <= 13)
+ * 
+ */
+
+static CYTHON_INLINE int __pyx_f_8wikibrev_9_linkscan_is_space(char __pyx_v_c) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "wikibrev/_linkscan.pyx":25
+ * 
+ * cdef inline bint is_space(char c) nogil:
+ *     return c == b' ' or (c >= 9 and c <= 13)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline bint is_letter(char c) nogil:
+ */
+  __pyx_t_2 = ((__pyx_v_c == ' ') != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L3_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_c >= 9) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L3_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_c <= 13) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L3_bool_binop_done:;
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":24
+ * # strings use the Unicode whitespace.
+ * 
+ * cdef inline bint is_space(char c) nogil:             # <<<<<<<<<<<<<<
+ *     return c == b' ' or (c >= 9 and c <= 13)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":27
+ *     return c == b' ' or (c >= 9 and c <= 13)
+ * 
+ * cdef inline bint is_letter(char c) nogil:             # <<<<<<<<<<<<<<
+ *     return (c >= b'a' and c <= b'z') or (c >= b'A' and c <= b'Z')
+ * 
+ */
+
+static CYTHON_INLINE int __pyx_f_8wikibrev_9_linkscan_is_letter(char __pyx_v_c) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "wikibrev/_linkscan.pyx":28
+ * 
+ * cdef inline bint is_letter(char c) nogil:
+ *     return (c >= b'a' and c <= b'z') or (c >= b'A' and c <= b'Z')             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline bint is_alnum(char c) nogil:
+ */
+  __pyx_t_2 = ((__pyx_v_c >= 'a') != 0);
+  if (!__pyx_t_2) {
+    goto __pyx_L4_next_or;
+  } else {
+  }
+  __pyx_t_2 = ((__pyx_v_c <= 'z') != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L3_bool_binop_done;
+  }
+  __pyx_L4_next_or:;
+  __pyx_t_2 = ((__pyx_v_c >= 'A') != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L3_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_c <= 'Z') != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L3_bool_binop_done:;
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":27
+ *     return c == b' ' or (c >= 9 and c <= 13)
+ * 
+ * cdef inline bint is_letter(char c) nogil:             # <<<<<<<<<<<<<<
+ *     return (c >= b'a' and c <= b'z') or (c >= b'A' and c <= b'Z')
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":30
+ *     return (c >= b'a' and c <= b'z') or (c >= b'A' and c <= b'Z')
+ * 
+ * cdef inline bint is_alnum(char c) nogil:             # <<<<<<<<<<<<<<
+ *     return is_letter(c) or (c >= b'0' and c <= b'9')
+ * 
+ */
+
+static CYTHON_INLINE int __pyx_f_8wikibrev_9_linkscan_is_alnum(char __pyx_v_c) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "wikibrev/_linkscan.pyx":31
+ * 
+ * cdef inline bint is_alnum(char c) nogil:
+ *     return is_letter(c) or (c >= b'0' and c <= b'9')             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline bint is_hex(char c) nogil:
+ */
+  __pyx_t_2 = (__pyx_f_8wikibrev_9_linkscan_is_letter(__pyx_v_c) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L3_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_c >= '0') != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L3_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_c <= '9') != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L3_bool_binop_done:;
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":30
+ *     return (c >= b'a' and c <= b'z') or (c >= b'A' and c <= b'Z')
+ * 
+ * cdef inline bint is_alnum(char c) nogil:             # <<<<<<<<<<<<<<
+ *     return is_letter(c) or (c >= b'0' and c <= b'9')
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":33
+ *     return is_letter(c) or (c >= b'0' and c <= b'9')
+ * 
+ * cdef inline bint is_hex(char c) nogil:             # <<<<<<<<<<<<<<
+ *     return (c >= b'0' and c <= b'9') or (c >= b'a' and c <= b'f') or (c >= b'A' and c <= b'F')
+ * 
+ */
+
+static CYTHON_INLINE int __pyx_f_8wikibrev_9_linkscan_is_hex(char __pyx_v_c) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "wikibrev/_linkscan.pyx":34
+ * 
+ * cdef inline bint is_hex(char c) nogil:
+ *     return (c >= b'0' and c <= b'9') or (c >= b'a' and c <= b'f') or (c >= b'A' and c <= b'F')             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline bint is_word(char c) nogil:
+ */
+  __pyx_t_2 = ((__pyx_v_c >= '0') != 0);
+  if (!__pyx_t_2) {
+    goto __pyx_L4_next_or;
+  } else {
+  }
+  __pyx_t_2 = ((__pyx_v_c <= '9') != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L3_bool_binop_done;
+  }
+  __pyx_L4_next_or:;
+  __pyx_t_2 = ((__pyx_v_c >= 'a') != 0);
+  if (!__pyx_t_2) {
+    goto __pyx_L6_next_or;
+  } else {
+  }
+  __pyx_t_2 = ((__pyx_v_c <= 'f') != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L3_bool_binop_done;
+  }
+  __pyx_L6_next_or:;
+  __pyx_t_2 = ((__pyx_v_c >= 'A') != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L3_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_c <= 'F') != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L3_bool_binop_done:;
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":33
+ *     return is_letter(c) or (c >= b'0' and c <= b'9')
+ * 
+ * cdef inline bint is_hex(char c) nogil:             # <<<<<<<<<<<<<<
+ *     return (c >= b'0' and c <= b'9') or (c >= b'a' and c <= b'f') or (c >= b'A' and c <= b'F')
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":36
+ *     return (c >= b'0' and c <= b'9') or (c >= b'a' and c <= b'f') or (c >= b'A' and c <= b'F')
+ * 
+ * cdef inline bint is_word(char c) nogil:             # <<<<<<<<<<<<<<
+ *     return is_alnum(c) or c == b'_'
+ * 
+ */
+
+static CYTHON_INLINE int __pyx_f_8wikibrev_9_linkscan_is_word(char __pyx_v_c) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "wikibrev/_linkscan.pyx":37
+ * 
+ * cdef inline bint is_word(char c) nogil:
+ *     return is_alnum(c) or c == b'_'             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline char ascii_lower(char c) nogil:
+ */
+  __pyx_t_2 = (__pyx_f_8wikibrev_9_linkscan_is_alnum(__pyx_v_c) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L3_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_c == '_') != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L3_bool_binop_done:;
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":36
+ *     return (c >= b'0' and c <= b'9') or (c >= b'a' and c <= b'f') or (c >= b'A' and c <= b'F')
+ * 
+ * cdef inline bint is_word(char c) nogil:             # <<<<<<<<<<<<<<
+ *     return is_alnum(c) or c == b'_'
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":39
+ *     return is_alnum(c) or c == b'_'
+ * 
+ * cdef inline char ascii_lower(char c) nogil:             # <<<<<<<<<<<<<<
+ *     return c + 32 if c >= b'A' and c <= b'Z' else c
+ * 
+ */
+
+static CYTHON_INLINE char __pyx_f_8wikibrev_9_linkscan_ascii_lower(char __pyx_v_c) {
+  char __pyx_r;
+  long __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+
+  /* "wikibrev/_linkscan.pyx":40
+ * 
+ * cdef inline char ascii_lower(char c) nogil:
+ *     return c + 32 if c >= b'A' and c <= b'Z' else c             # <<<<<<<<<<<<<<
+ * 
+ * cdef Py_ssize_t unicode_space_len(const unsigned char* s, Py_ssize_t i, Py_ssize_t n) nogil:
+ */
+  __pyx_t_3 = ((__pyx_v_c >= 'A') != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L3_bool_binop_done;
+  }
+  __pyx_t_3 = ((__pyx_v_c <= 'Z') != 0);
+  __pyx_t_2 = __pyx_t_3;
+  __pyx_L3_bool_binop_done:;
+  if (__pyx_t_2) {
+    __pyx_t_1 = (__pyx_v_c + 32);
+  } else {
+    __pyx_t_1 = __pyx_v_c;
+  }
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":39
+ *     return is_alnum(c) or c == b'_'
+ * 
+ * cdef inline char ascii_lower(char c) nogil:             # <<<<<<<<<<<<<<
+ *     return c + 32 if c >= b'A' and c <= b'Z' else c
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":42
+ *     return c + 32 if c >= b'A' and c <= b'Z' else c
+ * 
+ * cdef Py_ssize_t unicode_space_len(const unsigned char* s, Py_ssize_t i, Py_ssize_t n) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Return the length of the UTF-8 encoded Unicode whitespace character at
+ */
+
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_unicode_space_len(unsigned char const *__pyx_v_s, Py_ssize_t __pyx_v_i, Py_ssize_t __pyx_v_n) {
+  unsigned char __pyx_v_c;
+  Py_ssize_t __pyx_r;
+  int __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  int __pyx_t_3;
+
+  /* "wikibrev/_linkscan.pyx":47
+ *     `i`, or 0 if there is none.
+ *     """
+ *     cdef unsigned char c = s[i]             # <<<<<<<<<<<<<<
+ *     if c < 0x80:
+ *         return 1 if (c >= 9 and c <= 13) or (c >= 0x1c and c <= 0x20) else 0
+ */
+  __pyx_v_c = (__pyx_v_s[__pyx_v_i]);
+
+  /* "wikibrev/_linkscan.pyx":48
+ *     """
+ *     cdef unsigned char c = s[i]
+ *     if c < 0x80:             # <<<<<<<<<<<<<<
+ *         return 1 if (c >= 9 and c <= 13) or (c >= 0x1c and c <= 0x20) else 0
+ *     if c == 0xc2 and i + 1 < n:
+ */
+  __pyx_t_1 = ((__pyx_v_c < 0x80) != 0);
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":49
+ *     cdef unsigned char c = s[i]
+ *     if c < 0x80:
+ *         return 1 if (c >= 9 and c <= 13) or (c >= 0x1c and c <= 0x20) else 0             # <<<<<<<<<<<<<<
+ *     if c == 0xc2 and i + 1 < n:
+ *         return 2 if s[i+1] == 0x85 or s[i+1] == 0xa0 else 0
+ */
+    __pyx_t_3 = ((__pyx_v_c >= 9) != 0);
+    if (!__pyx_t_3) {
+      goto __pyx_L5_next_or;
+    } else {
+    }
+    __pyx_t_3 = ((__pyx_v_c <= 13) != 0);
+    if (!__pyx_t_3) {
+    } else {
+      __pyx_t_1 = __pyx_t_3;
+      goto __pyx_L4_bool_binop_done;
+    }
+    __pyx_L5_next_or:;
+    __pyx_t_3 = ((__pyx_v_c >= 0x1c) != 0);
+    if (__pyx_t_3) {
+    } else {
+      __pyx_t_1 = __pyx_t_3;
+      goto __pyx_L4_bool_binop_done;
+    }
+    __pyx_t_3 = ((__pyx_v_c <= 0x20) != 0);
+    __pyx_t_1 = __pyx_t_3;
+    __pyx_L4_bool_binop_done:;
+    if (__pyx_t_1) {
+      __pyx_t_2 = 1;
+    } else {
+      __pyx_t_2 = 0;
+    }
+    __pyx_r = __pyx_t_2;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":48
+ *     """
+ *     cdef unsigned char c = s[i]
+ *     if c < 0x80:             # <<<<<<<<<<<<<<
+ *         return 1 if (c >= 9 and c <= 13) or (c >= 0x1c and c <= 0x20) else 0
+ *     if c == 0xc2 and i + 1 < n:
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":50
+ *     if c < 0x80:
+ *         return 1 if (c >= 9 and c <= 13) or (c >= 0x1c and c <= 0x20) else 0
+ *     if c == 0xc2 and i + 1 < n:             # <<<<<<<<<<<<<<
+ *         return 2 if s[i+1] == 0x85 or s[i+1] == 0xa0 else 0
+ *     if i + 2 >= n:
+ */
+  __pyx_t_3 = ((__pyx_v_c == 0xc2) != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L9_bool_binop_done;
+  }
+  __pyx_t_3 = (((__pyx_v_i + 1) < __pyx_v_n) != 0);
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L9_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":51
+ *         return 1 if (c >= 9 and c <= 13) or (c >= 0x1c and c <= 0x20) else 0
+ *     if c == 0xc2 and i + 1 < n:
+ *         return 2 if s[i+1] == 0x85 or s[i+1] == 0xa0 else 0             # <<<<<<<<<<<<<<
+ *     if i + 2 >= n:
+ *         return 0
+ */
+    __pyx_t_3 = (((__pyx_v_s[(__pyx_v_i + 1)]) == 0x85) != 0);
+    if (!__pyx_t_3) {
+    } else {
+      __pyx_t_1 = __pyx_t_3;
+      goto __pyx_L11_bool_binop_done;
+    }
+    __pyx_t_3 = (((__pyx_v_s[(__pyx_v_i + 1)]) == 0xa0) != 0);
+    __pyx_t_1 = __pyx_t_3;
+    __pyx_L11_bool_binop_done:;
+    if (__pyx_t_1) {
+      __pyx_t_2 = 2;
+    } else {
+      __pyx_t_2 = 0;
+    }
+    __pyx_r = __pyx_t_2;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":50
+ *     if c < 0x80:
+ *         return 1 if (c >= 9 and c <= 13) or (c >= 0x1c and c <= 0x20) else 0
+ *     if c == 0xc2 and i + 1 < n:             # <<<<<<<<<<<<<<
+ *         return 2 if s[i+1] == 0x85 or s[i+1] == 0xa0 else 0
+ *     if i + 2 >= n:
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":52
+ *     if c == 0xc2 and i + 1 < n:
+ *         return 2 if s[i+1] == 0x85 or s[i+1] == 0xa0 else 0
+ *     if i + 2 >= n:             # <<<<<<<<<<<<<<
+ *         return 0
+ *     if c == 0xe1:
+ */
+  __pyx_t_1 = (((__pyx_v_i + 2) >= __pyx_v_n) != 0);
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":53
+ *         return 2 if s[i+1] == 0x85 or s[i+1] == 0xa0 else 0
+ *     if i + 2 >= n:
+ *         return 0             # <<<<<<<<<<<<<<
+ *     if c == 0xe1:
+ *         return 3 if (s[i+1] == 0x9a and s[i+2] == 0x80) or (s[i+1] == 0xa0 and s[i+2] == 0x8e) else 0
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":52
+ *     if c == 0xc2 and i + 1 < n:
+ *         return 2 if s[i+1] == 0x85 or s[i+1] == 0xa0 else 0
+ *     if i + 2 >= n:             # <<<<<<<<<<<<<<
+ *         return 0
+ *     if c == 0xe1:
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":54
+ *     if i + 2 >= n:
+ *         return 0
+ *     if c == 0xe1:             # <<<<<<<<<<<<<<
+ *         return 3 if (s[i+1] == 0x9a and s[i+2] == 0x80) or (s[i+1] == 0xa0 and s[i+2] == 0x8e) else 0
+ *     if c == 0xe2 and s[i+1] == 0x80:
+ */
+  __pyx_t_1 = ((__pyx_v_c == 0xe1) != 0);
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":55
+ *         return 0
+ *     if c == 0xe1:
+ *         return 3 if (s[i+1] == 0x9a and s[i+2] == 0x80) or (s[i+1] == 0xa0 and s[i+2] == 0x8e) else 0             # <<<<<<<<<<<<<<
+ *     if c == 0xe2 and s[i+1] == 0x80:
+ *         return 3 if s[i+2] <= 0x8a or s[i+2] == 0xa8 or s[i+2] == 0xa9 or s[i+2] == 0xaf else 0
+ */
+    __pyx_t_3 = (((__pyx_v_s[(__pyx_v_i + 1)]) == 0x9a) != 0);
+    if (!__pyx_t_3) {
+      goto __pyx_L16_next_or;
+    } else {
+    }
+    __pyx_t_3 = (((__pyx_v_s[(__pyx_v_i + 2)]) == 0x80) != 0);
+    if (!__pyx_t_3) {
+    } else {
+      __pyx_t_1 = __pyx_t_3;
+      goto __pyx_L15_bool_binop_done;
+    }
+    __pyx_L16_next_or:;
+    __pyx_t_3 = (((__pyx_v_s[(__pyx_v_i + 1)]) == 0xa0) != 0);
+    if (__pyx_t_3) {
+    } else {
+      __pyx_t_1 = __pyx_t_3;
+      goto __pyx_L15_bool_binop_done;
+    }
+    __pyx_t_3 = (((__pyx_v_s[(__pyx_v_i + 2)]) == 0x8e) != 0);
+    __pyx_t_1 = __pyx_t_3;
+    __pyx_L15_bool_binop_done:;
+    if (__pyx_t_1) {
+      __pyx_t_2 = 3;
+    } else {
+      __pyx_t_2 = 0;
+    }
+    __pyx_r = __pyx_t_2;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":54
+ *     if i + 2 >= n:
+ *         return 0
+ *     if c == 0xe1:             # <<<<<<<<<<<<<<
+ *         return 3 if (s[i+1] == 0x9a and s[i+2] == 0x80) or (s[i+1] == 0xa0 and s[i+2] == 0x8e) else 0
+ *     if c == 0xe2 and s[i+1] == 0x80:
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":56
+ *     if c == 0xe1:
+ *         return 3 if (s[i+1] == 0x9a and s[i+2] == 0x80) or (s[i+1] == 0xa0 and s[i+2] == 0x8e) else 0
+ *     if c == 0xe2 and s[i+1] == 0x80:             # <<<<<<<<<<<<<<
+ *         return 3 if s[i+2] <= 0x8a or s[i+2] == 0xa8 or s[i+2] == 0xa9 or s[i+2] == 0xaf else 0
+ *     if c == 0xe2 and s[i+1] == 0x81:
+ */
+  __pyx_t_3 = ((__pyx_v_c == 0xe2) != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L20_bool_binop_done;
+  }
+  __pyx_t_3 = (((__pyx_v_s[(__pyx_v_i + 1)]) == 0x80) != 0);
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L20_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":57
+ *         return 3 if (s[i+1] == 0x9a and s[i+2] == 0x80) or (s[i+1] == 0xa0 and s[i+2] == 0x8e) else 0
+ *     if c == 0xe2 and s[i+1] == 0x80:
+ *         return 3 if s[i+2] <= 0x8a or s[i+2] == 0xa8 or s[i+2] == 0xa9 or s[i+2] == 0xaf else 0             # <<<<<<<<<<<<<<
+ *     if c == 0xe2 and s[i+1] == 0x81:
+ *         return 3 if s[i+2] == 0x9f else 0
+ */
+    __pyx_t_3 = (((__pyx_v_s[(__pyx_v_i + 2)]) <= 0x8a) != 0);
+    if (!__pyx_t_3) {
+    } else {
+      __pyx_t_1 = __pyx_t_3;
+      goto __pyx_L22_bool_binop_done;
+    }
+    __pyx_t_3 = (((__pyx_v_s[(__pyx_v_i + 2)]) == 0xa8) != 0);
+    if (!__pyx_t_3) {
+    } else {
+      __pyx_t_1 = __pyx_t_3;
+      goto __pyx_L22_bool_binop_done;
+    }
+    __pyx_t_3 = (((__pyx_v_s[(__pyx_v_i + 2)]) == 0xa9) != 0);
+    if (!__pyx_t_3) {
+    } else {
+      __pyx_t_1 = __pyx_t_3;
+      goto __pyx_L22_bool_binop_done;
+    }
+    __pyx_t_3 = (((__pyx_v_s[(__pyx_v_i + 2)]) == 0xaf) != 0);
+    __pyx_t_1 = __pyx_t_3;
+    __pyx_L22_bool_binop_done:;
+    if (__pyx_t_1) {
+      __pyx_t_2 = 3;
+    } else {
+      __pyx_t_2 = 0;
+    }
+    __pyx_r = __pyx_t_2;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":56
+ *     if c == 0xe1:
+ *         return 3 if (s[i+1] == 0x9a and s[i+2] == 0x80) or (s[i+1] == 0xa0 and s[i+2] == 0x8e) else 0
+ *     if c == 0xe2 and s[i+1] == 0x80:             # <<<<<<<<<<<<<<
+ *         return 3 if s[i+2] <= 0x8a or s[i+2] == 0xa8 or s[i+2] == 0xa9 or s[i+2] == 0xaf else 0
+ *     if c == 0xe2 and s[i+1] == 0x81:
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":58
+ *     if c == 0xe2 and s[i+1] == 0x80:
+ *         return 3 if s[i+2] <= 0x8a or s[i+2] == 0xa8 or s[i+2] == 0xa9 or s[i+2] == 0xaf else 0
+ *     if c == 0xe2 and s[i+1] == 0x81:             # <<<<<<<<<<<<<<
+ *         return 3 if s[i+2] == 0x9f else 0
+ *     if c == 0xe3:
+ */
+  __pyx_t_3 = ((__pyx_v_c == 0xe2) != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L27_bool_binop_done;
+  }
+  __pyx_t_3 = (((__pyx_v_s[(__pyx_v_i + 1)]) == 0x81) != 0);
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L27_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":59
+ *         return 3 if s[i+2] <= 0x8a or s[i+2] == 0xa8 or s[i+2] == 0xa9 or s[i+2] == 0xaf else 0
+ *     if c == 0xe2 and s[i+1] == 0x81:
+ *         return 3 if s[i+2] == 0x9f else 0             # <<<<<<<<<<<<<<
+ *     if c == 0xe3:
+ *         return 3 if s[i+1] == 0x80 and s[i+2] == 0x80 else 0
+ */
+    if ((((__pyx_v_s[(__pyx_v_i + 2)]) == 0x9f) != 0)) {
+      __pyx_t_2 = 3;
+    } else {
+      __pyx_t_2 = 0;
+    }
+    __pyx_r = __pyx_t_2;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":58
+ *     if c == 0xe2 and s[i+1] == 0x80:
+ *         return 3 if s[i+2] <= 0x8a or s[i+2] == 0xa8 or s[i+2] == 0xa9 or s[i+2] == 0xaf else 0
+ *     if c == 0xe2 and s[i+1] == 0x81:             # <<<<<<<<<<<<<<
+ *         return 3 if s[i+2] == 0x9f else 0
+ *     if c == 0xe3:
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":60
+ *     if c == 0xe2 and s[i+1] == 0x81:
+ *         return 3 if s[i+2] == 0x9f else 0
+ *     if c == 0xe3:             # <<<<<<<<<<<<<<
+ *         return 3 if s[i+1] == 0x80 and s[i+2] == 0x80 else 0
+ *     return 0
+ */
+  __pyx_t_1 = ((__pyx_v_c == 0xe3) != 0);
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":61
+ *         return 3 if s[i+2] == 0x9f else 0
+ *     if c == 0xe3:
+ *         return 3 if s[i+1] == 0x80 and s[i+2] == 0x80 else 0             # <<<<<<<<<<<<<<
+ *     return 0
+ * 
+ */
+    __pyx_t_3 = (((__pyx_v_s[(__pyx_v_i + 1)]) == 0x80) != 0);
+    if (__pyx_t_3) {
+    } else {
+      __pyx_t_1 = __pyx_t_3;
+      goto __pyx_L30_bool_binop_done;
+    }
+    __pyx_t_3 = (((__pyx_v_s[(__pyx_v_i + 2)]) == 0x80) != 0);
+    __pyx_t_1 = __pyx_t_3;
+    __pyx_L30_bool_binop_done:;
+    if (__pyx_t_1) {
+      __pyx_t_2 = 3;
+    } else {
+      __pyx_t_2 = 0;
+    }
+    __pyx_r = __pyx_t_2;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":60
+ *     if c == 0xe2 and s[i+1] == 0x81:
+ *         return 3 if s[i+2] == 0x9f else 0
+ *     if c == 0xe3:             # <<<<<<<<<<<<<<
+ *         return 3 if s[i+1] == 0x80 and s[i+2] == 0x80 else 0
+ *     return 0
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":62
+ *     if c == 0xe3:
+ *         return 3 if s[i+1] == 0x80 and s[i+2] == 0x80 else 0
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * cdef void strip(const char* d, Py_ssize_t* start, Py_ssize_t* end) nogil:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":42
+ *     return c + 32 if c >= b'A' and c <= b'Z' else c
+ * 
+ * cdef Py_ssize_t unicode_space_len(const unsigned char* s, Py_ssize_t i, Py_ssize_t n) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Return the length of the UTF-8 encoded Unicode whitespace character at
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":64
+ *     return 0
+ * 
+ * cdef void strip(const char* d, Py_ssize_t* start, Py_ssize_t* end) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Narrow the span from `start` to `end` like `unicode.strip`.
+ */
+
+static void __pyx_f_8wikibrev_9_linkscan_strip(char const *__pyx_v_d, Py_ssize_t *__pyx_v_start, Py_ssize_t *__pyx_v_end) {
+  unsigned char const *__pyx_v_s;
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_v_k;
+  Py_ssize_t __pyx_v_m;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "wikibrev/_linkscan.pyx":68
+ *     Narrow the span from `start` to `end` like `unicode.strip`.
+ *     """
+ *     cdef const unsigned char* s = <const unsigned char*>d             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t i = start[0], j = end[0], k, m
+ *     while i < j:
+ */
+  __pyx_v_s = ((unsigned char const *)__pyx_v_d);
+
+  /* "wikibrev/_linkscan.pyx":69
+ *     """
+ *     cdef const unsigned char* s = <const unsigned char*>d
+ *     cdef Py_ssize_t i = start[0], j = end[0], k, m             # <<<<<<<<<<<<<<
+ *     while i < j:
+ *         m = unicode_space_len(s, i, j)
+ */
+  __pyx_v_i = (__pyx_v_start[0]);
+  __pyx_v_j = (__pyx_v_end[0]);
+
+  /* "wikibrev/_linkscan.pyx":70
+ *     cdef const unsigned char* s = <const unsigned char*>d
+ *     cdef Py_ssize_t i = start[0], j = end[0], k, m
+ *     while i < j:             # <<<<<<<<<<<<<<
+ *         m = unicode_space_len(s, i, j)
+ *         if m == 0:
+ */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_i < __pyx_v_j) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "wikibrev/_linkscan.pyx":71
+ *     cdef Py_ssize_t i = start[0], j = end[0], k, m
+ *     while i < j:
+ *         m = unicode_space_len(s, i, j)             # <<<<<<<<<<<<<<
+ *         if m == 0:
+ *             break
+ */
+    __pyx_v_m = __pyx_f_8wikibrev_9_linkscan_unicode_space_len(__pyx_v_s, __pyx_v_i, __pyx_v_j);
+
+    /* "wikibrev/_linkscan.pyx":72
+ *     while i < j:
+ *         m = unicode_space_len(s, i, j)
+ *         if m == 0:             # <<<<<<<<<<<<<<
+ *             break
+ *         i += m
+ */
+    __pyx_t_1 = ((__pyx_v_m == 0) != 0);
+    if (__pyx_t_1) {
+
+      /* "wikibrev/_linkscan.pyx":73
+ *         m = unicode_space_len(s, i, j)
+ *         if m == 0:
+ *             break             # <<<<<<<<<<<<<<
+ *         i += m
+ *     while j > i:
+ */
+      goto __pyx_L4_break;
+
+      /* "wikibrev/_linkscan.pyx":72
+ *     while i < j:
+ *         m = unicode_space_len(s, i, j)
+ *         if m == 0:             # <<<<<<<<<<<<<<
+ *             break
+ *         i += m
+ */
+    }
+
+    /* "wikibrev/_linkscan.pyx":74
+ *         if m == 0:
+ *             break
+ *         i += m             # <<<<<<<<<<<<<<
+ *     while j > i:
+ *         k = j - 1
+ */
+    __pyx_v_i = (__pyx_v_i + __pyx_v_m);
+  }
+  __pyx_L4_break:;
+
+  /* "wikibrev/_linkscan.pyx":75
+ *             break
+ *         i += m
+ *     while j > i:             # <<<<<<<<<<<<<<
+ *         k = j - 1
+ *         while k > i and (s[k] & 0xc0) == 0x80:
+ */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_j > __pyx_v_i) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "wikibrev/_linkscan.pyx":76
+ *         i += m
+ *     while j > i:
+ *         k = j - 1             # <<<<<<<<<<<<<<
+ *         while k > i and (s[k] & 0xc0) == 0x80:
+ *             k -= 1
+ */
+    __pyx_v_k = (__pyx_v_j - 1);
+
+    /* "wikibrev/_linkscan.pyx":77
+ *     while j > i:
+ *         k = j - 1
+ *         while k > i and (s[k] & 0xc0) == 0x80:             # <<<<<<<<<<<<<<
+ *             k -= 1
+ *         if unicode_space_len(s, k, j) != j - k:
+ */
+    while (1) {
+      __pyx_t_2 = ((__pyx_v_k > __pyx_v_i) != 0);
+      if (__pyx_t_2) {
+      } else {
+        __pyx_t_1 = __pyx_t_2;
+        goto __pyx_L10_bool_binop_done;
+      }
+      __pyx_t_2 = ((((__pyx_v_s[__pyx_v_k]) & 0xc0) == 0x80) != 0);
+      __pyx_t_1 = __pyx_t_2;
+      __pyx_L10_bool_binop_done:;
+      if (!__pyx_t_1) break;
+
+      /* "wikibrev/_linkscan.pyx":78
+ *         k = j - 1
+ *         while k > i and (s[k] & 0xc0) == 0x80:
+ *             k -= 1             # <<<<<<<<<<<<<<
+ *         if unicode_space_len(s, k, j) != j - k:
+ *             break
+ */
+      __pyx_v_k = (__pyx_v_k - 1);
+    }
+
+    /* "wikibrev/_linkscan.pyx":79
+ *         while k > i and (s[k] & 0xc0) == 0x80:
+ *             k -= 1
+ *         if unicode_space_len(s, k, j) != j - k:             # <<<<<<<<<<<<<<
+ *             break
+ *         j = k
+ */
+    __pyx_t_1 = ((__pyx_f_8wikibrev_9_linkscan_unicode_space_len(__pyx_v_s, __pyx_v_k, __pyx_v_j) != (__pyx_v_j - __pyx_v_k)) != 0);
+    if (__pyx_t_1) {
+
+      /* "wikibrev/_linkscan.pyx":80
+ *             k -= 1
+ *         if unicode_space_len(s, k, j) != j - k:
+ *             break             # <<<<<<<<<<<<<<
+ *         j = k
+ *     start[0] = i
+ */
+      goto __pyx_L7_break;
+
+      /* "wikibrev/_linkscan.pyx":79
+ *         while k > i and (s[k] & 0xc0) == 0x80:
+ *             k -= 1
+ *         if unicode_space_len(s, k, j) != j - k:             # <<<<<<<<<<<<<<
+ *             break
+ *         j = k
+ */
+    }
+
+    /* "wikibrev/_linkscan.pyx":81
+ *         if unicode_space_len(s, k, j) != j - k:
+ *             break
+ *         j = k             # <<<<<<<<<<<<<<
+ *     start[0] = i
+ *     end[0] = j
+ */
+    __pyx_v_j = __pyx_v_k;
+  }
+  __pyx_L7_break:;
+
+  /* "wikibrev/_linkscan.pyx":82
+ *             break
+ *         j = k
+ *     start[0] = i             # <<<<<<<<<<<<<<
+ *     end[0] = j
+ * 
+ */
+  (__pyx_v_start[0]) = __pyx_v_i;
+
+  /* "wikibrev/_linkscan.pyx":83
+ *         j = k
+ *     start[0] = i
+ *     end[0] = j             # <<<<<<<<<<<<<<
+ * 
+ * cdef Py_ssize_t find(const char* d, char c, Py_ssize_t i, Py_ssize_t n) nogil:
+ */
+  (__pyx_v_end[0]) = __pyx_v_j;
+
+  /* "wikibrev/_linkscan.pyx":64
+ *     return 0
+ * 
+ * cdef void strip(const char* d, Py_ssize_t* start, Py_ssize_t* end) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Narrow the span from `start` to `end` like `unicode.strip`.
+ */
+
+  /* function exit code */
+}
+
+/* "wikibrev/_linkscan.pyx":85
+ *     end[0] = j
+ * 
+ * cdef Py_ssize_t find(const char* d, char c, Py_ssize_t i, Py_ssize_t n) nogil:             # <<<<<<<<<<<<<<
+ *     if i >= n:
+ *         return -1
+ */
+
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_find(char const *__pyx_v_d, char __pyx_v_c, Py_ssize_t __pyx_v_i, Py_ssize_t __pyx_v_n) {
+  char const *__pyx_v_p;
+  Py_ssize_t __pyx_r;
+  int __pyx_t_1;
+  ptrdiff_t __pyx_t_2;
+
+  /* "wikibrev/_linkscan.pyx":86
+ * 
+ * cdef Py_ssize_t find(const char* d, char c, Py_ssize_t i, Py_ssize_t n) nogil:
+ *     if i >= n:             # <<<<<<<<<<<<<<
+ *         return -1
+ *     cdef const char* p = <const char*>memchr(d + i, c, n - i)
+ */
+  __pyx_t_1 = ((__pyx_v_i >= __pyx_v_n) != 0);
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":87
+ * cdef Py_ssize_t find(const char* d, char c, Py_ssize_t i, Py_ssize_t n) nogil:
+ *     if i >= n:
+ *         return -1             # <<<<<<<<<<<<<<
+ *     cdef const char* p = <const char*>memchr(d + i, c, n - i)
+ *     return -1 if p == NULL else p - d
+ */
+    __pyx_r = -1L;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":86
+ * 
+ * cdef Py_ssize_t find(const char* d, char c, Py_ssize_t i, Py_ssize_t n) nogil:
+ *     if i >= n:             # <<<<<<<<<<<<<<
+ *         return -1
+ *     cdef const char* p = <const char*>memchr(d + i, c, n - i)
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":88
+ *     if i >= n:
+ *         return -1
+ *     cdef const char* p = <const char*>memchr(d + i, c, n - i)             # <<<<<<<<<<<<<<
+ *     return -1 if p == NULL else p - d
+ * 
+ */
+  __pyx_v_p = ((char const *)memchr((__pyx_v_d + __pyx_v_i), __pyx_v_c, (__pyx_v_n - __pyx_v_i)));
+
+  /* "wikibrev/_linkscan.pyx":89
+ *         return -1
+ *     cdef const char* p = <const char*>memchr(d + i, c, n - i)
+ *     return -1 if p == NULL else p - d             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline bint starts_with(const char* d, Py_ssize_t i, Py_ssize_t n, const char* s, Py_ssize_t m) nogil:
+ */
+  if (((__pyx_v_p == NULL) != 0)) {
+    __pyx_t_2 = -1L;
+  } else {
+    __pyx_t_2 = (__pyx_v_p - __pyx_v_d);
+  }
+  __pyx_r = __pyx_t_2;
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":85
+ *     end[0] = j
+ * 
+ * cdef Py_ssize_t find(const char* d, char c, Py_ssize_t i, Py_ssize_t n) nogil:             # <<<<<<<<<<<<<<
+ *     if i >= n:
+ *         return -1
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":91
+ *     return -1 if p == NULL else p - d
+ * 
+ * cdef inline bint starts_with(const char* d, Py_ssize_t i, Py_ssize_t n, const char* s, Py_ssize_t m) nogil:             # <<<<<<<<<<<<<<
+ *     return i + m <= n and memcmp(d + i, s, m) == 0
+ * 
+ */
+
+static CYTHON_INLINE int __pyx_f_8wikibrev_9_linkscan_starts_with(char const *__pyx_v_d, Py_ssize_t __pyx_v_i, Py_ssize_t __pyx_v_n, char const *__pyx_v_s, Py_ssize_t __pyx_v_m) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "wikibrev/_linkscan.pyx":92
+ * 
+ * cdef inline bint starts_with(const char* d, Py_ssize_t i, Py_ssize_t n, const char* s, Py_ssize_t m) nogil:
+ *     return i + m <= n and memcmp(d + i, s, m) == 0             # <<<<<<<<<<<<<<
+ * 
+ * cdef bint equals_lower(const char* d, Py_ssize_t start, Py_ssize_t end, const char* s, Py_ssize_t m) nogil:
+ */
+  __pyx_t_2 = (((__pyx_v_i + __pyx_v_m) <= __pyx_v_n) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L3_bool_binop_done;
+  }
+  __pyx_t_2 = ((memcmp((__pyx_v_d + __pyx_v_i), __pyx_v_s, __pyx_v_m) == 0) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L3_bool_binop_done:;
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":91
+ *     return -1 if p == NULL else p - d
+ * 
+ * cdef inline bint starts_with(const char* d, Py_ssize_t i, Py_ssize_t n, const char* s, Py_ssize_t m) nogil:             # <<<<<<<<<<<<<<
+ *     return i + m <= n and memcmp(d + i, s, m) == 0
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":94
+ *     return i + m <= n and memcmp(d + i, s, m) == 0
+ * 
+ * cdef bint equals_lower(const char* d, Py_ssize_t start, Py_ssize_t end, const char* s, Py_ssize_t m) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Return True if the span from `start` to `end`, with the ASCII letters
+ */
+
+static int __pyx_f_8wikibrev_9_linkscan_equals_lower(char const *__pyx_v_d, Py_ssize_t __pyx_v_start, Py_ssize_t __pyx_v_end, char const *__pyx_v_s, Py_ssize_t __pyx_v_m) {
+  Py_ssize_t __pyx_v_i;
+  int __pyx_r;
+  int __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+
+  /* "wikibrev/_linkscan.pyx":100
+ *     """
+ *     cdef Py_ssize_t i
+ *     if end - start != m:             # <<<<<<<<<<<<<<
+ *         return False
+ *     for i in range(m):
+ */
+  __pyx_t_1 = (((__pyx_v_end - __pyx_v_start) != __pyx_v_m) != 0);
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":101
+ *     cdef Py_ssize_t i
+ *     if end - start != m:
+ *         return False             # <<<<<<<<<<<<<<
+ *     for i in range(m):
+ *         if ascii_lower(d[start + i]) != s[i]:
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":100
+ *     """
+ *     cdef Py_ssize_t i
+ *     if end - start != m:             # <<<<<<<<<<<<<<
+ *         return False
+ *     for i in range(m):
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":102
+ *     if end - start != m:
+ *         return False
+ *     for i in range(m):             # <<<<<<<<<<<<<<
+ *         if ascii_lower(d[start + i]) != s[i]:
+ *             return False
+ */
+  __pyx_t_2 = __pyx_v_m;
+  __pyx_t_3 = __pyx_t_2;
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_i = __pyx_t_4;
+
+    /* "wikibrev/_linkscan.pyx":103
+ *         return False
+ *     for i in range(m):
+ *         if ascii_lower(d[start + i]) != s[i]:             # <<<<<<<<<<<<<<
+ *             return False
+ *     return True
+ */
+    __pyx_t_1 = ((__pyx_f_8wikibrev_9_linkscan_ascii_lower((__pyx_v_d[(__pyx_v_start + __pyx_v_i)])) != (__pyx_v_s[__pyx_v_i])) != 0);
+    if (__pyx_t_1) {
+
+      /* "wikibrev/_linkscan.pyx":104
+ *     for i in range(m):
+ *         if ascii_lower(d[start + i]) != s[i]:
+ *             return False             # <<<<<<<<<<<<<<
+ *     return True
+ * 
+ */
+      __pyx_r = 0;
+      goto __pyx_L0;
+
+      /* "wikibrev/_linkscan.pyx":103
+ *         return False
+ *     for i in range(m):
+ *         if ascii_lower(d[start + i]) != s[i]:             # <<<<<<<<<<<<<<
+ *             return False
+ *     return True
+ */
+    }
+  }
+
+  /* "wikibrev/_linkscan.pyx":105
+ *         if ascii_lower(d[start + i]) != s[i]:
+ *             return False
+ *     return True             # <<<<<<<<<<<<<<
+ * 
+ * cdef bint is_ascii(const char* d, Py_ssize_t start, Py_ssize_t end) nogil:
+ */
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":94
+ *     return i + m <= n and memcmp(d + i, s, m) == 0
+ * 
+ * cdef bint equals_lower(const char* d, Py_ssize_t start, Py_ssize_t end, const char* s, Py_ssize_t m) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Return True if the span from `start` to `end`, with the ASCII letters
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":107
+ *     return True
+ * 
+ * cdef bint is_ascii(const char* d, Py_ssize_t start, Py_ssize_t end) nogil:             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t i
+ *     for i in range(start, end):
+ */
+
+static int __pyx_f_8wikibrev_9_linkscan_is_ascii(char const *__pyx_v_d, Py_ssize_t __pyx_v_start, Py_ssize_t __pyx_v_end) {
+  Py_ssize_t __pyx_v_i;
+  int __pyx_r;
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+
+  /* "wikibrev/_linkscan.pyx":109
+ * cdef bint is_ascii(const char* d, Py_ssize_t start, Py_ssize_t end) nogil:
+ *     cdef Py_ssize_t i
+ *     for i in range(start, end):             # <<<<<<<<<<<<<<
+ *         if <unsigned char>d[i] >= 0x80:
+ *             return False
+ */
+  __pyx_t_1 = __pyx_v_end;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = __pyx_v_start; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "wikibrev/_linkscan.pyx":110
+ *     cdef Py_ssize_t i
+ *     for i in range(start, end):
+ *         if <unsigned char>d[i] >= 0x80:             # <<<<<<<<<<<<<<
+ *             return False
+ *     return True
+ */
+    __pyx_t_4 = ((((unsigned char)(__pyx_v_d[__pyx_v_i])) >= 0x80) != 0);
+    if (__pyx_t_4) {
+
+      /* "wikibrev/_linkscan.pyx":111
+ *     for i in range(start, end):
+ *         if <unsigned char>d[i] >= 0x80:
+ *             return False             # <<<<<<<<<<<<<<
+ *     return True
+ * 
+ */
+      __pyx_r = 0;
+      goto __pyx_L0;
+
+      /* "wikibrev/_linkscan.pyx":110
+ *     cdef Py_ssize_t i
+ *     for i in range(start, end):
+ *         if <unsigned char>d[i] >= 0x80:             # <<<<<<<<<<<<<<
+ *             return False
+ *     return True
+ */
+    }
+  }
+
+  /* "wikibrev/_linkscan.pyx":112
+ *         if <unsigned char>d[i] >= 0x80:
+ *             return False
+ *     return True             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":107
+ *     return True
+ * 
+ * cdef bint is_ascii(const char* d, Py_ssize_t start, Py_ssize_t end) nogil:             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t i
+ *     for i in range(start, end):
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":135
+ * 
+ * 
+ * cdef void text(Scanner* s, Py_ssize_t start, Py_ssize_t end) nogil:             # <<<<<<<<<<<<<<
+ *     if s.is_link:
+ *         strip(s.d, &start, &end)
+ */
+
+static void __pyx_f_8wikibrev_9_linkscan_text(struct __pyx_t_8wikibrev_9_linkscan_Scanner *__pyx_v_s, Py_ssize_t __pyx_v_start, Py_ssize_t __pyx_v_end) {
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+
+  /* "wikibrev/_linkscan.pyx":136
+ * 
+ * cdef void text(Scanner* s, Py_ssize_t start, Py_ssize_t end) nogil:
+ *     if s.is_link:             # <<<<<<<<<<<<<<
+ *         strip(s.d, &start, &end)
+ *         s.link_text.append(s.d + start, end - start)
+ */
+  __pyx_t_1 = (__pyx_v_s->is_link != 0);
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":137
+ * cdef void text(Scanner* s, Py_ssize_t start, Py_ssize_t end) nogil:
+ *     if s.is_link:
+ *         strip(s.d, &start, &end)             # <<<<<<<<<<<<<<
+ *         s.link_text.append(s.d + start, end - start)
+ * 
+ */
+    __pyx_f_8wikibrev_9_linkscan_strip(__pyx_v_s->d, (&__pyx_v_start), (&__pyx_v_end));
+
+    /* "wikibrev/_linkscan.pyx":138
+ *     if s.is_link:
+ *         strip(s.d, &start, &end)
+ *         s.link_text.append(s.d + start, end - start)             # <<<<<<<<<<<<<<
+ * 
+ * cdef bint has_word(const char* d, Py_ssize_t start, Py_ssize_t end, const char* w, Py_ssize_t m) nogil:
+ */
+    try {
+      __pyx_v_s->link_text.append((__pyx_v_s->d + __pyx_v_start), (__pyx_v_end - __pyx_v_start));
+    } catch(...) {
+      #ifdef WITH_THREAD
+      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+      #endif
+      __Pyx_CppExn2PyErr();
+      #ifdef WITH_THREAD
+      __Pyx_PyGILState_Release(__pyx_gilstate_save);
+      #endif
+      __PYX_ERR(0, 138, __pyx_L1_error)
+    }
+
+    /* "wikibrev/_linkscan.pyx":136
+ * 
+ * cdef void text(Scanner* s, Py_ssize_t start, Py_ssize_t end) nogil:
+ *     if s.is_link:             # <<<<<<<<<<<<<<
+ *         strip(s.d, &start, &end)
+ *         s.link_text.append(s.d + start, end - start)
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":135
+ * 
+ * 
+ * cdef void text(Scanner* s, Py_ssize_t start, Py_ssize_t end) nogil:             # <<<<<<<<<<<<<<
+ *     if s.is_link:
+ *         strip(s.d, &start, &end)
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("wikibrev._linkscan.text", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
+  __pyx_L0:;
+}
+
+/* "wikibrev/_linkscan.pyx":140
+ *         s.link_text.append(s.d + start, end - start)
+ * 
+ * cdef bint has_word(const char* d, Py_ssize_t start, Py_ssize_t end, const char* w, Py_ssize_t m) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Return True if `w` occurs between `start` and `end` as a whole word, like
+ */
+
+static int __pyx_f_8wikibrev_9_linkscan_has_word(char const *__pyx_v_d, Py_ssize_t __pyx_v_start, Py_ssize_t __pyx_v_end, char const *__pyx_v_w, Py_ssize_t __pyx_v_m) {
+  Py_ssize_t __pyx_v_i;
+  int __pyx_r;
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+
+  /* "wikibrev/_linkscan.pyx":146
+ *     """
+ *     cdef Py_ssize_t i
+ *     for i in range(start, end - m + 1):             # <<<<<<<<<<<<<<
+ *         if memcmp(d + i, w, m) == 0 and (i == start or not is_word(d[i-1])) and \
+ *                 (i + m == end or not is_word(d[i+m])):
+ */
+  __pyx_t_1 = ((__pyx_v_end - __pyx_v_m) + 1);
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = __pyx_v_start; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "wikibrev/_linkscan.pyx":147
+ *     cdef Py_ssize_t i
+ *     for i in range(start, end - m + 1):
+ *         if memcmp(d + i, w, m) == 0 and (i == start or not is_word(d[i-1])) and \             # <<<<<<<<<<<<<<
+ *                 (i + m == end or not is_word(d[i+m])):
+ *             return True
+ */
+    __pyx_t_5 = ((memcmp((__pyx_v_d + __pyx_v_i), __pyx_v_w, __pyx_v_m) == 0) != 0);
+    if (__pyx_t_5) {
+    } else {
+      __pyx_t_4 = __pyx_t_5;
+      goto __pyx_L6_bool_binop_done;
+    }
+    __pyx_t_5 = ((__pyx_v_i == __pyx_v_start) != 0);
+    if (!__pyx_t_5) {
+    } else {
+      goto __pyx_L8_next_and;
+    }
+    __pyx_t_5 = ((!(__pyx_f_8wikibrev_9_linkscan_is_word((__pyx_v_d[(__pyx_v_i - 1)])) != 0)) != 0);
+    if (__pyx_t_5) {
+    } else {
+      __pyx_t_4 = __pyx_t_5;
+      goto __pyx_L6_bool_binop_done;
+    }
+    __pyx_L8_next_and:;
+
+    /* "wikibrev/_linkscan.pyx":148
+ *     for i in range(start, end - m + 1):
+ *         if memcmp(d + i, w, m) == 0 and (i == start or not is_word(d[i-1])) and \
+ *                 (i + m == end or not is_word(d[i+m])):             # <<<<<<<<<<<<<<
+ *             return True
+ *     return False
+ */
+    __pyx_t_5 = (((__pyx_v_i + __pyx_v_m) == __pyx_v_end) != 0);
+    if (!__pyx_t_5) {
+    } else {
+      __pyx_t_4 = __pyx_t_5;
+      goto __pyx_L6_bool_binop_done;
+    }
+    __pyx_t_5 = ((!(__pyx_f_8wikibrev_9_linkscan_is_word((__pyx_v_d[(__pyx_v_i + __pyx_v_m)])) != 0)) != 0);
+    __pyx_t_4 = __pyx_t_5;
+    __pyx_L6_bool_binop_done:;
+
+    /* "wikibrev/_linkscan.pyx":147
+ *     cdef Py_ssize_t i
+ *     for i in range(start, end - m + 1):
+ *         if memcmp(d + i, w, m) == 0 and (i == start or not is_word(d[i-1])) and \             # <<<<<<<<<<<<<<
+ *                 (i + m == end or not is_word(d[i+m])):
+ *             return True
+ */
+    if (__pyx_t_4) {
+
+      /* "wikibrev/_linkscan.pyx":149
+ *         if memcmp(d + i, w, m) == 0 and (i == start or not is_word(d[i-1])) and \
+ *                 (i + m == end or not is_word(d[i+m])):
+ *             return True             # <<<<<<<<<<<<<<
+ *     return False
+ * 
+ */
+      __pyx_r = 1;
+      goto __pyx_L0;
+
+      /* "wikibrev/_linkscan.pyx":147
+ *     cdef Py_ssize_t i
+ *     for i in range(start, end - m + 1):
+ *         if memcmp(d + i, w, m) == 0 and (i == start or not is_word(d[i-1])) and \             # <<<<<<<<<<<<<<
+ *                 (i + m == end or not is_word(d[i+m])):
+ *             return True
+ */
+    }
+  }
+
+  /* "wikibrev/_linkscan.pyx":150
+ *                 (i + m == end or not is_word(d[i+m])):
+ *             return True
+ *     return False             # <<<<<<<<<<<<<<
+ * 
+ * cdef bint has_class(const char* d, Py_ssize_t start, Py_ssize_t end, const char* c, Py_ssize_t m) nogil:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":140
+ *         s.link_text.append(s.d + start, end - start)
+ * 
+ * cdef bint has_word(const char* d, Py_ssize_t start, Py_ssize_t end, const char* w, Py_ssize_t m) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Return True if `w` occurs between `start` and `end` as a whole word, like
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":152
+ *     return False
+ * 
+ * cdef bint has_class(const char* d, Py_ssize_t start, Py_ssize_t end, const char* c, Py_ssize_t m) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Return True if `c` is one of the whitespace-separated classes between
+ */
+
+static int __pyx_f_8wikibrev_9_linkscan_has_class(char const *__pyx_v_d, Py_ssize_t __pyx_v_start, Py_ssize_t __pyx_v_end, char const *__pyx_v_c, Py_ssize_t __pyx_v_m) {
+  unsigned char const *__pyx_v_s;
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_v_k;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "wikibrev/_linkscan.pyx":157
+ *     `start` and `end`.
+ *     """
+ *     cdef const unsigned char* s = <const unsigned char*>d             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t i = start, j, k
+ *     while i < end:
+ */
+  __pyx_v_s = ((unsigned char const *)__pyx_v_d);
+
+  /* "wikibrev/_linkscan.pyx":158
+ *     """
+ *     cdef const unsigned char* s = <const unsigned char*>d
+ *     cdef Py_ssize_t i = start, j, k             # <<<<<<<<<<<<<<
+ *     while i < end:
+ *         k = unicode_space_len(s, i, end)
+ */
+  __pyx_v_i = __pyx_v_start;
+
+  /* "wikibrev/_linkscan.pyx":159
+ *     cdef const unsigned char* s = <const unsigned char*>d
+ *     cdef Py_ssize_t i = start, j, k
+ *     while i < end:             # <<<<<<<<<<<<<<
+ *         k = unicode_space_len(s, i, end)
+ *         if k > 0:
+ */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_i < __pyx_v_end) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "wikibrev/_linkscan.pyx":160
+ *     cdef Py_ssize_t i = start, j, k
+ *     while i < end:
+ *         k = unicode_space_len(s, i, end)             # <<<<<<<<<<<<<<
+ *         if k > 0:
+ *             i += k
+ */
+    __pyx_v_k = __pyx_f_8wikibrev_9_linkscan_unicode_space_len(__pyx_v_s, __pyx_v_i, __pyx_v_end);
+
+    /* "wikibrev/_linkscan.pyx":161
+ *     while i < end:
+ *         k = unicode_space_len(s, i, end)
+ *         if k > 0:             # <<<<<<<<<<<<<<
+ *             i += k
+ *             continue
+ */
+    __pyx_t_1 = ((__pyx_v_k > 0) != 0);
+    if (__pyx_t_1) {
+
+      /* "wikibrev/_linkscan.pyx":162
+ *         k = unicode_space_len(s, i, end)
+ *         if k > 0:
+ *             i += k             # <<<<<<<<<<<<<<
+ *             continue
+ *         j = i
+ */
+      __pyx_v_i = (__pyx_v_i + __pyx_v_k);
+
+      /* "wikibrev/_linkscan.pyx":163
+ *         if k > 0:
+ *             i += k
+ *             continue             # <<<<<<<<<<<<<<
+ *         j = i
+ *         while j < end and unicode_space_len(s, j, end) == 0:
+ */
+      goto __pyx_L3_continue;
+
+      /* "wikibrev/_linkscan.pyx":161
+ *     while i < end:
+ *         k = unicode_space_len(s, i, end)
+ *         if k > 0:             # <<<<<<<<<<<<<<
+ *             i += k
+ *             continue
+ */
+    }
+
+    /* "wikibrev/_linkscan.pyx":164
+ *             i += k
+ *             continue
+ *         j = i             # <<<<<<<<<<<<<<
+ *         while j < end and unicode_space_len(s, j, end) == 0:
+ *             j += 1
+ */
+    __pyx_v_j = __pyx_v_i;
+
+    /* "wikibrev/_linkscan.pyx":165
+ *             continue
+ *         j = i
+ *         while j < end and unicode_space_len(s, j, end) == 0:             # <<<<<<<<<<<<<<
+ *             j += 1
+ *         if j - i == m and memcmp(d + i, c, m) == 0:
+ */
+    while (1) {
+      __pyx_t_2 = ((__pyx_v_j < __pyx_v_end) != 0);
+      if (__pyx_t_2) {
+      } else {
+        __pyx_t_1 = __pyx_t_2;
+        goto __pyx_L8_bool_binop_done;
+      }
+      __pyx_t_2 = ((__pyx_f_8wikibrev_9_linkscan_unicode_space_len(__pyx_v_s, __pyx_v_j, __pyx_v_end) == 0) != 0);
+      __pyx_t_1 = __pyx_t_2;
+      __pyx_L8_bool_binop_done:;
+      if (!__pyx_t_1) break;
+
+      /* "wikibrev/_linkscan.pyx":166
+ *         j = i
+ *         while j < end and unicode_space_len(s, j, end) == 0:
+ *             j += 1             # <<<<<<<<<<<<<<
+ *         if j - i == m and memcmp(d + i, c, m) == 0:
+ *             return True
+ */
+      __pyx_v_j = (__pyx_v_j + 1);
+    }
+
+    /* "wikibrev/_linkscan.pyx":167
+ *         while j < end and unicode_space_len(s, j, end) == 0:
+ *             j += 1
+ *         if j - i == m and memcmp(d + i, c, m) == 0:             # <<<<<<<<<<<<<<
+ *             return True
+ *         i = j
+ */
+    __pyx_t_2 = (((__pyx_v_j - __pyx_v_i) == __pyx_v_m) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L11_bool_binop_done;
+    }
+    __pyx_t_2 = ((memcmp((__pyx_v_d + __pyx_v_i), __pyx_v_c, __pyx_v_m) == 0) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L11_bool_binop_done:;
+    if (__pyx_t_1) {
+
+      /* "wikibrev/_linkscan.pyx":168
+ *             j += 1
+ *         if j - i == m and memcmp(d + i, c, m) == 0:
+ *             return True             # <<<<<<<<<<<<<<
+ *         i = j
+ *     return False
+ */
+      __pyx_r = 1;
+      goto __pyx_L0;
+
+      /* "wikibrev/_linkscan.pyx":167
+ *         while j < end and unicode_space_len(s, j, end) == 0:
+ *             j += 1
+ *         if j - i == m and memcmp(d + i, c, m) == 0:             # <<<<<<<<<<<<<<
+ *             return True
+ *         i = j
+ */
+    }
+
+    /* "wikibrev/_linkscan.pyx":169
+ *         if j - i == m and memcmp(d + i, c, m) == 0:
+ *             return True
+ *         i = j             # <<<<<<<<<<<<<<
+ *     return False
+ * 
+ */
+    __pyx_v_i = __pyx_v_j;
+    __pyx_L3_continue:;
+  }
+
+  /* "wikibrev/_linkscan.pyx":170
+ *             return True
+ *         i = j
+ *     return False             # <<<<<<<<<<<<<<
+ * 
+ * cdef bint is_forbidden_id(const char* d, Py_ssize_t start, Py_ssize_t end) nogil:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":152
+ *     return False
+ * 
+ * cdef bint has_class(const char* d, Py_ssize_t start, Py_ssize_t end, const char* c, Py_ssize_t m) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Return True if `c` is one of the whitespace-separated classes between
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":172
+ *     return False
+ * 
+ * cdef bint is_forbidden_id(const char* d, Py_ssize_t start, Py_ssize_t end) nogil:             # <<<<<<<<<<<<<<
+ *     # ^(cite_.*|coordinates)$, where . does not match a newline and $ also
+ *     # matches before a newline at the end
+ */
+
+static int __pyx_f_8wikibrev_9_linkscan_is_forbidden_id(char const *__pyx_v_d, Py_ssize_t __pyx_v_start, Py_ssize_t __pyx_v_end) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "wikibrev/_linkscan.pyx":175
+ *     # ^(cite_.*|coordinates)$, where . does not match a newline and $ also
+ *     # matches before a newline at the end
+ *     if end > start and d[end-1] == b'\n':             # <<<<<<<<<<<<<<
+ *         end -= 1
+ *     if end - start == 11 and memcmp(d + start, b'coordinates', 11) == 0:
+ */
+  __pyx_t_2 = ((__pyx_v_end > __pyx_v_start) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (((__pyx_v_d[(__pyx_v_end - 1)]) == '\n') != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":176
+ *     # matches before a newline at the end
+ *     if end > start and d[end-1] == b'\n':
+ *         end -= 1             # <<<<<<<<<<<<<<
+ *     if end - start == 11 and memcmp(d + start, b'coordinates', 11) == 0:
+ *         return True
+ */
+    __pyx_v_end = (__pyx_v_end - 1);
+
+    /* "wikibrev/_linkscan.pyx":175
+ *     # ^(cite_.*|coordinates)$, where . does not match a newline and $ also
+ *     # matches before a newline at the end
+ *     if end > start and d[end-1] == b'\n':             # <<<<<<<<<<<<<<
+ *         end -= 1
+ *     if end - start == 11 and memcmp(d + start, b'coordinates', 11) == 0:
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":177
+ *     if end > start and d[end-1] == b'\n':
+ *         end -= 1
+ *     if end - start == 11 and memcmp(d + start, b'coordinates', 11) == 0:             # <<<<<<<<<<<<<<
+ *         return True
+ *     return end - start >= 5 and memcmp(d + start, b'cite_', 5) == 0 and \
+ */
+  __pyx_t_2 = (((__pyx_v_end - __pyx_v_start) == 11) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L7_bool_binop_done;
+  }
+  __pyx_t_2 = ((memcmp((__pyx_v_d + __pyx_v_start), ((char *)"coordinates"), 11) == 0) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L7_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":178
+ *         end -= 1
+ *     if end - start == 11 and memcmp(d + start, b'coordinates', 11) == 0:
+ *         return True             # <<<<<<<<<<<<<<
+ *     return end - start >= 5 and memcmp(d + start, b'cite_', 5) == 0 and \
+ *         memchr(d + start, b'\n', end - start) == NULL
+ */
+    __pyx_r = 1;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":177
+ *     if end > start and d[end-1] == b'\n':
+ *         end -= 1
+ *     if end - start == 11 and memcmp(d + start, b'coordinates', 11) == 0:             # <<<<<<<<<<<<<<
+ *         return True
+ *     return end - start >= 5 and memcmp(d + start, b'cite_', 5) == 0 and \
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":179
+ *     if end - start == 11 and memcmp(d + start, b'coordinates', 11) == 0:
+ *         return True
+ *     return end - start >= 5 and memcmp(d + start, b'cite_', 5) == 0 and \             # <<<<<<<<<<<<<<
+ *         memchr(d + start, b'\n', end - start) == NULL
+ * 
+ */
+  __pyx_t_2 = (((__pyx_v_end - __pyx_v_start) >= 5) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L9_bool_binop_done;
+  }
+  __pyx_t_2 = ((memcmp((__pyx_v_d + __pyx_v_start), ((char *)"cite_"), 5) == 0) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L9_bool_binop_done;
+  }
+
+  /* "wikibrev/_linkscan.pyx":180
+ *         return True
+ *     return end - start >= 5 and memcmp(d + start, b'cite_', 5) == 0 and \
+ *         memchr(d + start, b'\n', end - start) == NULL             # <<<<<<<<<<<<<<
+ * 
+ * cdef void start_tag(Scanner* s, const string& tag, Attr* cls, Attr* id_, Attr* href) nogil:
+ */
+  __pyx_t_2 = ((memchr((__pyx_v_d + __pyx_v_start), '\n', (__pyx_v_end - __pyx_v_start)) == NULL) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L9_bool_binop_done:;
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":172
+ *     return False
+ * 
+ * cdef bint is_forbidden_id(const char* d, Py_ssize_t start, Py_ssize_t end) nogil:             # <<<<<<<<<<<<<<
+ *     # ^(cite_.*|coordinates)$, where . does not match a newline and $ also
+ *     # matches before a newline at the end
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":182
+ *         memchr(d + start, b'\n', end - start) == NULL
+ * 
+ * cdef void start_tag(Scanner* s, const string& tag, Attr* cls, Attr* id_, Attr* href) nogil:             # <<<<<<<<<<<<<<
+ *     s.elem_stack.push_back(tag)
+ *     if (cls.present and (has_word(s.d, cls.start, cls.end, b'reference', 9) or
+ */
+
+static void __pyx_f_8wikibrev_9_linkscan_start_tag(struct __pyx_t_8wikibrev_9_linkscan_Scanner *__pyx_v_s, std::string const &__pyx_v_tag, struct __pyx_t_8wikibrev_9_linkscan_Attr *__pyx_v_cls, struct __pyx_t_8wikibrev_9_linkscan_Attr *__pyx_v_id_, struct __pyx_t_8wikibrev_9_linkscan_Attr *__pyx_v_href) {
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+
+  /* "wikibrev/_linkscan.pyx":183
+ * 
+ * cdef void start_tag(Scanner* s, const string& tag, Attr* cls, Attr* id_, Attr* href) nogil:
+ *     s.elem_stack.push_back(tag)             # <<<<<<<<<<<<<<
+ *     if (cls.present and (has_word(s.d, cls.start, cls.end, b'reference', 9) or
+ *                          has_word(s.d, cls.start, cls.end, b'hatnote', 7))) or \
+ */
+  try {
+    __pyx_v_s->elem_stack.push_back(__pyx_v_tag);
+  } catch(...) {
+    #ifdef WITH_THREAD
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    #endif
+    __Pyx_CppExn2PyErr();
+    #ifdef WITH_THREAD
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    #endif
+    __PYX_ERR(0, 183, __pyx_L1_error)
+  }
+
+  /* "wikibrev/_linkscan.pyx":184
+ * cdef void start_tag(Scanner* s, const string& tag, Attr* cls, Attr* id_, Attr* href) nogil:
+ *     s.elem_stack.push_back(tag)
+ *     if (cls.present and (has_word(s.d, cls.start, cls.end, b'reference', 9) or             # <<<<<<<<<<<<<<
+ *                          has_word(s.d, cls.start, cls.end, b'hatnote', 7))) or \
+ *             (id_.present and is_forbidden_id(s.d, id_.start, id_.end)) or \
+ */
+  __pyx_t_2 = (__pyx_v_cls->present != 0);
+  if (!__pyx_t_2) {
+    goto __pyx_L5_next_or;
+  } else {
+  }
+  __pyx_t_2 = (__pyx_f_8wikibrev_9_linkscan_has_word(__pyx_v_s->d, __pyx_v_cls->start, __pyx_v_cls->end, ((char const *)"reference"), 9) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "wikibrev/_linkscan.pyx":185
+ *     s.elem_stack.push_back(tag)
+ *     if (cls.present and (has_word(s.d, cls.start, cls.end, b'reference', 9) or
+ *                          has_word(s.d, cls.start, cls.end, b'hatnote', 7))) or \             # <<<<<<<<<<<<<<
+ *             (id_.present and is_forbidden_id(s.d, id_.start, id_.end)) or \
+ *             tag == b'head' or tag == b'script':
+ */
+  __pyx_t_2 = (__pyx_f_8wikibrev_9_linkscan_has_word(__pyx_v_s->d, __pyx_v_cls->start, __pyx_v_cls->end, ((char const *)"hatnote"), 7) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_L5_next_or:;
+
+  /* "wikibrev/_linkscan.pyx":186
+ *     if (cls.present and (has_word(s.d, cls.start, cls.end, b'reference', 9) or
+ *                          has_word(s.d, cls.start, cls.end, b'hatnote', 7))) or \
+ *             (id_.present and is_forbidden_id(s.d, id_.start, id_.end)) or \             # <<<<<<<<<<<<<<
+ *             tag == b'head' or tag == b'script':
+ *         s.forb_depth += 1
+ */
+  __pyx_t_2 = (__pyx_v_id_->present != 0);
+  if (!__pyx_t_2) {
+    goto __pyx_L8_next_or;
+  } else {
+  }
+  __pyx_t_2 = (__pyx_f_8wikibrev_9_linkscan_is_forbidden_id(__pyx_v_s->d, __pyx_v_id_->start, __pyx_v_id_->end) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_L8_next_or:;
+
+  /* "wikibrev/_linkscan.pyx":187
+ *                          has_word(s.d, cls.start, cls.end, b'hatnote', 7))) or \
+ *             (id_.present and is_forbidden_id(s.d, id_.start, id_.end)) or \
+ *             tag == b'head' or tag == b'script':             # <<<<<<<<<<<<<<
+ *         s.forb_depth += 1
+ *     if tag == b'a':
+ */
+  __pyx_t_2 = ((__pyx_v_tag == ((char const *)"head")) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_tag == ((char const *)"script")) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+
+  /* "wikibrev/_linkscan.pyx":184
+ * cdef void start_tag(Scanner* s, const string& tag, Attr* cls, Attr* id_, Attr* href) nogil:
+ *     s.elem_stack.push_back(tag)
+ *     if (cls.present and (has_word(s.d, cls.start, cls.end, b'reference', 9) or             # <<<<<<<<<<<<<<
+ *                          has_word(s.d, cls.start, cls.end, b'hatnote', 7))) or \
+ *             (id_.present and is_forbidden_id(s.d, id_.start, id_.end)) or \
+ */
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":188
+ *             (id_.present and is_forbidden_id(s.d, id_.start, id_.end)) or \
+ *             tag == b'head' or tag == b'script':
+ *         s.forb_depth += 1             # <<<<<<<<<<<<<<
+ *     if tag == b'a':
+ *         if s.forb_depth == 0 and href.present and \
+ */
+    __pyx_v_s->forb_depth = (__pyx_v_s->forb_depth + 1);
+
+    /* "wikibrev/_linkscan.pyx":184
+ * cdef void start_tag(Scanner* s, const string& tag, Attr* cls, Attr* id_, Attr* href) nogil:
+ *     s.elem_stack.push_back(tag)
+ *     if (cls.present and (has_word(s.d, cls.start, cls.end, b'reference', 9) or             # <<<<<<<<<<<<<<
+ *                          has_word(s.d, cls.start, cls.end, b'hatnote', 7))) or \
+ *             (id_.present and is_forbidden_id(s.d, id_.start, id_.end)) or \
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":189
+ *             tag == b'head' or tag == b'script':
+ *         s.forb_depth += 1
+ *     if tag == b'a':             # <<<<<<<<<<<<<<
+ *         if s.forb_depth == 0 and href.present and \
+ *                 not (cls.present and has_class(s.d, cls.start, cls.end, b'external', 8)):
+ */
+  __pyx_t_1 = ((__pyx_v_tag == ((char const *)"a")) != 0);
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":190
+ *         s.forb_depth += 1
+ *     if tag == b'a':
+ *         if s.forb_depth == 0 and href.present and \             # <<<<<<<<<<<<<<
+ *                 not (cls.present and has_class(s.d, cls.start, cls.end, b'external', 8)):
+ *             s.is_link = True
+ */
+    __pyx_t_2 = ((__pyx_v_s->forb_depth == 0) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L13_bool_binop_done;
+    }
+    __pyx_t_2 = (__pyx_v_href->present != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L13_bool_binop_done;
+    }
+
+    /* "wikibrev/_linkscan.pyx":191
+ *     if tag == b'a':
+ *         if s.forb_depth == 0 and href.present and \
+ *                 not (cls.present and has_class(s.d, cls.start, cls.end, b'external', 8)):             # <<<<<<<<<<<<<<
+ *             s.is_link = True
+ *             s.link_url.assign(s.d + href.start, href.end - href.start)
+ */
+    __pyx_t_3 = (__pyx_v_cls->present != 0);
+    if (__pyx_t_3) {
+    } else {
+      __pyx_t_2 = __pyx_t_3;
+      goto __pyx_L16_bool_binop_done;
+    }
+    __pyx_t_3 = (__pyx_f_8wikibrev_9_linkscan_has_class(__pyx_v_s->d, __pyx_v_cls->start, __pyx_v_cls->end, ((char const *)"external"), 8) != 0);
+    __pyx_t_2 = __pyx_t_3;
+    __pyx_L16_bool_binop_done:;
+    __pyx_t_3 = ((!__pyx_t_2) != 0);
+    __pyx_t_1 = __pyx_t_3;
+    __pyx_L13_bool_binop_done:;
+
+    /* "wikibrev/_linkscan.pyx":190
+ *         s.forb_depth += 1
+ *     if tag == b'a':
+ *         if s.forb_depth == 0 and href.present and \             # <<<<<<<<<<<<<<
+ *                 not (cls.present and has_class(s.d, cls.start, cls.end, b'external', 8)):
+ *             s.is_link = True
+ */
+    if (__pyx_t_1) {
+
+      /* "wikibrev/_linkscan.pyx":192
+ *         if s.forb_depth == 0 and href.present and \
+ *                 not (cls.present and has_class(s.d, cls.start, cls.end, b'external', 8)):
+ *             s.is_link = True             # <<<<<<<<<<<<<<
+ *             s.link_url.assign(s.d + href.start, href.end - href.start)
+ * 
+ */
+      __pyx_v_s->is_link = 1;
+
+      /* "wikibrev/_linkscan.pyx":193
+ *                 not (cls.present and has_class(s.d, cls.start, cls.end, b'external', 8)):
+ *             s.is_link = True
+ *             s.link_url.assign(s.d + href.start, href.end - href.start)             # <<<<<<<<<<<<<<
+ * 
+ * cdef void end_tag(Scanner* s, const string& tag) nogil:
+ */
+      try {
+        __pyx_v_s->link_url.assign((__pyx_v_s->d + __pyx_v_href->start), (__pyx_v_href->end - __pyx_v_href->start));
+      } catch(...) {
+        #ifdef WITH_THREAD
+        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+        #endif
+        __Pyx_CppExn2PyErr();
+        #ifdef WITH_THREAD
+        __Pyx_PyGILState_Release(__pyx_gilstate_save);
+        #endif
+        __PYX_ERR(0, 193, __pyx_L1_error)
+      }
+
+      /* "wikibrev/_linkscan.pyx":190
+ *         s.forb_depth += 1
+ *     if tag == b'a':
+ *         if s.forb_depth == 0 and href.present and \             # <<<<<<<<<<<<<<
+ *                 not (cls.present and has_class(s.d, cls.start, cls.end, b'external', 8)):
+ *             s.is_link = True
+ */
+    }
+
+    /* "wikibrev/_linkscan.pyx":189
+ *             tag == b'head' or tag == b'script':
+ *         s.forb_depth += 1
+ *     if tag == b'a':             # <<<<<<<<<<<<<<
+ *         if s.forb_depth == 0 and href.present and \
+ *                 not (cls.present and has_class(s.d, cls.start, cls.end, b'external', 8)):
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":182
+ *         memchr(d + start, b'\n', end - start) == NULL
+ * 
+ * cdef void start_tag(Scanner* s, const string& tag, Attr* cls, Attr* id_, Attr* href) nogil:             # <<<<<<<<<<<<<<
+ *     s.elem_stack.push_back(tag)
+ *     if (cls.present and (has_word(s.d, cls.start, cls.end, b'reference', 9) or
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("wikibrev._linkscan.start_tag", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
+  __pyx_L0:;
+}
+
+/* "wikibrev/_linkscan.pyx":195
+ *             s.link_url.assign(s.d + href.start, href.end - href.start)
+ * 
+ * cdef void end_tag(Scanner* s, const string& tag) nogil:             # <<<<<<<<<<<<<<
+ *     # close the innermost element with this tag, together with all the
+ *     # elements inside it (or everything if there is no such element)
+ */
+
+static void __pyx_f_8wikibrev_9_linkscan_end_tag(struct __pyx_t_8wikibrev_9_linkscan_Scanner *__pyx_v_s, std::string const &__pyx_v_tag) {
+  Py_ssize_t __pyx_v_old_depth;
+  Py_ssize_t __pyx_v_depth;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  long __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+
+  /* "wikibrev/_linkscan.pyx":198
+ *     # close the innermost element with this tag, together with all the
+ *     # elements inside it (or everything if there is no such element)
+ *     cdef Py_ssize_t old_depth = s.elem_stack.size()             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t depth = old_depth - 1
+ *     while depth > 0 and s.elem_stack[depth] != tag:
+ */
+  __pyx_v_old_depth = __pyx_v_s->elem_stack.size();
+
+  /* "wikibrev/_linkscan.pyx":199
+ *     # elements inside it (or everything if there is no such element)
+ *     cdef Py_ssize_t old_depth = s.elem_stack.size()
+ *     cdef Py_ssize_t depth = old_depth - 1             # <<<<<<<<<<<<<<
+ *     while depth > 0 and s.elem_stack[depth] != tag:
+ *         depth -= 1
+ */
+  __pyx_v_depth = (__pyx_v_old_depth - 1);
+
+  /* "wikibrev/_linkscan.pyx":200
+ *     cdef Py_ssize_t old_depth = s.elem_stack.size()
+ *     cdef Py_ssize_t depth = old_depth - 1
+ *     while depth > 0 and s.elem_stack[depth] != tag:             # <<<<<<<<<<<<<<
+ *         depth -= 1
+ *     if depth < 0:
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_depth > 0) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L5_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_s->elem_stack[__pyx_v_depth]) != __pyx_v_tag) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L5_bool_binop_done:;
+    if (!__pyx_t_1) break;
+
+    /* "wikibrev/_linkscan.pyx":201
+ *     cdef Py_ssize_t depth = old_depth - 1
+ *     while depth > 0 and s.elem_stack[depth] != tag:
+ *         depth -= 1             # <<<<<<<<<<<<<<
+ *     if depth < 0:
+ *         depth = 0
+ */
+    __pyx_v_depth = (__pyx_v_depth - 1);
+  }
+
+  /* "wikibrev/_linkscan.pyx":202
+ *     while depth > 0 and s.elem_stack[depth] != tag:
+ *         depth -= 1
+ *     if depth < 0:             # <<<<<<<<<<<<<<
+ *         depth = 0
+ *     s.forb_depth = max(0, s.forb_depth - (old_depth - depth))
+ */
+  __pyx_t_1 = ((__pyx_v_depth < 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":203
+ *         depth -= 1
+ *     if depth < 0:
+ *         depth = 0             # <<<<<<<<<<<<<<
+ *     s.forb_depth = max(0, s.forb_depth - (old_depth - depth))
+ *     s.elem_stack.resize(depth)
+ */
+    __pyx_v_depth = 0;
+
+    /* "wikibrev/_linkscan.pyx":202
+ *     while depth > 0 and s.elem_stack[depth] != tag:
+ *         depth -= 1
+ *     if depth < 0:             # <<<<<<<<<<<<<<
+ *         depth = 0
+ *     s.forb_depth = max(0, s.forb_depth - (old_depth - depth))
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":204
+ *     if depth < 0:
+ *         depth = 0
+ *     s.forb_depth = max(0, s.forb_depth - (old_depth - depth))             # <<<<<<<<<<<<<<
+ *     s.elem_stack.resize(depth)
+ *     if tag == b'a' and s.is_link:
+ */
+  __pyx_t_3 = (__pyx_v_s->forb_depth - (__pyx_v_old_depth - __pyx_v_depth));
+  __pyx_t_4 = 0;
+  if (((__pyx_t_3 > __pyx_t_4) != 0)) {
+    __pyx_t_5 = __pyx_t_3;
+  } else {
+    __pyx_t_5 = __pyx_t_4;
+  }
+  __pyx_v_s->forb_depth = __pyx_t_5;
+
+  /* "wikibrev/_linkscan.pyx":205
+ *         depth = 0
+ *     s.forb_depth = max(0, s.forb_depth - (old_depth - depth))
+ *     s.elem_stack.resize(depth)             # <<<<<<<<<<<<<<
+ *     if tag == b'a' and s.is_link:
+ *         if s.link_url.size() == 0 or s.link_url[0] != b'#':
+ */
+  try {
+    __pyx_v_s->elem_stack.resize(__pyx_v_depth);
+  } catch(...) {
+    #ifdef WITH_THREAD
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    #endif
+    __Pyx_CppExn2PyErr();
+    #ifdef WITH_THREAD
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    #endif
+    __PYX_ERR(0, 205, __pyx_L1_error)
+  }
+
+  /* "wikibrev/_linkscan.pyx":206
+ *     s.forb_depth = max(0, s.forb_depth - (old_depth - depth))
+ *     s.elem_stack.resize(depth)
+ *     if tag == b'a' and s.is_link:             # <<<<<<<<<<<<<<
+ *         if s.link_url.size() == 0 or s.link_url[0] != b'#':
+ *             s.urls.push_back(s.link_url)
+ */
+  __pyx_t_2 = ((__pyx_v_tag == ((char const *)"a")) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L9_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_s->is_link != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L9_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":207
+ *     s.elem_stack.resize(depth)
+ *     if tag == b'a' and s.is_link:
+ *         if s.link_url.size() == 0 or s.link_url[0] != b'#':             # <<<<<<<<<<<<<<
+ *             s.urls.push_back(s.link_url)
+ *             s.texts.push_back(s.link_text)
+ */
+    __pyx_t_2 = ((__pyx_v_s->link_url.size() == 0) != 0);
+    if (!__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L12_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_s->link_url[0]) != '#') != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L12_bool_binop_done:;
+    if (__pyx_t_1) {
+
+      /* "wikibrev/_linkscan.pyx":208
+ *     if tag == b'a' and s.is_link:
+ *         if s.link_url.size() == 0 or s.link_url[0] != b'#':
+ *             s.urls.push_back(s.link_url)             # <<<<<<<<<<<<<<
+ *             s.texts.push_back(s.link_text)
+ *         s.is_link = False
+ */
+      try {
+        __pyx_v_s->urls.push_back(__pyx_v_s->link_url);
+      } catch(...) {
+        #ifdef WITH_THREAD
+        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+        #endif
+        __Pyx_CppExn2PyErr();
+        #ifdef WITH_THREAD
+        __Pyx_PyGILState_Release(__pyx_gilstate_save);
+        #endif
+        __PYX_ERR(0, 208, __pyx_L1_error)
+      }
+
+      /* "wikibrev/_linkscan.pyx":209
+ *         if s.link_url.size() == 0 or s.link_url[0] != b'#':
+ *             s.urls.push_back(s.link_url)
+ *             s.texts.push_back(s.link_text)             # <<<<<<<<<<<<<<
+ *         s.is_link = False
+ *         s.link_url.clear()
+ */
+      try {
+        __pyx_v_s->texts.push_back(__pyx_v_s->link_text);
+      } catch(...) {
+        #ifdef WITH_THREAD
+        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+        #endif
+        __Pyx_CppExn2PyErr();
+        #ifdef WITH_THREAD
+        __Pyx_PyGILState_Release(__pyx_gilstate_save);
+        #endif
+        __PYX_ERR(0, 209, __pyx_L1_error)
+      }
+
+      /* "wikibrev/_linkscan.pyx":207
+ *     s.elem_stack.resize(depth)
+ *     if tag == b'a' and s.is_link:
+ *         if s.link_url.size() == 0 or s.link_url[0] != b'#':             # <<<<<<<<<<<<<<
+ *             s.urls.push_back(s.link_url)
+ *             s.texts.push_back(s.link_text)
+ */
+    }
+
+    /* "wikibrev/_linkscan.pyx":210
+ *             s.urls.push_back(s.link_url)
+ *             s.texts.push_back(s.link_text)
+ *         s.is_link = False             # <<<<<<<<<<<<<<
+ *         s.link_url.clear()
+ *         s.link_text.clear()
+ */
+    __pyx_v_s->is_link = 0;
+
+    /* "wikibrev/_linkscan.pyx":211
+ *             s.texts.push_back(s.link_text)
+ *         s.is_link = False
+ *         s.link_url.clear()             # <<<<<<<<<<<<<<
+ *         s.link_text.clear()
+ * 
+ */
+    __pyx_v_s->link_url.clear();
+
+    /* "wikibrev/_linkscan.pyx":212
+ *         s.is_link = False
+ *         s.link_url.clear()
+ *         s.link_text.clear()             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+    __pyx_v_s->link_text.clear();
+
+    /* "wikibrev/_linkscan.pyx":206
+ *     s.forb_depth = max(0, s.forb_depth - (old_depth - depth))
+ *     s.elem_stack.resize(depth)
+ *     if tag == b'a' and s.is_link:             # <<<<<<<<<<<<<<
+ *         if s.link_url.size() == 0 or s.link_url[0] != b'#':
+ *             s.urls.push_back(s.link_url)
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":195
+ *             s.link_url.assign(s.d + href.start, href.end - href.start)
+ * 
+ * cdef void end_tag(Scanner* s, const string& tag) nogil:             # <<<<<<<<<<<<<<
+ *     # close the innermost element with this tag, together with all the
+ *     # elements inside it (or everything if there is no such element)
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("wikibrev._linkscan.end_tag", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
+  __pyx_L0:;
+}
+
+/* "wikibrev/_linkscan.pyx":215
+ * 
+ * 
+ * cdef Py_ssize_t skip_trailer(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:             # <<<<<<<<<<<<<<
+ *     # (?:\s|/(?!>))*
+ *     while i < n:
+ */
+
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_skip_trailer(char const *__pyx_v_d, Py_ssize_t __pyx_v_i, Py_ssize_t __pyx_v_n) {
+  Py_ssize_t __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+
+  /* "wikibrev/_linkscan.pyx":217
+ * cdef Py_ssize_t skip_trailer(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:
+ *     # (?:\s|/(?!>))*
+ *     while i < n:             # <<<<<<<<<<<<<<
+ *         if is_space(d[i]):
+ *             i += 1
+ */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_i < __pyx_v_n) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "wikibrev/_linkscan.pyx":218
+ *     # (?:\s|/(?!>))*
+ *     while i < n:
+ *         if is_space(d[i]):             # <<<<<<<<<<<<<<
+ *             i += 1
+ *         elif d[i] == b'/' and not (i + 1 < n and d[i+1] == b'>'):
+ */
+    __pyx_t_1 = (__pyx_f_8wikibrev_9_linkscan_is_space((__pyx_v_d[__pyx_v_i])) != 0);
+    if (__pyx_t_1) {
+
+      /* "wikibrev/_linkscan.pyx":219
+ *     while i < n:
+ *         if is_space(d[i]):
+ *             i += 1             # <<<<<<<<<<<<<<
+ *         elif d[i] == b'/' and not (i + 1 < n and d[i+1] == b'>'):
+ *             i += 1
+ */
+      __pyx_v_i = (__pyx_v_i + 1);
+
+      /* "wikibrev/_linkscan.pyx":218
+ *     # (?:\s|/(?!>))*
+ *     while i < n:
+ *         if is_space(d[i]):             # <<<<<<<<<<<<<<
+ *             i += 1
+ *         elif d[i] == b'/' and not (i + 1 < n and d[i+1] == b'>'):
+ */
+      goto __pyx_L5;
+    }
+
+    /* "wikibrev/_linkscan.pyx":220
+ *         if is_space(d[i]):
+ *             i += 1
+ *         elif d[i] == b'/' and not (i + 1 < n and d[i+1] == b'>'):             # <<<<<<<<<<<<<<
+ *             i += 1
+ *         else:
+ */
+    __pyx_t_2 = (((__pyx_v_d[__pyx_v_i]) == '/') != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L6_bool_binop_done;
+    }
+    __pyx_t_3 = (((__pyx_v_i + 1) < __pyx_v_n) != 0);
+    if (__pyx_t_3) {
+    } else {
+      __pyx_t_2 = __pyx_t_3;
+      goto __pyx_L8_bool_binop_done;
+    }
+    __pyx_t_3 = (((__pyx_v_d[(__pyx_v_i + 1)]) == '>') != 0);
+    __pyx_t_2 = __pyx_t_3;
+    __pyx_L8_bool_binop_done:;
+    __pyx_t_3 = ((!__pyx_t_2) != 0);
+    __pyx_t_1 = __pyx_t_3;
+    __pyx_L6_bool_binop_done:;
+    if (__pyx_t_1) {
+
+      /* "wikibrev/_linkscan.pyx":221
+ *             i += 1
+ *         elif d[i] == b'/' and not (i + 1 < n and d[i+1] == b'>'):
+ *             i += 1             # <<<<<<<<<<<<<<
+ *         else:
+ *             break
+ */
+      __pyx_v_i = (__pyx_v_i + 1);
+
+      /* "wikibrev/_linkscan.pyx":220
+ *         if is_space(d[i]):
+ *             i += 1
+ *         elif d[i] == b'/' and not (i + 1 < n and d[i+1] == b'>'):             # <<<<<<<<<<<<<<
+ *             i += 1
+ *         else:
+ */
+      goto __pyx_L5;
+    }
+
+    /* "wikibrev/_linkscan.pyx":223
+ *             i += 1
+ *         else:
+ *             break             # <<<<<<<<<<<<<<
+ *     return i
+ * 
+ */
+    /*else*/ {
+      goto __pyx_L4_break;
+    }
+    __pyx_L5:;
+  }
+  __pyx_L4_break:;
+
+  /* "wikibrev/_linkscan.pyx":224
+ *         else:
+ *             break
+ *     return i             # <<<<<<<<<<<<<<
+ * 
+ * cdef Py_ssize_t bare_value_end(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:
+ */
+  __pyx_r = __pyx_v_i;
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":215
+ * 
+ * 
+ * cdef Py_ssize_t skip_trailer(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:             # <<<<<<<<<<<<<<
+ *     # (?:\s|/(?!>))*
+ *     while i < n:
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":226
+ *     return i
+ * 
+ * cdef Py_ssize_t bare_value_end(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:             # <<<<<<<<<<<<<<
+ *     # [^>\s]*
+ *     while i < n and d[i] != b'>' and not is_space(d[i]):
+ */
+
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_bare_value_end(char const *__pyx_v_d, Py_ssize_t __pyx_v_i, Py_ssize_t __pyx_v_n) {
+  Py_ssize_t __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "wikibrev/_linkscan.pyx":228
+ * cdef Py_ssize_t bare_value_end(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:
+ *     # [^>\s]*
+ *     while i < n and d[i] != b'>' and not is_space(d[i]):             # <<<<<<<<<<<<<<
+ *         i += 1
+ *     return i
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_i < __pyx_v_n) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L5_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_d[__pyx_v_i]) != '>') != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L5_bool_binop_done;
+    }
+    __pyx_t_2 = ((!(__pyx_f_8wikibrev_9_linkscan_is_space((__pyx_v_d[__pyx_v_i])) != 0)) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L5_bool_binop_done:;
+    if (!__pyx_t_1) break;
+
+    /* "wikibrev/_linkscan.pyx":229
+ *     # [^>\s]*
+ *     while i < n and d[i] != b'>' and not is_space(d[i]):
+ *         i += 1             # <<<<<<<<<<<<<<
+ *     return i
+ * 
+ */
+    __pyx_v_i = (__pyx_v_i + 1);
+  }
+
+  /* "wikibrev/_linkscan.pyx":230
+ *     while i < n and d[i] != b'>' and not is_space(d[i]):
+ *         i += 1
+ *     return i             # <<<<<<<<<<<<<<
+ * 
+ * cdef Py_ssize_t match_value(const char* d, Py_ssize_t i, Py_ssize_t n, Attr* value) nogil:
+ */
+  __pyx_r = __pyx_v_i;
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":226
+ *     return i
+ * 
+ * cdef Py_ssize_t bare_value_end(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:             # <<<<<<<<<<<<<<
+ *     # [^>\s]*
+ *     while i < n and d[i] != b'>' and not is_space(d[i]):
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":232
+ *     return i
+ * 
+ * cdef Py_ssize_t match_value(const char* d, Py_ssize_t i, Py_ssize_t n, Attr* value) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Match the value part \\s*=+\\s*('[^']*'|"[^"]*"|(?!['"])[^>\\s]*) of an
+ */
+
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_match_value(char const *__pyx_v_d, Py_ssize_t __pyx_v_i, Py_ssize_t __pyx_v_n, struct __pyx_t_8wikibrev_9_linkscan_Attr *__pyx_v_value) {
+  Py_ssize_t __pyx_v_p1;
+  Py_ssize_t __pyx_v_p2;
+  Py_ssize_t __pyx_v_p3;
+  Py_ssize_t __pyx_v_q;
+  Py_ssize_t __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+
+  /* "wikibrev/_linkscan.pyx":238
+ *     the end of the match and set `value`, or return -1 if there is no match.
+ *     """
+ *     cdef Py_ssize_t p1 = i, p2, p3, q             # <<<<<<<<<<<<<<
+ *     while p1 < n and is_space(d[p1]):
+ *         p1 += 1
+ */
+  __pyx_v_p1 = __pyx_v_i;
+
+  /* "wikibrev/_linkscan.pyx":239
+ *     """
+ *     cdef Py_ssize_t p1 = i, p2, p3, q
+ *     while p1 < n and is_space(d[p1]):             # <<<<<<<<<<<<<<
+ *         p1 += 1
+ *     if p1 >= n or d[p1] != b'=':
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_p1 < __pyx_v_n) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L5_bool_binop_done;
+    }
+    __pyx_t_2 = (__pyx_f_8wikibrev_9_linkscan_is_space((__pyx_v_d[__pyx_v_p1])) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L5_bool_binop_done:;
+    if (!__pyx_t_1) break;
+
+    /* "wikibrev/_linkscan.pyx":240
+ *     cdef Py_ssize_t p1 = i, p2, p3, q
+ *     while p1 < n and is_space(d[p1]):
+ *         p1 += 1             # <<<<<<<<<<<<<<
+ *     if p1 >= n or d[p1] != b'=':
+ *         return -1
+ */
+    __pyx_v_p1 = (__pyx_v_p1 + 1);
+  }
+
+  /* "wikibrev/_linkscan.pyx":241
+ *     while p1 < n and is_space(d[p1]):
+ *         p1 += 1
+ *     if p1 >= n or d[p1] != b'=':             # <<<<<<<<<<<<<<
+ *         return -1
+ *     p2 = p1
+ */
+  __pyx_t_2 = ((__pyx_v_p1 >= __pyx_v_n) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L8_bool_binop_done;
+  }
+  __pyx_t_2 = (((__pyx_v_d[__pyx_v_p1]) != '=') != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L8_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":242
+ *         p1 += 1
+ *     if p1 >= n or d[p1] != b'=':
+ *         return -1             # <<<<<<<<<<<<<<
+ *     p2 = p1
+ *     while p2 < n and d[p2] == b'=':
+ */
+    __pyx_r = -1L;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":241
+ *     while p1 < n and is_space(d[p1]):
+ *         p1 += 1
+ *     if p1 >= n or d[p1] != b'=':             # <<<<<<<<<<<<<<
+ *         return -1
+ *     p2 = p1
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":243
+ *     if p1 >= n or d[p1] != b'=':
+ *         return -1
+ *     p2 = p1             # <<<<<<<<<<<<<<
+ *     while p2 < n and d[p2] == b'=':
+ *         p2 += 1
+ */
+  __pyx_v_p2 = __pyx_v_p1;
+
+  /* "wikibrev/_linkscan.pyx":244
+ *         return -1
+ *     p2 = p1
+ *     while p2 < n and d[p2] == b'=':             # <<<<<<<<<<<<<<
+ *         p2 += 1
+ *     p3 = p2
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_p2 < __pyx_v_n) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L12_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_d[__pyx_v_p2]) == '=') != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L12_bool_binop_done:;
+    if (!__pyx_t_1) break;
+
+    /* "wikibrev/_linkscan.pyx":245
+ *     p2 = p1
+ *     while p2 < n and d[p2] == b'=':
+ *         p2 += 1             # <<<<<<<<<<<<<<
+ *     p3 = p2
+ *     while p3 < n and is_space(d[p3]):
+ */
+    __pyx_v_p2 = (__pyx_v_p2 + 1);
+  }
+
+  /* "wikibrev/_linkscan.pyx":246
+ *     while p2 < n and d[p2] == b'=':
+ *         p2 += 1
+ *     p3 = p2             # <<<<<<<<<<<<<<
+ *     while p3 < n and is_space(d[p3]):
+ *         p3 += 1
+ */
+  __pyx_v_p3 = __pyx_v_p2;
+
+  /* "wikibrev/_linkscan.pyx":247
+ *         p2 += 1
+ *     p3 = p2
+ *     while p3 < n and is_space(d[p3]):             # <<<<<<<<<<<<<<
+ *         p3 += 1
+ *     if p3 < n and (d[p3] == b'\'' or d[p3] == b'"'):
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_p3 < __pyx_v_n) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L16_bool_binop_done;
+    }
+    __pyx_t_2 = (__pyx_f_8wikibrev_9_linkscan_is_space((__pyx_v_d[__pyx_v_p3])) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L16_bool_binop_done:;
+    if (!__pyx_t_1) break;
+
+    /* "wikibrev/_linkscan.pyx":248
+ *     p3 = p2
+ *     while p3 < n and is_space(d[p3]):
+ *         p3 += 1             # <<<<<<<<<<<<<<
+ *     if p3 < n and (d[p3] == b'\'' or d[p3] == b'"'):
+ *         q = find(d, d[p3], p3 + 1, n)
+ */
+    __pyx_v_p3 = (__pyx_v_p3 + 1);
+  }
+
+  /* "wikibrev/_linkscan.pyx":249
+ *     while p3 < n and is_space(d[p3]):
+ *         p3 += 1
+ *     if p3 < n and (d[p3] == b'\'' or d[p3] == b'"'):             # <<<<<<<<<<<<<<
+ *         q = find(d, d[p3], p3 + 1, n)
+ *         if q >= 0:
+ */
+  __pyx_t_2 = ((__pyx_v_p3 < __pyx_v_n) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L19_bool_binop_done;
+  }
+  __pyx_t_2 = (((__pyx_v_d[__pyx_v_p3]) == '\'') != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L19_bool_binop_done;
+  }
+  __pyx_t_2 = (((__pyx_v_d[__pyx_v_p3]) == '"') != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L19_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":250
+ *         p3 += 1
+ *     if p3 < n and (d[p3] == b'\'' or d[p3] == b'"'):
+ *         q = find(d, d[p3], p3 + 1, n)             # <<<<<<<<<<<<<<
+ *         if q >= 0:
+ *             (value.start, value.end) = (p3, q + 1)
+ */
+    __pyx_v_q = __pyx_f_8wikibrev_9_linkscan_find(__pyx_v_d, (__pyx_v_d[__pyx_v_p3]), (__pyx_v_p3 + 1), __pyx_v_n);
+
+    /* "wikibrev/_linkscan.pyx":251
+ *     if p3 < n and (d[p3] == b'\'' or d[p3] == b'"'):
+ *         q = find(d, d[p3], p3 + 1, n)
+ *         if q >= 0:             # <<<<<<<<<<<<<<
+ *             (value.start, value.end) = (p3, q + 1)
+ *         elif p3 > p2:
+ */
+    __pyx_t_1 = ((__pyx_v_q >= 0) != 0);
+    if (__pyx_t_1) {
+
+      /* "wikibrev/_linkscan.pyx":252
+ *         q = find(d, d[p3], p3 + 1, n)
+ *         if q >= 0:
+ *             (value.start, value.end) = (p3, q + 1)             # <<<<<<<<<<<<<<
+ *         elif p3 > p2:
+ *             # an empty bare value before the last whitespace
+ */
+      __pyx_t_3 = __pyx_v_p3;
+      __pyx_t_4 = (__pyx_v_q + 1);
+      __pyx_v_value->start = __pyx_t_3;
+      __pyx_v_value->end = __pyx_t_4;
+
+      /* "wikibrev/_linkscan.pyx":251
+ *     if p3 < n and (d[p3] == b'\'' or d[p3] == b'"'):
+ *         q = find(d, d[p3], p3 + 1, n)
+ *         if q >= 0:             # <<<<<<<<<<<<<<
+ *             (value.start, value.end) = (p3, q + 1)
+ *         elif p3 > p2:
+ */
+      goto __pyx_L22;
+    }
+
+    /* "wikibrev/_linkscan.pyx":253
+ *         if q >= 0:
+ *             (value.start, value.end) = (p3, q + 1)
+ *         elif p3 > p2:             # <<<<<<<<<<<<<<
+ *             # an empty bare value before the last whitespace
+ *             (value.start, value.end) = (p3 - 1, p3 - 1)
+ */
+    __pyx_t_1 = ((__pyx_v_p3 > __pyx_v_p2) != 0);
+    if (__pyx_t_1) {
+
+      /* "wikibrev/_linkscan.pyx":255
+ *         elif p3 > p2:
+ *             # an empty bare value before the last whitespace
+ *             (value.start, value.end) = (p3 - 1, p3 - 1)             # <<<<<<<<<<<<<<
+ *         elif p2 - p1 >= 2:
+ *             # a bare value starting with the last '='
+ */
+      __pyx_t_4 = (__pyx_v_p3 - 1);
+      __pyx_t_3 = (__pyx_v_p3 - 1);
+      __pyx_v_value->start = __pyx_t_4;
+      __pyx_v_value->end = __pyx_t_3;
+
+      /* "wikibrev/_linkscan.pyx":253
+ *         if q >= 0:
+ *             (value.start, value.end) = (p3, q + 1)
+ *         elif p3 > p2:             # <<<<<<<<<<<<<<
+ *             # an empty bare value before the last whitespace
+ *             (value.start, value.end) = (p3 - 1, p3 - 1)
+ */
+      goto __pyx_L22;
+    }
+
+    /* "wikibrev/_linkscan.pyx":256
+ *             # an empty bare value before the last whitespace
+ *             (value.start, value.end) = (p3 - 1, p3 - 1)
+ *         elif p2 - p1 >= 2:             # <<<<<<<<<<<<<<
+ *             # a bare value starting with the last '='
+ *             (value.start, value.end) = (p2 - 1, bare_value_end(d, p2 - 1, n))
+ */
+    __pyx_t_1 = (((__pyx_v_p2 - __pyx_v_p1) >= 2) != 0);
+    if (__pyx_t_1) {
+
+      /* "wikibrev/_linkscan.pyx":258
+ *         elif p2 - p1 >= 2:
+ *             # a bare value starting with the last '='
+ *             (value.start, value.end) = (p2 - 1, bare_value_end(d, p2 - 1, n))             # <<<<<<<<<<<<<<
+ *         else:
+ *             return -1
+ */
+      __pyx_t_3 = (__pyx_v_p2 - 1);
+      __pyx_t_4 = __pyx_f_8wikibrev_9_linkscan_bare_value_end(__pyx_v_d, (__pyx_v_p2 - 1), __pyx_v_n);
+      __pyx_v_value->start = __pyx_t_3;
+      __pyx_v_value->end = __pyx_t_4;
+
+      /* "wikibrev/_linkscan.pyx":256
+ *             # an empty bare value before the last whitespace
+ *             (value.start, value.end) = (p3 - 1, p3 - 1)
+ *         elif p2 - p1 >= 2:             # <<<<<<<<<<<<<<
+ *             # a bare value starting with the last '='
+ *             (value.start, value.end) = (p2 - 1, bare_value_end(d, p2 - 1, n))
+ */
+      goto __pyx_L22;
+    }
+
+    /* "wikibrev/_linkscan.pyx":260
+ *             (value.start, value.end) = (p2 - 1, bare_value_end(d, p2 - 1, n))
+ *         else:
+ *             return -1             # <<<<<<<<<<<<<<
+ *     else:
+ *         (value.start, value.end) = (p3, bare_value_end(d, p3, n))
+ */
+    /*else*/ {
+      __pyx_r = -1L;
+      goto __pyx_L0;
+    }
+    __pyx_L22:;
+
+    /* "wikibrev/_linkscan.pyx":249
+ *     while p3 < n and is_space(d[p3]):
+ *         p3 += 1
+ *     if p3 < n and (d[p3] == b'\'' or d[p3] == b'"'):             # <<<<<<<<<<<<<<
+ *         q = find(d, d[p3], p3 + 1, n)
+ *         if q >= 0:
+ */
+    goto __pyx_L18;
+  }
+
+  /* "wikibrev/_linkscan.pyx":262
+ *             return -1
+ *     else:
+ *         (value.start, value.end) = (p3, bare_value_end(d, p3, n))             # <<<<<<<<<<<<<<
+ *     value.present = True
+ *     return value.end
+ */
+  /*else*/ {
+    __pyx_t_4 = __pyx_v_p3;
+    __pyx_t_3 = __pyx_f_8wikibrev_9_linkscan_bare_value_end(__pyx_v_d, __pyx_v_p3, __pyx_v_n);
+    __pyx_v_value->start = __pyx_t_4;
+    __pyx_v_value->end = __pyx_t_3;
+  }
+  __pyx_L18:;
+
+  /* "wikibrev/_linkscan.pyx":263
+ *     else:
+ *         (value.start, value.end) = (p3, bare_value_end(d, p3, n))
+ *     value.present = True             # <<<<<<<<<<<<<<
+ *     return value.end
+ * 
+ */
+  __pyx_v_value->present = 1;
+
+  /* "wikibrev/_linkscan.pyx":264
+ *         (value.start, value.end) = (p3, bare_value_end(d, p3, n))
+ *     value.present = True
+ *     return value.end             # <<<<<<<<<<<<<<
+ * 
+ * cdef Py_ssize_t match_attr(const char* d, Py_ssize_t i, Py_ssize_t n, Attr* name, Attr* value) nogil:
+ */
+  __pyx_r = __pyx_v_value->end;
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":232
+ *     return i
+ * 
+ * cdef Py_ssize_t match_value(const char* d, Py_ssize_t i, Py_ssize_t n, Attr* value) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Match the value part \\s*=+\\s*('[^']*'|"[^"]*"|(?!['"])[^>\\s]*) of an
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":266
+ *     return value.end
+ * 
+ * cdef Py_ssize_t match_attr(const char* d, Py_ssize_t i, Py_ssize_t n, Attr* name, Attr* value) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Match `HTMLParser.attrfind` at `i`. Return the end of the match and set
+ */
+
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_match_attr(char const *__pyx_v_d, Py_ssize_t __pyx_v_i, Py_ssize_t __pyx_v_n, struct __pyx_t_8wikibrev_9_linkscan_Attr *__pyx_v_name, struct __pyx_t_8wikibrev_9_linkscan_Attr *__pyx_v_value) {
+  char __pyx_v_c;
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+
+  /* "wikibrev/_linkscan.pyx":273
+ *     """
+ *     cdef char c
+ *     if i == 0 or i >= n:             # <<<<<<<<<<<<<<
+ *         return -1
+ *     c = d[i-1]
+ */
+  __pyx_t_2 = ((__pyx_v_i == 0) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_i >= __pyx_v_n) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":274
+ *     cdef char c
+ *     if i == 0 or i >= n:
+ *         return -1             # <<<<<<<<<<<<<<
+ *     c = d[i-1]
+ *     if not (c == b'\'' or c == b'"' or c == b'/' or is_space(c)):
+ */
+    __pyx_r = -1L;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":273
+ *     """
+ *     cdef char c
+ *     if i == 0 or i >= n:             # <<<<<<<<<<<<<<
+ *         return -1
+ *     c = d[i-1]
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":275
+ *     if i == 0 or i >= n:
+ *         return -1
+ *     c = d[i-1]             # <<<<<<<<<<<<<<
+ *     if not (c == b'\'' or c == b'"' or c == b'/' or is_space(c)):
+ *         return -1
+ */
+  __pyx_v_c = (__pyx_v_d[(__pyx_v_i - 1)]);
+
+  /* "wikibrev/_linkscan.pyx":276
+ *         return -1
+ *     c = d[i-1]
+ *     if not (c == b'\'' or c == b'"' or c == b'/' or is_space(c)):             # <<<<<<<<<<<<<<
+ *         return -1
+ *     c = d[i]
+ */
+  __pyx_t_2 = ((__pyx_v_c == '\'') != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L7_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_c == '"') != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L7_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_c == '/') != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L7_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_f_8wikibrev_9_linkscan_is_space(__pyx_v_c) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L7_bool_binop_done:;
+  __pyx_t_2 = ((!__pyx_t_1) != 0);
+  if (__pyx_t_2) {
+
+    /* "wikibrev/_linkscan.pyx":277
+ *     c = d[i-1]
+ *     if not (c == b'\'' or c == b'"' or c == b'/' or is_space(c)):
+ *         return -1             # <<<<<<<<<<<<<<
+ *     c = d[i]
+ *     if is_space(c) or c == b'/' or c == b'>':
+ */
+    __pyx_r = -1L;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":276
+ *         return -1
+ *     c = d[i-1]
+ *     if not (c == b'\'' or c == b'"' or c == b'/' or is_space(c)):             # <<<<<<<<<<<<<<
+ *         return -1
+ *     c = d[i]
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":278
+ *     if not (c == b'\'' or c == b'"' or c == b'/' or is_space(c)):
+ *         return -1
+ *     c = d[i]             # <<<<<<<<<<<<<<
+ *     if is_space(c) or c == b'/' or c == b'>':
+ *         return -1
+ */
+  __pyx_v_c = (__pyx_v_d[__pyx_v_i]);
+
+  /* "wikibrev/_linkscan.pyx":279
+ *         return -1
+ *     c = d[i]
+ *     if is_space(c) or c == b'/' or c == b'>':             # <<<<<<<<<<<<<<
+ *         return -1
+ *     name.start = i
+ */
+  __pyx_t_1 = (__pyx_f_8wikibrev_9_linkscan_is_space(__pyx_v_c) != 0);
+  if (!__pyx_t_1) {
+  } else {
+    __pyx_t_2 = __pyx_t_1;
+    goto __pyx_L12_bool_binop_done;
+  }
+  switch (__pyx_v_c) {
+    case '/':
+    case '>':
+    __pyx_t_1 = 1;
+    break;
+    default:
+    __pyx_t_1 = 0;
+    break;
+  }
+  __pyx_t_2 = __pyx_t_1;
+  __pyx_L12_bool_binop_done:;
+  if (__pyx_t_2) {
+
+    /* "wikibrev/_linkscan.pyx":280
+ *     c = d[i]
+ *     if is_space(c) or c == b'/' or c == b'>':
+ *         return -1             # <<<<<<<<<<<<<<
+ *     name.start = i
+ *     i += 1
+ */
+    __pyx_r = -1L;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":279
+ *         return -1
+ *     c = d[i]
+ *     if is_space(c) or c == b'/' or c == b'>':             # <<<<<<<<<<<<<<
+ *         return -1
+ *     name.start = i
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":281
+ *     if is_space(c) or c == b'/' or c == b'>':
+ *         return -1
+ *     name.start = i             # <<<<<<<<<<<<<<
+ *     i += 1
+ *     while i < n and not (is_space(d[i]) or d[i] == b'/' or d[i] == b'=' or d[i] == b'>'):
+ */
+  __pyx_v_name->start = __pyx_v_i;
+
+  /* "wikibrev/_linkscan.pyx":282
+ *         return -1
+ *     name.start = i
+ *     i += 1             # <<<<<<<<<<<<<<
+ *     while i < n and not (is_space(d[i]) or d[i] == b'/' or d[i] == b'=' or d[i] == b'>'):
+ *         i += 1
+ */
+  __pyx_v_i = (__pyx_v_i + 1);
+
+  /* "wikibrev/_linkscan.pyx":283
+ *     name.start = i
+ *     i += 1
+ *     while i < n and not (is_space(d[i]) or d[i] == b'/' or d[i] == b'=' or d[i] == b'>'):             # <<<<<<<<<<<<<<
+ *         i += 1
+ *     name.end = i
+ */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_i < __pyx_v_n) != 0);
+    if (__pyx_t_1) {
+    } else {
+      __pyx_t_2 = __pyx_t_1;
+      goto __pyx_L16_bool_binop_done;
+    }
+    __pyx_t_3 = (__pyx_f_8wikibrev_9_linkscan_is_space((__pyx_v_d[__pyx_v_i])) != 0);
+    if (!__pyx_t_3) {
+    } else {
+      __pyx_t_1 = __pyx_t_3;
+      goto __pyx_L18_bool_binop_done;
+    }
+    __pyx_t_3 = (((__pyx_v_d[__pyx_v_i]) == '/') != 0);
+    if (!__pyx_t_3) {
+    } else {
+      __pyx_t_1 = __pyx_t_3;
+      goto __pyx_L18_bool_binop_done;
+    }
+    __pyx_t_3 = (((__pyx_v_d[__pyx_v_i]) == '=') != 0);
+    if (!__pyx_t_3) {
+    } else {
+      __pyx_t_1 = __pyx_t_3;
+      goto __pyx_L18_bool_binop_done;
+    }
+    __pyx_t_3 = (((__pyx_v_d[__pyx_v_i]) == '>') != 0);
+    __pyx_t_1 = __pyx_t_3;
+    __pyx_L18_bool_binop_done:;
+    __pyx_t_3 = ((!__pyx_t_1) != 0);
+    __pyx_t_2 = __pyx_t_3;
+    __pyx_L16_bool_binop_done:;
+    if (!__pyx_t_2) break;
+
+    /* "wikibrev/_linkscan.pyx":284
+ *     i += 1
+ *     while i < n and not (is_space(d[i]) or d[i] == b'/' or d[i] == b'=' or d[i] == b'>'):
+ *         i += 1             # <<<<<<<<<<<<<<
+ *     name.end = i
+ *     value.present = False
+ */
+    __pyx_v_i = (__pyx_v_i + 1);
+  }
+
+  /* "wikibrev/_linkscan.pyx":285
+ *     while i < n and not (is_space(d[i]) or d[i] == b'/' or d[i] == b'=' or d[i] == b'>'):
+ *         i += 1
+ *     name.end = i             # <<<<<<<<<<<<<<
+ *     value.present = False
+ *     cdef Py_ssize_t j = match_value(d, i, n, value)
+ */
+  __pyx_v_name->end = __pyx_v_i;
+
+  /* "wikibrev/_linkscan.pyx":286
+ *         i += 1
+ *     name.end = i
+ *     value.present = False             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t j = match_value(d, i, n, value)
+ *     if j >= 0:
+ */
+  __pyx_v_value->present = 0;
+
+  /* "wikibrev/_linkscan.pyx":287
+ *     name.end = i
+ *     value.present = False
+ *     cdef Py_ssize_t j = match_value(d, i, n, value)             # <<<<<<<<<<<<<<
+ *     if j >= 0:
+ *         i = j
+ */
+  __pyx_v_j = __pyx_f_8wikibrev_9_linkscan_match_value(__pyx_v_d, __pyx_v_i, __pyx_v_n, __pyx_v_value);
+
+  /* "wikibrev/_linkscan.pyx":288
+ *     value.present = False
+ *     cdef Py_ssize_t j = match_value(d, i, n, value)
+ *     if j >= 0:             # <<<<<<<<<<<<<<
+ *         i = j
+ *     return skip_trailer(d, i, n)
+ */
+  __pyx_t_2 = ((__pyx_v_j >= 0) != 0);
+  if (__pyx_t_2) {
+
+    /* "wikibrev/_linkscan.pyx":289
+ *     cdef Py_ssize_t j = match_value(d, i, n, value)
+ *     if j >= 0:
+ *         i = j             # <<<<<<<<<<<<<<
+ *     return skip_trailer(d, i, n)
+ * 
+ */
+    __pyx_v_i = __pyx_v_j;
+
+    /* "wikibrev/_linkscan.pyx":288
+ *     value.present = False
+ *     cdef Py_ssize_t j = match_value(d, i, n, value)
+ *     if j >= 0:             # <<<<<<<<<<<<<<
+ *         i = j
+ *     return skip_trailer(d, i, n)
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":290
+ *     if j >= 0:
+ *         i = j
+ *     return skip_trailer(d, i, n)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline bint is_tag_name_char(char c) nogil:
+ */
+  __pyx_r = __pyx_f_8wikibrev_9_linkscan_skip_trailer(__pyx_v_d, __pyx_v_i, __pyx_v_n);
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":266
+ *     return value.end
+ * 
+ * cdef Py_ssize_t match_attr(const char* d, Py_ssize_t i, Py_ssize_t n, Attr* name, Attr* value) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Match `HTMLParser.attrfind` at `i`. Return the end of the match and set
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":292
+ *     return skip_trailer(d, i, n)
+ * 
+ * cdef inline bint is_tag_name_char(char c) nogil:             # <<<<<<<<<<<<<<
+ *     # [^\t\n\r\f />\x00]
+ *     return not (c == b'\t' or c == b'\n' or c == b'\r' or c == b'\f' or c == b' ' or c == b'/' or
+ */
+
+static CYTHON_INLINE int __pyx_f_8wikibrev_9_linkscan_is_tag_name_char(char __pyx_v_c) {
+  int __pyx_r;
+  int __pyx_t_1;
+
+  /* "wikibrev/_linkscan.pyx":294
+ * cdef inline bint is_tag_name_char(char c) nogil:
+ *     # [^\t\n\r\f />\x00]
+ *     return not (c == b'\t' or c == b'\n' or c == b'\r' or c == b'\f' or c == b' ' or c == b'/' or             # <<<<<<<<<<<<<<
+ *                 c == b'>' or c == 0)
+ * 
+ */
+  switch (__pyx_v_c) {
+    case '\t':
+    case '\n':
+    case '\r':
+    case '\x0C':
+    case ' ':
+    case '/':
+    case '>':
+
+    /* "wikibrev/_linkscan.pyx":295
+ *     # [^\t\n\r\f />\x00]
+ *     return not (c == b'\t' or c == b'\n' or c == b'\r' or c == b'\f' or c == b' ' or c == b'/' or
+ *                 c == b'>' or c == 0)             # <<<<<<<<<<<<<<
+ * 
+ * cdef Py_ssize_t locate_starttag_end(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:
+ */
+    case 0:
+
+    /* "wikibrev/_linkscan.pyx":294
+ * cdef inline bint is_tag_name_char(char c) nogil:
+ *     # [^\t\n\r\f />\x00]
+ *     return not (c == b'\t' or c == b'\n' or c == b'\r' or c == b'\f' or c == b' ' or c == b'/' or             # <<<<<<<<<<<<<<
+ *                 c == b'>' or c == 0)
+ * 
+ */
+    __pyx_t_1 = 1;
+    break;
+    default:
+    __pyx_t_1 = 0;
+    break;
+  }
+  __pyx_r = (!__pyx_t_1);
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":292
+ *     return skip_trailer(d, i, n)
+ * 
+ * cdef inline bint is_tag_name_char(char c) nogil:             # <<<<<<<<<<<<<<
+ *     # [^\t\n\r\f />\x00]
+ *     return not (c == b'\t' or c == b'\n' or c == b'\r' or c == b'\f' or c == b' ' or c == b'/' or
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":297
+ *                 c == b'>' or c == 0)
+ * 
+ * cdef Py_ssize_t locate_starttag_end(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Return the end of the match of `HTMLParser.locatestarttagend` at `i`.
+ */
+
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_locate_starttag_end(char const *__pyx_v_d, Py_ssize_t __pyx_v_i, Py_ssize_t __pyx_v_n) {
+  struct __pyx_t_8wikibrev_9_linkscan_Attr __pyx_v_name;
+  struct __pyx_t_8wikibrev_9_linkscan_Attr __pyx_v_value;
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "wikibrev/_linkscan.pyx":303
+ *     cdef Attr name, value
+ *     cdef Py_ssize_t j
+ *     i += 2             # <<<<<<<<<<<<<<
+ *     while i < n and is_tag_name_char(d[i]):
+ *         i += 1
+ */
+  __pyx_v_i = (__pyx_v_i + 2);
+
+  /* "wikibrev/_linkscan.pyx":304
+ *     cdef Py_ssize_t j
+ *     i += 2
+ *     while i < n and is_tag_name_char(d[i]):             # <<<<<<<<<<<<<<
+ *         i += 1
+ *     while i < n and (is_space(d[i]) or d[i] == b'/'):
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_i < __pyx_v_n) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L5_bool_binop_done;
+    }
+    __pyx_t_2 = (__pyx_f_8wikibrev_9_linkscan_is_tag_name_char((__pyx_v_d[__pyx_v_i])) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L5_bool_binop_done:;
+    if (!__pyx_t_1) break;
+
+    /* "wikibrev/_linkscan.pyx":305
+ *     i += 2
+ *     while i < n and is_tag_name_char(d[i]):
+ *         i += 1             # <<<<<<<<<<<<<<
+ *     while i < n and (is_space(d[i]) or d[i] == b'/'):
+ *         i += 1
+ */
+    __pyx_v_i = (__pyx_v_i + 1);
+  }
+
+  /* "wikibrev/_linkscan.pyx":306
+ *     while i < n and is_tag_name_char(d[i]):
+ *         i += 1
+ *     while i < n and (is_space(d[i]) or d[i] == b'/'):             # <<<<<<<<<<<<<<
+ *         i += 1
+ *     while True:
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_i < __pyx_v_n) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L9_bool_binop_done;
+    }
+    __pyx_t_2 = (__pyx_f_8wikibrev_9_linkscan_is_space((__pyx_v_d[__pyx_v_i])) != 0);
+    if (!__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L9_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_d[__pyx_v_i]) == '/') != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L9_bool_binop_done:;
+    if (!__pyx_t_1) break;
+
+    /* "wikibrev/_linkscan.pyx":307
+ *         i += 1
+ *     while i < n and (is_space(d[i]) or d[i] == b'/'):
+ *         i += 1             # <<<<<<<<<<<<<<
+ *     while True:
+ *         j = match_attr(d, i, n, &name, &value)
+ */
+    __pyx_v_i = (__pyx_v_i + 1);
+  }
+
+  /* "wikibrev/_linkscan.pyx":308
+ *     while i < n and (is_space(d[i]) or d[i] == b'/'):
+ *         i += 1
+ *     while True:             # <<<<<<<<<<<<<<
+ *         j = match_attr(d, i, n, &name, &value)
+ *         if j < 0:
+ */
+  while (1) {
+
+    /* "wikibrev/_linkscan.pyx":309
+ *         i += 1
+ *     while True:
+ *         j = match_attr(d, i, n, &name, &value)             # <<<<<<<<<<<<<<
+ *         if j < 0:
+ *             break
+ */
+    __pyx_v_j = __pyx_f_8wikibrev_9_linkscan_match_attr(__pyx_v_d, __pyx_v_i, __pyx_v_n, (&__pyx_v_name), (&__pyx_v_value));
+
+    /* "wikibrev/_linkscan.pyx":310
+ *     while True:
+ *         j = match_attr(d, i, n, &name, &value)
+ *         if j < 0:             # <<<<<<<<<<<<<<
+ *             break
+ *         i = j
+ */
+    __pyx_t_1 = ((__pyx_v_j < 0) != 0);
+    if (__pyx_t_1) {
+
+      /* "wikibrev/_linkscan.pyx":311
+ *         j = match_attr(d, i, n, &name, &value)
+ *         if j < 0:
+ *             break             # <<<<<<<<<<<<<<
+ *         i = j
+ *     while i < n and is_space(d[i]):
+ */
+      goto __pyx_L13_break;
+
+      /* "wikibrev/_linkscan.pyx":310
+ *     while True:
+ *         j = match_attr(d, i, n, &name, &value)
+ *         if j < 0:             # <<<<<<<<<<<<<<
+ *             break
+ *         i = j
+ */
+    }
+
+    /* "wikibrev/_linkscan.pyx":312
+ *         if j < 0:
+ *             break
+ *         i = j             # <<<<<<<<<<<<<<
+ *     while i < n and is_space(d[i]):
+ *         i += 1
+ */
+    __pyx_v_i = __pyx_v_j;
+  }
+  __pyx_L13_break:;
+
+  /* "wikibrev/_linkscan.pyx":313
+ *             break
+ *         i = j
+ *     while i < n and is_space(d[i]):             # <<<<<<<<<<<<<<
+ *         i += 1
+ *     return i
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_i < __pyx_v_n) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L17_bool_binop_done;
+    }
+    __pyx_t_2 = (__pyx_f_8wikibrev_9_linkscan_is_space((__pyx_v_d[__pyx_v_i])) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L17_bool_binop_done:;
+    if (!__pyx_t_1) break;
+
+    /* "wikibrev/_linkscan.pyx":314
+ *         i = j
+ *     while i < n and is_space(d[i]):
+ *         i += 1             # <<<<<<<<<<<<<<
+ *     return i
+ * 
+ */
+    __pyx_v_i = (__pyx_v_i + 1);
+  }
+
+  /* "wikibrev/_linkscan.pyx":315
+ *     while i < n and is_space(d[i]):
+ *         i += 1
+ *     return i             # <<<<<<<<<<<<<<
+ * 
+ * cdef Py_ssize_t scan_starttag(Scanner* s, Py_ssize_t i, string* cdata_tag) nogil:
+ */
+  __pyx_r = __pyx_v_i;
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":297
+ *                 c == b'>' or c == 0)
+ * 
+ * cdef Py_ssize_t locate_starttag_end(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Return the end of the match of `HTMLParser.locatestarttagend` at `i`.
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":317
+ *     return i
+ * 
+ * cdef Py_ssize_t scan_starttag(Scanner* s, Py_ssize_t i, string* cdata_tag) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Like `WikiLinkScanner.scan_starttag`: scan a start tag at `i` and return
+ */
+
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_scan_starttag(struct __pyx_t_8wikibrev_9_linkscan_Scanner *__pyx_v_s, Py_ssize_t __pyx_v_i, std::string *__pyx_v_cdata_tag) {
+  char const *__pyx_v_d;
+  Py_ssize_t __pyx_v_n;
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_v_endpos;
+  Py_ssize_t __pyx_v_k;
+  Py_ssize_t __pyx_v_end_start;
+  Py_ssize_t __pyx_v_end_end;
+  char __pyx_v_c;
+  std::string __pyx_v_tag;
+  struct __pyx_t_8wikibrev_9_linkscan_Attr __pyx_v_cls;
+  struct __pyx_t_8wikibrev_9_linkscan_Attr __pyx_v_id_;
+  struct __pyx_t_8wikibrev_9_linkscan_Attr __pyx_v_href;
+  struct __pyx_t_8wikibrev_9_linkscan_Attr __pyx_v_name;
+  struct __pyx_t_8wikibrev_9_linkscan_Attr __pyx_v_value;
+  struct __pyx_t_8wikibrev_9_linkscan_Attr *__pyx_v_kept;
+  Py_ssize_t __pyx_r;
+  char const *__pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  std::string __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+
+  /* "wikibrev/_linkscan.pyx":323
+ *     the name of the tag if it opened an element with CDATA content.
+ *     """
+ *     cdef const char* d = s.d             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t n = s.n
+ *     cdef Py_ssize_t j = locate_starttag_end(d, i, n), endpos, k, end_start, end_end
+ */
+  __pyx_t_1 = __pyx_v_s->d;
+  __pyx_v_d = __pyx_t_1;
+
+  /* "wikibrev/_linkscan.pyx":324
+ *     """
+ *     cdef const char* d = s.d
+ *     cdef Py_ssize_t n = s.n             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t j = locate_starttag_end(d, i, n), endpos, k, end_start, end_end
+ *     cdef char c
+ */
+  __pyx_t_2 = __pyx_v_s->n;
+  __pyx_v_n = __pyx_t_2;
+
+  /* "wikibrev/_linkscan.pyx":325
+ *     cdef const char* d = s.d
+ *     cdef Py_ssize_t n = s.n
+ *     cdef Py_ssize_t j = locate_starttag_end(d, i, n), endpos, k, end_start, end_end             # <<<<<<<<<<<<<<
+ *     cdef char c
+ *     if j >= n:
+ */
+  __pyx_v_j = __pyx_f_8wikibrev_9_linkscan_locate_starttag_end(__pyx_v_d, __pyx_v_i, __pyx_v_n);
+
+  /* "wikibrev/_linkscan.pyx":327
+ *     cdef Py_ssize_t j = locate_starttag_end(d, i, n), endpos, k, end_start, end_end
+ *     cdef char c
+ *     if j >= n:             # <<<<<<<<<<<<<<
+ *         return -1
+ *     c = d[j]
+ */
+  __pyx_t_3 = ((__pyx_v_j >= __pyx_v_n) != 0);
+  if (__pyx_t_3) {
+
+    /* "wikibrev/_linkscan.pyx":328
+ *     cdef char c
+ *     if j >= n:
+ *         return -1             # <<<<<<<<<<<<<<
+ *     c = d[j]
+ *     if c == b'>':
+ */
+    __pyx_r = -1L;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":327
+ *     cdef Py_ssize_t j = locate_starttag_end(d, i, n), endpos, k, end_start, end_end
+ *     cdef char c
+ *     if j >= n:             # <<<<<<<<<<<<<<
+ *         return -1
+ *     c = d[j]
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":329
+ *     if j >= n:
+ *         return -1
+ *     c = d[j]             # <<<<<<<<<<<<<<
+ *     if c == b'>':
+ *         endpos = j + 1
+ */
+  __pyx_v_c = (__pyx_v_d[__pyx_v_j]);
+
+  /* "wikibrev/_linkscan.pyx":330
+ *         return -1
+ *     c = d[j]
+ *     if c == b'>':             # <<<<<<<<<<<<<<
+ *         endpos = j + 1
+ *     elif c == b'/':
+ */
+  __pyx_t_3 = ((__pyx_v_c == '>') != 0);
+  if (__pyx_t_3) {
+
+    /* "wikibrev/_linkscan.pyx":331
+ *     c = d[j]
+ *     if c == b'>':
+ *         endpos = j + 1             # <<<<<<<<<<<<<<
+ *     elif c == b'/':
+ *         if not starts_with(d, j, n, b'/>', 2):
+ */
+    __pyx_v_endpos = (__pyx_v_j + 1);
+
+    /* "wikibrev/_linkscan.pyx":330
+ *         return -1
+ *     c = d[j]
+ *     if c == b'>':             # <<<<<<<<<<<<<<
+ *         endpos = j + 1
+ *     elif c == b'/':
+ */
+    goto __pyx_L4;
+  }
+
+  /* "wikibrev/_linkscan.pyx":332
+ *     if c == b'>':
+ *         endpos = j + 1
+ *     elif c == b'/':             # <<<<<<<<<<<<<<
+ *         if not starts_with(d, j, n, b'/>', 2):
+ *             return -1
+ */
+  __pyx_t_3 = ((__pyx_v_c == '/') != 0);
+  if (__pyx_t_3) {
+
+    /* "wikibrev/_linkscan.pyx":333
+ *         endpos = j + 1
+ *     elif c == b'/':
+ *         if not starts_with(d, j, n, b'/>', 2):             # <<<<<<<<<<<<<<
+ *             return -1
+ *         endpos = j + 2
+ */
+    __pyx_t_3 = ((!(__pyx_f_8wikibrev_9_linkscan_starts_with(__pyx_v_d, __pyx_v_j, __pyx_v_n, ((char const *)"/>"), 2) != 0)) != 0);
+    if (__pyx_t_3) {
+
+      /* "wikibrev/_linkscan.pyx":334
+ *     elif c == b'/':
+ *         if not starts_with(d, j, n, b'/>', 2):
+ *             return -1             # <<<<<<<<<<<<<<
+ *         endpos = j + 2
+ *     elif is_letter(c) or c == b'=':
+ */
+      __pyx_r = -1L;
+      goto __pyx_L0;
+
+      /* "wikibrev/_linkscan.pyx":333
+ *         endpos = j + 1
+ *     elif c == b'/':
+ *         if not starts_with(d, j, n, b'/>', 2):             # <<<<<<<<<<<<<<
+ *             return -1
+ *         endpos = j + 2
+ */
+    }
+
+    /* "wikibrev/_linkscan.pyx":335
+ *         if not starts_with(d, j, n, b'/>', 2):
+ *             return -1
+ *         endpos = j + 2             # <<<<<<<<<<<<<<
+ *     elif is_letter(c) or c == b'=':
+ *         return -1
+ */
+    __pyx_v_endpos = (__pyx_v_j + 2);
+
+    /* "wikibrev/_linkscan.pyx":332
+ *     if c == b'>':
+ *         endpos = j + 1
+ *     elif c == b'/':             # <<<<<<<<<<<<<<
+ *         if not starts_with(d, j, n, b'/>', 2):
+ *             return -1
+ */
+    goto __pyx_L4;
+  }
+
+  /* "wikibrev/_linkscan.pyx":336
+ *             return -1
+ *         endpos = j + 2
+ *     elif is_letter(c) or c == b'=':             # <<<<<<<<<<<<<<
+ *         return -1
+ *     else:
+ */
+  __pyx_t_4 = (__pyx_f_8wikibrev_9_linkscan_is_letter(__pyx_v_c) != 0);
+  if (!__pyx_t_4) {
+  } else {
+    __pyx_t_3 = __pyx_t_4;
+    goto __pyx_L6_bool_binop_done;
+  }
+  __pyx_t_4 = ((__pyx_v_c == '=') != 0);
+  __pyx_t_3 = __pyx_t_4;
+  __pyx_L6_bool_binop_done:;
+  if (__pyx_t_3) {
+
+    /* "wikibrev/_linkscan.pyx":337
+ *         endpos = j + 2
+ *     elif is_letter(c) or c == b'=':
+ *         return -1             # <<<<<<<<<<<<<<
+ *     else:
+ *         endpos = j
+ */
+    __pyx_r = -1L;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":336
+ *             return -1
+ *         endpos = j + 2
+ *     elif is_letter(c) or c == b'=':             # <<<<<<<<<<<<<<
+ *         return -1
+ *     else:
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":339
+ *         return -1
+ *     else:
+ *         endpos = j             # <<<<<<<<<<<<<<
+ * 
+ *     k = i + 2
+ */
+  /*else*/ {
+    __pyx_v_endpos = __pyx_v_j;
+  }
+  __pyx_L4:;
+
+  /* "wikibrev/_linkscan.pyx":341
+ *         endpos = j
+ * 
+ *     k = i + 2             # <<<<<<<<<<<<<<
+ *     while k < n and is_tag_name_char(d[k]):
+ *         k += 1
+ */
+  __pyx_v_k = (__pyx_v_i + 2);
+
+  /* "wikibrev/_linkscan.pyx":342
+ * 
+ *     k = i + 2
+ *     while k < n and is_tag_name_char(d[k]):             # <<<<<<<<<<<<<<
+ *         k += 1
+ *     if not is_ascii(d, i + 1, k):
+ */
+  while (1) {
+    __pyx_t_4 = ((__pyx_v_k < __pyx_v_n) != 0);
+    if (__pyx_t_4) {
+    } else {
+      __pyx_t_3 = __pyx_t_4;
+      goto __pyx_L10_bool_binop_done;
+    }
+    __pyx_t_4 = (__pyx_f_8wikibrev_9_linkscan_is_tag_name_char((__pyx_v_d[__pyx_v_k])) != 0);
+    __pyx_t_3 = __pyx_t_4;
+    __pyx_L10_bool_binop_done:;
+    if (!__pyx_t_3) break;
+
+    /* "wikibrev/_linkscan.pyx":343
+ *     k = i + 2
+ *     while k < n and is_tag_name_char(d[k]):
+ *         k += 1             # <<<<<<<<<<<<<<
+ *     if not is_ascii(d, i + 1, k):
+ *         s.fallback = True
+ */
+    __pyx_v_k = (__pyx_v_k + 1);
+  }
+
+  /* "wikibrev/_linkscan.pyx":344
+ *     while k < n and is_tag_name_char(d[k]):
+ *         k += 1
+ *     if not is_ascii(d, i + 1, k):             # <<<<<<<<<<<<<<
+ *         s.fallback = True
+ *         return -1
+ */
+  __pyx_t_3 = ((!(__pyx_f_8wikibrev_9_linkscan_is_ascii(__pyx_v_d, (__pyx_v_i + 1), __pyx_v_k) != 0)) != 0);
+  if (__pyx_t_3) {
+
+    /* "wikibrev/_linkscan.pyx":345
+ *         k += 1
+ *     if not is_ascii(d, i + 1, k):
+ *         s.fallback = True             # <<<<<<<<<<<<<<
+ *         return -1
+ *     cdef string tag = string(d + i + 1, k - i - 1)
+ */
+    __pyx_v_s->fallback = 1;
+
+    /* "wikibrev/_linkscan.pyx":346
+ *     if not is_ascii(d, i + 1, k):
+ *         s.fallback = True
+ *         return -1             # <<<<<<<<<<<<<<
+ *     cdef string tag = string(d + i + 1, k - i - 1)
+ *     for j in range(<Py_ssize_t>tag.size()):
+ */
+    __pyx_r = -1L;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":344
+ *     while k < n and is_tag_name_char(d[k]):
+ *         k += 1
+ *     if not is_ascii(d, i + 1, k):             # <<<<<<<<<<<<<<
+ *         s.fallback = True
+ *         return -1
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":347
+ *         s.fallback = True
+ *         return -1
+ *     cdef string tag = string(d + i + 1, k - i - 1)             # <<<<<<<<<<<<<<
+ *     for j in range(<Py_ssize_t>tag.size()):
+ *         tag[j] = ascii_lower(tag[j])
+ */
+  try {
+    __pyx_t_5 = std::string(((__pyx_v_d + __pyx_v_i) + 1), ((__pyx_v_k - __pyx_v_i) - 1));
+  } catch(...) {
+    #ifdef WITH_THREAD
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    #endif
+    __Pyx_CppExn2PyErr();
+    #ifdef WITH_THREAD
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    #endif
+    __PYX_ERR(0, 347, __pyx_L1_error)
+  }
+  __pyx_v_tag = __pyx_t_5;
+
+  /* "wikibrev/_linkscan.pyx":348
+ *         return -1
+ *     cdef string tag = string(d + i + 1, k - i - 1)
+ *     for j in range(<Py_ssize_t>tag.size()):             # <<<<<<<<<<<<<<
+ *         tag[j] = ascii_lower(tag[j])
+ *     k = skip_trailer(d, k, n)
+ */
+  __pyx_t_2 = ((Py_ssize_t)__pyx_v_tag.size());
+  __pyx_t_6 = __pyx_t_2;
+  for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+    __pyx_v_j = __pyx_t_7;
+
+    /* "wikibrev/_linkscan.pyx":349
+ *     cdef string tag = string(d + i + 1, k - i - 1)
+ *     for j in range(<Py_ssize_t>tag.size()):
+ *         tag[j] = ascii_lower(tag[j])             # <<<<<<<<<<<<<<
+ *     k = skip_trailer(d, k, n)
+ * 
+ */
+    (__pyx_v_tag[__pyx_v_j]) = __pyx_f_8wikibrev_9_linkscan_ascii_lower((__pyx_v_tag[__pyx_v_j]));
+  }
+
+  /* "wikibrev/_linkscan.pyx":350
+ *     for j in range(<Py_ssize_t>tag.size()):
+ *         tag[j] = ascii_lower(tag[j])
+ *     k = skip_trailer(d, k, n)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef Attr cls, id_, href, name, value
+ */
+  __pyx_v_k = __pyx_f_8wikibrev_9_linkscan_skip_trailer(__pyx_v_d, __pyx_v_k, __pyx_v_n);
+
+  /* "wikibrev/_linkscan.pyx":353
+ * 
+ *     cdef Attr cls, id_, href, name, value
+ *     cls.present = id_.present = href.present = False             # <<<<<<<<<<<<<<
+ *     cdef Attr* kept
+ *     while k < endpos:
+ */
+  __pyx_v_cls.present = 0;
+  __pyx_v_id_.present = 0;
+  __pyx_v_href.present = 0;
+
+  /* "wikibrev/_linkscan.pyx":355
+ *     cls.present = id_.present = href.present = False
+ *     cdef Attr* kept
+ *     while k < endpos:             # <<<<<<<<<<<<<<
+ *         j = match_attr(d, k, n, &name, &value)
+ *         if j < 0:
+ */
+  while (1) {
+    __pyx_t_3 = ((__pyx_v_k < __pyx_v_endpos) != 0);
+    if (!__pyx_t_3) break;
+
+    /* "wikibrev/_linkscan.pyx":356
+ *     cdef Attr* kept
+ *     while k < endpos:
+ *         j = match_attr(d, k, n, &name, &value)             # <<<<<<<<<<<<<<
+ *         if j < 0:
+ *             break
+ */
+    __pyx_v_j = __pyx_f_8wikibrev_9_linkscan_match_attr(__pyx_v_d, __pyx_v_k, __pyx_v_n, (&__pyx_v_name), (&__pyx_v_value));
+
+    /* "wikibrev/_linkscan.pyx":357
+ *     while k < endpos:
+ *         j = match_attr(d, k, n, &name, &value)
+ *         if j < 0:             # <<<<<<<<<<<<<<
+ *             break
+ *         k = j
+ */
+    __pyx_t_3 = ((__pyx_v_j < 0) != 0);
+    if (__pyx_t_3) {
+
+      /* "wikibrev/_linkscan.pyx":358
+ *         j = match_attr(d, k, n, &name, &value)
+ *         if j < 0:
+ *             break             # <<<<<<<<<<<<<<
+ *         k = j
+ *         if not is_ascii(d, name.start, name.end):
+ */
+      goto __pyx_L16_break;
+
+      /* "wikibrev/_linkscan.pyx":357
+ *     while k < endpos:
+ *         j = match_attr(d, k, n, &name, &value)
+ *         if j < 0:             # <<<<<<<<<<<<<<
+ *             break
+ *         k = j
+ */
+    }
+
+    /* "wikibrev/_linkscan.pyx":359
+ *         if j < 0:
+ *             break
+ *         k = j             # <<<<<<<<<<<<<<
+ *         if not is_ascii(d, name.start, name.end):
+ *             s.fallback = True
+ */
+    __pyx_v_k = __pyx_v_j;
+
+    /* "wikibrev/_linkscan.pyx":360
+ *             break
+ *         k = j
+ *         if not is_ascii(d, name.start, name.end):             # <<<<<<<<<<<<<<
+ *             s.fallback = True
+ *             return -1
+ */
+    __pyx_t_3 = ((!(__pyx_f_8wikibrev_9_linkscan_is_ascii(__pyx_v_d, __pyx_v_name.start, __pyx_v_name.end) != 0)) != 0);
+    if (__pyx_t_3) {
+
+      /* "wikibrev/_linkscan.pyx":361
+ *         k = j
+ *         if not is_ascii(d, name.start, name.end):
+ *             s.fallback = True             # <<<<<<<<<<<<<<
+ *             return -1
+ *         if equals_lower(d, name.start, name.end, b'class', 5):
+ */
+      __pyx_v_s->fallback = 1;
+
+      /* "wikibrev/_linkscan.pyx":362
+ *         if not is_ascii(d, name.start, name.end):
+ *             s.fallback = True
+ *             return -1             # <<<<<<<<<<<<<<
+ *         if equals_lower(d, name.start, name.end, b'class', 5):
+ *             kept = &cls
+ */
+      __pyx_r = -1L;
+      goto __pyx_L0;
+
+      /* "wikibrev/_linkscan.pyx":360
+ *             break
+ *         k = j
+ *         if not is_ascii(d, name.start, name.end):             # <<<<<<<<<<<<<<
+ *             s.fallback = True
+ *             return -1
+ */
+    }
+
+    /* "wikibrev/_linkscan.pyx":363
+ *             s.fallback = True
+ *             return -1
+ *         if equals_lower(d, name.start, name.end, b'class', 5):             # <<<<<<<<<<<<<<
+ *             kept = &cls
+ *         elif equals_lower(d, name.start, name.end, b'id', 2):
+ */
+    __pyx_t_3 = (__pyx_f_8wikibrev_9_linkscan_equals_lower(__pyx_v_d, __pyx_v_name.start, __pyx_v_name.end, ((char const *)"class"), 5) != 0);
+    if (__pyx_t_3) {
+
+      /* "wikibrev/_linkscan.pyx":364
+ *             return -1
+ *         if equals_lower(d, name.start, name.end, b'class', 5):
+ *             kept = &cls             # <<<<<<<<<<<<<<
+ *         elif equals_lower(d, name.start, name.end, b'id', 2):
+ *             kept = &id_
+ */
+      __pyx_v_kept = (&__pyx_v_cls);
+
+      /* "wikibrev/_linkscan.pyx":363
+ *             s.fallback = True
+ *             return -1
+ *         if equals_lower(d, name.start, name.end, b'class', 5):             # <<<<<<<<<<<<<<
+ *             kept = &cls
+ *         elif equals_lower(d, name.start, name.end, b'id', 2):
+ */
+      goto __pyx_L19;
+    }
+
+    /* "wikibrev/_linkscan.pyx":365
+ *         if equals_lower(d, name.start, name.end, b'class', 5):
+ *             kept = &cls
+ *         elif equals_lower(d, name.start, name.end, b'id', 2):             # <<<<<<<<<<<<<<
+ *             kept = &id_
+ *         elif equals_lower(d, name.start, name.end, b'href', 4):
+ */
+    __pyx_t_3 = (__pyx_f_8wikibrev_9_linkscan_equals_lower(__pyx_v_d, __pyx_v_name.start, __pyx_v_name.end, ((char const *)"id"), 2) != 0);
+    if (__pyx_t_3) {
+
+      /* "wikibrev/_linkscan.pyx":366
+ *             kept = &cls
+ *         elif equals_lower(d, name.start, name.end, b'id', 2):
+ *             kept = &id_             # <<<<<<<<<<<<<<
+ *         elif equals_lower(d, name.start, name.end, b'href', 4):
+ *             kept = &href
+ */
+      __pyx_v_kept = (&__pyx_v_id_);
+
+      /* "wikibrev/_linkscan.pyx":365
+ *         if equals_lower(d, name.start, name.end, b'class', 5):
+ *             kept = &cls
+ *         elif equals_lower(d, name.start, name.end, b'id', 2):             # <<<<<<<<<<<<<<
+ *             kept = &id_
+ *         elif equals_lower(d, name.start, name.end, b'href', 4):
+ */
+      goto __pyx_L19;
+    }
+
+    /* "wikibrev/_linkscan.pyx":367
+ *         elif equals_lower(d, name.start, name.end, b'id', 2):
+ *             kept = &id_
+ *         elif equals_lower(d, name.start, name.end, b'href', 4):             # <<<<<<<<<<<<<<
+ *             kept = &href
+ *         else:
+ */
+    __pyx_t_3 = (__pyx_f_8wikibrev_9_linkscan_equals_lower(__pyx_v_d, __pyx_v_name.start, __pyx_v_name.end, ((char const *)"href"), 4) != 0);
+    if (__pyx_t_3) {
+
+      /* "wikibrev/_linkscan.pyx":368
+ *             kept = &id_
+ *         elif equals_lower(d, name.start, name.end, b'href', 4):
+ *             kept = &href             # <<<<<<<<<<<<<<
+ *         else:
+ *             continue
+ */
+      __pyx_v_kept = (&__pyx_v_href);
+
+      /* "wikibrev/_linkscan.pyx":367
+ *         elif equals_lower(d, name.start, name.end, b'id', 2):
+ *             kept = &id_
+ *         elif equals_lower(d, name.start, name.end, b'href', 4):             # <<<<<<<<<<<<<<
+ *             kept = &href
+ *         else:
+ */
+      goto __pyx_L19;
+    }
+
+    /* "wikibrev/_linkscan.pyx":370
+ *             kept = &href
+ *         else:
+ *             continue             # <<<<<<<<<<<<<<
+ *         if not value.present:
+ *             s.fallback = True
+ */
+    /*else*/ {
+      goto __pyx_L15_continue;
+    }
+    __pyx_L19:;
+
+    /* "wikibrev/_linkscan.pyx":371
+ *         else:
+ *             continue
+ *         if not value.present:             # <<<<<<<<<<<<<<
+ *             s.fallback = True
+ *             return -1
+ */
+    __pyx_t_3 = ((!(__pyx_v_value.present != 0)) != 0);
+    if (__pyx_t_3) {
+
+      /* "wikibrev/_linkscan.pyx":372
+ *             continue
+ *         if not value.present:
+ *             s.fallback = True             # <<<<<<<<<<<<<<
+ *             return -1
+ *         if value.end - value.start >= 2 and (d[value.start] == b'\'' or d[value.start] == b'"') and \
+ */
+      __pyx_v_s->fallback = 1;
+
+      /* "wikibrev/_linkscan.pyx":373
+ *         if not value.present:
+ *             s.fallback = True
+ *             return -1             # <<<<<<<<<<<<<<
+ *         if value.end - value.start >= 2 and (d[value.start] == b'\'' or d[value.start] == b'"') and \
+ *                 d[value.end - 1] == d[value.start]:
+ */
+      __pyx_r = -1L;
+      goto __pyx_L0;
+
+      /* "wikibrev/_linkscan.pyx":371
+ *         else:
+ *             continue
+ *         if not value.present:             # <<<<<<<<<<<<<<
+ *             s.fallback = True
+ *             return -1
+ */
+    }
+
+    /* "wikibrev/_linkscan.pyx":374
+ *             s.fallback = True
+ *             return -1
+ *         if value.end - value.start >= 2 and (d[value.start] == b'\'' or d[value.start] == b'"') and \             # <<<<<<<<<<<<<<
+ *                 d[value.end - 1] == d[value.start]:
+ *             value.start += 1
+ */
+    __pyx_t_4 = (((__pyx_v_value.end - __pyx_v_value.start) >= 2) != 0);
+    if (__pyx_t_4) {
+    } else {
+      __pyx_t_3 = __pyx_t_4;
+      goto __pyx_L22_bool_binop_done;
+    }
+    __pyx_t_4 = (((__pyx_v_d[__pyx_v_value.start]) == '\'') != 0);
+    if (!__pyx_t_4) {
+    } else {
+      goto __pyx_L24_next_and;
+    }
+    __pyx_t_4 = (((__pyx_v_d[__pyx_v_value.start]) == '"') != 0);
+    if (__pyx_t_4) {
+    } else {
+      __pyx_t_3 = __pyx_t_4;
+      goto __pyx_L22_bool_binop_done;
+    }
+    __pyx_L24_next_and:;
+
+    /* "wikibrev/_linkscan.pyx":375
+ *             return -1
+ *         if value.end - value.start >= 2 and (d[value.start] == b'\'' or d[value.start] == b'"') and \
+ *                 d[value.end - 1] == d[value.start]:             # <<<<<<<<<<<<<<
+ *             value.start += 1
+ *             value.end -= 1
+ */
+    __pyx_t_4 = (((__pyx_v_d[(__pyx_v_value.end - 1)]) == (__pyx_v_d[__pyx_v_value.start])) != 0);
+    __pyx_t_3 = __pyx_t_4;
+    __pyx_L22_bool_binop_done:;
+
+    /* "wikibrev/_linkscan.pyx":374
+ *             s.fallback = True
+ *             return -1
+ *         if value.end - value.start >= 2 and (d[value.start] == b'\'' or d[value.start] == b'"') and \             # <<<<<<<<<<<<<<
+ *                 d[value.end - 1] == d[value.start]:
+ *             value.start += 1
+ */
+    if (__pyx_t_3) {
+
+      /* "wikibrev/_linkscan.pyx":376
+ *         if value.end - value.start >= 2 and (d[value.start] == b'\'' or d[value.start] == b'"') and \
+ *                 d[value.end - 1] == d[value.start]:
+ *             value.start += 1             # <<<<<<<<<<<<<<
+ *             value.end -= 1
+ *         if memchr(d + value.start, b'&', value.end - value.start) != NULL:
+ */
+      __pyx_v_value.start = (__pyx_v_value.start + 1);
+
+      /* "wikibrev/_linkscan.pyx":377
+ *                 d[value.end - 1] == d[value.start]:
+ *             value.start += 1
+ *             value.end -= 1             # <<<<<<<<<<<<<<
+ *         if memchr(d + value.start, b'&', value.end - value.start) != NULL:
+ *             s.fallback = True
+ */
+      __pyx_v_value.end = (__pyx_v_value.end - 1);
+
+      /* "wikibrev/_linkscan.pyx":374
+ *             s.fallback = True
+ *             return -1
+ *         if value.end - value.start >= 2 and (d[value.start] == b'\'' or d[value.start] == b'"') and \             # <<<<<<<<<<<<<<
+ *                 d[value.end - 1] == d[value.start]:
+ *             value.start += 1
+ */
+    }
+
+    /* "wikibrev/_linkscan.pyx":378
+ *             value.start += 1
+ *             value.end -= 1
+ *         if memchr(d + value.start, b'&', value.end - value.start) != NULL:             # <<<<<<<<<<<<<<
+ *             s.fallback = True
+ *             return -1
+ */
+    __pyx_t_3 = ((memchr((__pyx_v_d + __pyx_v_value.start), '&', (__pyx_v_value.end - __pyx_v_value.start)) != NULL) != 0);
+    if (__pyx_t_3) {
+
+      /* "wikibrev/_linkscan.pyx":379
+ *             value.end -= 1
+ *         if memchr(d + value.start, b'&', value.end - value.start) != NULL:
+ *             s.fallback = True             # <<<<<<<<<<<<<<
+ *             return -1
+ *         kept[0] = value
+ */
+      __pyx_v_s->fallback = 1;
+
+      /* "wikibrev/_linkscan.pyx":380
+ *         if memchr(d + value.start, b'&', value.end - value.start) != NULL:
+ *             s.fallback = True
+ *             return -1             # <<<<<<<<<<<<<<
+ *         kept[0] = value
+ * 
+ */
+      __pyx_r = -1L;
+      goto __pyx_L0;
+
+      /* "wikibrev/_linkscan.pyx":378
+ *             value.start += 1
+ *             value.end -= 1
+ *         if memchr(d + value.start, b'&', value.end - value.start) != NULL:             # <<<<<<<<<<<<<<
+ *             s.fallback = True
+ *             return -1
+ */
+    }
+
+    /* "wikibrev/_linkscan.pyx":381
+ *             s.fallback = True
+ *             return -1
+ *         kept[0] = value             # <<<<<<<<<<<<<<
+ * 
+ *     (end_start, end_end) = (k, endpos)
+ */
+    (__pyx_v_kept[0]) = __pyx_v_value;
+    __pyx_L15_continue:;
+  }
+  __pyx_L16_break:;
+
+  /* "wikibrev/_linkscan.pyx":383
+ *         kept[0] = value
+ * 
+ *     (end_start, end_end) = (k, endpos)             # <<<<<<<<<<<<<<
+ *     strip(d, &end_start, &end_end)
+ *     if not (starts_with(d, end_start, end_end, b'>', 1) and end_end - end_start == 1) and \
+ */
+  __pyx_t_2 = __pyx_v_k;
+  __pyx_t_6 = __pyx_v_endpos;
+  __pyx_v_end_start = __pyx_t_2;
+  __pyx_v_end_end = __pyx_t_6;
+
+  /* "wikibrev/_linkscan.pyx":384
+ * 
+ *     (end_start, end_end) = (k, endpos)
+ *     strip(d, &end_start, &end_end)             # <<<<<<<<<<<<<<
+ *     if not (starts_with(d, end_start, end_end, b'>', 1) and end_end - end_start == 1) and \
+ *             not (starts_with(d, end_start, end_end, b'/>', 2) and end_end - end_start == 2):
+ */
+  __pyx_f_8wikibrev_9_linkscan_strip(__pyx_v_d, (&__pyx_v_end_start), (&__pyx_v_end_end));
+
+  /* "wikibrev/_linkscan.pyx":385
+ *     (end_start, end_end) = (k, endpos)
+ *     strip(d, &end_start, &end_end)
+ *     if not (starts_with(d, end_start, end_end, b'>', 1) and end_end - end_start == 1) and \             # <<<<<<<<<<<<<<
+ *             not (starts_with(d, end_start, end_end, b'/>', 2) and end_end - end_start == 2):
+ *         # not a well-formed tag, HTMLParser treats it as text
+ */
+  __pyx_t_8 = (__pyx_f_8wikibrev_9_linkscan_starts_with(__pyx_v_d, __pyx_v_end_start, __pyx_v_end_end, ((char const *)">"), 1) != 0);
+  if (__pyx_t_8) {
+  } else {
+    __pyx_t_4 = __pyx_t_8;
+    goto __pyx_L30_bool_binop_done;
+  }
+  __pyx_t_8 = (((__pyx_v_end_end - __pyx_v_end_start) == 1) != 0);
+  __pyx_t_4 = __pyx_t_8;
+  __pyx_L30_bool_binop_done:;
+  __pyx_t_8 = ((!__pyx_t_4) != 0);
+  if (__pyx_t_8) {
+  } else {
+    __pyx_t_3 = __pyx_t_8;
+    goto __pyx_L28_bool_binop_done;
+  }
+
+  /* "wikibrev/_linkscan.pyx":386
+ *     strip(d, &end_start, &end_end)
+ *     if not (starts_with(d, end_start, end_end, b'>', 1) and end_end - end_start == 1) and \
+ *             not (starts_with(d, end_start, end_end, b'/>', 2) and end_end - end_start == 2):             # <<<<<<<<<<<<<<
+ *         # not a well-formed tag, HTMLParser treats it as text
+ *         text(s, i, endpos)
+ */
+  __pyx_t_4 = (__pyx_f_8wikibrev_9_linkscan_starts_with(__pyx_v_d, __pyx_v_end_start, __pyx_v_end_end, ((char const *)"/>"), 2) != 0);
+  if (__pyx_t_4) {
+  } else {
+    __pyx_t_8 = __pyx_t_4;
+    goto __pyx_L32_bool_binop_done;
+  }
+  __pyx_t_4 = (((__pyx_v_end_end - __pyx_v_end_start) == 2) != 0);
+  __pyx_t_8 = __pyx_t_4;
+  __pyx_L32_bool_binop_done:;
+  __pyx_t_4 = ((!__pyx_t_8) != 0);
+  __pyx_t_3 = __pyx_t_4;
+  __pyx_L28_bool_binop_done:;
+
+  /* "wikibrev/_linkscan.pyx":385
+ *     (end_start, end_end) = (k, endpos)
+ *     strip(d, &end_start, &end_end)
+ *     if not (starts_with(d, end_start, end_end, b'>', 1) and end_end - end_start == 1) and \             # <<<<<<<<<<<<<<
+ *             not (starts_with(d, end_start, end_end, b'/>', 2) and end_end - end_start == 2):
+ *         # not a well-formed tag, HTMLParser treats it as text
+ */
+  if (__pyx_t_3) {
+
+    /* "wikibrev/_linkscan.pyx":388
+ *             not (starts_with(d, end_start, end_end, b'/>', 2) and end_end - end_start == 2):
+ *         # not a well-formed tag, HTMLParser treats it as text
+ *         text(s, i, endpos)             # <<<<<<<<<<<<<<
+ *         return endpos
+ *     start_tag(s, tag, &cls, &id_, &href)
+ */
+    __pyx_f_8wikibrev_9_linkscan_text(__pyx_v_s, __pyx_v_i, __pyx_v_endpos);
+
+    /* "wikibrev/_linkscan.pyx":389
+ *         # not a well-formed tag, HTMLParser treats it as text
+ *         text(s, i, endpos)
+ *         return endpos             # <<<<<<<<<<<<<<
+ *     start_tag(s, tag, &cls, &id_, &href)
+ *     if end_end - end_start == 2:
+ */
+    __pyx_r = __pyx_v_endpos;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":385
+ *     (end_start, end_end) = (k, endpos)
+ *     strip(d, &end_start, &end_end)
+ *     if not (starts_with(d, end_start, end_end, b'>', 1) and end_end - end_start == 1) and \             # <<<<<<<<<<<<<<
+ *             not (starts_with(d, end_start, end_end, b'/>', 2) and end_end - end_start == 2):
+ *         # not a well-formed tag, HTMLParser treats it as text
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":390
+ *         text(s, i, endpos)
+ *         return endpos
+ *     start_tag(s, tag, &cls, &id_, &href)             # <<<<<<<<<<<<<<
+ *     if end_end - end_start == 2:
+ *         end_tag(s, tag)
+ */
+  __pyx_f_8wikibrev_9_linkscan_start_tag(__pyx_v_s, __pyx_v_tag, (&__pyx_v_cls), (&__pyx_v_id_), (&__pyx_v_href));
+
+  /* "wikibrev/_linkscan.pyx":391
+ *         return endpos
+ *     start_tag(s, tag, &cls, &id_, &href)
+ *     if end_end - end_start == 2:             # <<<<<<<<<<<<<<
+ *         end_tag(s, tag)
+ *         return endpos
+ */
+  __pyx_t_3 = (((__pyx_v_end_end - __pyx_v_end_start) == 2) != 0);
+  if (__pyx_t_3) {
+
+    /* "wikibrev/_linkscan.pyx":392
+ *     start_tag(s, tag, &cls, &id_, &href)
+ *     if end_end - end_start == 2:
+ *         end_tag(s, tag)             # <<<<<<<<<<<<<<
+ *         return endpos
+ *     if tag == b'script' or tag == b'style':
+ */
+    __pyx_f_8wikibrev_9_linkscan_end_tag(__pyx_v_s, __pyx_v_tag);
+
+    /* "wikibrev/_linkscan.pyx":393
+ *     if end_end - end_start == 2:
+ *         end_tag(s, tag)
+ *         return endpos             # <<<<<<<<<<<<<<
+ *     if tag == b'script' or tag == b'style':
+ *         cdata_tag[0] = tag
+ */
+    __pyx_r = __pyx_v_endpos;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":391
+ *         return endpos
+ *     start_tag(s, tag, &cls, &id_, &href)
+ *     if end_end - end_start == 2:             # <<<<<<<<<<<<<<
+ *         end_tag(s, tag)
+ *         return endpos
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":394
+ *         end_tag(s, tag)
+ *         return endpos
+ *     if tag == b'script' or tag == b'style':             # <<<<<<<<<<<<<<
+ *         cdata_tag[0] = tag
+ *     return endpos
+ */
+  __pyx_t_4 = ((__pyx_v_tag == ((char const *)"script")) != 0);
+  if (!__pyx_t_4) {
+  } else {
+    __pyx_t_3 = __pyx_t_4;
+    goto __pyx_L36_bool_binop_done;
+  }
+  __pyx_t_4 = ((__pyx_v_tag == ((char const *)"style")) != 0);
+  __pyx_t_3 = __pyx_t_4;
+  __pyx_L36_bool_binop_done:;
+  if (__pyx_t_3) {
+
+    /* "wikibrev/_linkscan.pyx":395
+ *         return endpos
+ *     if tag == b'script' or tag == b'style':
+ *         cdata_tag[0] = tag             # <<<<<<<<<<<<<<
+ *     return endpos
+ * 
+ */
+    (__pyx_v_cdata_tag[0]) = __pyx_v_tag;
+
+    /* "wikibrev/_linkscan.pyx":394
+ *         end_tag(s, tag)
+ *         return endpos
+ *     if tag == b'script' or tag == b'style':             # <<<<<<<<<<<<<<
+ *         cdata_tag[0] = tag
+ *     return endpos
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":396
+ *     if tag == b'script' or tag == b'style':
+ *         cdata_tag[0] = tag
+ *     return endpos             # <<<<<<<<<<<<<<
+ * 
+ * cdef Py_ssize_t match_endtag(const char* d, Py_ssize_t i, Py_ssize_t n, Py_ssize_t* name_end) nogil:
+ */
+  __pyx_r = __pyx_v_endpos;
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":317
+ *     return i
+ * 
+ * cdef Py_ssize_t scan_starttag(Scanner* s, Py_ssize_t i, string* cdata_tag) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Like `WikiLinkScanner.scan_starttag`: scan a start tag at `i` and return
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("wikibrev._linkscan.scan_starttag", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":398
+ *     return endpos
+ * 
+ * cdef Py_ssize_t match_endtag(const char* d, Py_ssize_t i, Py_ssize_t n, Py_ssize_t* name_end) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Match `HTMLParser.endtagfind` at `i`. Return the end of the match and set
+ */
+
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_match_endtag(char const *__pyx_v_d, Py_ssize_t __pyx_v_i, Py_ssize_t __pyx_v_n, Py_ssize_t *__pyx_v_name_end) {
+  Py_ssize_t __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "wikibrev/_linkscan.pyx":404
+ *     return -1 if there is no match.
+ *     """
+ *     i += 2             # <<<<<<<<<<<<<<
+ *     while i < n and is_space(d[i]):
+ *         i += 1
+ */
+  __pyx_v_i = (__pyx_v_i + 2);
+
+  /* "wikibrev/_linkscan.pyx":405
+ *     """
+ *     i += 2
+ *     while i < n and is_space(d[i]):             # <<<<<<<<<<<<<<
+ *         i += 1
+ *     if i >= n or not is_letter(d[i]):
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_i < __pyx_v_n) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L5_bool_binop_done;
+    }
+    __pyx_t_2 = (__pyx_f_8wikibrev_9_linkscan_is_space((__pyx_v_d[__pyx_v_i])) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L5_bool_binop_done:;
+    if (!__pyx_t_1) break;
+
+    /* "wikibrev/_linkscan.pyx":406
+ *     i += 2
+ *     while i < n and is_space(d[i]):
+ *         i += 1             # <<<<<<<<<<<<<<
+ *     if i >= n or not is_letter(d[i]):
+ *         return -1
+ */
+    __pyx_v_i = (__pyx_v_i + 1);
+  }
+
+  /* "wikibrev/_linkscan.pyx":407
+ *     while i < n and is_space(d[i]):
+ *         i += 1
+ *     if i >= n or not is_letter(d[i]):             # <<<<<<<<<<<<<<
+ *         return -1
+ *     i += 1
+ */
+  __pyx_t_2 = ((__pyx_v_i >= __pyx_v_n) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L8_bool_binop_done;
+  }
+  __pyx_t_2 = ((!(__pyx_f_8wikibrev_9_linkscan_is_letter((__pyx_v_d[__pyx_v_i])) != 0)) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L8_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":408
+ *         i += 1
+ *     if i >= n or not is_letter(d[i]):
+ *         return -1             # <<<<<<<<<<<<<<
+ *     i += 1
+ *     while i < n and (is_alnum(d[i]) or d[i] == b'-' or d[i] == b'.' or d[i] == b':' or d[i] == b'_'):
+ */
+    __pyx_r = -1L;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":407
+ *     while i < n and is_space(d[i]):
+ *         i += 1
+ *     if i >= n or not is_letter(d[i]):             # <<<<<<<<<<<<<<
+ *         return -1
+ *     i += 1
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":409
+ *     if i >= n or not is_letter(d[i]):
+ *         return -1
+ *     i += 1             # <<<<<<<<<<<<<<
+ *     while i < n and (is_alnum(d[i]) or d[i] == b'-' or d[i] == b'.' or d[i] == b':' or d[i] == b'_'):
+ *         i += 1
+ */
+  __pyx_v_i = (__pyx_v_i + 1);
+
+  /* "wikibrev/_linkscan.pyx":410
+ *         return -1
+ *     i += 1
+ *     while i < n and (is_alnum(d[i]) or d[i] == b'-' or d[i] == b'.' or d[i] == b':' or d[i] == b'_'):             # <<<<<<<<<<<<<<
+ *         i += 1
+ *     name_end[0] = i
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_i < __pyx_v_n) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L12_bool_binop_done;
+    }
+    __pyx_t_2 = (__pyx_f_8wikibrev_9_linkscan_is_alnum((__pyx_v_d[__pyx_v_i])) != 0);
+    if (!__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L12_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_d[__pyx_v_i]) == '-') != 0);
+    if (!__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L12_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_d[__pyx_v_i]) == '.') != 0);
+    if (!__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L12_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_d[__pyx_v_i]) == ':') != 0);
+    if (!__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L12_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_d[__pyx_v_i]) == '_') != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L12_bool_binop_done:;
+    if (!__pyx_t_1) break;
+
+    /* "wikibrev/_linkscan.pyx":411
+ *     i += 1
+ *     while i < n and (is_alnum(d[i]) or d[i] == b'-' or d[i] == b'.' or d[i] == b':' or d[i] == b'_'):
+ *         i += 1             # <<<<<<<<<<<<<<
+ *     name_end[0] = i
+ *     while i < n and is_space(d[i]):
+ */
+    __pyx_v_i = (__pyx_v_i + 1);
+  }
+
+  /* "wikibrev/_linkscan.pyx":412
+ *     while i < n and (is_alnum(d[i]) or d[i] == b'-' or d[i] == b'.' or d[i] == b':' or d[i] == b'_'):
+ *         i += 1
+ *     name_end[0] = i             # <<<<<<<<<<<<<<
+ *     while i < n and is_space(d[i]):
+ *         i += 1
+ */
+  (__pyx_v_name_end[0]) = __pyx_v_i;
+
+  /* "wikibrev/_linkscan.pyx":413
+ *         i += 1
+ *     name_end[0] = i
+ *     while i < n and is_space(d[i]):             # <<<<<<<<<<<<<<
+ *         i += 1
+ *     if i >= n or d[i] != b'>':
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_i < __pyx_v_n) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L20_bool_binop_done;
+    }
+    __pyx_t_2 = (__pyx_f_8wikibrev_9_linkscan_is_space((__pyx_v_d[__pyx_v_i])) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L20_bool_binop_done:;
+    if (!__pyx_t_1) break;
+
+    /* "wikibrev/_linkscan.pyx":414
+ *     name_end[0] = i
+ *     while i < n and is_space(d[i]):
+ *         i += 1             # <<<<<<<<<<<<<<
+ *     if i >= n or d[i] != b'>':
+ *         return -1
+ */
+    __pyx_v_i = (__pyx_v_i + 1);
+  }
+
+  /* "wikibrev/_linkscan.pyx":415
+ *     while i < n and is_space(d[i]):
+ *         i += 1
+ *     if i >= n or d[i] != b'>':             # <<<<<<<<<<<<<<
+ *         return -1
+ *     return i + 1
+ */
+  __pyx_t_2 = ((__pyx_v_i >= __pyx_v_n) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L23_bool_binop_done;
+  }
+  __pyx_t_2 = (((__pyx_v_d[__pyx_v_i]) != '>') != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L23_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":416
+ *         i += 1
+ *     if i >= n or d[i] != b'>':
+ *         return -1             # <<<<<<<<<<<<<<
+ *     return i + 1
+ * 
+ */
+    __pyx_r = -1L;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":415
+ *     while i < n and is_space(d[i]):
+ *         i += 1
+ *     if i >= n or d[i] != b'>':             # <<<<<<<<<<<<<<
+ *         return -1
+ *     return i + 1
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":417
+ *     if i >= n or d[i] != b'>':
+ *         return -1
+ *     return i + 1             # <<<<<<<<<<<<<<
+ * 
+ * cdef string lower_name(Scanner* s, Py_ssize_t start, Py_ssize_t end) nogil:
+ */
+  __pyx_r = (__pyx_v_i + 1);
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":398
+ *     return endpos
+ * 
+ * cdef Py_ssize_t match_endtag(const char* d, Py_ssize_t i, Py_ssize_t n, Py_ssize_t* name_end) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Match `HTMLParser.endtagfind` at `i`. Return the end of the match and set
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":419
+ *     return i + 1
+ * 
+ * cdef string lower_name(Scanner* s, Py_ssize_t start, Py_ssize_t end) nogil:             # <<<<<<<<<<<<<<
+ *     cdef string name = string(s.d + start, end - start)
+ *     cdef size_t i
+ */
+
+static std::string __pyx_f_8wikibrev_9_linkscan_lower_name(struct __pyx_t_8wikibrev_9_linkscan_Scanner *__pyx_v_s, Py_ssize_t __pyx_v_start, Py_ssize_t __pyx_v_end) {
+  std::string __pyx_v_name;
+  size_t __pyx_v_i;
+  std::string __pyx_r;
+  std::string __pyx_t_1;
+  int __pyx_t_2;
+  size_t __pyx_t_3;
+  size_t __pyx_t_4;
+  size_t __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+
+  /* "wikibrev/_linkscan.pyx":420
+ * 
+ * cdef string lower_name(Scanner* s, Py_ssize_t start, Py_ssize_t end) nogil:
+ *     cdef string name = string(s.d + start, end - start)             # <<<<<<<<<<<<<<
+ *     cdef size_t i
+ *     if not is_ascii(s.d, start, end):
+ */
+  try {
+    __pyx_t_1 = std::string((__pyx_v_s->d + __pyx_v_start), (__pyx_v_end - __pyx_v_start));
+  } catch(...) {
+    #ifdef WITH_THREAD
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    #endif
+    __Pyx_CppExn2PyErr();
+    #ifdef WITH_THREAD
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    #endif
+    __PYX_ERR(0, 420, __pyx_L1_error)
+  }
+  __pyx_v_name = __pyx_t_1;
+
+  /* "wikibrev/_linkscan.pyx":422
+ *     cdef string name = string(s.d + start, end - start)
+ *     cdef size_t i
+ *     if not is_ascii(s.d, start, end):             # <<<<<<<<<<<<<<
+ *         s.fallback = True
+ *     for i in range(name.size()):
+ */
+  __pyx_t_2 = ((!(__pyx_f_8wikibrev_9_linkscan_is_ascii(__pyx_v_s->d, __pyx_v_start, __pyx_v_end) != 0)) != 0);
+  if (__pyx_t_2) {
+
+    /* "wikibrev/_linkscan.pyx":423
+ *     cdef size_t i
+ *     if not is_ascii(s.d, start, end):
+ *         s.fallback = True             # <<<<<<<<<<<<<<
+ *     for i in range(name.size()):
+ *         name[i] = ascii_lower(name[i])
+ */
+    __pyx_v_s->fallback = 1;
+
+    /* "wikibrev/_linkscan.pyx":422
+ *     cdef string name = string(s.d + start, end - start)
+ *     cdef size_t i
+ *     if not is_ascii(s.d, start, end):             # <<<<<<<<<<<<<<
+ *         s.fallback = True
+ *     for i in range(name.size()):
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":424
+ *     if not is_ascii(s.d, start, end):
+ *         s.fallback = True
+ *     for i in range(name.size()):             # <<<<<<<<<<<<<<
+ *         name[i] = ascii_lower(name[i])
+ *     return name
+ */
+  __pyx_t_3 = __pyx_v_name.size();
+  __pyx_t_4 = __pyx_t_3;
+  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_i = __pyx_t_5;
+
+    /* "wikibrev/_linkscan.pyx":425
+ *         s.fallback = True
+ *     for i in range(name.size()):
+ *         name[i] = ascii_lower(name[i])             # <<<<<<<<<<<<<<
+ *     return name
+ * 
+ */
+    (__pyx_v_name[__pyx_v_i]) = __pyx_f_8wikibrev_9_linkscan_ascii_lower((__pyx_v_name[__pyx_v_i]));
+  }
+
+  /* "wikibrev/_linkscan.pyx":426
+ *     for i in range(name.size()):
+ *         name[i] = ascii_lower(name[i])
+ *     return name             # <<<<<<<<<<<<<<
+ * 
+ * cdef Py_ssize_t scan_endtag(Scanner* s, Py_ssize_t i, bint in_cdata, bint* closed_cdata) nogil:
+ */
+  __pyx_r = __pyx_v_name;
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":419
+ *     return i + 1
+ * 
+ * cdef string lower_name(Scanner* s, Py_ssize_t start, Py_ssize_t end) nogil:             # <<<<<<<<<<<<<<
+ *     cdef string name = string(s.d + start, end - start)
+ *     cdef size_t i
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("wikibrev._linkscan.lower_name", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
+  __Pyx_pretend_to_initialize(&__pyx_r);
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":428
+ *     return name
+ * 
+ * cdef Py_ssize_t scan_endtag(Scanner* s, Py_ssize_t i, bint in_cdata, bint* closed_cdata) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Like `WikiLinkScanner.scan_endtag`: scan an end tag at `i` and return the
+ */
+
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_scan_endtag(struct __pyx_t_8wikibrev_9_linkscan_Scanner *__pyx_v_s, Py_ssize_t __pyx_v_i, int __pyx_v_in_cdata, int *__pyx_v_closed_cdata) {
+  char const *__pyx_v_d;
+  Py_ssize_t __pyx_v_n;
+  Py_ssize_t __pyx_v_gtpos;
+  Py_ssize_t __pyx_v_name_start;
+  Py_ssize_t __pyx_v_name_end;
+  Py_ssize_t __pyx_v_k;
+  std::string __pyx_v_tag;
+  Py_ssize_t __pyx_r;
+  char const *__pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+
+  /* "wikibrev/_linkscan.pyx":434
+ *     closed an element.
+ *     """
+ *     cdef const char* d = s.d             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t n = s.n
+ *     cdef Py_ssize_t gtpos = find(d, b'>', i + 1, n), name_start, name_end, k
+ */
+  __pyx_t_1 = __pyx_v_s->d;
+  __pyx_v_d = __pyx_t_1;
+
+  /* "wikibrev/_linkscan.pyx":435
+ *     """
+ *     cdef const char* d = s.d
+ *     cdef Py_ssize_t n = s.n             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t gtpos = find(d, b'>', i + 1, n), name_start, name_end, k
+ *     cdef string tag
+ */
+  __pyx_t_2 = __pyx_v_s->n;
+  __pyx_v_n = __pyx_t_2;
+
+  /* "wikibrev/_linkscan.pyx":436
+ *     cdef const char* d = s.d
+ *     cdef Py_ssize_t n = s.n
+ *     cdef Py_ssize_t gtpos = find(d, b'>', i + 1, n), name_start, name_end, k             # <<<<<<<<<<<<<<
+ *     cdef string tag
+ *     if gtpos < 0:
+ */
+  __pyx_v_gtpos = __pyx_f_8wikibrev_9_linkscan_find(__pyx_v_d, '>', (__pyx_v_i + 1), __pyx_v_n);
+
+  /* "wikibrev/_linkscan.pyx":438
+ *     cdef Py_ssize_t gtpos = find(d, b'>', i + 1, n), name_start, name_end, k
+ *     cdef string tag
+ *     if gtpos < 0:             # <<<<<<<<<<<<<<
+ *         return -1
+ *     gtpos += 1
+ */
+  __pyx_t_3 = ((__pyx_v_gtpos < 0) != 0);
+  if (__pyx_t_3) {
+
+    /* "wikibrev/_linkscan.pyx":439
+ *     cdef string tag
+ *     if gtpos < 0:
+ *         return -1             # <<<<<<<<<<<<<<
+ *     gtpos += 1
+ *     if match_endtag(d, i, n, &name_end) < 0:
+ */
+    __pyx_r = -1L;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":438
+ *     cdef Py_ssize_t gtpos = find(d, b'>', i + 1, n), name_start, name_end, k
+ *     cdef string tag
+ *     if gtpos < 0:             # <<<<<<<<<<<<<<
+ *         return -1
+ *     gtpos += 1
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":440
+ *     if gtpos < 0:
+ *         return -1
+ *     gtpos += 1             # <<<<<<<<<<<<<<
+ *     if match_endtag(d, i, n, &name_end) < 0:
+ *         if in_cdata:
+ */
+  __pyx_v_gtpos = (__pyx_v_gtpos + 1);
+
+  /* "wikibrev/_linkscan.pyx":441
+ *         return -1
+ *     gtpos += 1
+ *     if match_endtag(d, i, n, &name_end) < 0:             # <<<<<<<<<<<<<<
+ *         if in_cdata:
+ *             text(s, i, gtpos)
+ */
+  __pyx_t_3 = ((__pyx_f_8wikibrev_9_linkscan_match_endtag(__pyx_v_d, __pyx_v_i, __pyx_v_n, (&__pyx_v_name_end)) < 0) != 0);
+  if (__pyx_t_3) {
+
+    /* "wikibrev/_linkscan.pyx":442
+ *     gtpos += 1
+ *     if match_endtag(d, i, n, &name_end) < 0:
+ *         if in_cdata:             # <<<<<<<<<<<<<<
+ *             text(s, i, gtpos)
+ *             return gtpos
+ */
+    __pyx_t_3 = (__pyx_v_in_cdata != 0);
+    if (__pyx_t_3) {
+
+      /* "wikibrev/_linkscan.pyx":443
+ *     if match_endtag(d, i, n, &name_end) < 0:
+ *         if in_cdata:
+ *             text(s, i, gtpos)             # <<<<<<<<<<<<<<
+ *             return gtpos
+ *         if i + 2 >= n or not is_letter(d[i+2]):
+ */
+      __pyx_f_8wikibrev_9_linkscan_text(__pyx_v_s, __pyx_v_i, __pyx_v_gtpos);
+
+      /* "wikibrev/_linkscan.pyx":444
+ *         if in_cdata:
+ *             text(s, i, gtpos)
+ *             return gtpos             # <<<<<<<<<<<<<<
+ *         if i + 2 >= n or not is_letter(d[i+2]):
+ *             if starts_with(d, i, n, b'</>', 3):
+ */
+      __pyx_r = __pyx_v_gtpos;
+      goto __pyx_L0;
+
+      /* "wikibrev/_linkscan.pyx":442
+ *     gtpos += 1
+ *     if match_endtag(d, i, n, &name_end) < 0:
+ *         if in_cdata:             # <<<<<<<<<<<<<<
+ *             text(s, i, gtpos)
+ *             return gtpos
+ */
+    }
+
+    /* "wikibrev/_linkscan.pyx":445
+ *             text(s, i, gtpos)
+ *             return gtpos
+ *         if i + 2 >= n or not is_letter(d[i+2]):             # <<<<<<<<<<<<<<
+ *             if starts_with(d, i, n, b'</>', 3):
+ *                 return i + 3
+ */
+    __pyx_t_4 = (((__pyx_v_i + 2) >= __pyx_v_n) != 0);
+    if (!__pyx_t_4) {
+    } else {
+      __pyx_t_3 = __pyx_t_4;
+      goto __pyx_L7_bool_binop_done;
+    }
+    __pyx_t_4 = ((!(__pyx_f_8wikibrev_9_linkscan_is_letter((__pyx_v_d[(__pyx_v_i + 2)])) != 0)) != 0);
+    __pyx_t_3 = __pyx_t_4;
+    __pyx_L7_bool_binop_done:;
+    if (__pyx_t_3) {
+
+      /* "wikibrev/_linkscan.pyx":446
+ *             return gtpos
+ *         if i + 2 >= n or not is_letter(d[i+2]):
+ *             if starts_with(d, i, n, b'</>', 3):             # <<<<<<<<<<<<<<
+ *                 return i + 3
+ *             # bogus comment
+ */
+      __pyx_t_3 = (__pyx_f_8wikibrev_9_linkscan_starts_with(__pyx_v_d, __pyx_v_i, __pyx_v_n, ((char const *)"</>"), 3) != 0);
+      if (__pyx_t_3) {
+
+        /* "wikibrev/_linkscan.pyx":447
+ *         if i + 2 >= n or not is_letter(d[i+2]):
+ *             if starts_with(d, i, n, b'</>', 3):
+ *                 return i + 3             # <<<<<<<<<<<<<<
+ *             # bogus comment
+ *             k = find(d, b'>', i + 2, n)
+ */
+        __pyx_r = (__pyx_v_i + 3);
+        goto __pyx_L0;
+
+        /* "wikibrev/_linkscan.pyx":446
+ *             return gtpos
+ *         if i + 2 >= n or not is_letter(d[i+2]):
+ *             if starts_with(d, i, n, b'</>', 3):             # <<<<<<<<<<<<<<
+ *                 return i + 3
+ *             # bogus comment
+ */
+      }
+
+      /* "wikibrev/_linkscan.pyx":449
+ *                 return i + 3
+ *             # bogus comment
+ *             k = find(d, b'>', i + 2, n)             # <<<<<<<<<<<<<<
+ *             return k + 1 if k >= 0 else -1
+ *         k = i + 3
+ */
+      __pyx_v_k = __pyx_f_8wikibrev_9_linkscan_find(__pyx_v_d, '>', (__pyx_v_i + 2), __pyx_v_n);
+
+      /* "wikibrev/_linkscan.pyx":450
+ *             # bogus comment
+ *             k = find(d, b'>', i + 2, n)
+ *             return k + 1 if k >= 0 else -1             # <<<<<<<<<<<<<<
+ *         k = i + 3
+ *         while k < n and is_tag_name_char(d[k]):
+ */
+      if (((__pyx_v_k >= 0) != 0)) {
+        __pyx_t_2 = (__pyx_v_k + 1);
+      } else {
+        __pyx_t_2 = -1L;
+      }
+      __pyx_r = __pyx_t_2;
+      goto __pyx_L0;
+
+      /* "wikibrev/_linkscan.pyx":445
+ *             text(s, i, gtpos)
+ *             return gtpos
+ *         if i + 2 >= n or not is_letter(d[i+2]):             # <<<<<<<<<<<<<<
+ *             if starts_with(d, i, n, b'</>', 3):
+ *                 return i + 3
+ */
+    }
+
+    /* "wikibrev/_linkscan.pyx":451
+ *             k = find(d, b'>', i + 2, n)
+ *             return k + 1 if k >= 0 else -1
+ *         k = i + 3             # <<<<<<<<<<<<<<
+ *         while k < n and is_tag_name_char(d[k]):
+ *             k += 1
+ */
+    __pyx_v_k = (__pyx_v_i + 3);
+
+    /* "wikibrev/_linkscan.pyx":452
+ *             return k + 1 if k >= 0 else -1
+ *         k = i + 3
+ *         while k < n and is_tag_name_char(d[k]):             # <<<<<<<<<<<<<<
+ *             k += 1
+ *         tag = lower_name(s, i + 2, k)
+ */
+    while (1) {
+      __pyx_t_4 = ((__pyx_v_k < __pyx_v_n) != 0);
+      if (__pyx_t_4) {
+      } else {
+        __pyx_t_3 = __pyx_t_4;
+        goto __pyx_L12_bool_binop_done;
+      }
+      __pyx_t_4 = (__pyx_f_8wikibrev_9_linkscan_is_tag_name_char((__pyx_v_d[__pyx_v_k])) != 0);
+      __pyx_t_3 = __pyx_t_4;
+      __pyx_L12_bool_binop_done:;
+      if (!__pyx_t_3) break;
+
+      /* "wikibrev/_linkscan.pyx":453
+ *         k = i + 3
+ *         while k < n and is_tag_name_char(d[k]):
+ *             k += 1             # <<<<<<<<<<<<<<
+ *         tag = lower_name(s, i + 2, k)
+ *         if s.fallback:
+ */
+      __pyx_v_k = (__pyx_v_k + 1);
+    }
+
+    /* "wikibrev/_linkscan.pyx":454
+ *         while k < n and is_tag_name_char(d[k]):
+ *             k += 1
+ *         tag = lower_name(s, i + 2, k)             # <<<<<<<<<<<<<<
+ *         if s.fallback:
+ *             return -1
+ */
+    __pyx_v_tag = __pyx_f_8wikibrev_9_linkscan_lower_name(__pyx_v_s, (__pyx_v_i + 2), __pyx_v_k);
+
+    /* "wikibrev/_linkscan.pyx":455
+ *             k += 1
+ *         tag = lower_name(s, i + 2, k)
+ *         if s.fallback:             # <<<<<<<<<<<<<<
+ *             return -1
+ *         end_tag(s, tag)
+ */
+    __pyx_t_3 = (__pyx_v_s->fallback != 0);
+    if (__pyx_t_3) {
+
+      /* "wikibrev/_linkscan.pyx":456
+ *         tag = lower_name(s, i + 2, k)
+ *         if s.fallback:
+ *             return -1             # <<<<<<<<<<<<<<
+ *         end_tag(s, tag)
+ *         return find(d, b'>', skip_trailer(d, k, n), n) + 1
+ */
+      __pyx_r = -1L;
+      goto __pyx_L0;
+
+      /* "wikibrev/_linkscan.pyx":455
+ *             k += 1
+ *         tag = lower_name(s, i + 2, k)
+ *         if s.fallback:             # <<<<<<<<<<<<<<
+ *             return -1
+ *         end_tag(s, tag)
+ */
+    }
+
+    /* "wikibrev/_linkscan.pyx":457
+ *         if s.fallback:
+ *             return -1
+ *         end_tag(s, tag)             # <<<<<<<<<<<<<<
+ *         return find(d, b'>', skip_trailer(d, k, n), n) + 1
+ * 
+ */
+    __pyx_f_8wikibrev_9_linkscan_end_tag(__pyx_v_s, __pyx_v_tag);
+
+    /* "wikibrev/_linkscan.pyx":458
+ *             return -1
+ *         end_tag(s, tag)
+ *         return find(d, b'>', skip_trailer(d, k, n), n) + 1             # <<<<<<<<<<<<<<
+ * 
+ *     name_start = i + 2
+ */
+    __pyx_r = (__pyx_f_8wikibrev_9_linkscan_find(__pyx_v_d, '>', __pyx_f_8wikibrev_9_linkscan_skip_trailer(__pyx_v_d, __pyx_v_k, __pyx_v_n), __pyx_v_n) + 1);
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":441
+ *         return -1
+ *     gtpos += 1
+ *     if match_endtag(d, i, n, &name_end) < 0:             # <<<<<<<<<<<<<<
+ *         if in_cdata:
+ *             text(s, i, gtpos)
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":460
+ *         return find(d, b'>', skip_trailer(d, k, n), n) + 1
+ * 
+ *     name_start = i + 2             # <<<<<<<<<<<<<<
+ *     while is_space(d[name_start]):
+ *         name_start += 1
+ */
+  __pyx_v_name_start = (__pyx_v_i + 2);
+
+  /* "wikibrev/_linkscan.pyx":461
+ * 
+ *     name_start = i + 2
+ *     while is_space(d[name_start]):             # <<<<<<<<<<<<<<
+ *         name_start += 1
+ *     tag = lower_name(s, name_start, name_end)
+ */
+  while (1) {
+    __pyx_t_3 = (__pyx_f_8wikibrev_9_linkscan_is_space((__pyx_v_d[__pyx_v_name_start])) != 0);
+    if (!__pyx_t_3) break;
+
+    /* "wikibrev/_linkscan.pyx":462
+ *     name_start = i + 2
+ *     while is_space(d[name_start]):
+ *         name_start += 1             # <<<<<<<<<<<<<<
+ *     tag = lower_name(s, name_start, name_end)
+ *     if in_cdata and tag != b'script' and tag != b'style':
+ */
+    __pyx_v_name_start = (__pyx_v_name_start + 1);
+  }
+
+  /* "wikibrev/_linkscan.pyx":463
+ *     while is_space(d[name_start]):
+ *         name_start += 1
+ *     tag = lower_name(s, name_start, name_end)             # <<<<<<<<<<<<<<
+ *     if in_cdata and tag != b'script' and tag != b'style':
+ *         text(s, i, gtpos)
+ */
+  __pyx_v_tag = __pyx_f_8wikibrev_9_linkscan_lower_name(__pyx_v_s, __pyx_v_name_start, __pyx_v_name_end);
+
+  /* "wikibrev/_linkscan.pyx":464
+ *         name_start += 1
+ *     tag = lower_name(s, name_start, name_end)
+ *     if in_cdata and tag != b'script' and tag != b'style':             # <<<<<<<<<<<<<<
+ *         text(s, i, gtpos)
+ *         return gtpos
+ */
+  __pyx_t_4 = (__pyx_v_in_cdata != 0);
+  if (__pyx_t_4) {
+  } else {
+    __pyx_t_3 = __pyx_t_4;
+    goto __pyx_L18_bool_binop_done;
+  }
+  __pyx_t_4 = ((__pyx_v_tag != ((char const *)"script")) != 0);
+  if (__pyx_t_4) {
+  } else {
+    __pyx_t_3 = __pyx_t_4;
+    goto __pyx_L18_bool_binop_done;
+  }
+  __pyx_t_4 = ((__pyx_v_tag != ((char const *)"style")) != 0);
+  __pyx_t_3 = __pyx_t_4;
+  __pyx_L18_bool_binop_done:;
+  if (__pyx_t_3) {
+
+    /* "wikibrev/_linkscan.pyx":465
+ *     tag = lower_name(s, name_start, name_end)
+ *     if in_cdata and tag != b'script' and tag != b'style':
+ *         text(s, i, gtpos)             # <<<<<<<<<<<<<<
+ *         return gtpos
+ *     end_tag(s, tag)
+ */
+    __pyx_f_8wikibrev_9_linkscan_text(__pyx_v_s, __pyx_v_i, __pyx_v_gtpos);
+
+    /* "wikibrev/_linkscan.pyx":466
+ *     if in_cdata and tag != b'script' and tag != b'style':
+ *         text(s, i, gtpos)
+ *         return gtpos             # <<<<<<<<<<<<<<
+ *     end_tag(s, tag)
+ *     closed_cdata[0] = True
+ */
+    __pyx_r = __pyx_v_gtpos;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":464
+ *         name_start += 1
+ *     tag = lower_name(s, name_start, name_end)
+ *     if in_cdata and tag != b'script' and tag != b'style':             # <<<<<<<<<<<<<<
+ *         text(s, i, gtpos)
+ *         return gtpos
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":467
+ *         text(s, i, gtpos)
+ *         return gtpos
+ *     end_tag(s, tag)             # <<<<<<<<<<<<<<
+ *     closed_cdata[0] = True
+ *     return gtpos
+ */
+  __pyx_f_8wikibrev_9_linkscan_end_tag(__pyx_v_s, __pyx_v_tag);
+
+  /* "wikibrev/_linkscan.pyx":468
+ *         return gtpos
+ *     end_tag(s, tag)
+ *     closed_cdata[0] = True             # <<<<<<<<<<<<<<
+ *     return gtpos
+ * 
+ */
+  (__pyx_v_closed_cdata[0]) = 1;
+
+  /* "wikibrev/_linkscan.pyx":469
+ *     end_tag(s, tag)
+ *     closed_cdata[0] = True
+ *     return gtpos             # <<<<<<<<<<<<<<
+ * 
+ * cdef Py_ssize_t search_cdata_end(const char* d, Py_ssize_t i, Py_ssize_t n, const string& tag) nogil:
+ */
+  __pyx_r = __pyx_v_gtpos;
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":428
+ *     return name
+ * 
+ * cdef Py_ssize_t scan_endtag(Scanner* s, Py_ssize_t i, bint in_cdata, bint* closed_cdata) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Like `WikiLinkScanner.scan_endtag`: scan an end tag at `i` and return the
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":471
+ *     return gtpos
+ * 
+ * cdef Py_ssize_t search_cdata_end(const char* d, Py_ssize_t i, Py_ssize_t n, const string& tag) nogil:             # <<<<<<<<<<<<<<
+ *     # </\s*tag\s*> with re.IGNORECASE
+ *     cdef Py_ssize_t j
+ */
+
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_search_cdata_end(char const *__pyx_v_d, Py_ssize_t __pyx_v_i, Py_ssize_t __pyx_v_n, std::string const &__pyx_v_tag) {
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+
+  /* "wikibrev/_linkscan.pyx":474
+ *     # </\s*tag\s*> with re.IGNORECASE
+ *     cdef Py_ssize_t j
+ *     while True:             # <<<<<<<<<<<<<<
+ *         i = find(d, b'<', i, n)
+ *         if i < 0:
+ */
+  while (1) {
+
+    /* "wikibrev/_linkscan.pyx":475
+ *     cdef Py_ssize_t j
+ *     while True:
+ *         i = find(d, b'<', i, n)             # <<<<<<<<<<<<<<
+ *         if i < 0:
+ *             return -1
+ */
+    __pyx_v_i = __pyx_f_8wikibrev_9_linkscan_find(__pyx_v_d, '<', __pyx_v_i, __pyx_v_n);
+
+    /* "wikibrev/_linkscan.pyx":476
+ *     while True:
+ *         i = find(d, b'<', i, n)
+ *         if i < 0:             # <<<<<<<<<<<<<<
+ *             return -1
+ *         if i + 1 < n and d[i+1] == b'/':
+ */
+    __pyx_t_1 = ((__pyx_v_i < 0) != 0);
+    if (__pyx_t_1) {
+
+      /* "wikibrev/_linkscan.pyx":477
+ *         i = find(d, b'<', i, n)
+ *         if i < 0:
+ *             return -1             # <<<<<<<<<<<<<<
+ *         if i + 1 < n and d[i+1] == b'/':
+ *             j = i + 2
+ */
+      __pyx_r = -1L;
+      goto __pyx_L0;
+
+      /* "wikibrev/_linkscan.pyx":476
+ *     while True:
+ *         i = find(d, b'<', i, n)
+ *         if i < 0:             # <<<<<<<<<<<<<<
+ *             return -1
+ *         if i + 1 < n and d[i+1] == b'/':
+ */
+    }
+
+    /* "wikibrev/_linkscan.pyx":478
+ *         if i < 0:
+ *             return -1
+ *         if i + 1 < n and d[i+1] == b'/':             # <<<<<<<<<<<<<<
+ *             j = i + 2
+ *             while j < n and is_space(d[j]):
+ */
+    __pyx_t_2 = (((__pyx_v_i + 1) < __pyx_v_n) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L7_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_d[(__pyx_v_i + 1)]) == '/') != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L7_bool_binop_done:;
+    if (__pyx_t_1) {
+
+      /* "wikibrev/_linkscan.pyx":479
+ *             return -1
+ *         if i + 1 < n and d[i+1] == b'/':
+ *             j = i + 2             # <<<<<<<<<<<<<<
+ *             while j < n and is_space(d[j]):
+ *                 j += 1
+ */
+      __pyx_v_j = (__pyx_v_i + 2);
+
+      /* "wikibrev/_linkscan.pyx":480
+ *         if i + 1 < n and d[i+1] == b'/':
+ *             j = i + 2
+ *             while j < n and is_space(d[j]):             # <<<<<<<<<<<<<<
+ *                 j += 1
+ *             if equals_lower(d, j, min(n, j + <Py_ssize_t>tag.size()), tag.c_str(), tag.size()):
+ */
+      while (1) {
+        __pyx_t_2 = ((__pyx_v_j < __pyx_v_n) != 0);
+        if (__pyx_t_2) {
+        } else {
+          __pyx_t_1 = __pyx_t_2;
+          goto __pyx_L11_bool_binop_done;
+        }
+        __pyx_t_2 = (__pyx_f_8wikibrev_9_linkscan_is_space((__pyx_v_d[__pyx_v_j])) != 0);
+        __pyx_t_1 = __pyx_t_2;
+        __pyx_L11_bool_binop_done:;
+        if (!__pyx_t_1) break;
+
+        /* "wikibrev/_linkscan.pyx":481
+ *             j = i + 2
+ *             while j < n and is_space(d[j]):
+ *                 j += 1             # <<<<<<<<<<<<<<
+ *             if equals_lower(d, j, min(n, j + <Py_ssize_t>tag.size()), tag.c_str(), tag.size()):
+ *                 j += tag.size()
+ */
+        __pyx_v_j = (__pyx_v_j + 1);
+      }
+
+      /* "wikibrev/_linkscan.pyx":482
+ *             while j < n and is_space(d[j]):
+ *                 j += 1
+ *             if equals_lower(d, j, min(n, j + <Py_ssize_t>tag.size()), tag.c_str(), tag.size()):             # <<<<<<<<<<<<<<
+ *                 j += tag.size()
+ *                 while j < n and is_space(d[j]):
+ */
+      __pyx_t_3 = (__pyx_v_j + ((Py_ssize_t)__pyx_v_tag.size()));
+      __pyx_t_4 = __pyx_v_n;
+      if (((__pyx_t_3 < __pyx_t_4) != 0)) {
+        __pyx_t_5 = __pyx_t_3;
+      } else {
+        __pyx_t_5 = __pyx_t_4;
+      }
+      __pyx_t_1 = (__pyx_f_8wikibrev_9_linkscan_equals_lower(__pyx_v_d, __pyx_v_j, __pyx_t_5, __pyx_v_tag.c_str(), __pyx_v_tag.size()) != 0);
+      if (__pyx_t_1) {
+
+        /* "wikibrev/_linkscan.pyx":483
+ *                 j += 1
+ *             if equals_lower(d, j, min(n, j + <Py_ssize_t>tag.size()), tag.c_str(), tag.size()):
+ *                 j += tag.size()             # <<<<<<<<<<<<<<
+ *                 while j < n and is_space(d[j]):
+ *                     j += 1
+ */
+        __pyx_v_j = (__pyx_v_j + __pyx_v_tag.size());
+
+        /* "wikibrev/_linkscan.pyx":484
+ *             if equals_lower(d, j, min(n, j + <Py_ssize_t>tag.size()), tag.c_str(), tag.size()):
+ *                 j += tag.size()
+ *                 while j < n and is_space(d[j]):             # <<<<<<<<<<<<<<
+ *                     j += 1
+ *                 if j < n and d[j] == b'>':
+ */
+        while (1) {
+          __pyx_t_2 = ((__pyx_v_j < __pyx_v_n) != 0);
+          if (__pyx_t_2) {
+          } else {
+            __pyx_t_1 = __pyx_t_2;
+            goto __pyx_L16_bool_binop_done;
+          }
+          __pyx_t_2 = (__pyx_f_8wikibrev_9_linkscan_is_space((__pyx_v_d[__pyx_v_j])) != 0);
+          __pyx_t_1 = __pyx_t_2;
+          __pyx_L16_bool_binop_done:;
+          if (!__pyx_t_1) break;
+
+          /* "wikibrev/_linkscan.pyx":485
+ *                 j += tag.size()
+ *                 while j < n and is_space(d[j]):
+ *                     j += 1             # <<<<<<<<<<<<<<
+ *                 if j < n and d[j] == b'>':
+ *                     return i
+ */
+          __pyx_v_j = (__pyx_v_j + 1);
+        }
+
+        /* "wikibrev/_linkscan.pyx":486
+ *                 while j < n and is_space(d[j]):
+ *                     j += 1
+ *                 if j < n and d[j] == b'>':             # <<<<<<<<<<<<<<
+ *                     return i
+ *         i += 1
+ */
+        __pyx_t_2 = ((__pyx_v_j < __pyx_v_n) != 0);
+        if (__pyx_t_2) {
+        } else {
+          __pyx_t_1 = __pyx_t_2;
+          goto __pyx_L19_bool_binop_done;
+        }
+        __pyx_t_2 = (((__pyx_v_d[__pyx_v_j]) == '>') != 0);
+        __pyx_t_1 = __pyx_t_2;
+        __pyx_L19_bool_binop_done:;
+        if (__pyx_t_1) {
+
+          /* "wikibrev/_linkscan.pyx":487
+ *                     j += 1
+ *                 if j < n and d[j] == b'>':
+ *                     return i             # <<<<<<<<<<<<<<
+ *         i += 1
+ * 
+ */
+          __pyx_r = __pyx_v_i;
+          goto __pyx_L0;
+
+          /* "wikibrev/_linkscan.pyx":486
+ *                 while j < n and is_space(d[j]):
+ *                     j += 1
+ *                 if j < n and d[j] == b'>':             # <<<<<<<<<<<<<<
+ *                     return i
+ *         i += 1
+ */
+        }
+
+        /* "wikibrev/_linkscan.pyx":482
+ *             while j < n and is_space(d[j]):
+ *                 j += 1
+ *             if equals_lower(d, j, min(n, j + <Py_ssize_t>tag.size()), tag.c_str(), tag.size()):             # <<<<<<<<<<<<<<
+ *                 j += tag.size()
+ *                 while j < n and is_space(d[j]):
+ */
+      }
+
+      /* "wikibrev/_linkscan.pyx":478
+ *         if i < 0:
+ *             return -1
+ *         if i + 1 < n and d[i+1] == b'/':             # <<<<<<<<<<<<<<
+ *             j = i + 2
+ *             while j < n and is_space(d[j]):
+ */
+    }
+
+    /* "wikibrev/_linkscan.pyx":488
+ *                 if j < n and d[j] == b'>':
+ *                     return i
+ *         i += 1             # <<<<<<<<<<<<<<
+ * 
+ * cdef Py_ssize_t search_comment_end(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:
+ */
+    __pyx_v_i = (__pyx_v_i + 1);
+  }
+
+  /* "wikibrev/_linkscan.pyx":471
+ *     return gtpos
+ * 
+ * cdef Py_ssize_t search_cdata_end(const char* d, Py_ssize_t i, Py_ssize_t n, const string& tag) nogil:             # <<<<<<<<<<<<<<
+ *     # </\s*tag\s*> with re.IGNORECASE
+ *     cdef Py_ssize_t j
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":490
+ *         i += 1
+ * 
+ * cdef Py_ssize_t search_comment_end(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:             # <<<<<<<<<<<<<<
+ *     # the end of the first match of --\s*>
+ *     cdef Py_ssize_t j
+ */
+
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_search_comment_end(char const *__pyx_v_d, Py_ssize_t __pyx_v_i, Py_ssize_t __pyx_v_n) {
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "wikibrev/_linkscan.pyx":493
+ *     # the end of the first match of --\s*>
+ *     cdef Py_ssize_t j
+ *     while True:             # <<<<<<<<<<<<<<
+ *         i = find(d, b'-', i, n)
+ *         if i < 0:
+ */
+  while (1) {
+
+    /* "wikibrev/_linkscan.pyx":494
+ *     cdef Py_ssize_t j
+ *     while True:
+ *         i = find(d, b'-', i, n)             # <<<<<<<<<<<<<<
+ *         if i < 0:
+ *             return -1
+ */
+    __pyx_v_i = __pyx_f_8wikibrev_9_linkscan_find(__pyx_v_d, '-', __pyx_v_i, __pyx_v_n);
+
+    /* "wikibrev/_linkscan.pyx":495
+ *     while True:
+ *         i = find(d, b'-', i, n)
+ *         if i < 0:             # <<<<<<<<<<<<<<
+ *             return -1
+ *         if i + 1 < n and d[i+1] == b'-':
+ */
+    __pyx_t_1 = ((__pyx_v_i < 0) != 0);
+    if (__pyx_t_1) {
+
+      /* "wikibrev/_linkscan.pyx":496
+ *         i = find(d, b'-', i, n)
+ *         if i < 0:
+ *             return -1             # <<<<<<<<<<<<<<
+ *         if i + 1 < n and d[i+1] == b'-':
+ *             j = i + 2
+ */
+      __pyx_r = -1L;
+      goto __pyx_L0;
+
+      /* "wikibrev/_linkscan.pyx":495
+ *     while True:
+ *         i = find(d, b'-', i, n)
+ *         if i < 0:             # <<<<<<<<<<<<<<
+ *             return -1
+ *         if i + 1 < n and d[i+1] == b'-':
+ */
+    }
+
+    /* "wikibrev/_linkscan.pyx":497
+ *         if i < 0:
+ *             return -1
+ *         if i + 1 < n and d[i+1] == b'-':             # <<<<<<<<<<<<<<
+ *             j = i + 2
+ *             while j < n and is_space(d[j]):
+ */
+    __pyx_t_2 = (((__pyx_v_i + 1) < __pyx_v_n) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L7_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_d[(__pyx_v_i + 1)]) == '-') != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L7_bool_binop_done:;
+    if (__pyx_t_1) {
+
+      /* "wikibrev/_linkscan.pyx":498
+ *             return -1
+ *         if i + 1 < n and d[i+1] == b'-':
+ *             j = i + 2             # <<<<<<<<<<<<<<
+ *             while j < n and is_space(d[j]):
+ *                 j += 1
+ */
+      __pyx_v_j = (__pyx_v_i + 2);
+
+      /* "wikibrev/_linkscan.pyx":499
+ *         if i + 1 < n and d[i+1] == b'-':
+ *             j = i + 2
+ *             while j < n and is_space(d[j]):             # <<<<<<<<<<<<<<
+ *                 j += 1
+ *             if j < n and d[j] == b'>':
+ */
+      while (1) {
+        __pyx_t_2 = ((__pyx_v_j < __pyx_v_n) != 0);
+        if (__pyx_t_2) {
+        } else {
+          __pyx_t_1 = __pyx_t_2;
+          goto __pyx_L11_bool_binop_done;
+        }
+        __pyx_t_2 = (__pyx_f_8wikibrev_9_linkscan_is_space((__pyx_v_d[__pyx_v_j])) != 0);
+        __pyx_t_1 = __pyx_t_2;
+        __pyx_L11_bool_binop_done:;
+        if (!__pyx_t_1) break;
+
+        /* "wikibrev/_linkscan.pyx":500
+ *             j = i + 2
+ *             while j < n and is_space(d[j]):
+ *                 j += 1             # <<<<<<<<<<<<<<
+ *             if j < n and d[j] == b'>':
+ *                 return j + 1
+ */
+        __pyx_v_j = (__pyx_v_j + 1);
+      }
+
+      /* "wikibrev/_linkscan.pyx":501
+ *             while j < n and is_space(d[j]):
+ *                 j += 1
+ *             if j < n and d[j] == b'>':             # <<<<<<<<<<<<<<
+ *                 return j + 1
+ *         i += 1
+ */
+      __pyx_t_2 = ((__pyx_v_j < __pyx_v_n) != 0);
+      if (__pyx_t_2) {
+      } else {
+        __pyx_t_1 = __pyx_t_2;
+        goto __pyx_L14_bool_binop_done;
+      }
+      __pyx_t_2 = (((__pyx_v_d[__pyx_v_j]) == '>') != 0);
+      __pyx_t_1 = __pyx_t_2;
+      __pyx_L14_bool_binop_done:;
+      if (__pyx_t_1) {
+
+        /* "wikibrev/_linkscan.pyx":502
+ *                 j += 1
+ *             if j < n and d[j] == b'>':
+ *                 return j + 1             # <<<<<<<<<<<<<<
+ *         i += 1
+ * 
+ */
+        __pyx_r = (__pyx_v_j + 1);
+        goto __pyx_L0;
+
+        /* "wikibrev/_linkscan.pyx":501
+ *             while j < n and is_space(d[j]):
+ *                 j += 1
+ *             if j < n and d[j] == b'>':             # <<<<<<<<<<<<<<
+ *                 return j + 1
+ *         i += 1
+ */
+      }
+
+      /* "wikibrev/_linkscan.pyx":497
+ *         if i < 0:
+ *             return -1
+ *         if i + 1 < n and d[i+1] == b'-':             # <<<<<<<<<<<<<<
+ *             j = i + 2
+ *             while j < n and is_space(d[j]):
+ */
+    }
+
+    /* "wikibrev/_linkscan.pyx":503
+ *             if j < n and d[j] == b'>':
+ *                 return j + 1
+ *         i += 1             # <<<<<<<<<<<<<<
+ * 
+ * cdef Py_ssize_t match_charref(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:
+ */
+    __pyx_v_i = (__pyx_v_i + 1);
+  }
+
+  /* "wikibrev/_linkscan.pyx":490
+ *         i += 1
+ * 
+ * cdef Py_ssize_t search_comment_end(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:             # <<<<<<<<<<<<<<
+ *     # the end of the first match of --\s*>
+ *     cdef Py_ssize_t j
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":505
+ *         i += 1
+ * 
+ * cdef Py_ssize_t match_charref(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:             # <<<<<<<<<<<<<<
+ *     # the end of the match of &#(?:[0-9]+|[xX][0-9a-fA-F]+)[^0-9a-fA-F] at i
+ *     cdef Py_ssize_t j = i + 2
+ */
+
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_match_charref(char const *__pyx_v_d, Py_ssize_t __pyx_v_i, Py_ssize_t __pyx_v_n) {
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "wikibrev/_linkscan.pyx":507
+ * cdef Py_ssize_t match_charref(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:
+ *     # the end of the match of &#(?:[0-9]+|[xX][0-9a-fA-F]+)[^0-9a-fA-F] at i
+ *     cdef Py_ssize_t j = i + 2             # <<<<<<<<<<<<<<
+ *     if j < n and d[j] >= b'0' and d[j] <= b'9':
+ *         while j < n and d[j] >= b'0' and d[j] <= b'9':
+ */
+  __pyx_v_j = (__pyx_v_i + 2);
+
+  /* "wikibrev/_linkscan.pyx":508
+ *     # the end of the match of &#(?:[0-9]+|[xX][0-9a-fA-F]+)[^0-9a-fA-F] at i
+ *     cdef Py_ssize_t j = i + 2
+ *     if j < n and d[j] >= b'0' and d[j] <= b'9':             # <<<<<<<<<<<<<<
+ *         while j < n and d[j] >= b'0' and d[j] <= b'9':
+ *             j += 1
+ */
+  __pyx_t_2 = ((__pyx_v_j < __pyx_v_n) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (((__pyx_v_d[__pyx_v_j]) >= '0') != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (((__pyx_v_d[__pyx_v_j]) <= '9') != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":509
+ *     cdef Py_ssize_t j = i + 2
+ *     if j < n and d[j] >= b'0' and d[j] <= b'9':
+ *         while j < n and d[j] >= b'0' and d[j] <= b'9':             # <<<<<<<<<<<<<<
+ *             j += 1
+ *     elif j < n and (d[j] == b'x' or d[j] == b'X'):
+ */
+    while (1) {
+      __pyx_t_2 = ((__pyx_v_j < __pyx_v_n) != 0);
+      if (__pyx_t_2) {
+      } else {
+        __pyx_t_1 = __pyx_t_2;
+        goto __pyx_L9_bool_binop_done;
+      }
+      __pyx_t_2 = (((__pyx_v_d[__pyx_v_j]) >= '0') != 0);
+      if (__pyx_t_2) {
+      } else {
+        __pyx_t_1 = __pyx_t_2;
+        goto __pyx_L9_bool_binop_done;
+      }
+      __pyx_t_2 = (((__pyx_v_d[__pyx_v_j]) <= '9') != 0);
+      __pyx_t_1 = __pyx_t_2;
+      __pyx_L9_bool_binop_done:;
+      if (!__pyx_t_1) break;
+
+      /* "wikibrev/_linkscan.pyx":510
+ *     if j < n and d[j] >= b'0' and d[j] <= b'9':
+ *         while j < n and d[j] >= b'0' and d[j] <= b'9':
+ *             j += 1             # <<<<<<<<<<<<<<
+ *     elif j < n and (d[j] == b'x' or d[j] == b'X'):
+ *         j += 1
+ */
+      __pyx_v_j = (__pyx_v_j + 1);
+    }
+
+    /* "wikibrev/_linkscan.pyx":508
+ *     # the end of the match of &#(?:[0-9]+|[xX][0-9a-fA-F]+)[^0-9a-fA-F] at i
+ *     cdef Py_ssize_t j = i + 2
+ *     if j < n and d[j] >= b'0' and d[j] <= b'9':             # <<<<<<<<<<<<<<
+ *         while j < n and d[j] >= b'0' and d[j] <= b'9':
+ *             j += 1
+ */
+    goto __pyx_L3;
+  }
+
+  /* "wikibrev/_linkscan.pyx":511
+ *         while j < n and d[j] >= b'0' and d[j] <= b'9':
+ *             j += 1
+ *     elif j < n and (d[j] == b'x' or d[j] == b'X'):             # <<<<<<<<<<<<<<
+ *         j += 1
+ *         if j >= n or not is_hex(d[j]):
+ */
+  __pyx_t_2 = ((__pyx_v_j < __pyx_v_n) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L12_bool_binop_done;
+  }
+  __pyx_t_2 = (((__pyx_v_d[__pyx_v_j]) == 'x') != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L12_bool_binop_done;
+  }
+  __pyx_t_2 = (((__pyx_v_d[__pyx_v_j]) == 'X') != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L12_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":512
+ *             j += 1
+ *     elif j < n and (d[j] == b'x' or d[j] == b'X'):
+ *         j += 1             # <<<<<<<<<<<<<<
+ *         if j >= n or not is_hex(d[j]):
+ *             return -1
+ */
+    __pyx_v_j = (__pyx_v_j + 1);
+
+    /* "wikibrev/_linkscan.pyx":513
+ *     elif j < n and (d[j] == b'x' or d[j] == b'X'):
+ *         j += 1
+ *         if j >= n or not is_hex(d[j]):             # <<<<<<<<<<<<<<
+ *             return -1
+ *         while j < n and is_hex(d[j]):
+ */
+    __pyx_t_2 = ((__pyx_v_j >= __pyx_v_n) != 0);
+    if (!__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L16_bool_binop_done;
+    }
+    __pyx_t_2 = ((!(__pyx_f_8wikibrev_9_linkscan_is_hex((__pyx_v_d[__pyx_v_j])) != 0)) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L16_bool_binop_done:;
+    if (__pyx_t_1) {
+
+      /* "wikibrev/_linkscan.pyx":514
+ *         j += 1
+ *         if j >= n or not is_hex(d[j]):
+ *             return -1             # <<<<<<<<<<<<<<
+ *         while j < n and is_hex(d[j]):
+ *             j += 1
+ */
+      __pyx_r = -1L;
+      goto __pyx_L0;
+
+      /* "wikibrev/_linkscan.pyx":513
+ *     elif j < n and (d[j] == b'x' or d[j] == b'X'):
+ *         j += 1
+ *         if j >= n or not is_hex(d[j]):             # <<<<<<<<<<<<<<
+ *             return -1
+ *         while j < n and is_hex(d[j]):
+ */
+    }
+
+    /* "wikibrev/_linkscan.pyx":515
+ *         if j >= n or not is_hex(d[j]):
+ *             return -1
+ *         while j < n and is_hex(d[j]):             # <<<<<<<<<<<<<<
+ *             j += 1
+ *     else:
+ */
+    while (1) {
+      __pyx_t_2 = ((__pyx_v_j < __pyx_v_n) != 0);
+      if (__pyx_t_2) {
+      } else {
+        __pyx_t_1 = __pyx_t_2;
+        goto __pyx_L20_bool_binop_done;
+      }
+      __pyx_t_2 = (__pyx_f_8wikibrev_9_linkscan_is_hex((__pyx_v_d[__pyx_v_j])) != 0);
+      __pyx_t_1 = __pyx_t_2;
+      __pyx_L20_bool_binop_done:;
+      if (!__pyx_t_1) break;
+
+      /* "wikibrev/_linkscan.pyx":516
+ *             return -1
+ *         while j < n and is_hex(d[j]):
+ *             j += 1             # <<<<<<<<<<<<<<
+ *     else:
+ *         return -1
+ */
+      __pyx_v_j = (__pyx_v_j + 1);
+    }
+
+    /* "wikibrev/_linkscan.pyx":511
+ *         while j < n and d[j] >= b'0' and d[j] <= b'9':
+ *             j += 1
+ *     elif j < n and (d[j] == b'x' or d[j] == b'X'):             # <<<<<<<<<<<<<<
+ *         j += 1
+ *         if j >= n or not is_hex(d[j]):
+ */
+    goto __pyx_L3;
+  }
+
+  /* "wikibrev/_linkscan.pyx":518
+ *             j += 1
+ *     else:
+ *         return -1             # <<<<<<<<<<<<<<
+ *     if j >= n or is_hex(d[j]):
+ *         return -1
+ */
+  /*else*/ {
+    __pyx_r = -1L;
+    goto __pyx_L0;
+  }
+  __pyx_L3:;
+
+  /* "wikibrev/_linkscan.pyx":519
+ *     else:
+ *         return -1
+ *     if j >= n or is_hex(d[j]):             # <<<<<<<<<<<<<<
+ *         return -1
+ *     return j + 1
+ */
+  __pyx_t_2 = ((__pyx_v_j >= __pyx_v_n) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L23_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_f_8wikibrev_9_linkscan_is_hex((__pyx_v_d[__pyx_v_j])) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L23_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":520
+ *         return -1
+ *     if j >= n or is_hex(d[j]):
+ *         return -1             # <<<<<<<<<<<<<<
+ *     return j + 1
+ * 
+ */
+    __pyx_r = -1L;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":519
+ *     else:
+ *         return -1
+ *     if j >= n or is_hex(d[j]):             # <<<<<<<<<<<<<<
+ *         return -1
+ *     return j + 1
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":521
+ *     if j >= n or is_hex(d[j]):
+ *         return -1
+ *     return j + 1             # <<<<<<<<<<<<<<
+ * 
+ * cdef Py_ssize_t match_entityref(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:
+ */
+  __pyx_r = (__pyx_v_j + 1);
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":505
+ *         i += 1
+ * 
+ * cdef Py_ssize_t match_charref(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:             # <<<<<<<<<<<<<<
+ *     # the end of the match of &#(?:[0-9]+|[xX][0-9a-fA-F]+)[^0-9a-fA-F] at i
+ *     cdef Py_ssize_t j = i + 2
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":523
+ *     return j + 1
+ * 
+ * cdef Py_ssize_t match_entityref(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:             # <<<<<<<<<<<<<<
+ *     # the end of the match of &([a-zA-Z][-.a-zA-Z0-9]*)[^a-zA-Z0-9] at i
+ *     cdef Py_ssize_t j = i + 1, k
+ */
+
+static Py_ssize_t __pyx_f_8wikibrev_9_linkscan_match_entityref(char const *__pyx_v_d, Py_ssize_t __pyx_v_i, Py_ssize_t __pyx_v_n) {
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_v_k;
+  Py_ssize_t __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "wikibrev/_linkscan.pyx":525
+ * cdef Py_ssize_t match_entityref(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:
+ *     # the end of the match of &([a-zA-Z][-.a-zA-Z0-9]*)[^a-zA-Z0-9] at i
+ *     cdef Py_ssize_t j = i + 1, k             # <<<<<<<<<<<<<<
+ *     if j >= n or not is_letter(d[j]):
+ *         return -1
+ */
+  __pyx_v_j = (__pyx_v_i + 1);
+
+  /* "wikibrev/_linkscan.pyx":526
+ *     # the end of the match of &([a-zA-Z][-.a-zA-Z0-9]*)[^a-zA-Z0-9] at i
+ *     cdef Py_ssize_t j = i + 1, k
+ *     if j >= n or not is_letter(d[j]):             # <<<<<<<<<<<<<<
+ *         return -1
+ *     j += 1
+ */
+  __pyx_t_2 = ((__pyx_v_j >= __pyx_v_n) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((!(__pyx_f_8wikibrev_9_linkscan_is_letter((__pyx_v_d[__pyx_v_j])) != 0)) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":527
+ *     cdef Py_ssize_t j = i + 1, k
+ *     if j >= n or not is_letter(d[j]):
+ *         return -1             # <<<<<<<<<<<<<<
+ *     j += 1
+ *     while j < n and (is_alnum(d[j]) or d[j] == b'-' or d[j] == b'.'):
+ */
+    __pyx_r = -1L;
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":526
+ *     # the end of the match of &([a-zA-Z][-.a-zA-Z0-9]*)[^a-zA-Z0-9] at i
+ *     cdef Py_ssize_t j = i + 1, k
+ *     if j >= n or not is_letter(d[j]):             # <<<<<<<<<<<<<<
+ *         return -1
+ *     j += 1
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":528
+ *     if j >= n or not is_letter(d[j]):
+ *         return -1
+ *     j += 1             # <<<<<<<<<<<<<<
+ *     while j < n and (is_alnum(d[j]) or d[j] == b'-' or d[j] == b'.'):
+ *         j += 1
+ */
+  __pyx_v_j = (__pyx_v_j + 1);
+
+  /* "wikibrev/_linkscan.pyx":529
+ *         return -1
+ *     j += 1
+ *     while j < n and (is_alnum(d[j]) or d[j] == b'-' or d[j] == b'.'):             # <<<<<<<<<<<<<<
+ *         j += 1
+ *     if j < n:
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_j < __pyx_v_n) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L8_bool_binop_done;
+    }
+    __pyx_t_2 = (__pyx_f_8wikibrev_9_linkscan_is_alnum((__pyx_v_d[__pyx_v_j])) != 0);
+    if (!__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L8_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_d[__pyx_v_j]) == '-') != 0);
+    if (!__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L8_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_d[__pyx_v_j]) == '.') != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L8_bool_binop_done:;
+    if (!__pyx_t_1) break;
+
+    /* "wikibrev/_linkscan.pyx":530
+ *     j += 1
+ *     while j < n and (is_alnum(d[j]) or d[j] == b'-' or d[j] == b'.'):
+ *         j += 1             # <<<<<<<<<<<<<<
+ *     if j < n:
+ *         return j + 1
+ */
+    __pyx_v_j = (__pyx_v_j + 1);
+  }
+
+  /* "wikibrev/_linkscan.pyx":531
+ *     while j < n and (is_alnum(d[j]) or d[j] == b'-' or d[j] == b'.'):
+ *         j += 1
+ *     if j < n:             # <<<<<<<<<<<<<<
+ *         return j + 1
+ *     # backtrack to the last '-' or '.' of the name
+ */
+  __pyx_t_1 = ((__pyx_v_j < __pyx_v_n) != 0);
+  if (__pyx_t_1) {
+
+    /* "wikibrev/_linkscan.pyx":532
+ *         j += 1
+ *     if j < n:
+ *         return j + 1             # <<<<<<<<<<<<<<
+ *     # backtrack to the last '-' or '.' of the name
+ *     k = n - 1
+ */
+    __pyx_r = (__pyx_v_j + 1);
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":531
+ *     while j < n and (is_alnum(d[j]) or d[j] == b'-' or d[j] == b'.'):
+ *         j += 1
+ *     if j < n:             # <<<<<<<<<<<<<<
+ *         return j + 1
+ *     # backtrack to the last '-' or '.' of the name
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":534
+ *         return j + 1
+ *     # backtrack to the last '-' or '.' of the name
+ *     k = n - 1             # <<<<<<<<<<<<<<
+ *     while k > i + 1:
+ *         if d[k] == b'-' or d[k] == b'.':
+ */
+  __pyx_v_k = (__pyx_v_n - 1);
+
+  /* "wikibrev/_linkscan.pyx":535
+ *     # backtrack to the last '-' or '.' of the name
+ *     k = n - 1
+ *     while k > i + 1:             # <<<<<<<<<<<<<<
+ *         if d[k] == b'-' or d[k] == b'.':
+ *             return k + 1
+ */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_k > (__pyx_v_i + 1)) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "wikibrev/_linkscan.pyx":536
+ *     k = n - 1
+ *     while k > i + 1:
+ *         if d[k] == b'-' or d[k] == b'.':             # <<<<<<<<<<<<<<
+ *             return k + 1
+ *         k -= 1
+ */
+    __pyx_t_2 = (((__pyx_v_d[__pyx_v_k]) == '-') != 0);
+    if (!__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L16_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_d[__pyx_v_k]) == '.') != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L16_bool_binop_done:;
+    if (__pyx_t_1) {
+
+      /* "wikibrev/_linkscan.pyx":537
+ *     while k > i + 1:
+ *         if d[k] == b'-' or d[k] == b'.':
+ *             return k + 1             # <<<<<<<<<<<<<<
+ *         k -= 1
+ *     return -1
+ */
+      __pyx_r = (__pyx_v_k + 1);
+      goto __pyx_L0;
+
+      /* "wikibrev/_linkscan.pyx":536
+ *     k = n - 1
+ *     while k > i + 1:
+ *         if d[k] == b'-' or d[k] == b'.':             # <<<<<<<<<<<<<<
+ *             return k + 1
+ *         k -= 1
+ */
+    }
+
+    /* "wikibrev/_linkscan.pyx":538
+ *         if d[k] == b'-' or d[k] == b'.':
+ *             return k + 1
+ *         k -= 1             # <<<<<<<<<<<<<<
+ *     return -1
+ * 
+ */
+    __pyx_v_k = (__pyx_v_k - 1);
+  }
+
+  /* "wikibrev/_linkscan.pyx":539
+ *             return k + 1
+ *         k -= 1
+ *     return -1             # <<<<<<<<<<<<<<
+ * 
+ * cdef void scan(Scanner* s) nogil:
+ */
+  __pyx_r = -1L;
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":523
+ *     return j + 1
+ * 
+ * cdef Py_ssize_t match_entityref(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:             # <<<<<<<<<<<<<<
+ *     # the end of the match of &([a-zA-Z][-.a-zA-Z0-9]*)[^a-zA-Z0-9] at i
+ *     cdef Py_ssize_t j = i + 1, k
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "wikibrev/_linkscan.pyx":541
+ *     return -1
+ * 
+ * cdef void scan(Scanner* s) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Like `WikiLinkScanner.scan`.
+ */
+
+static void __pyx_f_8wikibrev_9_linkscan_scan(struct __pyx_t_8wikibrev_9_linkscan_Scanner *__pyx_v_s) {
+  char const *__pyx_v_d;
+  Py_ssize_t __pyx_v_n;
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_v_k;
+  std::string __pyx_v_cdata_tag;
+  int __pyx_v_closed;
+  char const *__pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+
+  /* "wikibrev/_linkscan.pyx":545
+ *     Like `WikiLinkScanner.scan`.
+ *     """
+ *     cdef const char* d = s.d             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t n = s.n
+ *     cdef Py_ssize_t i = 0, j, k
+ */
+  __pyx_t_1 = __pyx_v_s->d;
+  __pyx_v_d = __pyx_t_1;
+
+  /* "wikibrev/_linkscan.pyx":546
+ *     """
+ *     cdef const char* d = s.d
+ *     cdef Py_ssize_t n = s.n             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t i = 0, j, k
+ *     cdef string cdata_tag
+ */
+  __pyx_t_2 = __pyx_v_s->n;
+  __pyx_v_n = __pyx_t_2;
+
+  /* "wikibrev/_linkscan.pyx":547
+ *     cdef const char* d = s.d
+ *     cdef Py_ssize_t n = s.n
+ *     cdef Py_ssize_t i = 0, j, k             # <<<<<<<<<<<<<<
+ *     cdef string cdata_tag
+ *     cdef bint closed
+ */
+  __pyx_v_i = 0;
+
+  /* "wikibrev/_linkscan.pyx":550
+ *     cdef string cdata_tag
+ *     cdef bint closed
+ *     while i < n:             # <<<<<<<<<<<<<<
+ *         if cdata_tag.size():
+ *             j = search_cdata_end(d, i, n, cdata_tag)
+ */
+  while (1) {
+    __pyx_t_3 = ((__pyx_v_i < __pyx_v_n) != 0);
+    if (!__pyx_t_3) break;
+
+    /* "wikibrev/_linkscan.pyx":551
+ *     cdef bint closed
+ *     while i < n:
+ *         if cdata_tag.size():             # <<<<<<<<<<<<<<
+ *             j = search_cdata_end(d, i, n, cdata_tag)
+ *             if j < 0:
+ */
+    __pyx_t_3 = (__pyx_v_cdata_tag.size() != 0);
+    if (__pyx_t_3) {
+
+      /* "wikibrev/_linkscan.pyx":552
+ *     while i < n:
+ *         if cdata_tag.size():
+ *             j = search_cdata_end(d, i, n, cdata_tag)             # <<<<<<<<<<<<<<
+ *             if j < 0:
+ *                 break
+ */
+      __pyx_v_j = __pyx_f_8wikibrev_9_linkscan_search_cdata_end(__pyx_v_d, __pyx_v_i, __pyx_v_n, __pyx_v_cdata_tag);
+
+      /* "wikibrev/_linkscan.pyx":553
+ *         if cdata_tag.size():
+ *             j = search_cdata_end(d, i, n, cdata_tag)
+ *             if j < 0:             # <<<<<<<<<<<<<<
+ *                 break
+ *         else:
+ */
+      __pyx_t_3 = ((__pyx_v_j < 0) != 0);
+      if (__pyx_t_3) {
+
+        /* "wikibrev/_linkscan.pyx":554
+ *             j = search_cdata_end(d, i, n, cdata_tag)
+ *             if j < 0:
+ *                 break             # <<<<<<<<<<<<<<
+ *         else:
+ *             # [&<]
+ */
+        goto __pyx_L4_break;
+
+        /* "wikibrev/_linkscan.pyx":553
+ *         if cdata_tag.size():
+ *             j = search_cdata_end(d, i, n, cdata_tag)
+ *             if j < 0:             # <<<<<<<<<<<<<<
+ *                 break
+ *         else:
+ */
+      }
+
+      /* "wikibrev/_linkscan.pyx":551
+ *     cdef bint closed
+ *     while i < n:
+ *         if cdata_tag.size():             # <<<<<<<<<<<<<<
+ *             j = search_cdata_end(d, i, n, cdata_tag)
+ *             if j < 0:
+ */
+      goto __pyx_L5;
+    }
+
+    /* "wikibrev/_linkscan.pyx":557
+ *         else:
+ *             # [&<]
+ *             j = i             # <<<<<<<<<<<<<<
+ *             while j < n and d[j] != b'<' and d[j] != b'&':
+ *                 j += 1
+ */
+    /*else*/ {
+      __pyx_v_j = __pyx_v_i;
+
+      /* "wikibrev/_linkscan.pyx":558
+ *             # [&<]
+ *             j = i
+ *             while j < n and d[j] != b'<' and d[j] != b'&':             # <<<<<<<<<<<<<<
+ *                 j += 1
+ *         if i < j and s.is_link:
+ */
+      while (1) {
+        __pyx_t_4 = ((__pyx_v_j < __pyx_v_n) != 0);
+        if (__pyx_t_4) {
+        } else {
+          __pyx_t_3 = __pyx_t_4;
+          goto __pyx_L9_bool_binop_done;
+        }
+        __pyx_t_4 = (((__pyx_v_d[__pyx_v_j]) != '<') != 0);
+        if (__pyx_t_4) {
+        } else {
+          __pyx_t_3 = __pyx_t_4;
+          goto __pyx_L9_bool_binop_done;
+        }
+        __pyx_t_4 = (((__pyx_v_d[__pyx_v_j]) != '&') != 0);
+        __pyx_t_3 = __pyx_t_4;
+        __pyx_L9_bool_binop_done:;
+        if (!__pyx_t_3) break;
+
+        /* "wikibrev/_linkscan.pyx":559
+ *             j = i
+ *             while j < n and d[j] != b'<' and d[j] != b'&':
+ *                 j += 1             # <<<<<<<<<<<<<<
+ *         if i < j and s.is_link:
+ *             text(s, i, j)
+ */
+        __pyx_v_j = (__pyx_v_j + 1);
+      }
+    }
+    __pyx_L5:;
+
+    /* "wikibrev/_linkscan.pyx":560
+ *             while j < n and d[j] != b'<' and d[j] != b'&':
+ *                 j += 1
+ *         if i < j and s.is_link:             # <<<<<<<<<<<<<<
+ *             text(s, i, j)
+ *         i = j
+ */
+    __pyx_t_4 = ((__pyx_v_i < __pyx_v_j) != 0);
+    if (__pyx_t_4) {
+    } else {
+      __pyx_t_3 = __pyx_t_4;
+      goto __pyx_L13_bool_binop_done;
+    }
+    __pyx_t_4 = (__pyx_v_s->is_link != 0);
+    __pyx_t_3 = __pyx_t_4;
+    __pyx_L13_bool_binop_done:;
+    if (__pyx_t_3) {
+
+      /* "wikibrev/_linkscan.pyx":561
+ *                 j += 1
+ *         if i < j and s.is_link:
+ *             text(s, i, j)             # <<<<<<<<<<<<<<
+ *         i = j
+ *         if i == n:
+ */
+      __pyx_f_8wikibrev_9_linkscan_text(__pyx_v_s, __pyx_v_i, __pyx_v_j);
+
+      /* "wikibrev/_linkscan.pyx":560
+ *             while j < n and d[j] != b'<' and d[j] != b'&':
+ *                 j += 1
+ *         if i < j and s.is_link:             # <<<<<<<<<<<<<<
+ *             text(s, i, j)
+ *         i = j
+ */
+    }
+
+    /* "wikibrev/_linkscan.pyx":562
+ *         if i < j and s.is_link:
+ *             text(s, i, j)
+ *         i = j             # <<<<<<<<<<<<<<
+ *         if i == n:
+ *             break
+ */
+    __pyx_v_i = __pyx_v_j;
+
+    /* "wikibrev/_linkscan.pyx":563
+ *             text(s, i, j)
+ *         i = j
+ *         if i == n:             # <<<<<<<<<<<<<<
+ *             break
+ * 
+ */
+    __pyx_t_3 = ((__pyx_v_i == __pyx_v_n) != 0);
+    if (__pyx_t_3) {
+
+      /* "wikibrev/_linkscan.pyx":564
+ *         i = j
+ *         if i == n:
+ *             break             # <<<<<<<<<<<<<<
+ * 
+ *         if d[i] == b'<':
+ */
+      goto __pyx_L4_break;
+
+      /* "wikibrev/_linkscan.pyx":563
+ *             text(s, i, j)
+ *         i = j
+ *         if i == n:             # <<<<<<<<<<<<<<
+ *             break
+ * 
+ */
+    }
+
+    /* "wikibrev/_linkscan.pyx":566
+ *             break
+ * 
+ *         if d[i] == b'<':             # <<<<<<<<<<<<<<
+ *             if i + 1 < n and is_letter(d[i+1]):
+ *                 k = scan_starttag(s, i, &cdata_tag)
+ */
+    __pyx_t_3 = (((__pyx_v_d[__pyx_v_i]) == '<') != 0);
+    if (__pyx_t_3) {
+
+      /* "wikibrev/_linkscan.pyx":567
+ * 
+ *         if d[i] == b'<':
+ *             if i + 1 < n and is_letter(d[i+1]):             # <<<<<<<<<<<<<<
+ *                 k = scan_starttag(s, i, &cdata_tag)
+ *             elif starts_with(d, i, n, b'</', 2):
+ */
+      __pyx_t_4 = (((__pyx_v_i + 1) < __pyx_v_n) != 0);
+      if (__pyx_t_4) {
+      } else {
+        __pyx_t_3 = __pyx_t_4;
+        goto __pyx_L18_bool_binop_done;
+      }
+      __pyx_t_4 = (__pyx_f_8wikibrev_9_linkscan_is_letter((__pyx_v_d[(__pyx_v_i + 1)])) != 0);
+      __pyx_t_3 = __pyx_t_4;
+      __pyx_L18_bool_binop_done:;
+      if (__pyx_t_3) {
+
+        /* "wikibrev/_linkscan.pyx":568
+ *         if d[i] == b'<':
+ *             if i + 1 < n and is_letter(d[i+1]):
+ *                 k = scan_starttag(s, i, &cdata_tag)             # <<<<<<<<<<<<<<
+ *             elif starts_with(d, i, n, b'</', 2):
+ *                 closed = False
+ */
+        __pyx_v_k = __pyx_f_8wikibrev_9_linkscan_scan_starttag(__pyx_v_s, __pyx_v_i, (&__pyx_v_cdata_tag));
+
+        /* "wikibrev/_linkscan.pyx":567
+ * 
+ *         if d[i] == b'<':
+ *             if i + 1 < n and is_letter(d[i+1]):             # <<<<<<<<<<<<<<
+ *                 k = scan_starttag(s, i, &cdata_tag)
+ *             elif starts_with(d, i, n, b'</', 2):
+ */
+        goto __pyx_L17;
+      }
+
+      /* "wikibrev/_linkscan.pyx":569
+ *             if i + 1 < n and is_letter(d[i+1]):
+ *                 k = scan_starttag(s, i, &cdata_tag)
+ *             elif starts_with(d, i, n, b'</', 2):             # <<<<<<<<<<<<<<
+ *                 closed = False
+ *                 k = scan_endtag(s, i, cdata_tag.size() > 0, &closed)
+ */
+      __pyx_t_3 = (__pyx_f_8wikibrev_9_linkscan_starts_with(__pyx_v_d, __pyx_v_i, __pyx_v_n, ((char const *)"</"), 2) != 0);
+      if (__pyx_t_3) {
+
+        /* "wikibrev/_linkscan.pyx":570
+ *                 k = scan_starttag(s, i, &cdata_tag)
+ *             elif starts_with(d, i, n, b'</', 2):
+ *                 closed = False             # <<<<<<<<<<<<<<
+ *                 k = scan_endtag(s, i, cdata_tag.size() > 0, &closed)
+ *                 if closed:
+ */
+        __pyx_v_closed = 0;
+
+        /* "wikibrev/_linkscan.pyx":571
+ *             elif starts_with(d, i, n, b'</', 2):
+ *                 closed = False
+ *                 k = scan_endtag(s, i, cdata_tag.size() > 0, &closed)             # <<<<<<<<<<<<<<
+ *                 if closed:
+ *                     cdata_tag.clear()
+ */
+        __pyx_v_k = __pyx_f_8wikibrev_9_linkscan_scan_endtag(__pyx_v_s, __pyx_v_i, (__pyx_v_cdata_tag.size() > 0), (&__pyx_v_closed));
+
+        /* "wikibrev/_linkscan.pyx":572
+ *                 closed = False
+ *                 k = scan_endtag(s, i, cdata_tag.size() > 0, &closed)
+ *                 if closed:             # <<<<<<<<<<<<<<
+ *                     cdata_tag.clear()
+ *             elif starts_with(d, i, n, b'<!--', 4):
+ */
+        __pyx_t_3 = (__pyx_v_closed != 0);
+        if (__pyx_t_3) {
+
+          /* "wikibrev/_linkscan.pyx":573
+ *                 k = scan_endtag(s, i, cdata_tag.size() > 0, &closed)
+ *                 if closed:
+ *                     cdata_tag.clear()             # <<<<<<<<<<<<<<
+ *             elif starts_with(d, i, n, b'<!--', 4):
+ *                 k = search_comment_end(d, i + 4, n)
+ */
+          __pyx_v_cdata_tag.clear();
+
+          /* "wikibrev/_linkscan.pyx":572
+ *                 closed = False
+ *                 k = scan_endtag(s, i, cdata_tag.size() > 0, &closed)
+ *                 if closed:             # <<<<<<<<<<<<<<
+ *                     cdata_tag.clear()
+ *             elif starts_with(d, i, n, b'<!--', 4):
+ */
+        }
+
+        /* "wikibrev/_linkscan.pyx":569
+ *             if i + 1 < n and is_letter(d[i+1]):
+ *                 k = scan_starttag(s, i, &cdata_tag)
+ *             elif starts_with(d, i, n, b'</', 2):             # <<<<<<<<<<<<<<
+ *                 closed = False
+ *                 k = scan_endtag(s, i, cdata_tag.size() > 0, &closed)
+ */
+        goto __pyx_L17;
+      }
+
+      /* "wikibrev/_linkscan.pyx":574
+ *                 if closed:
+ *                     cdata_tag.clear()
+ *             elif starts_with(d, i, n, b'<!--', 4):             # <<<<<<<<<<<<<<
+ *                 k = search_comment_end(d, i + 4, n)
+ *             elif starts_with(d, i, n, b'<?', 2):
+ */
+      __pyx_t_3 = (__pyx_f_8wikibrev_9_linkscan_starts_with(__pyx_v_d, __pyx_v_i, __pyx_v_n, ((char const *)"<!--"), 4) != 0);
+      if (__pyx_t_3) {
+
+        /* "wikibrev/_linkscan.pyx":575
+ *                     cdata_tag.clear()
+ *             elif starts_with(d, i, n, b'<!--', 4):
+ *                 k = search_comment_end(d, i + 4, n)             # <<<<<<<<<<<<<<
+ *             elif starts_with(d, i, n, b'<?', 2):
+ *                 k = find(d, b'>', i + 2, n)
+ */
+        __pyx_v_k = __pyx_f_8wikibrev_9_linkscan_search_comment_end(__pyx_v_d, (__pyx_v_i + 4), __pyx_v_n);
+
+        /* "wikibrev/_linkscan.pyx":574
+ *                 if closed:
+ *                     cdata_tag.clear()
+ *             elif starts_with(d, i, n, b'<!--', 4):             # <<<<<<<<<<<<<<
+ *                 k = search_comment_end(d, i + 4, n)
+ *             elif starts_with(d, i, n, b'<?', 2):
+ */
+        goto __pyx_L17;
+      }
+
+      /* "wikibrev/_linkscan.pyx":576
+ *             elif starts_with(d, i, n, b'<!--', 4):
+ *                 k = search_comment_end(d, i + 4, n)
+ *             elif starts_with(d, i, n, b'<?', 2):             # <<<<<<<<<<<<<<
+ *                 k = find(d, b'>', i + 2, n)
+ *                 if k >= 0:
+ */
+      __pyx_t_3 = (__pyx_f_8wikibrev_9_linkscan_starts_with(__pyx_v_d, __pyx_v_i, __pyx_v_n, ((char const *)"<?"), 2) != 0);
+      if (__pyx_t_3) {
+
+        /* "wikibrev/_linkscan.pyx":577
+ *                 k = search_comment_end(d, i + 4, n)
+ *             elif starts_with(d, i, n, b'<?', 2):
+ *                 k = find(d, b'>', i + 2, n)             # <<<<<<<<<<<<<<
+ *                 if k >= 0:
+ *                     k += 1
+ */
+        __pyx_v_k = __pyx_f_8wikibrev_9_linkscan_find(__pyx_v_d, '>', (__pyx_v_i + 2), __pyx_v_n);
+
+        /* "wikibrev/_linkscan.pyx":578
+ *             elif starts_with(d, i, n, b'<?', 2):
+ *                 k = find(d, b'>', i + 2, n)
+ *                 if k >= 0:             # <<<<<<<<<<<<<<
+ *                     k += 1
+ *             elif starts_with(d, i, n, b'<![', 3):
+ */
+        __pyx_t_3 = ((__pyx_v_k >= 0) != 0);
+        if (__pyx_t_3) {
+
+          /* "wikibrev/_linkscan.pyx":579
+ *                 k = find(d, b'>', i + 2, n)
+ *                 if k >= 0:
+ *                     k += 1             # <<<<<<<<<<<<<<
+ *             elif starts_with(d, i, n, b'<![', 3):
+ *                 s.fallback = True
+ */
+          __pyx_v_k = (__pyx_v_k + 1);
+
+          /* "wikibrev/_linkscan.pyx":578
+ *             elif starts_with(d, i, n, b'<?', 2):
+ *                 k = find(d, b'>', i + 2, n)
+ *                 if k >= 0:             # <<<<<<<<<<<<<<
+ *                     k += 1
+ *             elif starts_with(d, i, n, b'<![', 3):
+ */
+        }
+
+        /* "wikibrev/_linkscan.pyx":576
+ *             elif starts_with(d, i, n, b'<!--', 4):
+ *                 k = search_comment_end(d, i + 4, n)
+ *             elif starts_with(d, i, n, b'<?', 2):             # <<<<<<<<<<<<<<
+ *                 k = find(d, b'>', i + 2, n)
+ *                 if k >= 0:
+ */
+        goto __pyx_L17;
+      }
+
+      /* "wikibrev/_linkscan.pyx":580
+ *                 if k >= 0:
+ *                     k += 1
+ *             elif starts_with(d, i, n, b'<![', 3):             # <<<<<<<<<<<<<<
+ *                 s.fallback = True
+ *                 k = -1
+ */
+      __pyx_t_3 = (__pyx_f_8wikibrev_9_linkscan_starts_with(__pyx_v_d, __pyx_v_i, __pyx_v_n, ((char const *)"<!["), 3) != 0);
+      if (__pyx_t_3) {
+
+        /* "wikibrev/_linkscan.pyx":581
+ *                     k += 1
+ *             elif starts_with(d, i, n, b'<![', 3):
+ *                 s.fallback = True             # <<<<<<<<<<<<<<
+ *                 k = -1
+ *             elif starts_with(d, i, n, b'<!', 2):
+ */
+        __pyx_v_s->fallback = 1;
+
+        /* "wikibrev/_linkscan.pyx":582
+ *             elif starts_with(d, i, n, b'<![', 3):
+ *                 s.fallback = True
+ *                 k = -1             # <<<<<<<<<<<<<<
+ *             elif starts_with(d, i, n, b'<!', 2):
+ *                 if equals_lower(d, i, min(n, i + 9), b'<!doctype', 9):
+ */
+        __pyx_v_k = -1L;
+
+        /* "wikibrev/_linkscan.pyx":580
+ *                 if k >= 0:
+ *                     k += 1
+ *             elif starts_with(d, i, n, b'<![', 3):             # <<<<<<<<<<<<<<
+ *                 s.fallback = True
+ *                 k = -1
+ */
+        goto __pyx_L17;
+      }
+
+      /* "wikibrev/_linkscan.pyx":583
+ *                 s.fallback = True
+ *                 k = -1
+ *             elif starts_with(d, i, n, b'<!', 2):             # <<<<<<<<<<<<<<
+ *                 if equals_lower(d, i, min(n, i + 9), b'<!doctype', 9):
+ *                     k = find(d, b'>', i + 9, n)
+ */
+      __pyx_t_3 = (__pyx_f_8wikibrev_9_linkscan_starts_with(__pyx_v_d, __pyx_v_i, __pyx_v_n, ((char const *)"<!"), 2) != 0);
+      if (__pyx_t_3) {
+
+        /* "wikibrev/_linkscan.pyx":584
+ *                 k = -1
+ *             elif starts_with(d, i, n, b'<!', 2):
+ *                 if equals_lower(d, i, min(n, i + 9), b'<!doctype', 9):             # <<<<<<<<<<<<<<
+ *                     k = find(d, b'>', i + 9, n)
+ *                 else:
+ */
+        __pyx_t_2 = (__pyx_v_i + 9);
+        __pyx_t_5 = __pyx_v_n;
+        if (((__pyx_t_2 < __pyx_t_5) != 0)) {
+          __pyx_t_6 = __pyx_t_2;
+        } else {
+          __pyx_t_6 = __pyx_t_5;
+        }
+        __pyx_t_3 = (__pyx_f_8wikibrev_9_linkscan_equals_lower(__pyx_v_d, __pyx_v_i, __pyx_t_6, ((char const *)"<!doctype"), 9) != 0);
+        if (__pyx_t_3) {
+
+          /* "wikibrev/_linkscan.pyx":585
+ *             elif starts_with(d, i, n, b'<!', 2):
+ *                 if equals_lower(d, i, min(n, i + 9), b'<!doctype', 9):
+ *                     k = find(d, b'>', i + 9, n)             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     k = find(d, b'>', i + 2, n)
+ */
+          __pyx_v_k = __pyx_f_8wikibrev_9_linkscan_find(__pyx_v_d, '>', (__pyx_v_i + 9), __pyx_v_n);
+
+          /* "wikibrev/_linkscan.pyx":584
+ *                 k = -1
+ *             elif starts_with(d, i, n, b'<!', 2):
+ *                 if equals_lower(d, i, min(n, i + 9), b'<!doctype', 9):             # <<<<<<<<<<<<<<
+ *                     k = find(d, b'>', i + 9, n)
+ *                 else:
+ */
+          goto __pyx_L22;
+        }
+
+        /* "wikibrev/_linkscan.pyx":587
+ *                     k = find(d, b'>', i + 9, n)
+ *                 else:
+ *                     k = find(d, b'>', i + 2, n)             # <<<<<<<<<<<<<<
+ *                 if k >= 0:
+ *                     k += 1
+ */
+        /*else*/ {
+          __pyx_v_k = __pyx_f_8wikibrev_9_linkscan_find(__pyx_v_d, '>', (__pyx_v_i + 2), __pyx_v_n);
+        }
+        __pyx_L22:;
+
+        /* "wikibrev/_linkscan.pyx":588
+ *                 else:
+ *                     k = find(d, b'>', i + 2, n)
+ *                 if k >= 0:             # <<<<<<<<<<<<<<
+ *                     k += 1
+ *             elif i + 1 < n:
+ */
+        __pyx_t_3 = ((__pyx_v_k >= 0) != 0);
+        if (__pyx_t_3) {
+
+          /* "wikibrev/_linkscan.pyx":589
+ *                     k = find(d, b'>', i + 2, n)
+ *                 if k >= 0:
+ *                     k += 1             # <<<<<<<<<<<<<<
+ *             elif i + 1 < n:
+ *                 text(s, i, i + 1)
+ */
+          __pyx_v_k = (__pyx_v_k + 1);
+
+          /* "wikibrev/_linkscan.pyx":588
+ *                 else:
+ *                     k = find(d, b'>', i + 2, n)
+ *                 if k >= 0:             # <<<<<<<<<<<<<<
+ *                     k += 1
+ *             elif i + 1 < n:
+ */
+        }
+
+        /* "wikibrev/_linkscan.pyx":583
+ *                 s.fallback = True
+ *                 k = -1
+ *             elif starts_with(d, i, n, b'<!', 2):             # <<<<<<<<<<<<<<
+ *                 if equals_lower(d, i, min(n, i + 9), b'<!doctype', 9):
+ *                     k = find(d, b'>', i + 9, n)
+ */
+        goto __pyx_L17;
+      }
+
+      /* "wikibrev/_linkscan.pyx":590
+ *                 if k >= 0:
+ *                     k += 1
+ *             elif i + 1 < n:             # <<<<<<<<<<<<<<
+ *                 text(s, i, i + 1)
+ *                 k = i + 1
+ */
+      __pyx_t_3 = (((__pyx_v_i + 1) < __pyx_v_n) != 0);
+      if (__pyx_t_3) {
+
+        /* "wikibrev/_linkscan.pyx":591
+ *                     k += 1
+ *             elif i + 1 < n:
+ *                 text(s, i, i + 1)             # <<<<<<<<<<<<<<
+ *                 k = i + 1
+ *             else:
+ */
+        __pyx_f_8wikibrev_9_linkscan_text(__pyx_v_s, __pyx_v_i, (__pyx_v_i + 1));
+
+        /* "wikibrev/_linkscan.pyx":592
+ *             elif i + 1 < n:
+ *                 text(s, i, i + 1)
+ *                 k = i + 1             # <<<<<<<<<<<<<<
+ *             else:
+ *                 break
+ */
+        __pyx_v_k = (__pyx_v_i + 1);
+
+        /* "wikibrev/_linkscan.pyx":590
+ *                 if k >= 0:
+ *                     k += 1
+ *             elif i + 1 < n:             # <<<<<<<<<<<<<<
+ *                 text(s, i, i + 1)
+ *                 k = i + 1
+ */
+        goto __pyx_L17;
+      }
+
+      /* "wikibrev/_linkscan.pyx":594
+ *                 k = i + 1
+ *             else:
+ *                 break             # <<<<<<<<<<<<<<
+ *             if k < 0:
+ *                 break
+ */
+      /*else*/ {
+        goto __pyx_L4_break;
+      }
+      __pyx_L17:;
+
+      /* "wikibrev/_linkscan.pyx":595
+ *             else:
+ *                 break
+ *             if k < 0:             # <<<<<<<<<<<<<<
+ *                 break
+ *             i = k
+ */
+      __pyx_t_3 = ((__pyx_v_k < 0) != 0);
+      if (__pyx_t_3) {
+
+        /* "wikibrev/_linkscan.pyx":596
+ *                 break
+ *             if k < 0:
+ *                 break             # <<<<<<<<<<<<<<
+ *             i = k
+ *         elif starts_with(d, i, n, b'&#', 2):
+ */
+        goto __pyx_L4_break;
+
+        /* "wikibrev/_linkscan.pyx":595
+ *             else:
+ *                 break
+ *             if k < 0:             # <<<<<<<<<<<<<<
+ *                 break
+ *             i = k
+ */
+      }
+
+      /* "wikibrev/_linkscan.pyx":597
+ *             if k < 0:
+ *                 break
+ *             i = k             # <<<<<<<<<<<<<<
+ *         elif starts_with(d, i, n, b'&#', 2):
+ *             k = match_charref(d, i, n)
+ */
+      __pyx_v_i = __pyx_v_k;
+
+      /* "wikibrev/_linkscan.pyx":566
+ *             break
+ * 
+ *         if d[i] == b'<':             # <<<<<<<<<<<<<<
+ *             if i + 1 < n and is_letter(d[i+1]):
+ *                 k = scan_starttag(s, i, &cdata_tag)
+ */
+      goto __pyx_L16;
+    }
+
+    /* "wikibrev/_linkscan.pyx":598
+ *                 break
+ *             i = k
+ *         elif starts_with(d, i, n, b'&#', 2):             # <<<<<<<<<<<<<<
+ *             k = match_charref(d, i, n)
+ *             if k < 0:
+ */
+    __pyx_t_3 = (__pyx_f_8wikibrev_9_linkscan_starts_with(__pyx_v_d, __pyx_v_i, __pyx_v_n, ((char const *)"&#"), 2) != 0);
+    if (__pyx_t_3) {
+
+      /* "wikibrev/_linkscan.pyx":599
+ *             i = k
+ *         elif starts_with(d, i, n, b'&#', 2):
+ *             k = match_charref(d, i, n)             # <<<<<<<<<<<<<<
+ *             if k < 0:
+ *                 break
+ */
+      __pyx_v_k = __pyx_f_8wikibrev_9_linkscan_match_charref(__pyx_v_d, __pyx_v_i, __pyx_v_n);
+
+      /* "wikibrev/_linkscan.pyx":600
+ *         elif starts_with(d, i, n, b'&#', 2):
+ *             k = match_charref(d, i, n)
+ *             if k < 0:             # <<<<<<<<<<<<<<
+ *                 break
+ *             i = k
+ */
+      __pyx_t_3 = ((__pyx_v_k < 0) != 0);
+      if (__pyx_t_3) {
+
+        /* "wikibrev/_linkscan.pyx":601
+ *             k = match_charref(d, i, n)
+ *             if k < 0:
+ *                 break             # <<<<<<<<<<<<<<
+ *             i = k
+ *             if d[i-1] != b';':
+ */
+        goto __pyx_L4_break;
+
+        /* "wikibrev/_linkscan.pyx":600
+ *         elif starts_with(d, i, n, b'&#', 2):
+ *             k = match_charref(d, i, n)
+ *             if k < 0:             # <<<<<<<<<<<<<<
+ *                 break
+ *             i = k
+ */
+      }
+
+      /* "wikibrev/_linkscan.pyx":602
+ *             if k < 0:
+ *                 break
+ *             i = k             # <<<<<<<<<<<<<<
+ *             if d[i-1] != b';':
+ *                 i -= 1
+ */
+      __pyx_v_i = __pyx_v_k;
+
+      /* "wikibrev/_linkscan.pyx":603
+ *                 break
+ *             i = k
+ *             if d[i-1] != b';':             # <<<<<<<<<<<<<<
+ *                 i -= 1
+ *         else:
+ */
+      __pyx_t_3 = (((__pyx_v_d[(__pyx_v_i - 1)]) != ';') != 0);
+      if (__pyx_t_3) {
+
+        /* "wikibrev/_linkscan.pyx":604
+ *             i = k
+ *             if d[i-1] != b';':
+ *                 i -= 1             # <<<<<<<<<<<<<<
+ *         else:
+ *             k = match_entityref(d, i, n)
+ */
+        __pyx_v_i = (__pyx_v_i - 1);
+
+        /* "wikibrev/_linkscan.pyx":603
+ *                 break
+ *             i = k
+ *             if d[i-1] != b';':             # <<<<<<<<<<<<<<
+ *                 i -= 1
+ *         else:
+ */
+      }
+
+      /* "wikibrev/_linkscan.pyx":598
+ *                 break
+ *             i = k
+ *         elif starts_with(d, i, n, b'&#', 2):             # <<<<<<<<<<<<<<
+ *             k = match_charref(d, i, n)
+ *             if k < 0:
+ */
+      goto __pyx_L16;
+    }
+
+    /* "wikibrev/_linkscan.pyx":606
+ *                 i -= 1
+ *         else:
+ *             k = match_entityref(d, i, n)             # <<<<<<<<<<<<<<
+ *             if k >= 0:
+ *                 i = k
+ */
+    /*else*/ {
+      __pyx_v_k = __pyx_f_8wikibrev_9_linkscan_match_entityref(__pyx_v_d, __pyx_v_i, __pyx_v_n);
+
+      /* "wikibrev/_linkscan.pyx":607
+ *         else:
+ *             k = match_entityref(d, i, n)
+ *             if k >= 0:             # <<<<<<<<<<<<<<
+ *                 i = k
+ *                 if d[i-1] != b';':
+ */
+      __pyx_t_3 = ((__pyx_v_k >= 0) != 0);
+      if (__pyx_t_3) {
+
+        /* "wikibrev/_linkscan.pyx":608
+ *             k = match_entityref(d, i, n)
+ *             if k >= 0:
+ *                 i = k             # <<<<<<<<<<<<<<
+ *                 if d[i-1] != b';':
+ *                     i -= 1
+ */
+        __pyx_v_i = __pyx_v_k;
+
+        /* "wikibrev/_linkscan.pyx":609
+ *             if k >= 0:
+ *                 i = k
+ *                 if d[i-1] != b';':             # <<<<<<<<<<<<<<
+ *                     i -= 1
+ *             elif (i + 1 < n and (is_letter(d[i+1]) or d[i+1] == b'#')) or i + 1 == n:
+ */
+        __pyx_t_3 = (((__pyx_v_d[(__pyx_v_i - 1)]) != ';') != 0);
+        if (__pyx_t_3) {
+
+          /* "wikibrev/_linkscan.pyx":610
+ *                 i = k
+ *                 if d[i-1] != b';':
+ *                     i -= 1             # <<<<<<<<<<<<<<
+ *             elif (i + 1 < n and (is_letter(d[i+1]) or d[i+1] == b'#')) or i + 1 == n:
+ *                 break
+ */
+          __pyx_v_i = (__pyx_v_i - 1);
+
+          /* "wikibrev/_linkscan.pyx":609
+ *             if k >= 0:
+ *                 i = k
+ *                 if d[i-1] != b';':             # <<<<<<<<<<<<<<
+ *                     i -= 1
+ *             elif (i + 1 < n and (is_letter(d[i+1]) or d[i+1] == b'#')) or i + 1 == n:
+ */
+        }
+
+        /* "wikibrev/_linkscan.pyx":607
+ *         else:
+ *             k = match_entityref(d, i, n)
+ *             if k >= 0:             # <<<<<<<<<<<<<<
+ *                 i = k
+ *                 if d[i-1] != b';':
+ */
+        goto __pyx_L27;
+      }
+
+      /* "wikibrev/_linkscan.pyx":611
+ *                 if d[i-1] != b';':
+ *                     i -= 1
+ *             elif (i + 1 < n and (is_letter(d[i+1]) or d[i+1] == b'#')) or i + 1 == n:             # <<<<<<<<<<<<<<
+ *                 break
+ *             else:
+ */
+      __pyx_t_4 = (((__pyx_v_i + 1) < __pyx_v_n) != 0);
+      if (!__pyx_t_4) {
+        goto __pyx_L30_next_or;
+      } else {
+      }
+      __pyx_t_4 = (__pyx_f_8wikibrev_9_linkscan_is_letter((__pyx_v_d[(__pyx_v_i + 1)])) != 0);
+      if (!__pyx_t_4) {
+      } else {
+        __pyx_t_3 = __pyx_t_4;
+        goto __pyx_L29_bool_binop_done;
+      }
+      __pyx_t_4 = (((__pyx_v_d[(__pyx_v_i + 1)]) == '#') != 0);
+      if (!__pyx_t_4) {
+      } else {
+        __pyx_t_3 = __pyx_t_4;
+        goto __pyx_L29_bool_binop_done;
+      }
+      __pyx_L30_next_or:;
+      __pyx_t_4 = (((__pyx_v_i + 1) == __pyx_v_n) != 0);
+      __pyx_t_3 = __pyx_t_4;
+      __pyx_L29_bool_binop_done:;
+      if (__pyx_t_3) {
+
+        /* "wikibrev/_linkscan.pyx":612
+ *                     i -= 1
+ *             elif (i + 1 < n and (is_letter(d[i+1]) or d[i+1] == b'#')) or i + 1 == n:
+ *                 break             # <<<<<<<<<<<<<<
+ *             else:
+ *                 text(s, i, i + 1)
+ */
+        goto __pyx_L4_break;
+
+        /* "wikibrev/_linkscan.pyx":611
+ *                 if d[i-1] != b';':
+ *                     i -= 1
+ *             elif (i + 1 < n and (is_letter(d[i+1]) or d[i+1] == b'#')) or i + 1 == n:             # <<<<<<<<<<<<<<
+ *                 break
+ *             else:
+ */
+      }
+
+      /* "wikibrev/_linkscan.pyx":614
+ *                 break
+ *             else:
+ *                 text(s, i, i + 1)             # <<<<<<<<<<<<<<
+ *                 i += 1
+ * 
+ */
+      /*else*/ {
+        __pyx_f_8wikibrev_9_linkscan_text(__pyx_v_s, __pyx_v_i, (__pyx_v_i + 1));
+
+        /* "wikibrev/_linkscan.pyx":615
+ *             else:
+ *                 text(s, i, i + 1)
+ *                 i += 1             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+        __pyx_v_i = (__pyx_v_i + 1);
+      }
+      __pyx_L27:;
+    }
+    __pyx_L16:;
+  }
+  __pyx_L4_break:;
+
+  /* "wikibrev/_linkscan.pyx":541
+ *     return -1
+ * 
+ * cdef void scan(Scanner* s) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Like `WikiLinkScanner.scan`.
+ */
+
+  /* function exit code */
+}
+
+/* "wikibrev/_linkscan.pyx":618
+ * 
+ * 
+ * def scan_links(data):             # <<<<<<<<<<<<<<
+ *     """
+ *     Scan a page (a unicode string, or UTF-8 encoded bytes or a buffer of them
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8wikibrev_9_linkscan_1scan_links(PyObject *__pyx_self, PyObject *__pyx_v_data); /*proto*/
+static char __pyx_doc_8wikibrev_9_linkscan_scan_links[] = "\n    Scan a page (a unicode string, or UTF-8 encoded bytes or a buffer of them\n    such as the memoryviews of `_unzim.File.blob_view`) and return the\n    (url, text) pairs of the links that `WikiLinkScanner` would pass to\n    `WikiLinkHandler.add_link`, or None if the page has to be scanned by\n    `WikiLinkScanner`. The page is scanned without the GIL and only the links\n    are decoded.\n    ";
+static PyMethodDef __pyx_mdef_8wikibrev_9_linkscan_1scan_links = {"scan_links", (PyCFunction)__pyx_pw_8wikibrev_9_linkscan_1scan_links, METH_O, __pyx_doc_8wikibrev_9_linkscan_scan_links};
+static PyObject *__pyx_pw_8wikibrev_9_linkscan_1scan_links(PyObject *__pyx_self, PyObject *__pyx_v_data) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("scan_links (wrapper)", 0);
+  __pyx_r = __pyx_pf_8wikibrev_9_linkscan_scan_links(__pyx_self, ((PyObject *)__pyx_v_data));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8wikibrev_9_linkscan_scan_links(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_data) {
+  Py_buffer __pyx_v_page;
+  struct __pyx_t_8wikibrev_9_linkscan_Scanner __pyx_v_s;
+  std::vector<std::string> ::size_type __pyx_v_i;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  std::vector<std::string> ::size_type __pyx_t_8;
+  std::vector<std::string> ::size_type __pyx_t_9;
+  std::vector<std::string> ::size_type __pyx_t_10;
+  PyObject *__pyx_t_11 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("scan_links", 0);
+  __Pyx_INCREF(__pyx_v_data);
+
+  /* "wikibrev/_linkscan.pyx":627
+ *     are decoded.
+ *     """
+ *     if isinstance(data, unicode):             # <<<<<<<<<<<<<<
+ *         data = data.encode('utf-8')
+ *     cdef Py_buffer page
+ */
+  __pyx_t_1 = PyUnicode_Check(__pyx_v_data); 
+  __pyx_t_2 = (__pyx_t_1 != 0);
+  if (__pyx_t_2) {
+
+    /* "wikibrev/_linkscan.pyx":628
+ *     """
+ *     if isinstance(data, unicode):
+ *         data = data.encode('utf-8')             # <<<<<<<<<<<<<<
+ *     cdef Py_buffer page
+ *     cdef Scanner s
+ */
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_data, __pyx_n_s_encode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 628, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_kp_s_utf_8) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_kp_s_utf_8);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 628, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF_SET(__pyx_v_data, __pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "wikibrev/_linkscan.pyx":627
+ *     are decoded.
+ *     """
+ *     if isinstance(data, unicode):             # <<<<<<<<<<<<<<
+ *         data = data.encode('utf-8')
+ *     cdef Py_buffer page
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":631
+ *     cdef Py_buffer page
+ *     cdef Scanner s
+ *     PyObject_GetBuffer(data, &page, PyBUF_SIMPLE)             # <<<<<<<<<<<<<<
+ *     try:
+ *         s.d = <const char*>page.buf
+ */
+  __pyx_t_6 = PyObject_GetBuffer(__pyx_v_data, (&__pyx_v_page), PyBUF_SIMPLE); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 631, __pyx_L1_error)
+
+  /* "wikibrev/_linkscan.pyx":632
+ *     cdef Scanner s
+ *     PyObject_GetBuffer(data, &page, PyBUF_SIMPLE)
+ *     try:             # <<<<<<<<<<<<<<
+ *         s.d = <const char*>page.buf
+ *         s.n = page.len
+ */
+  /*try:*/ {
+
+    /* "wikibrev/_linkscan.pyx":633
+ *     PyObject_GetBuffer(data, &page, PyBUF_SIMPLE)
+ *     try:
+ *         s.d = <const char*>page.buf             # <<<<<<<<<<<<<<
+ *         s.n = page.len
+ *         s.fallback = False
+ */
+    __pyx_v_s.d = ((char const *)__pyx_v_page.buf);
+
+    /* "wikibrev/_linkscan.pyx":634
+ *     try:
+ *         s.d = <const char*>page.buf
+ *         s.n = page.len             # <<<<<<<<<<<<<<
+ *         s.fallback = False
+ *         s.is_link = False
+ */
+    __pyx_t_7 = __pyx_v_page.len;
+    __pyx_v_s.n = __pyx_t_7;
+
+    /* "wikibrev/_linkscan.pyx":635
+ *         s.d = <const char*>page.buf
+ *         s.n = page.len
+ *         s.fallback = False             # <<<<<<<<<<<<<<
+ *         s.is_link = False
+ *         s.forb_depth = 0
+ */
+    __pyx_v_s.fallback = 0;
+
+    /* "wikibrev/_linkscan.pyx":636
+ *         s.n = page.len
+ *         s.fallback = False
+ *         s.is_link = False             # <<<<<<<<<<<<<<
+ *         s.forb_depth = 0
+ *         with nogil:
+ */
+    __pyx_v_s.is_link = 0;
+
+    /* "wikibrev/_linkscan.pyx":637
+ *         s.fallback = False
+ *         s.is_link = False
+ *         s.forb_depth = 0             # <<<<<<<<<<<<<<
+ *         with nogil:
+ *             scan(&s)
+ */
+    __pyx_v_s.forb_depth = 0;
+
+    /* "wikibrev/_linkscan.pyx":638
+ *         s.is_link = False
+ *         s.forb_depth = 0
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             scan(&s)
+ *     finally:
+ */
+    {
+        #ifdef WITH_THREAD
+        PyThreadState *_save;
+        Py_UNBLOCK_THREADS
+        __Pyx_FastGIL_Remember();
+        #endif
+        /*try:*/ {
+
+          /* "wikibrev/_linkscan.pyx":639
+ *         s.forb_depth = 0
+ *         with nogil:
+ *             scan(&s)             # <<<<<<<<<<<<<<
+ *     finally:
+ *         PyBuffer_Release(&page)
+ */
+          __pyx_f_8wikibrev_9_linkscan_scan((&__pyx_v_s));
+        }
+
+        /* "wikibrev/_linkscan.pyx":638
+ *         s.is_link = False
+ *         s.forb_depth = 0
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             scan(&s)
+ *     finally:
+ */
+        /*finally:*/ {
+          /*normal exit:*/{
+            #ifdef WITH_THREAD
+            __Pyx_FastGIL_Forget();
+            Py_BLOCK_THREADS
+            #endif
+            goto __pyx_L9;
+          }
+          __pyx_L9:;
+        }
+    }
+  }
+
+  /* "wikibrev/_linkscan.pyx":641
+ *             scan(&s)
+ *     finally:
+ *         PyBuffer_Release(&page)             # <<<<<<<<<<<<<<
+ *     if s.fallback:
+ *         return None
+ */
+  /*finally:*/ {
+    /*normal exit:*/{
+      PyBuffer_Release((&__pyx_v_page));
+      goto __pyx_L6;
+    }
+    __pyx_L6:;
+  }
+
+  /* "wikibrev/_linkscan.pyx":642
+ *     finally:
+ *         PyBuffer_Release(&page)
+ *     if s.fallback:             # <<<<<<<<<<<<<<
+ *         return None
+ *     return [(s.urls[i].decode('utf-8'), s.texts[i].decode('utf-8')) for i in range(s.urls.size())]
+ */
+  __pyx_t_2 = (__pyx_v_s.fallback != 0);
+  if (__pyx_t_2) {
+
+    /* "wikibrev/_linkscan.pyx":643
+ *         PyBuffer_Release(&page)
+ *     if s.fallback:
+ *         return None             # <<<<<<<<<<<<<<
+ *     return [(s.urls[i].decode('utf-8'), s.texts[i].decode('utf-8')) for i in range(s.urls.size())]
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "wikibrev/_linkscan.pyx":642
+ *     finally:
+ *         PyBuffer_Release(&page)
+ *     if s.fallback:             # <<<<<<<<<<<<<<
+ *         return None
+ *     return [(s.urls[i].decode('utf-8'), s.texts[i].decode('utf-8')) for i in range(s.urls.size())]
+ */
+  }
+
+  /* "wikibrev/_linkscan.pyx":644
+ *     if s.fallback:
+ *         return None
+ *     return [(s.urls[i].decode('utf-8'), s.texts[i].decode('utf-8')) for i in range(s.urls.size())]             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = PyList_New(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 644, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_8 = __pyx_v_s.urls.size();
+  __pyx_t_9 = __pyx_t_8;
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_i = __pyx_t_10;
+    __pyx_t_4 = __Pyx_decode_cpp_string((__pyx_v_s.urls[__pyx_v_i]), 0, PY_SSIZE_T_MAX, NULL, NULL, PyUnicode_DecodeUTF8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 644, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = __Pyx_decode_cpp_string((__pyx_v_s.texts[__pyx_v_i]), 0, PY_SSIZE_T_MAX, NULL, NULL, PyUnicode_DecodeUTF8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 644, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_11 = PyTuple_New(2); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 644, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_11);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_11, 1, __pyx_t_5);
+    __pyx_t_4 = 0;
+    __pyx_t_5 = 0;
+    if (unlikely(__Pyx_ListComp_Append(__pyx_t_3, (PyObject*)__pyx_t_11))) __PYX_ERR(0, 644, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  }
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "wikibrev/_linkscan.pyx":618
+ * 
+ * 
+ * def scan_links(data):             # <<<<<<<<<<<<<<
+ *     """
+ *     Scan a page (a unicode string, or UTF-8 encoded bytes or a buffer of them
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_AddTraceback("wikibrev._linkscan.scan_links", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_data);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "string.to_py":31
+ * 
+ * @cname("__pyx_convert_PyObject_string_to_py_std__in_string")
+ * cdef inline object __pyx_convert_PyObject_string_to_py_std__in_string(const string& s):             # <<<<<<<<<<<<<<
+ *     return __Pyx_PyObject_FromStringAndSize(s.data(), s.size())
+ * cdef extern from *:
+ */
+
+static CYTHON_INLINE PyObject *__pyx_convert_PyObject_string_to_py_std__in_string(std::string const &__pyx_v_s) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_convert_PyObject_string_to_py_std__in_string", 0);
+
+  /* "string.to_py":32
+ * @cname("__pyx_convert_PyObject_string_to_py_std__in_string")
+ * cdef inline object __pyx_convert_PyObject_string_to_py_std__in_string(const string& s):
+ *     return __Pyx_PyObject_FromStringAndSize(s.data(), s.size())             # <<<<<<<<<<<<<<
+ * cdef extern from *:
+ *     cdef object __Pyx_PyUnicode_FromStringAndSize(const char*, size_t)
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyObject_FromStringAndSize(__pyx_v_s.data(), __pyx_v_s.size()); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 32, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "string.to_py":31
+ * 
+ * @cname("__pyx_convert_PyObject_string_to_py_std__in_string")
+ * cdef inline object __pyx_convert_PyObject_string_to_py_std__in_string(const string& s):             # <<<<<<<<<<<<<<
+ *     return __Pyx_PyObject_FromStringAndSize(s.data(), s.size())
+ * cdef extern from *:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("string.to_py.__pyx_convert_PyObject_string_to_py_std__in_string", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "string.to_py":37
+ * 
+ * @cname("__pyx_convert_PyUnicode_string_to_py_std__in_string")
+ * cdef inline object __pyx_convert_PyUnicode_string_to_py_std__in_string(const string& s):             # <<<<<<<<<<<<<<
+ *     return __Pyx_PyUnicode_FromStringAndSize(s.data(), s.size())
+ * cdef extern from *:
+ */
+
+static CYTHON_INLINE PyObject *__pyx_convert_PyUnicode_string_to_py_std__in_string(std::string const &__pyx_v_s) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_convert_PyUnicode_string_to_py_std__in_string", 0);
+
+  /* "string.to_py":38
+ * @cname("__pyx_convert_PyUnicode_string_to_py_std__in_string")
+ * cdef inline object __pyx_convert_PyUnicode_string_to_py_std__in_string(const string& s):
+ *     return __Pyx_PyUnicode_FromStringAndSize(s.data(), s.size())             # <<<<<<<<<<<<<<
+ * cdef extern from *:
+ *     cdef object __Pyx_PyStr_FromStringAndSize(const char*, size_t)
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyUnicode_FromStringAndSize(__pyx_v_s.data(), __pyx_v_s.size()); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 38, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "string.to_py":37
+ * 
+ * @cname("__pyx_convert_PyUnicode_string_to_py_std__in_string")
+ * cdef inline object __pyx_convert_PyUnicode_string_to_py_std__in_string(const string& s):             # <<<<<<<<<<<<<<
+ *     return __Pyx_PyUnicode_FromStringAndSize(s.data(), s.size())
+ * cdef extern from *:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("string.to_py.__pyx_convert_PyUnicode_string_to_py_std__in_string", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "string.to_py":43
+ * 
+ * @cname("__pyx_convert_PyStr_string_to_py_std__in_string")
+ * cdef inline object __pyx_convert_PyStr_string_to_py_std__in_string(const string& s):             # <<<<<<<<<<<<<<
+ *     return __Pyx_PyStr_FromStringAndSize(s.data(), s.size())
+ * cdef extern from *:
+ */
+
+static CYTHON_INLINE PyObject *__pyx_convert_PyStr_string_to_py_std__in_string(std::string const &__pyx_v_s) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_convert_PyStr_string_to_py_std__in_string", 0);
+
+  /* "string.to_py":44
+ * @cname("__pyx_convert_PyStr_string_to_py_std__in_string")
+ * cdef inline object __pyx_convert_PyStr_string_to_py_std__in_string(const string& s):
+ *     return __Pyx_PyStr_FromStringAndSize(s.data(), s.size())             # <<<<<<<<<<<<<<
+ * cdef extern from *:
+ *     cdef object __Pyx_PyBytes_FromStringAndSize(const char*, size_t)
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyStr_FromStringAndSize(__pyx_v_s.data(), __pyx_v_s.size()); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 44, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "string.to_py":43
+ * 
+ * @cname("__pyx_convert_PyStr_string_to_py_std__in_string")
+ * cdef inline object __pyx_convert_PyStr_string_to_py_std__in_string(const string& s):             # <<<<<<<<<<<<<<
+ *     return __Pyx_PyStr_FromStringAndSize(s.data(), s.size())
+ * cdef extern from *:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("string.to_py.__pyx_convert_PyStr_string_to_py_std__in_string", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "string.to_py":49
+ * 
+ * @cname("__pyx_convert_PyBytes_string_to_py_std__in_string")
+ * cdef inline object __pyx_convert_PyBytes_string_to_py_std__in_string(const string& s):             # <<<<<<<<<<<<<<
+ *     return __Pyx_PyBytes_FromStringAndSize(s.data(), s.size())
+ * cdef extern from *:
+ */
+
+static CYTHON_INLINE PyObject *__pyx_convert_PyBytes_string_to_py_std__in_string(std::string const &__pyx_v_s) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_convert_PyBytes_string_to_py_std__in_string", 0);
+
+  /* "string.to_py":50
+ * @cname("__pyx_convert_PyBytes_string_to_py_std__in_string")
+ * cdef inline object __pyx_convert_PyBytes_string_to_py_std__in_string(const string& s):
+ *     return __Pyx_PyBytes_FromStringAndSize(s.data(), s.size())             # <<<<<<<<<<<<<<
+ * cdef extern from *:
+ *     cdef object __Pyx_PyByteArray_FromStringAndSize(const char*, size_t)
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyBytes_FromStringAndSize(__pyx_v_s.data(), __pyx_v_s.size()); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 50, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "string.to_py":49
+ * 
+ * @cname("__pyx_convert_PyBytes_string_to_py_std__in_string")
+ * cdef inline object __pyx_convert_PyBytes_string_to_py_std__in_string(const string& s):             # <<<<<<<<<<<<<<
+ *     return __Pyx_PyBytes_FromStringAndSize(s.data(), s.size())
+ * cdef extern from *:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("string.to_py.__pyx_convert_PyBytes_string_to_py_std__in_string", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "string.to_py":55
+ * 
+ * @cname("__pyx_convert_PyByteArray_string_to_py_std__in_string")
+ * cdef inline object __pyx_convert_PyByteArray_string_to_py_std__in_string(const string& s):             # <<<<<<<<<<<<<<
+ *     return __Pyx_PyByteArray_FromStringAndSize(s.data(), s.size())
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_convert_PyByteArray_string_to_py_std__in_string(std::string const &__pyx_v_s) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_convert_PyByteArray_string_to_py_std__in_string", 0);
+
+  /* "string.to_py":56
+ * @cname("__pyx_convert_PyByteArray_string_to_py_std__in_string")
+ * cdef inline object __pyx_convert_PyByteArray_string_to_py_std__in_string(const string& s):
+ *     return __Pyx_PyByteArray_FromStringAndSize(s.data(), s.size())             # <<<<<<<<<<<<<<
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyByteArray_FromStringAndSize(__pyx_v_s.data(), __pyx_v_s.size()); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 56, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "string.to_py":55
+ * 
+ * @cname("__pyx_convert_PyByteArray_string_to_py_std__in_string")
+ * cdef inline object __pyx_convert_PyByteArray_string_to_py_std__in_string(const string& s):             # <<<<<<<<<<<<<<
+ *     return __Pyx_PyByteArray_FromStringAndSize(s.data(), s.size())
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("string.to_py.__pyx_convert_PyByteArray_string_to_py_std__in_string", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec__linkscan(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec__linkscan},
+  {0, NULL}
+};
+#endif
+
+static struct PyModuleDef __pyx_moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "_linkscan",
+    __pyx_k_A_compiled_version_of_the_token, /* m_doc */
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    0, /* m_size */
+  #else
+    -1, /* m_size */
+  #endif
+    __pyx_methods /* m_methods */,
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    __pyx_moduledef_slots, /* m_slots */
+  #else
+    NULL, /* m_reload */
+  #endif
+    NULL, /* m_traverse */
+    NULL, /* m_clear */
+    NULL /* m_free */
+};
+#endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_data, __pyx_k_data, sizeof(__pyx_k_data), 0, 0, 1, 1},
+  {&__pyx_n_s_encode, __pyx_k_encode, sizeof(__pyx_k_encode), 0, 0, 1, 1},
+  {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
+  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_n_s_page, __pyx_k_page, sizeof(__pyx_k_page), 0, 0, 1, 1},
+  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
+  {&__pyx_n_s_s, __pyx_k_s, sizeof(__pyx_k_s), 0, 0, 1, 1},
+  {&__pyx_n_s_scan_links, __pyx_k_scan_links, sizeof(__pyx_k_scan_links), 0, 0, 1, 1},
+  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_kp_s_utf_8, __pyx_k_utf_8, sizeof(__pyx_k_utf_8), 0, 0, 1, 0},
+  {&__pyx_n_s_wikibrev__linkscan, __pyx_k_wikibrev__linkscan, sizeof(__pyx_k_wikibrev__linkscan), 0, 0, 1, 1},
+  {&__pyx_kp_s_wikibrev__linkscan_pyx, __pyx_k_wikibrev__linkscan_pyx, sizeof(__pyx_k_wikibrev__linkscan_pyx), 0, 0, 1, 0},
+  {0, 0, 0, 0, 0, 0, 0}
+};
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 102, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "wikibrev/_linkscan.pyx":618
+ * 
+ * 
+ * def scan_links(data):             # <<<<<<<<<<<<<<
+ *     """
+ *     Scan a page (a unicode string, or UTF-8 encoded bytes or a buffer of them
+ */
+  __pyx_tuple_ = PyTuple_Pack(4, __pyx_n_s_data, __pyx_n_s_page, __pyx_n_s_s, __pyx_n_s_i); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 618, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple_);
+  __Pyx_GIVEREF(__pyx_tuple_);
+  __pyx_codeobj__2 = (PyObject*)__Pyx_PyCode_New(1, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple_, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_wikibrev__linkscan_pyx, __pyx_n_s_scan_links, 618, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__2)) __PYX_ERR(0, 618, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+
+#ifndef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
+#endif
+#else
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC init_linkscan(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC init_linkscan(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit__linkscan(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit__linkscan(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec__linkscan(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module '_linkscan' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit__linkscan(void)", 0);
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  PyEval_InitThreads();
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("_linkscan", __pyx_methods, __pyx_k_A_compiled_version_of_the_token, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_b);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_wikibrev___linkscan) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "wikibrev._linkscan")) {
+      if (unlikely(PyDict_SetItemString(modules, "wikibrev._linkscan", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  (void)__Pyx_modinit_function_export_code();
+  (void)__Pyx_modinit_type_init_code();
+  (void)__Pyx_modinit_type_import_code();
+  (void)__Pyx_modinit_variable_import_code();
+  (void)__Pyx_modinit_function_import_code();
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+
+  /* "wikibrev/_linkscan.pyx":618
+ * 
+ * 
+ * def scan_links(data):             # <<<<<<<<<<<<<<
+ *     """
+ *     Scan a page (a unicode string, or UTF-8 encoded bytes or a buffer of them
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8wikibrev_9_linkscan_1scan_links, NULL, __pyx_n_s_wikibrev__linkscan); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 618, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_scan_links, __pyx_t_1) < 0) __PYX_ERR(0, 618, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "wikibrev/_linkscan.pyx":1
+ * """             # <<<<<<<<<<<<<<
+ * A compiled version of the tokenizer of `link_extractor.WikiLinkScanner` and of
+ * the part of `WikiLinkHandler` that tracks the open elements and the links. It
+ */
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "string.to_py":55
+ * 
+ * @cname("__pyx_convert_PyByteArray_string_to_py_std__in_string")
+ * cdef inline object __pyx_convert_PyByteArray_string_to_py_std__in_string(const string& s):             # <<<<<<<<<<<<<<
+ *     return __Pyx_PyByteArray_FromStringAndSize(s.data(), s.size())
+ * 
+ */
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  if (__pyx_m) {
+    if (__pyx_d) {
+      __Pyx_AddTraceback("init wikibrev._linkscan", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    Py_CLEAR(__pyx_m);
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init wikibrev._linkscan");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* WriteUnraisableException */
+static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
+                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
+                                  int full_traceback, CYTHON_UNUSED int nogil) {
+    PyObject *old_exc, *old_val, *old_tb;
+    PyObject *ctx;
+    __Pyx_PyThreadState_declare
+#ifdef WITH_THREAD
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+    else state = (PyGILState_STATE)0;
+#endif
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(1);
+    }
+    #if PY_MAJOR_VERSION < 3
+    ctx = PyString_FromString(name);
+    #else
+    ctx = PyUnicode_FromString(name);
+    #endif
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+#ifdef WITH_THREAD
+    if (nogil)
+        PyGILState_Release(state);
+#endif
+}
+
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
+}
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+    }
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* decode_c_bytes */
+static CYTHON_INLINE PyObject* __Pyx_decode_c_bytes(
+         const char* cstring, Py_ssize_t length, Py_ssize_t start, Py_ssize_t stop,
+         const char* encoding, const char* errors,
+         PyObject* (*decode_func)(const char *s, Py_ssize_t size, const char *errors)) {
+    if (unlikely((start < 0) | (stop < 0))) {
+        if (start < 0) {
+            start += length;
+            if (start < 0)
+                start = 0;
+        }
+        if (stop < 0)
+            stop += length;
+    }
+    if (stop > length)
+        stop = length;
+    if (unlikely(stop <= start))
+        return __Pyx_NewRef(__pyx_empty_unicode);
+    length = stop - start;
+    cstring += start;
+    if (decode_func) {
+        return decode_func(cstring, length, errors);
+    } else {
+        return PyUnicode_Decode(cstring, length, encoding, errors);
+    }
+}
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* CLineInTraceback */
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
+    PyObject *use_cline;
+    PyObject *ptype, *pvalue, *ptraceback;
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject **cython_runtime_dict;
+#endif
+    if (unlikely(!__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+#if CYTHON_COMPILING_IN_CPYTHON
+    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
+    } else
+#endif
+    {
+      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
+      if (use_cline_obj) {
+        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
+        Py_DECREF(use_cline_obj);
+      } else {
+        PyErr_Clear();
+        use_cline = NULL;
+      }
+    }
+    if (!use_cline) {
+        c_line = 0;
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+    }
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static PyCodeObject *__pyx_find_code_object(int code_line) {
+    PyCodeObject* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = __pyx_code_cache.entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            __pyx_code_cache.entries = entries;
+            __pyx_code_cache.max_count = 64;
+            __pyx_code_cache.count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
+        PyCodeObject* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_DECREF(tmp);
+        return;
+    }
+    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
+        int new_max = __pyx_code_cache.max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        __pyx_code_cache.entries = entries;
+        __pyx_code_cache.max_count = new_max;
+    }
+    for (i=__pyx_code_cache.count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    __pyx_code_cache.count++;
+    Py_INCREF(code_object);
+}
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
+    py_srcfile = PyString_FromString(filename);
+    if (!py_srcfile) goto bad;
+    #endif
+    if (c_line) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        if (!py_funcname) goto bad;
+        #endif
+    }
+    #if PY_MAJOR_VERSION < 3
+    py_code = __Pyx_PyCode_New(
+        0,
+        0,
+        0,
+        0,
+        0,
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple, /*PyObject *consts,*/
+        __pyx_empty_tuple, /*PyObject *names,*/
+        __pyx_empty_tuple, /*PyObject *varnames,*/
+        __pyx_empty_tuple, /*PyObject *freevars,*/
+        __pyx_empty_tuple, /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        py_line,
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    Py_DECREF(py_srcfile);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* CIntFromPy */
+static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const size_t neg_one = (size_t) -1, const_zero = (size_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(size_t) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(size_t, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (size_t) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (size_t) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(size_t, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(size_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) >= 2 * PyLong_SHIFT) {
+                            return (size_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(size_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) >= 3 * PyLong_SHIFT) {
+                            return (size_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(size_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) >= 4 * PyLong_SHIFT) {
+                            return (size_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (size_t) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(size_t) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(size_t) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (size_t) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(size_t, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(size_t,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(size_t) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (size_t) (((size_t)-1)*(((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(size_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (size_t) ((((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (size_t) (((size_t)-1)*(((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(size_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (size_t) ((((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (size_t) (((size_t)-1)*(((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(size_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (size_t) ((((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(size_t) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(size_t) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            size_t val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (size_t) -1;
+        }
+    } else {
+        size_t val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (size_t) -1;
+        val = __Pyx_PyInt_As_size_t(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to size_t");
+    return (size_t) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to size_t");
+    return (size_t) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (long) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            long val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (long) -1;
+        }
+    } else {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
+        }
+    } else {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = a->tp_base;
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
+    }
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
+        }
+    }
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
+}
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    int res = exc_type1 ? __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type1) : 0;
+    if (!res) {
+        res = __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+    return res;
+}
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(void) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
+        char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
+        PyOS_snprintf(message, sizeof(message),
+                      "compiletime version %s of module '%.100s' "
+                      "does not match runtime version %s",
+                      ctversion, __Pyx_MODULE_NAME, rtversion);
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+    return 0;
+}
+
+/* InitStrings */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+    while (t->p) {
+        #if PY_MAJOR_VERSION < 3
+        if (t->is_unicode) {
+            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
+        } else if (t->intern) {
+            *t->p = PyString_InternFromString(t->s);
+        } else {
+            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        }
+        #else
+        if (t->is_unicode | t->is_str) {
+            if (t->intern) {
+                *t->p = PyUnicode_InternFromString(t->s);
+            } else if (t->encoding) {
+                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
+            } else {
+                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
+            }
+        } else {
+            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
+        }
+        #endif
+        if (!*t->p)
+            return -1;
+        if (PyObject_Hash(*t->p) == -1)
+            return -1;
+        ++t;
+    }
+    return 0;
+}
+
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if !CYTHON_PEP393_ENABLED
+static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    char* defenc_c;
+    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
+    if (!defenc) return NULL;
+    defenc_c = PyBytes_AS_STRING(defenc);
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    {
+        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
+        char* c;
+        for (c = defenc_c; c < end; c++) {
+            if ((unsigned char) (*c) >= 128) {
+                PyUnicode_AsASCIIString(o);
+                return NULL;
+            }
+        }
+    }
+#endif
+    *length = PyBytes_GET_SIZE(defenc);
+    return defenc_c;
+}
+#else
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+}
+#endif
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+    if (
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+            __Pyx_sys_getdefaultencoding_not_ascii &&
+#endif
+            PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    if (PyByteArray_Check(o)) {
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+    } else
+#endif
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
+#if PY_MAJOR_VERSION >= 3
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type %.200s).  "
+                "The ability to return an instance of a strict subclass of int "
+                "is deprecated, and may be removed in a future version of Python.",
+                Py_TYPE(result)->tp_name)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        return result;
+    }
+#endif
+    PyErr_Format(PyExc_TypeError,
+                 "__%.4s__ returned non-%.4s (type %.200s)",
+                 type_name, type_name, Py_TYPE(result)->tp_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  const char *name = NULL;
+  PyObject *res = NULL;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_Check(x) || PyLong_Check(x)))
+#else
+  if (likely(PyLong_Check(x)))
+#endif
+    return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  #if PY_MAJOR_VERSION < 3
+  if (m && m->nb_int) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  else if (m && m->nb_long) {
+    name = "long";
+    res = m->nb_long(x);
+  }
+  #else
+  if (likely(m && m->nb_int)) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  #endif
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+    res = PyNumber_Int(x);
+  }
+#endif
+  if (likely(res)) {
+#if PY_MAJOR_VERSION < 3
+    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
+#else
+    if (unlikely(!PyLong_CheckExact(res))) {
+#endif
+        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
+    }
+  }
+  else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_TypeError,
+                    "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject *x;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_CheckExact(b))) {
+    if (sizeof(Py_ssize_t) >= sizeof(long))
+        return PyInt_AS_LONG(b);
+    else
+        return PyInt_AsSsize_t(b);
+  }
+#endif
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    const digit* digits = ((PyLongObject*)b)->ob_digit;
+    const Py_ssize_t size = Py_SIZE(b);
+    if (likely(__Pyx_sst_abs(size) <= 1)) {
+        ival = likely(size) ? digits[0] : 0;
+        if (size == -1) ival = -ival;
+        return ival;
+    } else {
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyInt_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+    return PyInt_FromSize_t(ival);
+}
+
+
+#endif /* Py_PYTHON_H */
@@ -0,0 +1,644 @@
+"""
+A compiled version of the tokenizer of `link_extractor.WikiLinkScanner` and of
+the part of `WikiLinkHandler` that tracks the open elements and the links. It
+scans the UTF-8 encoded page without the GIL, so that worker threads can scan
+pages at the same time.
+
+`scan_links` must find exactly the links that `WikiLinkScanner` would pass to
+`WikiLinkHandler.add_link`. Pages with constructs that it does not reproduce
+(character references in the kept attributes, attributes without a value,
+non-ASCII tag or attribute names and marked sections) are left to
+`WikiLinkScanner`.
+"""
+
+from libcpp.string cimport string
+from libcpp.vector cimport vector
+from libc.string cimport memchr, memcmp
+from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release, PyBUF_SIMPLE
+
+
+# The regular expressions of HTMLParser are compiled without re.UNICODE, so
+# \s only matches ASCII whitespace there; strip() and split() of the unicode
+# strings use the Unicode whitespace.
+
+cdef inline bint is_space(char c) nogil:
+    return c == b' ' or (c >= 9 and c <= 13)
+
+cdef inline bint is_letter(char c) nogil:
+    return (c >= b'a' and c <= b'z') or (c >= b'A' and c <= b'Z')
+
+cdef inline bint is_alnum(char c) nogil:
+    return is_letter(c) or (c >= b'0' and c <= b'9')
+
+cdef inline bint is_hex(char c) nogil:
+    return (c >= b'0' and c <= b'9') or (c >= b'a' and c <= b'f') or (c >= b'A' and c <= b'F')
+
+cdef inline bint is_word(char c) nogil:
+    return is_alnum(c) or c == b'_'
+
+cdef inline char ascii_lower(char c) nogil:
+    return c + 32 if c >= b'A' and c <= b'Z' else c
+
+cdef Py_ssize_t unicode_space_len(const unsigned char* s, Py_ssize_t i, Py_ssize_t n) nogil:
+    """
+    Return the length of the UTF-8 encoded Unicode whitespace character at
+    `i`, or 0 if there is none.
+    """
+    cdef unsigned char c = s[i]
+    if c < 0x80:
+        return 1 if (c >= 9 and c <= 13) or (c >= 0x1c and c <= 0x20) else 0
+    if c == 0xc2 and i + 1 < n:
+        return 2 if s[i+1] == 0x85 or s[i+1] == 0xa0 else 0
+    if i + 2 >= n:
+        return 0
+    if c == 0xe1:
+        return 3 if (s[i+1] == 0x9a and s[i+2] == 0x80) or (s[i+1] == 0xa0 and s[i+2] == 0x8e) else 0
+    if c == 0xe2 and s[i+1] == 0x80:
+        return 3 if s[i+2] <= 0x8a or s[i+2] == 0xa8 or s[i+2] == 0xa9 or s[i+2] == 0xaf else 0
+    if c == 0xe2 and s[i+1] == 0x81:
+        return 3 if s[i+2] == 0x9f else 0
+    if c == 0xe3:
+        return 3 if s[i+1] == 0x80 and s[i+2] == 0x80 else 0
+    return 0
+
+cdef void strip(const char* d, Py_ssize_t* start, Py_ssize_t* end) nogil:
+    """
+    Narrow the span from `start` to `end` like `unicode.strip`.
+    """
+    cdef const unsigned char* s = <const unsigned char*>d
+    cdef Py_ssize_t i = start[0], j = end[0], k, m
+    while i < j:
+        m = unicode_space_len(s, i, j)
+        if m == 0:
+            break
+        i += m
+    while j > i:
+        k = j - 1
+        while k > i and (s[k] & 0xc0) == 0x80:
+            k -= 1
+        if unicode_space_len(s, k, j) != j - k:
+            break
+        j = k
+    start[0] = i
+    end[0] = j
+
+cdef Py_ssize_t find(const char* d, char c, Py_ssize_t i, Py_ssize_t n) nogil:
+    if i >= n:
+        return -1
+    cdef const char* p = <const char*>memchr(d + i, c, n - i)
+    return -1 if p == NULL else p - d
+
+cdef inline bint starts_with(const char* d, Py_ssize_t i, Py_ssize_t n, const char* s, Py_ssize_t m) nogil:
+    return i + m <= n and memcmp(d + i, s, m) == 0
+
+cdef bint equals_lower(const char* d, Py_ssize_t start, Py_ssize_t end, const char* s, Py_ssize_t m) nogil:
+    """
+    Return True if the span from `start` to `end`, with the ASCII letters
+    lowercased, equals `s`.
+    """
+    cdef Py_ssize_t i
+    if end - start != m:
+        return False
+    for i in range(m):
+        if ascii_lower(d[start + i]) != s[i]:
+            return False
+    return True
+
+cdef bint is_ascii(const char* d, Py_ssize_t start, Py_ssize_t end) nogil:
+    cdef Py_ssize_t i
+    for i in range(start, end):
+        if <unsigned char>d[i] >= 0x80:
+            return False
+    return True
+
+
+cdef struct Attr:
+    bint present
+    Py_ssize_t start
+    Py_ssize_t end
+
+cdef struct Scanner:
+    const char* d
+    Py_ssize_t n
+    bint fallback
+    # the state of WikiLinkHandler
+    bint is_link
+    string link_url
+    string link_text
+    vector[string] elem_stack
+    int forb_depth
+    # the (url, text) pairs passed to add_link
+    vector[string] urls
+    vector[string] texts
+
+
+cdef void text(Scanner* s, Py_ssize_t start, Py_ssize_t end) nogil:
+    if s.is_link:
+        strip(s.d, &start, &end)
+        s.link_text.append(s.d + start, end - start)
+
+cdef bint has_word(const char* d, Py_ssize_t start, Py_ssize_t end, const char* w, Py_ssize_t m) nogil:
+    """
+    Return True if `w` occurs between `start` and `end` as a whole word, like
+    the regular expression \\bw\\b.
+    """
+    cdef Py_ssize_t i
+    for i in range(start, end - m + 1):
+        if memcmp(d + i, w, m) == 0 and (i == start or not is_word(d[i-1])) and \
+                (i + m == end or not is_word(d[i+m])):
+            return True
+    return False
+
+cdef bint has_class(const char* d, Py_ssize_t start, Py_ssize_t end, const char* c, Py_ssize_t m) nogil:
+    """
+    Return True if `c` is one of the whitespace-separated classes between
+    `start` and `end`.
+    """
+    cdef const unsigned char* s = <const unsigned char*>d
+    cdef Py_ssize_t i = start, j, k
+    while i < end:
+        k = unicode_space_len(s, i, end)
+        if k > 0:
+            i += k
+            continue
+        j = i
+        while j < end and unicode_space_len(s, j, end) == 0:
+            j += 1
+        if j - i == m and memcmp(d + i, c, m) == 0:
+            return True
+        i = j
+    return False
+
+cdef bint is_forbidden_id(const char* d, Py_ssize_t start, Py_ssize_t end) nogil:
+    # ^(cite_.*|coordinates)$, where . does not match a newline and $ also
+    # matches before a newline at the end
+    if end > start and d[end-1] == b'\n':
+        end -= 1
+    if end - start == 11 and memcmp(d + start, b'coordinates', 11) == 0:
+        return True
+    return end - start >= 5 and memcmp(d + start, b'cite_', 5) == 0 and \
+        memchr(d + start, b'\n', end - start) == NULL
+
+cdef void start_tag(Scanner* s, const string& tag, Attr* cls, Attr* id_, Attr* href) nogil:
+    s.elem_stack.push_back(tag)
+    if (cls.present and (has_word(s.d, cls.start, cls.end, b'reference', 9) or
+                         has_word(s.d, cls.start, cls.end, b'hatnote', 7))) or \
+            (id_.present and is_forbidden_id(s.d, id_.start, id_.end)) or \
+            tag == b'head' or tag == b'script':
+        s.forb_depth += 1
+    if tag == b'a':
+        if s.forb_depth == 0 and href.present and \
+                not (cls.present and has_class(s.d, cls.start, cls.end, b'external', 8)):
+            s.is_link = True
+            s.link_url.assign(s.d + href.start, href.end - href.start)
+
+cdef void end_tag(Scanner* s, const string& tag) nogil:
+    # close the innermost element with this tag, together with all the
+    # elements inside it (or everything if there is no such element)
+    cdef Py_ssize_t old_depth = s.elem_stack.size()
+    cdef Py_ssize_t depth = old_depth - 1
+    while depth > 0 and s.elem_stack[depth] != tag:
+        depth -= 1
+    if depth < 0:
+        depth = 0
+    s.forb_depth = max(0, s.forb_depth - (old_depth - depth))
+    s.elem_stack.resize(depth)
+    if tag == b'a' and s.is_link:
+        if s.link_url.size() == 0 or s.link_url[0] != b'#':
+            s.urls.push_back(s.link_url)
+            s.texts.push_back(s.link_text)
+        s.is_link = False
+        s.link_url.clear()
+        s.link_text.clear()
+
+
+cdef Py_ssize_t skip_trailer(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:
+    # (?:\s|/(?!>))*
+    while i < n:
+        if is_space(d[i]):
+            i += 1
+        elif d[i] == b'/' and not (i + 1 < n and d[i+1] == b'>'):
+            i += 1
+        else:
+            break
+    return i
+
+cdef Py_ssize_t bare_value_end(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:
+    # [^>\s]*
+    while i < n and d[i] != b'>' and not is_space(d[i]):
+        i += 1
+    return i
+
+cdef Py_ssize_t match_value(const char* d, Py_ssize_t i, Py_ssize_t n, Attr* value) nogil:
+    """
+    Match the value part \\s*=+\\s*('[^']*'|"[^"]*"|(?!['"])[^>\\s]*) of an
+    attribute at `i`, with the backtracking of the regular expression. Return
+    the end of the match and set `value`, or return -1 if there is no match.
+    """
+    cdef Py_ssize_t p1 = i, p2, p3, q
+    while p1 < n and is_space(d[p1]):
+        p1 += 1
+    if p1 >= n or d[p1] != b'=':
+        return -1
+    p2 = p1
+    while p2 < n and d[p2] == b'=':
+        p2 += 1
+    p3 = p2
+    while p3 < n and is_space(d[p3]):
+        p3 += 1
+    if p3 < n and (d[p3] == b'\'' or d[p3] == b'"'):
+        q = find(d, d[p3], p3 + 1, n)
+        if q >= 0:
+            (value.start, value.end) = (p3, q + 1)
+        elif p3 > p2:
+            # an empty bare value before the last whitespace
+            (value.start, value.end) = (p3 - 1, p3 - 1)
+        elif p2 - p1 >= 2:
+            # a bare value starting with the last '='
+            (value.start, value.end) = (p2 - 1, bare_value_end(d, p2 - 1, n))
+        else:
+            return -1
+    else:
+        (value.start, value.end) = (p3, bare_value_end(d, p3, n))
+    value.present = True
+    return value.end
+
+cdef Py_ssize_t match_attr(const char* d, Py_ssize_t i, Py_ssize_t n, Attr* name, Attr* value) nogil:
+    """
+    Match `HTMLParser.attrfind` at `i`. Return the end of the match and set
+    `name` and `value` (not present if the attribute has no value), or return
+    -1 if there is no match.
+    """
+    cdef char c
+    if i == 0 or i >= n:
+        return -1
+    c = d[i-1]
+    if not (c == b'\'' or c == b'"' or c == b'/' or is_space(c)):
+        return -1
+    c = d[i]
+    if is_space(c) or c == b'/' or c == b'>':
+        return -1
+    name.start = i
+    i += 1
+    while i < n and not (is_space(d[i]) or d[i] == b'/' or d[i] == b'=' or d[i] == b'>'):
+        i += 1
+    name.end = i
+    value.present = False
+    cdef Py_ssize_t j = match_value(d, i, n, value)
+    if j >= 0:
+        i = j
+    return skip_trailer(d, i, n)
+
+cdef inline bint is_tag_name_char(char c) nogil:
+    # [^\t\n\r\f />\x00]
+    return not (c == b'\t' or c == b'\n' or c == b'\r' or c == b'\f' or c == b' ' or c == b'/' or
+                c == b'>' or c == 0)
+
+cdef Py_ssize_t locate_starttag_end(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:
+    """
+    Return the end of the match of `HTMLParser.locatestarttagend` at `i`.
+    """
+    cdef Attr name, value
+    cdef Py_ssize_t j
+    i += 2
+    while i < n and is_tag_name_char(d[i]):
+        i += 1
+    while i < n and (is_space(d[i]) or d[i] == b'/'):
+        i += 1
+    while True:
+        j = match_attr(d, i, n, &name, &value)
+        if j < 0:
+            break
+        i = j
+    while i < n and is_space(d[i]):
+        i += 1
+    return i
+
+cdef Py_ssize_t scan_starttag(Scanner* s, Py_ssize_t i, string* cdata_tag) nogil:
+    """
+    Like `WikiLinkScanner.scan_starttag`: scan a start tag at `i` and return
+    the position after it, or -1 if it is incomplete. `cdata_tag` is set to
+    the name of the tag if it opened an element with CDATA content.
+    """
+    cdef const char* d = s.d
+    cdef Py_ssize_t n = s.n
+    cdef Py_ssize_t j = locate_starttag_end(d, i, n), endpos, k, end_start, end_end
+    cdef char c
+    if j >= n:
+        return -1
+    c = d[j]
+    if c == b'>':
+        endpos = j + 1
+    elif c == b'/':
+        if not starts_with(d, j, n, b'/>', 2):
+            return -1
+        endpos = j + 2
+    elif is_letter(c) or c == b'=':
+        return -1
+    else:
+        endpos = j
+
+    k = i + 2
+    while k < n and is_tag_name_char(d[k]):
+        k += 1
+    if not is_ascii(d, i + 1, k):
+        s.fallback = True
+        return -1
+    cdef string tag = string(d + i + 1, k - i - 1)
+    for j in range(<Py_ssize_t>tag.size()):
+        tag[j] = ascii_lower(tag[j])
+    k = skip_trailer(d, k, n)
+
+    cdef Attr cls, id_, href, name, value
+    cls.present = id_.present = href.present = False
+    cdef Attr* kept
+    while k < endpos:
+        j = match_attr(d, k, n, &name, &value)
+        if j < 0:
+            break
+        k = j
+        if not is_ascii(d, name.start, name.end):
+            s.fallback = True
+            return -1
+        if equals_lower(d, name.start, name.end, b'class', 5):
+            kept = &cls
+        elif equals_lower(d, name.start, name.end, b'id', 2):
+            kept = &id_
+        elif equals_lower(d, name.start, name.end, b'href', 4):
+            kept = &href
+        else:
+            continue
+        if not value.present:
+            s.fallback = True
+            return -1
+        if value.end - value.start >= 2 and (d[value.start] == b'\'' or d[value.start] == b'"') and \
+                d[value.end - 1] == d[value.start]:
+            value.start += 1
+            value.end -= 1
+        if memchr(d + value.start, b'&', value.end - value.start) != NULL:
+            s.fallback = True
+            return -1
+        kept[0] = value
+
+    (end_start, end_end) = (k, endpos)
+    strip(d, &end_start, &end_end)
+    if not (starts_with(d, end_start, end_end, b'>', 1) and end_end - end_start == 1) and \
+            not (starts_with(d, end_start, end_end, b'/>', 2) and end_end - end_start == 2):
+        # not a well-formed tag, HTMLParser treats it as text
+        text(s, i, endpos)
+        return endpos
+    start_tag(s, tag, &cls, &id_, &href)
+    if end_end - end_start == 2:
+        end_tag(s, tag)
+        return endpos
+    if tag == b'script' or tag == b'style':
+        cdata_tag[0] = tag
+    return endpos
+
+cdef Py_ssize_t match_endtag(const char* d, Py_ssize_t i, Py_ssize_t n, Py_ssize_t* name_end) nogil:
+    """
+    Match `HTMLParser.endtagfind` at `i`. Return the end of the match and set
+    `name_end` (the name starts after the whitespace following `</`), or
+    return -1 if there is no match.
+    """
+    i += 2
+    while i < n and is_space(d[i]):
+        i += 1
+    if i >= n or not is_letter(d[i]):
+        return -1
+    i += 1
+    while i < n and (is_alnum(d[i]) or d[i] == b'-' or d[i] == b'.' or d[i] == b':' or d[i] == b'_'):
+        i += 1
+    name_end[0] = i
+    while i < n and is_space(d[i]):
+        i += 1
+    if i >= n or d[i] != b'>':
+        return -1
+    return i + 1
+
+cdef string lower_name(Scanner* s, Py_ssize_t start, Py_ssize_t end) nogil:
+    cdef string name = string(s.d + start, end - start)
+    cdef size_t i
+    if not is_ascii(s.d, start, end):
+        s.fallback = True
+    for i in range(name.size()):
+        name[i] = ascii_lower(name[i])
+    return name
+
+cdef Py_ssize_t scan_endtag(Scanner* s, Py_ssize_t i, bint in_cdata, bint* closed_cdata) nogil:
+    """
+    Like `WikiLinkScanner.scan_endtag`: scan an end tag at `i` and return the
+    position after it, or -1 if it is incomplete. `closed_cdata` is set if it
+    closed an element.
+    """
+    cdef const char* d = s.d
+    cdef Py_ssize_t n = s.n
+    cdef Py_ssize_t gtpos = find(d, b'>', i + 1, n), name_start, name_end, k
+    cdef string tag
+    if gtpos < 0:
+        return -1
+    gtpos += 1
+    if match_endtag(d, i, n, &name_end) < 0:
+        if in_cdata:
+            text(s, i, gtpos)
+            return gtpos
+        if i + 2 >= n or not is_letter(d[i+2]):
+            if starts_with(d, i, n, b'</>', 3):
+                return i + 3
+            # bogus comment
+            k = find(d, b'>', i + 2, n)
+            return k + 1 if k >= 0 else -1
+        k = i + 3
+        while k < n and is_tag_name_char(d[k]):
+            k += 1
+        tag = lower_name(s, i + 2, k)
+        if s.fallback:
+            return -1
+        end_tag(s, tag)
+        return find(d, b'>', skip_trailer(d, k, n), n) + 1
+
+    name_start = i + 2
+    while is_space(d[name_start]):
+        name_start += 1
+    tag = lower_name(s, name_start, name_end)
+    if in_cdata and tag != b'script' and tag != b'style':
+        text(s, i, gtpos)
+        return gtpos
+    end_tag(s, tag)
+    closed_cdata[0] = True
+    return gtpos
+
+cdef Py_ssize_t search_cdata_end(const char* d, Py_ssize_t i, Py_ssize_t n, const string& tag) nogil:
+    # </\s*tag\s*> with re.IGNORECASE
+    cdef Py_ssize_t j
+    while True:
+        i = find(d, b'<', i, n)
+        if i < 0:
+            return -1
+        if i + 1 < n and d[i+1] == b'/':
+            j = i + 2
+            while j < n and is_space(d[j]):
+                j += 1
+            if equals_lower(d, j, min(n, j + <Py_ssize_t>tag.size()), tag.c_str(), tag.size()):
+                j += tag.size()
+                while j < n and is_space(d[j]):
+                    j += 1
+                if j < n and d[j] == b'>':
+                    return i
+        i += 1
+
+cdef Py_ssize_t search_comment_end(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:
+    # the end of the first match of --\s*>
+    cdef Py_ssize_t j
+    while True:
+        i = find(d, b'-', i, n)
+        if i < 0:
+            return -1
+        if i + 1 < n and d[i+1] == b'-':
+            j = i + 2
+            while j < n and is_space(d[j]):
+                j += 1
+            if j < n and d[j] == b'>':
+                return j + 1
+        i += 1
+
+cdef Py_ssize_t match_charref(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:
+    # the end of the match of &#(?:[0-9]+|[xX][0-9a-fA-F]+)[^0-9a-fA-F] at i
+    cdef Py_ssize_t j = i + 2
+    if j < n and d[j] >= b'0' and d[j] <= b'9':
+        while j < n and d[j] >= b'0' and d[j] <= b'9':
+            j += 1
+    elif j < n and (d[j] == b'x' or d[j] == b'X'):
+        j += 1
+        if j >= n or not is_hex(d[j]):
+            return -1
+        while j < n and is_hex(d[j]):
+            j += 1
+    else:
+        return -1
+    if j >= n or is_hex(d[j]):
+        return -1
+    return j + 1
+
+cdef Py_ssize_t match_entityref(const char* d, Py_ssize_t i, Py_ssize_t n) nogil:
+    # the end of the match of &([a-zA-Z][-.a-zA-Z0-9]*)[^a-zA-Z0-9] at i
+    cdef Py_ssize_t j = i + 1, k
+    if j >= n or not is_letter(d[j]):
+        return -1
+    j += 1
+    while j < n and (is_alnum(d[j]) or d[j] == b'-' or d[j] == b'.'):
+        j += 1
+    if j < n:
+        return j + 1
+    # backtrack to the last '-' or '.' of the name
+    k = n - 1
+    while k > i + 1:
+        if d[k] == b'-' or d[k] == b'.':
+            return k + 1
+        k -= 1
+    return -1
+
+cdef void scan(Scanner* s) nogil:
+    """
+    Like `WikiLinkScanner.scan`.
+    """
+    cdef const char* d = s.d
+    cdef Py_ssize_t n = s.n
+    cdef Py_ssize_t i = 0, j, k
+    cdef string cdata_tag
+    cdef bint closed
+    while i < n:
+        if cdata_tag.size():
+            j = search_cdata_end(d, i, n, cdata_tag)
+            if j < 0:
+                break
+        else:
+            # [&<]
+            j = i
+            while j < n and d[j] != b'<' and d[j] != b'&':
+                j += 1
+        if i < j and s.is_link:
+            text(s, i, j)
+        i = j
+        if i == n:
+            break
+
+        if d[i] == b'<':
+            if i + 1 < n and is_letter(d[i+1]):
+                k = scan_starttag(s, i, &cdata_tag)
+            elif starts_with(d, i, n, b'</', 2):
+                closed = False
+                k = scan_endtag(s, i, cdata_tag.size() > 0, &closed)
+                if closed:
+                    cdata_tag.clear()
+            elif starts_with(d, i, n, b'<!--', 4):
+                k = search_comment_end(d, i + 4, n)
+            elif starts_with(d, i, n, b'<?', 2):
+                k = find(d, b'>', i + 2, n)
+                if k >= 0:
+                    k += 1
+            elif starts_with(d, i, n, b'<![', 3):
+                s.fallback = True
+                k = -1
+            elif starts_with(d, i, n, b'<!', 2):
+                if equals_lower(d, i, min(n, i + 9), b'<!doctype', 9):
+                    k = find(d, b'>', i + 9, n)
+                else:
+                    k = find(d, b'>', i + 2, n)
+                if k >= 0:
+                    k += 1
+            elif i + 1 < n:
+                text(s, i, i + 1)
+                k = i + 1
+            else:
+                break
+            if k < 0:
+                break
+            i = k
+        elif starts_with(d, i, n, b'&#', 2):
+            k = match_charref(d, i, n)
+            if k < 0:
+                break
+            i = k
+            if d[i-1] != b';':
+                i -= 1
+        else:
+            k = match_entityref(d, i, n)
+            if k >= 0:
+                i = k
+                if d[i-1] != b';':
+                    i -= 1
+            elif (i + 1 < n and (is_letter(d[i+1]) or d[i+1] == b'#')) or i + 1 == n:
+                break
+            else:
+                text(s, i, i + 1)
+                i += 1
+
+
+def scan_links(data):
+    """
+    Scan a page (a unicode string, or UTF-8 encoded bytes or a buffer of them
+    such as the memoryviews of `_unzim.File.blob_view`) and return the
+    (url, text) pairs of the links that `WikiLinkScanner` would pass to
+    `WikiLinkHandler.add_link`, or None if the page has to be scanned by
+    `WikiLinkScanner`. The page is scanned without the GIL and only the links
+    are decoded.
+    """
+    if isinstance(data, unicode):
+        data = data.encode('utf-8')
+    cdef Py_buffer page
+    cdef Scanner s
+    PyObject_GetBuffer(data, &page, PyBUF_SIMPLE)
+    try:
+        s.d = <const char*>page.buf
+        s.n = page.len
+        s.fallback = False
+        s.is_link = False
+        s.forb_depth = 0
+        with nogil:
+            scan(&s)
+    finally:
+        PyBuffer_Release(&page)
+    if s.fallback:
+        return None
+    return [(s.urls[i].decode('utf-8'), s.texts[i].decode('utf-8')) for i in range(s.urls.size())]
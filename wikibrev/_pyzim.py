@@ -0,0 +1,322 @@
+"""
+A pure-Python stand-in for the `_unzim` extension with the same `File` and
+`Article` interface. Instead of a ZIM file, it reads a directory of HTML files
+or a synthetic corpus that is generated on the fly, so that the extraction can
+be run and measured without zimlib or a real dump.
+
+A directory corpus consists of the `*.html` files in a directory (the URL of an
+article is the file's path without the extension and its title is taken from
+the `<title>` element) and an optional file `redirects.tsv` with lines of the
+form `url<TAB>target url[<TAB>title]`.
+
+A synthetic corpus is given by a path of the form
+`synthetic:articles=N,links=L,redirects=R,seed=S`, where any of the parameters
+may be omitted: `N` articles (including redirects, default: 10000) with `L`
+links per page on average (default: 20), a fraction `R` of which are redirects
+(default: 0.2). The corpus depends only on the parameters.
+"""
+
+import os
+import re
+import cgi
+import codecs
+import random
+from bisect import bisect_right
+from HTMLParser import HTMLParser
+from dirents import scan_articles
+
+synthetic_prefix = 'synthetic:'
+
+# the number of articles stored in one cluster
+cluster_size = 16
+
+def is_corpus(path):
+    """
+    Return True if `path` is to be read by this module rather than by zimlib.
+    """
+    return path.startswith(synthetic_prefix) or os.path.isdir(path)
+
+def File(path):
+    """
+    Open a directory or synthetic corpus.
+    """
+    if path.startswith(synthetic_prefix):
+        return SyntheticFile(path[len(synthetic_prefix):])
+    return DirectoryFile(path)
+
+
+class Article(object):
+    """
+    Represents one article.
+    """
+
+    __slots__ = ('file', 'index', 'title', 'url', 'redirect_index', 'cluster_id', 'blob_id')
+
+    ns = u'A'
+    linktarget = False
+
+    def __init__(self, file, index, title, url, redirect_index, cluster_id, blob_id):
+        self.file = file
+        self.index = index
+        self.title = title
+        self.url = url
+        self.redirect_index = redirect_index
+        self.cluster_id = cluster_id
+        self.blob_id = blob_id
+
+    @property
+    def long_url(self):
+        return self.ns + u'/' + self.url
+
+    @property
+    def redirect_article(self):
+        if self.redirect_index is None:
+            return None
+        return self.file.article(self.redirect_index)
+
+    @property
+    def data(self):
+        if self.redirect_index is not None:
+            return u''
+        return self.file.blob_data(self.cluster_id, self.blob_id)
+
+    @property
+    def data_view(self):
+        if self.redirect_index is not None:
+            return memoryview(b'')
+        return self.file.blob_view(self.cluster_id, self.blob_id)
+
+
+class DirectoryFile(object):
+    """
+    A corpus of HTML files in a directory. The articles are ordered by URL,
+    like in a ZIM file.
+    """
+
+    re_title = re.compile(r'<title>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+
+    def __init__(self, path):
+        self.path = path
+        entries = [] # (url, title, redirect url, file name)
+        for (dirpath, dirnames, filenames) in os.walk(path):
+            for filename in filenames:
+                if filename.endswith('.html'):
+                    fname = os.path.join(dirpath, filename)
+                    url = os.path.relpath(fname, path)[:-len('.html')].replace(os.sep, '/').decode('utf-8')
+                    entries.append((url, self.read_title(fname, url), None, fname))
+
+        redirects_path = os.path.join(path, 'redirects.tsv')
+        if os.path.exists(redirects_path):
+            with codecs.open(redirects_path, 'r', 'utf-8') as f:
+                for line in f:
+                    fields = line.rstrip(u'\n').split(u'\t')
+                    title = fields[2] if len(fields) > 2 else fields[0].replace(u'_', u' ')
+                    entries.append((fields[0], title, fields[1], None))
+
+        entries.sort()
+        indices = dict((entry[0], index) for (index, entry) in enumerate(entries))
+        self.urls = [entry[0] for entry in entries]
+        self.titles = [entry[1] for entry in entries]
+        self.redirects = [None if entry[2] is None else indices[entry[2]] for entry in entries]
+        self.fnames = [entry[3] for entry in entries if entry[3] is not None]
+        self.blob_indices = [index for (index, entry) in enumerate(entries) if entry[3] is not None]
+
+    def read_title(self, fname, url):
+        with open(fname, 'rb') as f:
+            m = self.re_title.search(f.read(4096).decode('utf-8', 'replace'))
+        if m is None:
+            return url.split(u'/')[-1].replace(u'_', u' ')
+        return HTMLParser().unescape(m.group(1).strip())
+
+    def __len__(self):
+        return len(self.urls)
+
+    def article(self, index):
+        """
+        Return the article with the index `index`.
+        """
+        blob = bisect_right(self.blob_indices, index) - 1
+        return Article(self, index, self.titles[index], self.urls[index], self.redirects[index],
+                       blob // cluster_size, blob % cluster_size)
+
+    def articles(self, start=0):
+        """
+        Return an iterator over the articles, starting at the index `start`.
+        """
+        for index in xrange(start, len(self.urls)):
+            yield self.article(index)
+
+    def scan_dirents(self, namespace=u'A', start=0, count=None):
+        """
+        Return the `dirents.Dirents` of the articles from the index `start` to
+        `start + count` (to the end if `count` is None).
+        """
+        end = len(self) if count is None else min(len(self), start + count)
+        return scan_articles(self.articles(start), namespace, end)
+
+    def blob_data(self, cluster_id, blob_id):
+        with codecs.open(self.fnames[cluster_id * cluster_size + blob_id], 'r', 'utf-8') as f:
+            return f.read()
+
+    def blob_view(self, cluster_id, blob_id):
+        with open(self.fnames[cluster_id * cluster_size + blob_id], 'rb') as f:
+            return memoryview(f.read())
+
+
+def splitmix(x):
+    """
+    Return a 64-bit hash of a non-negative integer.
+    """
+    x = (x + 0x9e3779b97f4a7c15) & 0xffffffffffffffff
+    x = ((x ^ (x >> 30)) * 0xbf58476d1ce4e5b9) & 0xffffffffffffffff
+    x = ((x ^ (x >> 27)) * 0x94d049bb133111eb) & 0xffffffffffffffff
+    return x ^ (x >> 31)
+
+def make_words(n):
+    """
+    Return `n` distinct pronounceable words.
+    """
+    rnd = random.Random(0)
+    onsets = ['b', 'c', 'd', 'f', 'g', 'k', 'l', 'm', 'n', 'p', 'r', 's', 't', 'v', 'z', 'br', 'st', 'tr', 'ch']
+    vowels = ['a', 'e', 'i', 'o', 'u', 'ai', 'ou']
+    words = set()
+    while len(words) < n:
+        words.add(''.join(rnd.choice(onsets) + rnd.choice(vowels) for i in range(rnd.randint(2, 3))))
+    return sorted(words)
+
+
+class SyntheticFile(object):
+    """
+    A synthetic corpus. Every property of an article is computed from its
+    index, so even a large corpus takes no memory.
+
+    The titles of the articles consist of three words and are unique. About
+    half of the redirects are titled by the initials of their target. The
+    pages link to random articles (and some missing ones) with the target's
+    title, its initials, its first word, a longer phrase or unrelated words as
+    the link text, and also contain references, which are to be ignored.
+    """
+
+    words = [w.decode('ascii') for w in make_words(1000)]
+    n_titles = len(words) ** 3
+    title_step = 3 ** 18 # coprime with n_titles, so that the titles are unique
+
+    def __init__(self, spec):
+        params = {'articles': 10000, 'links': 20, 'redirects': 0.2, 'seed': 0}
+        for item in spec.split(','):
+            if item:
+                (key, value) = item.split('=')
+                if key not in params:
+                    raise ValueError('Unknown parameter of a synthetic corpus: ' + key)
+                params[key] = type(params[key])(value)
+        if not 0 <= params['redirects'] < 1:
+            raise ValueError('The ratio of redirects must be at least 0 and less than 1')
+        self.n_articles = params['articles']
+        self.n_links = params['links']
+        self.redirect_ratio = params['redirects']
+        self.seed = params['seed']
+
+    def random(self, index, salt):
+        """
+        Return a pseudo-random number in [0, 1) for an article.
+        """
+        return splitmix((self.seed << 40) ^ (salt << 32) ^ index) / 18446744073709551616.0
+
+    def is_redirect(self, index):
+        return self.random(index, 1) < self.redirect_ratio
+
+    def redirect_target(self, index):
+        target = int(self.random(index, 2) * self.n_articles)
+        while self.is_redirect(target):
+            target = (target + 1) % self.n_articles
+        return target
+
+    def content_title(self, index):
+        p = (index * self.title_step + self.seed) % self.n_titles
+        n = len(self.words)
+        return u' '.join(w.capitalize() for w in (self.words[p // (n * n)], self.words[p // n % n], self.words[p % n]))
+
+    def title(self, index):
+        if self.is_redirect(index) and self.random(index, 3) < 0.5:
+            return initials(self.content_title(self.redirect_target(index))) + u' (%d)' % index
+        return self.content_title(index)
+
+    def __len__(self):
+        return self.n_articles
+
+    def article(self, index):
+        """
+        Return the article with the index `index`.
+        """
+        title = self.title(index)
+        redirect_index = self.redirect_target(index) if self.is_redirect(index) else None
+        return Article(self, index, title, title.replace(u' ', u'_'), redirect_index,
+                       index // cluster_size, index % cluster_size)
+
+    def articles(self, start=0):
+        """
+        Return an iterator over the articles, starting at the index `start`.
+        """
+        for index in xrange(start, self.n_articles):
+            yield self.article(index)
+
+    def scan_dirents(self, namespace=u'A', start=0, count=None):
+        """
+        Return the `dirents.Dirents` of the articles from the index `start` to
+        `start + count` (to the end if `count` is None).
+        """
+        end = len(self) if count is None else min(len(self), start + count)
+        return scan_articles(self.articles(start), namespace, end)
+
+    def link(self, rnd):
+        """
+        Return the HTML of a random link.
+        """
+        target = rnd.randrange(self.n_articles)
+        title = self.title(target)
+        url = title.replace(u' ', u'_')
+        x = rnd.random()
+        if x < 0.35:
+            text = title
+        elif x < 0.55:
+            text = initials(title)
+        elif x < 0.7:
+            text = title.split()[0].lower()
+        elif x < 0.85:
+            text = title + u' ' + rnd.choice(self.words)
+        else:
+            text = u' '.join(rnd.choice(self.words) for i in range(rnd.randint(1, 3)))
+        x = rnd.random()
+        if x < 0.05:
+            url = u'Missing_' + url
+        elif x < 0.1:
+            url = u'../A/' + url
+        elif x < 0.15:
+            return u'<a class="external" href="http://example.org/%s">%s</a>' % (url, text)
+        return u'<a href="%s">%s</a>' % (cgi.escape(url, True), cgi.escape(text))
+
+    def blob_data(self, cluster_id, blob_id):
+        index = cluster_id * cluster_size + blob_id
+        rnd = random.Random(splitmix((self.seed << 32) ^ index))
+        title = cgi.escape(self.title(index))
+        parts = [u'<html><head><title>%s</title></head><body><h1>%s</h1><p>' % (title, title)]
+        for i in range(rnd.randint(0, 2 * self.n_links)):
+            parts.append(u' '.join(rnd.choice(self.words) for j in range(rnd.randint(1, 8))))
+            parts.append(self.link(rnd))
+            x = rnd.random()
+            if x < 0.1:
+                parts.append(u'<sup class="reference">%s</sup>' % self.link(rnd))
+            elif x < 0.2:
+                parts.append(u'</p><p>')
+        parts.append(u'</p></body></html>')
+        return u' '.join(parts)
+
+    def blob_view(self, cluster_id, blob_id):
+        return memoryview(self.blob_data(cluster_id, blob_id).encode('utf-8'))
+
+
+def initials(title):
+    """
+    Return the initials of a title, without a bracketed part at the end.
+    """
+    return u''.join(w[0].upper() for w in title.split(u' (')[0].split())
@@ -1,6 +1,22 @@
 from libcpp cimport bool
 from libcpp.string cimport string
+from libcpp.vector cimport vector
+from libc.string cimport memcpy
+from cpython cimport array
+from cpython.buffer cimport PyBuffer_FillInfo
+from cpython.pythread cimport (PyThread_type_lock, PyThread_allocate_lock, PyThread_free_lock,
+                              PyThread_acquire_lock, PyThread_release_lock, WAIT_LOCK)
+cimport cython
 from cython.operator cimport dereference as deref, preincrement as incr
+from dirents import Dirents
+
+# the bits of `Dirents.flags`, as in the dirents module
+cdef enum:
+    REDIRECT = 1
+    LINKTARGET = 2
+
+cdef array.array long_template = array.array('l')
+cdef array.array uchar_template = array.array('B')
 
 
 cdef extern from "<zim/file.h>":
@@ -8,13 +24,18 @@ cdef extern from "<zim/file.h>":
         _File(string) except +
         _FileIterator begin() except +
         _FileIterator end() except +
-        _Blob getBlob(size_t clusterIdx, size_t blobIdx) except +
+        size_t getCountArticles() except +
+        _Article getArticle(size_t idx) except +
+        _Blob getBlob(size_t clusterIdx, size_t blobIdx) nogil except +
+        _Dirent getDirent(size_t idx) nogil except +
 
     bool operator==(const _FileIterator&, const _FileIterator&) except +
     bool operator!=(const _FileIterator&, const _FileIterator&) except +
 
 cdef extern from "<zim/fileiterator.h>":
     cdef cppclass _FileIterator "zim::File::const_iterator":
+        _FileIterator()
+        _FileIterator(const _File*, size_t) except +
         _FileIterator operator++() except +
         _Article operator*() except +
 
@@ -31,50 +52,186 @@ cdef extern from "<zim/article.h>":
         _Article getRedirectArticle() except +
         size_t getRedirectIndex() except+
         _Dirent getDirent() except +
-        _Blob getData() except +
+        _Blob getData() nogil except +
 
 cdef extern from "<zim/dirent.h>":
     cdef cppclass _Dirent "zim::Dirent":
-        size_t getClusterNumber()
-        size_t getBlobNumber()
+        _Dirent() nogil
+        bool isRedirect() nogil
+        bool isLinktarget() nogil
+        bool isDeleted() nogil
+        char getNamespace() nogil
+        string getTitle() nogil except +
+        string getUrl() nogil except +
+        size_t getRedirectIndex() nogil
+        size_t getClusterNumber() nogil
+        size_t getBlobNumber() nogil
 
 cdef extern from "<zim/blob.h>":
     cdef cppclass _Blob "zim::Blob":
-        const char* data()
-        const char* end()
-        unsigned size()
+        _Blob() nogil
+        const char* data() nogil
+        const char* end() nogil
+        unsigned size() nogil
+
+
+cdef long_array(const vector[long]& v):
+    cdef array.array a = array.clone(long_template, v.size(), False)
+    if v.size():
+        memcpy(a.data.as_voidptr, v.data(), v.size() * sizeof(long))
+    return a
+
+cdef uchar_array(const vector[unsigned char]& v):
+    cdef array.array a = array.clone(uchar_template, v.size(), False)
+    if v.size():
+        memcpy(a.data.as_voidptr, v.data(), v.size())
+    return a
 
 
 cdef class File:
     """
-    Represents a ZIM file.
+    Represents a ZIM file. Reading a blob releases the GIL, but zimlib does not
+    lock its cluster cache, so a `File` must not be used by several threads at
+    once. The blobs read from it (see `Blob`) may be passed to other threads.
     """
 
     cdef _File *f
+    cdef PyThread_type_lock lock # held while zimlib reads or releases a cluster
+
+    def __cinit__(self):
+        self.lock = PyThread_allocate_lock()
+        if self.lock == NULL:
+            raise MemoryError()
 
     def __init__(self, path):
         self.f = new _File(path)
 
     def __dealloc__(self):
         del self.f
+        if self.lock != NULL:
+            PyThread_free_lock(self.lock)
 
-    def articles(self):
+    def __len__(self):
+        """
+        Return the number of articles (in all namespaces) in the archive.
+        """
+        return self.f.getCountArticles()
+
+    def articles(self, size_t start=0):
         """
         Return an iterator that iterates over all articles in the archive
-        (instances of the Article class).
+        (instances of the Article class), starting at the article with the
+        index `start`.
         """
-        cdef _FileIterator it = self.f.begin()
+        cdef _FileIterator it = _FileIterator(self.f, min(start, self.f.getCountArticles()))
         while it != self.f.end():
-            a = Article.create(deref(it))
+            a = Article.create(self, deref(it))
             if a: yield a
             it = incr(it)
 
+    def article(self, size_t index):
+        """
+        Return the article with the index `index` (an instance of the Article
+        class), or None if it is deleted.
+        """
+        return Article.create(self, self.f.getArticle(index))
+
+    def scan_dirents(self, namespace='A', size_t start=0, count=None):
+        """
+        Return the directory entries of the articles in `namespace` with the
+        indices from `start` to `start + count` (to the end if `count` is None)
+        as a `dirents.Dirents` object. The entries are read in one loop
+        without the GIL and no Article objects are created.
+        """
+        cdef size_t end = self.f.getCountArticles()
+        if count is not None:
+            end = min(end, start + count)
+        cdef char ns = ord(namespace)
+        cdef vector[long] indices, redirect_indices, cluster_ids, blob_ids, title_offsets, url_offsets
+        cdef vector[unsigned char] flags
+        cdef string titles, urls
+        cdef _Dirent d
+        cdef size_t i
+        title_offsets.push_back(0)
+        url_offsets.push_back(0)
+        with nogil:
+            for i in range(start, end):
+                d = self.f.getDirent(i)
+                if d.isDeleted() or d.getNamespace() != ns:
+                    continue
+                indices.push_back(i)
+                if d.isRedirect():
+                    redirect_indices.push_back(d.getRedirectIndex())
+                    flags.push_back(REDIRECT)
+                else:
+                    redirect_indices.push_back(-1)
+                    flags.push_back(LINKTARGET if d.isLinktarget() else 0)
+                if flags.back():
+                    cluster_ids.push_back(0)
+                    blob_ids.push_back(0)
+                else:
+                    cluster_ids.push_back(d.getClusterNumber())
+                    blob_ids.push_back(d.getBlobNumber())
+                titles.append(d.getTitle())
+                title_offsets.push_back(titles.size())
+                urls.append(d.getUrl())
+                url_offsets.push_back(urls.size())
+        return Dirents(long_array(indices), long_array(redirect_indices), long_array(cluster_ids),
+                       long_array(blob_ids), uchar_array(flags), titles, long_array(title_offsets),
+                       urls, long_array(url_offsets))
+
     def blob_data(self, cluster_id, blob_id):
         """
         Return the data of a given blob.
         """
-        cdef _Blob data = self.f.getBlob(cluster_id, blob_id)
-        return data.data()[:data.size()].decode('utf-8')
+        return self.blob_view(cluster_id, blob_id).tobytes().decode('utf-8')
+
+    def blob_view(self, cluster_id, blob_id):
+        """
+        Return the UTF-8 encoded data of a given blob as a read-only
+        memoryview, without copying it.
+        """
+        cdef size_t c = cluster_id
+        cdef size_t b = blob_id
+        cdef Blob blob = Blob()
+        blob.file = self
+        with nogil:
+            PyThread_acquire_lock(self.lock, WAIT_LOCK)
+            try:
+                blob.blob = self.f.getBlob(c, b)
+            finally:
+                PyThread_release_lock(self.lock)
+        return memoryview(blob)
+
+
+@cython.no_gc_clear # `file` is needed in __dealloc__
+cdef class Blob:
+    """
+    A read-only buffer over the data of a blob. The underlying `zim::Blob`
+    keeps its cluster in memory for as long as this object is referenced,
+    e.g. by a memoryview. It may be released by another thread than the one
+    that read it, e.g. a worker thread, so it drops its reference to the
+    cluster under the lock of its `File`.
+    """
+
+    cdef _Blob blob
+    cdef File file
+
+    def __dealloc__(self):
+        if self.file is not None:
+            with nogil:
+                PyThread_acquire_lock(self.file.lock, WAIT_LOCK)
+                self.blob = _Blob()
+                PyThread_release_lock(self.file.lock)
+
+    def __len__(self):
+        return self.blob.size()
+
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        PyBuffer_FillInfo(buffer, self, <void*>self.blob.data(), self.blob.size(), 1, flags)
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        pass
 
 
 cdef class Article:
@@ -83,6 +240,7 @@ cdef class Article:
     """
 
     cdef _Article a
+    cdef File file
 
     @property
     def index(self):
@@ -129,6 +287,15 @@ cdef class Article:
             return self.a.getRedirectIndex()
         return None
 
+    @property
+    def redirect_article(self):
+        """
+        if the article is redirected, the target article; None otherwise
+        """
+        if self.a.isRedirect():
+            return Article.create(self.file, self.a.getRedirectArticle())
+        return None
+
     @property
     def linktarget(self):
         """
@@ -142,10 +309,24 @@ cdef class Article:
         """
         the contents of the article, if applicable; otherwise, an empty string
         """
-        cdef _Blob data = self.a.getData()
+        return self.data_view.tobytes().decode('utf-8')
+
+    @property
+    def data_view(self):
+        """
+        the UTF-8 encoded contents of the article as a read-only memoryview
+            (see `File.blob_view`), if applicable; otherwise, an empty one
+        """
+        cdef Blob blob = Blob()
         if not self.a.isRedirect() and not self.a.isLinktarget():
-            return data.data()[:data.size()].decode('utf-8')
-        return u''
+            blob.file = self.file
+            with nogil:
+                PyThread_acquire_lock(self.file.lock, WAIT_LOCK)
+                try:
+                    blob.blob = self.a.getData()
+                finally:
+                    PyThread_release_lock(self.file.lock)
+        return memoryview(blob)
 
     @property
     def cluster_id(self):
@@ -163,10 +344,11 @@ cdef class Article:
 
 
     @staticmethod
-    cdef create(_Article _a):
+    cdef create(File file, _Article _a):
         if _a.isDeleted(): return None
 
         a = Article()
         a.a = _a
+        a.file = file
 
         return a
@@ -9,7 +9,10 @@ import os
 import sys
 import codecs
 import re
+import itertools
+import multiprocessing
 from ask import ask_yes_no
+from metrics import metrics, init_worker
 from contextlib import closing
 
 re_whitespace = re.compile(r'\s+')
@@ -27,7 +30,33 @@ def tokenize(txt):
     """
     return re_whitespace.sub(' ', re_token.sub(r' \1', txt).strip())
 
-def check_abbr(abbr, exp):
+memo_size = 100000
+normalized_memo = {}
+
+def py_normalize(txt):
+    """
+    Return the representation of `txt` used by `check_abbr`: the length of the
+    tokenized string and its letters, alphanumeric characters and words, all
+    lowercased. The results are memoized, since most link targets are linked
+    to many times.
+    """
+    try:
+        return normalized_memo[txt]
+    except KeyError:
+        pass
+
+    tok = tokenize(txt)
+    norm = (len(tok),
+            ''.join(re_letter.findall(tok)).lower(),
+            re_non_alnum.sub('', tok).lower(),
+            re_non_alnum.sub(' ', tok).lower().split())
+
+    if len(normalized_memo) >= memo_size:
+        normalized_memo.clear()
+    normalized_memo[txt] = norm
+    return norm
+
+def py_check_abbr(abbr, exp):
     """
     Return True if `abbr` is an abbreviation of `exp`. `abbr` is considered an
     abbreviation of `exp` if it can be created from `exp` by removing some
@@ -35,6 +64,72 @@ def check_abbr(abbr, exp):
     conditions.
     """
     # remove brackets (incl. contents)
+    if '(' in abbr:
+        abbr = re_brackets.sub('', abbr)
+    if '(' in exp:
+        exp = re_brackets.sub('', exp)
+
+    if len(abbr) == len(exp):
+        return False
+
+    if len(abbr) > len(exp):
+        abbr, exp = exp, abbr
+
+    abbr_len, abbr_letters, abbr_alnum, abbr_words = py_normalize(abbr)
+
+    # too short:
+    if abbr_len < 2:
+        return False
+    # not containing any letters:
+    if len(abbr_letters) == 0:
+        return False
+    # the match below can only succeed if the tokenized abbr consists of
+    # alphanumeric characters only, i.e. if it is a single word equal to
+    # abbr_alnum:
+    if len(abbr_alnum) < abbr_len:
+        return False
+
+    exp_len, exp_letters, exp_alnum, exp_words = py_normalize(exp)
+
+    # exp contains all letters from abbr, in the same order, as a substring:
+    if abbr_letters in exp_letters:
+        return False
+    # all words from abbr (i.e. the only one) are in exp:
+    if abbr_alnum in exp_words:
+        return False
+
+    n = len(abbr_alnum)
+    first = abbr_alnum[0]
+    j = 0
+    for w in exp_words:
+        if j == 0:
+            # the first letter of the abbreviation must match the
+            # first letter of a word
+            if w[0] != first:
+                continue
+            # it matches, so move to the next character in both strings
+            j = 1
+            w = w[1:]
+
+        for c in w:
+            if abbr_alnum[j] == c:
+                j += 1
+                if j == n: return True
+
+    return False
+
+# use the compiled versions if they are available
+try:
+    from _abbrev import normalize, check_abbr
+except ImportError:
+    normalize, check_abbr = py_normalize, py_check_abbr
+
+def check_abbr_reference(abbr, exp):
+    """
+    The straightforward version of `check_abbr`, which it must agree with.
+    Kept as a reference for testing and benchmarking.
+    """
+    # remove brackets (incl. contents)
     abbr = re_brackets.sub('', abbr)
     exp = re_brackets.sub('', exp)
 
@@ -108,61 +203,210 @@ def get_abbr(abbr, exp, idx):
     
     return (idx, abbr, exp)
 
-def make_abbrevs(dbpath):
+# queries returning the (text, title, article id, count) of the pairs to check, for
+# a rowid range, where `count` is the number of links (or redirects) behind the pair
+link_query = """select L.text, A.title, A.id, count(*) from link L join article A on L.tgt_id = A.id
+                where L.rowid >= ? and L.rowid < ? group by L.text, A.id"""
+link_count_query = """select L.text, A.title, A.id, L.count from link_count L join article A on L.tgt_id = A.id
+                      where L.rowid >= ? and L.rowid < ?"""
+redirect_query = """select distinct A.title, R.title, A.id, 1 from article A join article R on A.redirect_id = R.id
+                    where A.id >= ? and A.id < ?"""
+# the same for the articles listed in the update_dirty table, for an id range
+dirty_link_query = """select L.text, A.title, A.id, count(*) from update_dirty D join link L on L.tgt_id = D.id
+                      join article A on A.id = D.id
+                      where D.id >= ? and D.id < ? group by L.text, A.id"""
+dirty_redirect_query = """select distinct A.title, R.title, A.id, 1 from update_dirty D join article A on A.id = D.id
+                          join article R on A.redirect_id = R.id
+                          where D.id >= ? and D.id < ?"""
+
+# adds the count of an (article id, abbr, exp, count) record to the `abbrev`
+# table, as a pair may be found in several chunks; without upsert (before
+# SQLite 3.24), the row is replaced, keeping its rowid
+if sqlite3.sqlite_version_info >= (3, 24, 0):
+    abbrev_sql = """insert into abbrev values (?1, ?2, ?3, ?4)
+                    on conflict (article_id, abbr, exp) do update set count = count + excluded.count"""
+else:
+    abbrev_sql = """insert or replace into abbrev (rowid, article_id, abbr, exp, count)
+                    select B.rowid, ?1, ?2, ?3, ?4 + coalesce(B.count, 0)
+                    from (select 1) left join abbrev B on B.article_id = ?1 and B.abbr = ?2 and B.exp = ?3"""
+
+def create_abbrev_table(db):
     """
-    Search a database containing the tables `article` and `link` for
-    abbreviations and insert them into a new table named `abbrev` in the
-    database.
+    Create the `abbrev` table and its indexes.
     """
-    with closing(sqlite3.connect(dbpath)) as dbconn:
-        db = dbconn.cursor()
-        if db.execute("select count(*) from sqlite_master where type='table' and name='abbrev'").fetchone()[0] > 0:
-            if ask_yes_no(sys.stderr, "Table 'abbrev' already exists; do you wish to drop it?"):
-                db.execute('drop table abbrev')
-            else:
-                print >>sys.stderr, 'Aborting'
-                return
-        db.execute("""create table abbrev (article_id integer,
-                                           abbr text not null,
-                                           exp text not null,
-                                           foreign key (article_id) references article(id),
-                                           unique(article_id, abbr, exp))""")
-        db.execute('create index abbrev_article_id on abbrev(article_id)')
-        db.execute('create index abbrev_abbr on abbrev(abbr)')
-        db.execute('create index abbrev_exp on abbrev(exp)')
+    db.execute("""create table abbrev (article_id integer,
+                                       abbr text not null,
+                                       exp text not null,
+                                       count integer not null,
+                                       foreign key (article_id) references article(id),
+                                       unique(article_id, abbr, exp))""")
+    db.execute('create index abbrev_article_id on abbrev(article_id)')
+    db.execute('create index abbrev_abbr on abbrev(abbr)')
+    db.execute('create index abbrev_exp on abbrev(exp)')
 
+def thread_init(dbpath):
+    global reader
+    init_worker()
+    reader = sqlite3.connect(dbpath, timeout=600)
 
-        # A generator function that yields abbreviations:
-        def abbrevs():
-            db2 = dbconn.cursor() # the other cursor is being used for inserting, must use a different one!
+def process_chunk(chunk):
+    """
+    Run a query for a (query, start rowid, end rowid) chunk, check the pairs it
+    returns and return the abbreviation records found, with their counts.
+    """
+    (query, start, end) = chunk
+    abbrevs = []
+    for (a, b, idx, count) in reader.execute(query, (start, end)).fetchall():
+        if check_abbr(a, b):
+            abbrevs.append(get_abbr(a, b, idx) + (count,))
+    return abbrevs
 
-            # Go through all links and collect abbreviation--expansion pairs.
+def get_chunks(db, query, table, chunk_size):
+    """
+    Split the rowid range of `table` into chunks for `process_chunk`.
+    """
+    (lo, hi) = db.execute('select min(rowid), max(rowid) from %s' % table).fetchone()
+    if lo is None:
+        return []
+    return [(query, start, start + chunk_size) for start in range(lo, hi + 1, chunk_size)]
 
-            links = db2.execute('select distinct L.text, A.title, A.id from link L join article a on L.tgt_id = A.id')
+def copy_abbrevs(db, old_path):
+    """
+    Copy the abbreviations of the articles not listed in the `update_dirty`
+    table from the database at `old_path`, matching the articles by URL.
+    Return False if there are no abbreviations (with counts) in the old
+    database.
+    """
+    db.execute('attach database ? as old', (old_path,))
+    try:
+        if db.execute("select count(*) from old.sqlite_master where type='table' and name='abbrev'").fetchone()[0] == 0:
+            return False
+        if 'count' not in [column[1] for column in db.execute('pragma old.table_info(abbrev)')]:
+            print >>sys.stderr, 'The old abbreviations have no counts; all articles will be checked'
+            return False
+        db.execute("""insert or ignore into abbrev select N.id, B.abbr, B.exp, B.count
+                      from old.abbrev B join old.article O on O.id = B.article_id join article N on N.url = O.url
+                      where N.id not in (select id from update_dirty)
+                      order by B.rowid""")
+        print >>sys.stderr, db.rowcount, 'abbrevs copied'
+        return True
+    finally:
+        db.connection.commit()
+        db.execute('detach database old')
 
-            n_done = 0
-            for (a, b, idx) in links:
-                if check_abbr(a, b):
-                    yield get_abbr(a, b, idx)
-                    n_done += 1
+def make_abbrevs(dbpath, threads=1, chunk_size=100000, old_path=None):
+    """
+    Search a database containing the tables `article` and `link` (or
+    `link_count`) for abbreviations and insert them into a new table named
+    `abbrev` in the database. The `count` of an abbreviation is the number of
+    links and redirects in which it was found.
+
+    The links and redirects are checked in chunks of `chunk_size` rows using
+    `threads` worker processes. If the database has an `abbrev_links_pending`
+    table, `extract_links` has already put the abbreviations of the redirects
+    into the `abbrev` table and only the links are checked.
 
-                    if n_done % 1000 == 0:
-                        print >>sys.stderr, n_done, 'abbrevs collected'
-                        sys.stdout.flush()
-            print >>sys.stderr, 'Done processing links'
+    If `old_path` is given, the database was made by `update_links` from the
+    one at `old_path`; only the articles listed in its `update_dirty` table
+    are checked and the abbreviations of the rest are copied.
+    """
+    # start the workers before opening the database, so that they don't
+    # inherit the connection
+    pool = None
+    if threads > 1:
+        pool = multiprocessing.Pool(threads, initializer=thread_init, initargs=(dbpath,))
 
-            # Go through redirects.
+    try:
+        with closing(sqlite3.connect(dbpath, timeout=600)) as dbconn:
+            db = dbconn.cursor()
+            redirects_checked = db.execute("select count(*) from sqlite_master where type='table' and name='abbrev_links_pending'").fetchone()[0] > 0
+            if redirects_checked:
+                # dropped before the links are added, so that an interrupted
+                # run is not continued but asks to start over
+                db.execute('drop table abbrev_links_pending')
+            elif db.execute("select count(*) from sqlite_master where type='table' and name='abbrev'").fetchone()[0] > 0:
+                if ask_yes_no(sys.stderr, "Table 'abbrev' already exists; do you wish to drop it?"):
+                    db.execute('drop table abbrev')
+                else:
+                    print >>sys.stderr, 'Aborting'
+                    return
+            if not redirects_checked:
+                create_abbrev_table(db)
+            dbconn.commit()
 
-            redirs = db2.execute('select distinct A.title, R.title, A.id from article A join article R on A.redirect_id = R.id')
+            if old_path is not None and copy_abbrevs(db, old_path):
+                link_chunks = get_chunks(db, dirty_link_query, 'update_dirty', chunk_size)
+                redirect_chunks = get_chunks(db, dirty_redirect_query, 'update_dirty', chunk_size)
+            elif db.execute("select count(*) from sqlite_master where type='table' and name='link_count'").fetchone()[0] > 0:
+                link_chunks = get_chunks(db, link_count_query, 'link_count', chunk_size)
+                redirect_chunks = get_chunks(db, redirect_query, 'article', chunk_size)
+            else:
+                link_chunks = get_chunks(db, link_query, 'link', chunk_size)
+                redirect_chunks = get_chunks(db, redirect_query, 'article', chunk_size)
+            if redirects_checked:
+                print >>sys.stderr, 'The redirects were checked during the extraction'
+                redirect_chunks = []
+            if pool is not None:
+                results = pool.imap(process_chunk, link_chunks + redirect_chunks)
+            else:
+                thread_init(dbpath)
+                results = itertools.imap(process_chunk, link_chunks + redirect_chunks)
 
-            for (a, b, idx) in redirs:
-                if check_abbr(a, b):
-                    yield get_abbr(a, b, idx)
-                    n_done += 1
+            metrics.start('link_abbrevs')
+            n_done = 0
+            for (i, abbrevs) in enumerate(results):
+                # commit after every chunk, so that the workers are never
+                # locked out of the database for long
+                with metrics.timer('insert'):
+                    db.executemany(abbrev_sql, abbrevs)
+                with metrics.timer('commit'):
+                    dbconn.commit()
+                metrics.count('chunks')
+                metrics.count('abbrevs', len(abbrevs))
+                metrics.report()
 
-                    if n_done % 1000 == 0:
-                        print >>sys.stderr, n_done, 'abbrevs collected'
+                n_done += len(abbrevs)
+                print >>sys.stderr, n_done, 'abbrevs collected'
+                if i + 1 == len(link_chunks):
+                    print >>sys.stderr, 'Done processing links'
+                    metrics.finish()
+                    metrics.start('redirect_abbrevs')
+            if not link_chunks:
+                print >>sys.stderr, 'Done processing links'
+                metrics.finish()
+                metrics.start('redirect_abbrevs')
             print >>sys.stderr, 'Done processing redirects'
+            metrics.finish()
+
+            if old_path is not None:
+                db.execute('drop table update_dirty')
+                dbconn.commit()
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+def database_to_text(dbpath, out_f, counts=False):
+    """
+    Write the distinct abbreviations in a database to `out_f` as lines of the
+    form `abbr<TAB>exp`, followed by `<TAB>count` if `counts` is True, where
+    `count` is the total count of the abbreviation.
+    """
+    with closing(sqlite3.connect(dbpath)) as dbconn:
+        db = dbconn.cursor()
+        if counts:
+            abbrevs = db.execute('select abbr, exp, sum(count) from abbrev group by abbr, exp order by lower(abbr) asc, abbr, exp')
+        else:
+            abbrevs = db.execute('select distinct abbr, exp from abbrev order by lower(abbr) asc, abbr, exp')
+        for row in abbrevs:
+            out_f.write(row[0])
+            out_f.write('\t')
+            out_f.write(row[1])
+            if counts:
+                out_f.write('\t')
+                out_f.write(unicode(row[2]))
+            out_f.write('\n')
 
-        db.executemany('insert or ignore into abbrev values(?,?,?)', abbrevs())
-        dbconn.commit()
+def database_to_file(dbpath, fname, counts=False):
+    with closing(codecs.getwriter('utf8')(open(fname, 'w'))) as out_f:
+        database_to_text(dbpath, out_f, counts)
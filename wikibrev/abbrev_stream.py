@@ -0,0 +1,275 @@
+"""
+Provides an `extract_abbrevs` function that collects the abbreviations from a
+ZIM dump in a single pass, without building a database. The result is the
+same as that of `extract_links`, `make_abbrevs` and `abbr-db2list` combined.
+"""
+
+from __future__ import unicode_literals
+import sys
+import time
+import string
+import threading
+from array import array
+from itertools import izip
+import unzim
+from url_map import UrlMap, TitleMap
+from external_sort import ExternalSorter
+from link_extractor import engines, make_pool, page_batches, blob_batches, imap_bounded, page_batch_bytes, report_pool, print_stalls
+from metrics import metrics, init_worker
+from abbrev_processor import check_abbr, get_abbr
+
+# lowercases the ASCII letters in a UTF-8 string, like lower() in SQLite
+ascii_lower = string.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+def sort_key(abbr, exp):
+    """
+    Return a key that orders (abbr, exp) pairs like the query in
+    `database_to_text`, i.e. by the UTF-8 encoded strings, with only the ASCII
+    letters of `abbr` lowercased first.
+    """
+    abbr = abbr.encode('utf-8')
+    return (abbr.translate(ascii_lower), abbr, exp.encode('utf-8'))
+
+# the parser and the ZIM file of a worker, as in `link_extractor`
+local = threading.local()
+
+def thread_init(engine, url_map, title_map, zim_path):
+    global urls, titles
+    init_worker()
+    local.parser = engines[engine]()
+    urls = url_map
+    titles = title_map
+    local.zim_file = unzim.File(zim_path)
+
+def check_pair(a, b, keys):
+    """
+    Add the sort key of the abbreviation record for `a` and `b` to `keys` if
+    one is an abbreviation of the other.
+    """
+    if check_abbr(a, b):
+        (idx, abbr, exp) = get_abbr(a, b, None)
+        keys.add(sort_key(abbr, exp))
+
+def check_links(links, keys):
+    """
+    Check the (index, url, text) links whose target exists against the titles
+    of their targets.
+    """
+    for (index, url, text) in links:
+        tgt_index = urls.get(url, zim_file=local.zim_file)
+        if tgt_index is not None:
+            check_pair(text, titles.get(tgt_index), keys)
+
+def process_batch(batch):
+    """
+    Parse a batch of (index, data) pairs and return the sort keys of the
+    abbreviations found in all of them.
+    """
+    try:
+        keys = set()
+        for (index, data) in batch:
+            check_links(local.parser.parse_page(index, data)['links'], keys)
+        return list(keys)
+    except:
+        print >>sys.stderr, "Error during parsing:", sys.exc_info()
+        raise
+
+def process_blob_batch(batch):
+    """
+    Like `process_batch`, but for a batch of (index, cluster_id, blob_id)
+    triples read from the worker's own copy of the ZIM file.
+    """
+    try:
+        keys = set()
+        for (index, cluster_id, blob_id) in batch:
+            check_links(local.parser.parse_page(index, local.zim_file.blob_view(cluster_id, blob_id))['links'], keys)
+        return list(keys)
+    except:
+        print >>sys.stderr, "Error during parsing:", sys.exc_info()
+        raise
+
+def process_redirect_batch(batch):
+    """
+    Check a batch of (redirect index, target index) pairs and return the sort
+    keys of the abbreviations found.
+    """
+    keys = set()
+    for (index, tgt_index) in batch:
+        check_pair(titles.get(index), titles.get(tgt_index), keys)
+    return list(keys)
+
+def read_articles(chunks, counts, keep_blob_ids):
+    """
+    Read the articles from the `Dirents` chunks of a ZIM dump (see
+    `unzim.scan`) and return a `UrlMap` and a `TitleMap` of them, a `UrlMap`
+    of their titles (for finding duplicates), the (index, target index) arrays
+    of the redirects and, if `keep_blob_ids` is True, a list of keys as in
+    `link_extractor.read_articles`.
+    """
+    url_map = UrlMap()
+    title_map = TitleMap()
+    title_hashes = UrlMap()
+    redirects = (array('L'), array('L'))
+    keys = []
+    for d in chunks:
+        for i in xrange(len(d)):
+            index = d.indices[i]
+            title = d.title(i)
+            url_map.add(d.url(i).split('/')[-1], index)
+            title_map.add(index, title)
+            title_hashes.add(title, index)
+
+            redirect_index = d.redirect_index(i)
+            if redirect_index is not None:
+                counts['redirects'] += 1
+                redirects[0].append(index)
+                redirects[1].append(redirect_index)
+            else:
+                counts['articles'] += 1
+                if keep_blob_ids and not d.is_linktarget(i):
+                    keys.append((d.cluster_ids[i] << 64) | (d.blob_ids[i] << 32) | index)
+    url_map.freeze()
+    title_hashes.freeze()
+
+    return (url_map, title_map, title_hashes, redirects, keys)
+
+def find_rejected(chunks, dup_urls, dup_titles):
+    """
+    Return the (index, url) pairs of the articles that `extract_links` would
+    not insert into the article table because an earlier article has the same
+    URL or title. `dup_urls` and `dup_titles` are the hashes of the URLs and
+    titles that occur more than once.
+    """
+    inserted_urls = set()
+    inserted_titles = set()
+    rejected = []
+    for d in chunks:
+        for i in xrange(len(d)):
+            url = d.url(i).split('/')[-1]
+            url_hash = hash(url)
+            title_hash = hash(d.title(i))
+            if url_hash not in dup_urls and title_hash not in dup_titles:
+                continue
+            if url_hash in inserted_urls or title_hash in inserted_titles:
+                print >>sys.stderr, 'Duplicate URL or title;', 'article', (d.indices[i], d.title(i), 'A/' + d.url(i)), 'skipped!'
+                rejected.append((d.indices[i], url))
+            else:
+                inserted_urls.add(url_hash)
+                inserted_titles.add(title_hash)
+    return rejected
+
+def redirect_batches(redirects, title_map, rejected, batch_size):
+    """
+    Yield batches of the (index, target index) pairs of the redirects whose
+    source and target are both in the article table.
+    """
+    batch = []
+    for (index, tgt_index) in izip(*redirects):
+        if index in rejected or tgt_index in rejected or title_map.get(tgt_index) is None:
+            continue
+        batch.append((index, tgt_index))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def extract_abbrevs(zim_path, out_f, tmpdir, n_threads, batch_size=50, direct_read=False, engine='htmlparser',
+                    sort_memory=256, max_inflight_mb=256, workers='processes', redirects_only=False):
+    """
+    Extract the abbreviations from a ZIM dump and write them to `out_f` in the
+    format of `database_to_text`.
+
+    The article URLs and titles are kept in memory. The workers resolve the
+    links, check them for abbreviations and only send the abbreviations found
+    back. These are de-duplicated and sorted in memory, or in run files in
+    `tmpdir` if they take more than `sort_memory` MiB.
+
+    The other arguments are the same as in `extract_links`; if
+    `redirects_only` is True, only the redirects are checked.
+    """
+
+    zim = unzim.File(zim_path)
+
+    t = time.time()
+
+    print >>sys.stderr, "Reading articles"
+    counts = {'articles': 0, 'redirects': 0}
+    (url_map, title_map, title_hashes, redirects, keys) = read_articles(unzim.scan(zim), counts,
+                                                                         direct_read and not redirects_only)
+
+    # reproduce the unique constraints of the article table
+    dup_urls = url_map.duplicates()
+    dup_titles = title_hashes.duplicates()
+    del title_hashes
+    rejected = set()
+    if dup_urls or dup_titles:
+        for (index, url) in find_rejected(unzim.scan(zim), dup_urls, dup_titles):
+            url_map.remove(url, index)
+            rejected.add(index)
+
+    print >>sys.stderr, 'Read', counts['articles'], 'articles'
+    print >>sys.stderr, counts['redirects'], 'redirects'
+    print >>sys.stderr, 'Took', time.time()-t, 's'
+    t = time.time()
+
+    print >>sys.stderr
+    print >>sys.stderr, "Processing articles"
+    # the maps are built before the pool, so the workers inherit them
+    pool = make_pool(workers, n_threads, thread_init, (engine, url_map, title_map, zim_path))
+    if direct_read:
+        batches = blob_batches(keys, batch_size)
+        process = process_blob_batch
+        sizeof = None
+    else:
+        batches = page_batches(zim.articles(), batch_size, workers != 'threads')
+        process = process_batch
+        sizeof = page_batch_bytes
+    if redirects_only:
+        batches = []
+
+    sorter = ExternalSorter(tmpdir, sort_memory * 1024 * 1024)
+
+    metrics.start('extract_abbrevs')
+    n_done = 0
+    for (n, abbrevs) in imap_bounded(pool, process, batches, n_threads, max_inflight_mb * 1024 * 1024, sizeof):
+        with metrics.timer('sort'):
+            for key in abbrevs:
+                sorter.add(key)
+        metrics.count('abbrevs', len(abbrevs))
+
+        n_done += n
+        if n_done // 2000 > (n_done - n) // 2000:
+            print >>sys.stderr, n_done, 'done'
+            print >>sys.stderr, 'speed:', n_done/(time.time()-t), 'per second'
+            print >>sys.stderr, 'time per article:', (time.time()-t)/n_done
+        report_pool(n_threads)
+    metrics.finish(articles=n_done)
+
+    print >>sys.stderr, 'Processed', n_done, 'articles'
+    print_stalls()
+    print >>sys.stderr, 'Took', time.time()-t, 's'
+    t = time.time()
+
+    print >>sys.stderr
+    print >>sys.stderr, "Processing redirects"
+    metrics.start('redirect_abbrevs')
+    for (n, abbrevs) in imap_bounded(pool, process_redirect_batch,
+                                     redirect_batches(redirects, title_map, rejected, 1000), n_threads):
+        with metrics.timer('sort'):
+            for key in abbrevs:
+                sorter.add(key)
+        metrics.count('abbrevs', len(abbrevs))
+        report_pool(n_threads)
+
+    pool.close()
+    pool.join()
+    metrics.finish()
+
+    print >>sys.stderr, 'Took', time.time()-t, 's'
+
+    for (low, abbr, exp) in sorter:
+        out_f.write(abbr.decode('utf-8'))
+        out_f.write('\t')
+        out_f.write(exp.decode('utf-8'))
+        out_f.write('\n')
@@ -12,6 +12,15 @@ AutoZip can also be used as a context manager in the following way:
     with AutoZip(path) as new_path:
         # do something with new_path
 
+The file is only compressed again if it was modified. The module also
+provides the `compress_file` and `decompress_file` functions, which copy the
+data in large chunks; compression can use several threads.
+
+A compressed file can have sidecars: small gzip files stored next to it
+(written with `write_sidecar`) with data exported from it that can be read
+without decompressing the whole file (using `AutoZip.open_sidecar`). A
+sidecar is stamped with the gzip trailer of the file, so a sidecar left over
+from a different version of the file is ignored.
 """
 
 import os
@@ -19,6 +28,94 @@ import re
 import magic
 import tempfile
 import gzip
+import zlib
+import struct
+import shutil
+import time
+from collections import deque
+from multiprocessing.pool import ThreadPool
+
+# the size of the chunks of data copied at once, in bytes
+buffer_size = 16 * 1024 * 1024
+# the size of the blocks compressed independently by the threads, in bytes
+block_size = 4 * 1024 * 1024
+
+def decompress_file(fname_in, fname_out):
+    """
+    Decompress a gzip file.
+    """
+    with gzip.open(fname_in, 'rb') as f_in:
+        with open(fname_out, 'wb') as f_out:
+            shutil.copyfileobj(f_in, f_out, buffer_size)
+
+def compress_block(data, level):
+    """
+    Compress a block into raw deflate data that ends on a byte boundary, so
+    that compressed blocks can be concatenated.
+    """
+    c = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return c.compress(data) + c.flush(zlib.Z_SYNC_FLUSH)
+
+def compress_file(fname_in, fname_out, threads=1, level=9):
+    """
+    Compress a file using gzip. With more than one thread, the file is split
+    into blocks that are compressed in parallel (like pigz does), but the
+    output is still a single gzip stream.
+    """
+    with open(fname_in, 'rb') as f_in:
+        if threads <= 1:
+            with gzip.open(fname_out, 'wb', level) as f_out:
+                shutil.copyfileobj(f_in, f_out, buffer_size)
+            return
+
+        pool = ThreadPool(threads) # zlib releases the GIL while compressing
+        try:
+            with open(fname_out, 'wb') as f_out:
+                # header: magic, method, no flags, mtime, no extra flags, unknown OS
+                f_out.write(struct.pack('<BBBBIBB', 0x1f, 0x8b, 8, 0, int(time.time()), 0, 255))
+                crc = zlib.crc32('')
+                size = 0
+                pending = deque()
+                while True:
+                    data = f_in.read(block_size)
+                    if data:
+                        crc = zlib.crc32(data, crc)
+                        size += len(data)
+                        pending.append(pool.apply_async(compress_block, (data, level)))
+                    if pending and (not data or len(pending) >= 2 * threads):
+                        f_out.write(pending.popleft().get())
+                    elif not data:
+                        break
+                # an empty final block ends the deflate stream
+                c = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+                f_out.write(c.flush(zlib.Z_FINISH))
+                f_out.write(struct.pack('<II', crc & 0xffffffff, size & 0xffffffff))
+        finally:
+            pool.close()
+            pool.join()
+
+def sidecar_path(path, name):
+    return '%s.%s.gz' % (path, name)
+
+def archive_stamp(path):
+    """
+    Return a string identifying the contents of a gzip file: its size and
+    trailer (the CRC and size of the uncompressed data).
+    """
+    with open(path, 'rb') as f:
+        f.seek(-8, os.SEEK_END)
+        return '%d %s' % (os.fstat(f.fileno()).st_size, f.read(8).encode('hex'))
+
+def write_sidecar(path, name, fname_in):
+    """
+    Compress `fname_in` into a sidecar of the gzip file `path` named `name`.
+    """
+    out_path = sidecar_path(path, name)
+    with open(fname_in, 'rb') as f_in:
+        with gzip.open(out_path + '.tmp', 'wb') as f_out:
+            f_out.write('wikibrev sidecar %s\n' % archive_stamp(path))
+            shutil.copyfileobj(f_in, f_out, buffer_size)
+    os.rename(out_path + '.tmp', out_path)
 
 class AutoZip(object):
     mime = None
@@ -26,12 +123,15 @@ class AutoZip(object):
     _path = None
     _tmpdir = None
     _read_only = True
+    _threads = 1
+    _stat = None
 
-    def __init__(self, path, tmpdir=None, readonly=False):
+    def __init__(self, path, tmpdir=None, readonly=False, threads=1):
         if tmpdir is None: tmpdir = '/tmp'
         self.original_path = path
         self._tmpdir = tmpdir
         self._read_only = readonly
+        self._threads = threads
         with magic.Magic(flags=magic.MAGIC_MIME_TYPE) as m:
             self.mime = m.id_filename(path)
 
@@ -40,26 +140,62 @@ class AutoZip(object):
             if 'gzip' in self.mime:
                 fname = re.sub('\.gz$', '', os.path.split(self.original_path)[-1])
                 (fd_out, self._path) = tempfile.mkstemp(dir=self._tmpdir, suffix='.'+fname)
+                os.close(fd_out)
                 try:
-                    with os.fdopen(fd_out, 'wb') as f_out:
-                        with gzip.open(self.original_path, 'rb') as f_in:
-                            f_out.writelines(f_in)
+                    decompress_file(self.original_path, self._path)
                 except:
                     os.remove(self._path)
                     self._path = None
                     raise
+                self._stat = self._get_stat()
             else:
                 self._path = self.original_path
 
         return self._path
 
+    def is_compressed(self):
+        return 'gzip' in self.mime
+
+    def open_sidecar(self, name):
+        """
+        Return the sidecar named `name` opened for reading (the data after
+        the stamp) if it exists and matches the file, or None otherwise.
+        """
+        path = sidecar_path(self.original_path, name)
+        if not self.is_compressed() or not os.path.exists(path):
+            return None
+        f = gzip.open(path, 'rb')
+        try:
+            if f.readline() == 'wikibrev sidecar %s\n' % archive_stamp(self.original_path):
+                return f
+        except IOError: # not a gzip file
+            pass
+        f.close()
+        return None
+
+    def _get_stat(self):
+        st = os.stat(self._path)
+        return (st.st_size, st.st_mtime)
+
+    def is_modified(self):
+        """
+        Return True if the decompressed file has been modified.
+        """
+        return self._path != self.original_path and self._get_stat() != self._stat
+
     def close(self, commit_changes=True):
-        if self._path != self.original_path:
-            if commit_changes and not self._read_only:
+        if self._path is not None and self._path != self.original_path:
+            if commit_changes and not self._read_only and self.is_modified():
                 if 'gzip' in self.mime:
-                    with open(self._path, 'rb') as f_in:
-                        with gzip.open(self.original_path, 'wb') as f_out:
-                            f_out.writelines(f_in)
+                    # replace the original only once the new archive is complete
+                    tmp_path = self.original_path + '.tmp'
+                    try:
+                        compress_file(self._path, tmp_path, self._threads)
+                        os.rename(tmp_path, self.original_path)
+                    except:
+                        if os.path.exists(tmp_path):
+                            os.remove(tmp_path)
+                        raise
             os.remove(self._path)
         self._path = None
 
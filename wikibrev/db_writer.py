@@ -0,0 +1,157 @@
+"""
+Provides the `DatabaseWriter` class, a thread that writes rows into a SQLite
+database in large transactions, so that the thread producing the rows does
+not wait for the inserts and commits.
+"""
+
+from __future__ import unicode_literals
+import sys
+import time
+import threading
+import Queue
+import sqlite3
+from metrics import metrics
+
+class DatabaseWriter(threading.Thread):
+    """
+    A thread that writes the rows queued with `insert` and `insert_each`
+    through a database connection. The rows are collected per statement and
+    written, in the order in which the statements were first queued, when the
+    transaction is committed: once `commit_rows` rows are collected or
+    `commit_seconds` have passed since the last commit, whichever comes first.
+
+    The queue holds at most `max_queue` batches of rows, so a producer that is
+    faster than the database blocks in `insert` instead of taking up memory.
+
+    If `checkpoint_sql` is given, each commit also executes it with the
+    checkpoint arguments of the last batch written, so that the database
+    always records how far the committed data goes.
+
+    The connection must be opened with `check_same_thread=False` and must not
+    be used by other threads between `start` and `close`. An error in the
+    writer is raised again from `insert`, `flush` or `close`.
+    """
+
+    def __init__(self, dbconn, commit_rows=100000, commit_seconds=10.0, checkpoint_sql=None, max_queue=16):
+        threading.Thread.__init__(self, name='DatabaseWriter')
+        self.daemon = True
+        self.dbconn = dbconn
+        self.commit_rows = commit_rows
+        self.commit_seconds = commit_seconds
+        self.checkpoint_sql = checkpoint_sql
+        self.queue = Queue.Queue(max_queue)
+        self.statements = [] # (sql, each) in the order of first use since the last commit
+        self.buffers = {} # (sql, each) -> rows
+        self.n_buffered = 0
+        self.checkpoint_args = None
+        self.last_commit = time.time()
+        self.rowcounts = {} # sql -> the number of rows changed
+        self.rejected = [] # (row, error message) from `insert_each`
+        self.error = None
+
+    def put(self, item):
+        self.check()
+        with metrics.timer('writer_queue'):
+            self.queue.put(item)
+        metrics.gauge('writer_queue', self.queue.qsize())
+
+    def check(self):
+        if self.error is not None:
+            raise self.error[0], self.error[1], self.error[2]
+
+    def insert(self, sql, rows, checkpoint=None):
+        """
+        Queue `rows` to be written with `executemany(sql, rows)`. `checkpoint`
+        is the tuple of arguments for `checkpoint_sql` once these rows are
+        written.
+        """
+        self.put(('rows', sql, rows, False, checkpoint))
+
+    def insert_each(self, sql, rows, checkpoint=None):
+        """
+        Like `insert`, but execute the rows one by one and collect the rows that
+        violate a constraint in `rejected` instead of failing.
+        """
+        self.put(('rows', sql, rows, True, checkpoint))
+
+    def flush(self):
+        """
+        Wait until everything queued is written and committed.
+        """
+        self.put(('commit',))
+        self.queue.join()
+        self.check()
+
+    def close(self):
+        """
+        Write and commit everything queued and stop the thread.
+        """
+        self.put(('commit',))
+        self.queue.put(('stop',))
+        self.join()
+        self.check()
+
+    def run(self):
+        db = self.dbconn.cursor()
+        while True:
+            try:
+                if self.n_buffered > 0:
+                    timeout = max(0, self.last_commit + self.commit_seconds - time.time())
+                    item = self.queue.get(timeout=timeout)
+                else:
+                    item = self.queue.get()
+            except Queue.Empty:
+                self.commit(db)
+                continue
+            try:
+                if self.error is not None:
+                    pass # drop everything, so that the producer does not block
+                elif item[0] == 'rows':
+                    (kind, sql, rows, each, checkpoint) = item
+                    key = (sql, each)
+                    if key not in self.buffers:
+                        self.statements.append(key)
+                        self.buffers[key] = []
+                    self.buffers[key].extend(rows)
+                    self.n_buffered += len(rows)
+                    if checkpoint is not None:
+                        self.checkpoint_args = checkpoint
+                    if self.n_buffered >= self.commit_rows or time.time() - self.last_commit >= self.commit_seconds:
+                        self.commit(db)
+                elif item[0] == 'commit':
+                    self.commit(db)
+            except:
+                self.error = sys.exc_info()
+            finally:
+                self.queue.task_done()
+            if item[0] == 'stop':
+                return
+
+    def commit(self, db):
+        """
+        Write the collected rows and the checkpoint and commit.
+        """
+        with metrics.timer('insert'):
+            for key in self.statements:
+                (sql, each) = key
+                n_changed = 0
+                if each:
+                    for row in self.buffers[key]:
+                        try:
+                            db.execute(sql, row)
+                            n_changed += 1
+                        except sqlite3.IntegrityError as e:
+                            self.rejected.append((row, unicode(e)))
+                else:
+                    db.executemany(sql, self.buffers[key])
+                    n_changed = max(db.rowcount, 0)
+                self.rowcounts[sql] = self.rowcounts.get(sql, 0) + n_changed
+            if self.checkpoint_sql is not None and self.checkpoint_args is not None:
+                db.execute(self.checkpoint_sql, self.checkpoint_args)
+        with metrics.timer('commit'):
+            self.dbconn.commit()
+        metrics.count('rows_written', self.n_buffered)
+        self.statements = []
+        self.buffers = {}
+        self.n_buffered = 0
+        self.last_commit = time.time()
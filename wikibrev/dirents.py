@@ -0,0 +1,87 @@
+"""
+Provides the `Dirents` class, which holds the directory entries of a range of
+articles in columns, as returned by `File.scan_dirents` of both ZIM backends.
+"""
+
+from array import array
+
+# the bits of `Dirents.flags`
+REDIRECT = 1
+LINKTARGET = 2
+
+class Dirents(object):
+    """
+    The directory entries of the articles of one namespace in a range of
+    indices. The entries are kept in arrays: `indices`, `redirect_indices`
+    (-1 if the article is not a redirect), `cluster_ids` and `blob_ids` (0 for
+    redirects and link targets) and `flags`. The UTF-8 encoded titles and URLs
+    are concatenated in `titles` and `urls`; the i-th one spans from
+    `title_offsets[i]` to `title_offsets[i+1]`, and likewise for the URLs.
+    """
+
+    __slots__ = ('indices', 'redirect_indices', 'cluster_ids', 'blob_ids', 'flags',
+                 'titles', 'title_offsets', 'urls', 'url_offsets')
+
+    def __init__(self, indices, redirect_indices, cluster_ids, blob_ids, flags,
+                 titles, title_offsets, urls, url_offsets):
+        self.indices = indices
+        self.redirect_indices = redirect_indices
+        self.cluster_ids = cluster_ids
+        self.blob_ids = blob_ids
+        self.flags = flags
+        self.titles = titles
+        self.title_offsets = title_offsets
+        self.urls = urls
+        self.url_offsets = url_offsets
+
+    def __len__(self):
+        return len(self.indices)
+
+    def title(self, i):
+        return self.titles[self.title_offsets[i]:self.title_offsets[i+1]].decode('utf-8')
+
+    def url(self, i):
+        return self.urls[self.url_offsets[i]:self.url_offsets[i+1]].decode('utf-8')
+
+    def redirect_index(self, i):
+        index = self.redirect_indices[i]
+        return None if index < 0 else index
+
+    def is_linktarget(self, i):
+        return self.flags[i] & LINKTARGET != 0
+
+def scan_articles(articles, namespace, end):
+    """
+    Return the `Dirents` of the articles of `namespace` from an iterator over
+    `Article` objects, up to the index `end` (exclusive).
+    """
+    columns = (array('l'), array('l'), array('l'), array('l'), array('B'))
+    (indices, redirect_indices, cluster_ids, blob_ids, flags) = columns
+    titles = bytearray()
+    title_offsets = array('l', [0])
+    urls = bytearray()
+    url_offsets = array('l', [0])
+    for a in articles:
+        if a.index >= end:
+            break
+        if a.ns != namespace:
+            continue
+        indices.append(a.index)
+        redirect_index = a.redirect_index
+        if redirect_index is not None:
+            redirect_indices.append(redirect_index)
+            flags.append(REDIRECT)
+        else:
+            redirect_indices.append(-1)
+            flags.append(LINKTARGET if a.linktarget else 0)
+        if flags[-1]:
+            cluster_ids.append(0)
+            blob_ids.append(0)
+        else:
+            cluster_ids.append(a.cluster_id)
+            blob_ids.append(a.blob_id)
+        titles.extend(a.title.encode('utf-8'))
+        title_offsets.append(len(titles))
+        urls.extend(a.url.encode('utf-8'))
+        url_offsets.append(len(urls))
+    return Dirents(*(columns + (bytes(titles), title_offsets, bytes(urls), url_offsets)))
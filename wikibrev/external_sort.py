@@ -0,0 +1,72 @@
+"""
+Provides the `ExternalSorter` class, which sorts and de-duplicates more items
+than fit into memory by spilling sorted runs into temporary files.
+"""
+
+import os
+import heapq
+import marshal
+import tempfile
+
+class ExternalSorter(object):
+    """
+    Collects items (tuples of strings) with `add` and yields them sorted and
+    without duplicates when iterated over. When the items held in memory take
+    more than about `max_bytes`, they are sorted and written into a run file
+    in `tmpdir`; the runs are merged at the end.
+    """
+
+    item_overhead = 200 # the approximate size of a tuple of strings, in bytes
+    chunk_size = 1000 # the number of items per record in a run file
+
+    def __init__(self, tmpdir, max_bytes):
+        self.tmpdir = tmpdir
+        self.max_bytes = max_bytes
+        self.items = set()
+        self.size = 0
+        self.runs = []
+
+    def add(self, item):
+        if item not in self.items:
+            self.items.add(item)
+            self.size += self.item_overhead + sum(len(s) for s in item)
+            if self.size > self.max_bytes:
+                self.spill()
+
+    def spill(self):
+        """
+        Write the items held in memory into a new run file.
+        """
+        (fd, path) = tempfile.mkstemp(dir=self.tmpdir, suffix='.run')
+        self.runs.append(path)
+        with os.fdopen(fd, 'wb') as f:
+            items = sorted(self.items)
+            for i in range(0, len(items), self.chunk_size):
+                marshal.dump(items[i:i+self.chunk_size], f)
+        self.items = set()
+        self.size = 0
+
+    def read_run(self, path):
+        with open(path, 'rb') as f:
+            while True:
+                try:
+                    chunk = marshal.load(f)
+                except EOFError:
+                    break
+                for item in chunk:
+                    yield item
+
+    def __iter__(self):
+        try:
+            runs = [self.read_run(path) for path in self.runs]
+            last = None
+            for item in heapq.merge(iter(sorted(self.items)), *runs):
+                if item != last:
+                    yield item
+                    last = item
+        finally:
+            for path in self.runs:
+                os.remove(path)
+            self.runs = []
+            self.items = set()
+            self.size = 0
@@ -10,34 +10,38 @@ import codecs
 import time
 import re
 import urllib
+import struct
+import hashlib
+from bisect import bisect_left
+from array import array
 from collections import deque
+from contextlib import closing
+from itertools import takewhile
+import threading
 import multiprocessing
-import Queue
+from multiprocessing.pool import ThreadPool
 import shutil
 import tempfile
 import sqlite3
 import unzim
+from url_map import UrlMap
+from metrics import metrics, timed_call, init_worker
+from db_writer import DatabaseWriter
+from abbrev_processor import check_abbr, get_abbr, create_abbrev_table
+import markupbase
+import HTMLParser as htmlparser
 from HTMLParser import HTMLParser
 
-class WikiHTMLParser(HTMLParser):
+class WikiLinkHandler(object):
     """
-    An HTML parser that extracts links from a Wikipedia page that are
-    candidates for abbreviation--expansion pairs.
+    The tokenizer-independent part of a link extractor. It keeps track of the
+    open elements and forbidden regions of a Wikipedia page and collects the
+    links that are candidates for abbreviation--expansion pairs. Subclasses
+    feed it through `start_tag`, `end_tag` and `text`.
     """
 
-    t = time.time()
-
-    index = None
-
-    is_link = False
-    link_url = None
-    link_text = ''
-    links = []
-
-    is_paragraph = False
-
-    elem_stack = deque()
-    forb_depth = 0
+    __slots__ = ('index', 'is_link', 'link_url', 'link_text', 'links',
+                 'is_paragraph', 'tag_ids', 'elem_stack', 'depth', 'forb_depth')
 
     re_forbidden_tag = re.compile(r'^(head|script)$')
     re_forbidden_class = re.compile(r'\b(reference|hatnote)\b')
@@ -51,10 +55,33 @@ class WikiHTMLParser(HTMLParser):
     re_html_ext = re.compile(r'\.html?$')
     re_brackets = re.compile(r'\s*\(.*\)\s*')
 
-    def handle_starttag(self, tag, attrs):
-        self.elem_stack.append(tag)
+    def __init__(self):
+        self.index = None
+        self.links = []
+        self.tag_ids = {} # tag name -> small int, kept across pages
+        self.elem_stack = [0] * 64 # tag ids of the open elements
+        self.reset_page()
+
+    def reset_page(self):
+        """
+        Clear the per-page state.
+        """
+        self.is_link = False
+        self.link_url = None
+        self.link_text = ''
+        self.is_paragraph = False
+        self.depth = 0
+        self.forb_depth = 0
+
+    def start_tag(self, tag, attrs):
+        tag_id = self.tag_ids.get(tag)
+        if tag_id is None:
+            tag_id = self.tag_ids[tag] = len(self.tag_ids)
+        if self.depth == len(self.elem_stack):
+            self.elem_stack.extend([0] * self.depth)
+        self.elem_stack[self.depth] = tag_id
+        self.depth += 1
 
-        attrs = dict(attrs)
         classes = []
         if 'class' in attrs:
             classes = attrs['class'].split()
@@ -69,28 +96,40 @@ class WikiHTMLParser(HTMLParser):
         elif tag == 'p':
             self.is_paragraph = True
 
-    def handle_endtag(self, tag):
-        while len(self.elem_stack) > 0:
-            top = self.elem_stack.pop()
-            if self.forb_depth > 0:
-                self.forb_depth -= 1
-            if top == tag:
-                break
+    def end_tag(self, tag):
+        # close the innermost element with this tag, together with all the
+        # elements inside it (or everything if there is no such element);
+        # each closed element leaves one level of a forbidden region
+        tag_id = self.tag_ids.get(tag)
+        depth = self.depth - 1
+        while depth > 0 and self.elem_stack[depth] != tag_id:
+            depth -= 1
+        if depth < 0:
+            depth = 0
+        self.forb_depth = max(0, self.forb_depth - (self.depth - depth))
+        self.depth = depth
 
         if tag == 'a' and self.is_link:
             if not self.link_url.startswith('#'):
-                url = self.link_url.split('/')[-1].split('#')[-1].strip()
-                title = self.re_html_ext.sub('', urllib.unquote(url)).replace('_', ' ') # not necessarily the exact title!
-                
-                if self.check_abbr_triv(self.link_text, title):
-                    self.links += [(self.index, url, self.link_text)]
+                self.add_link(self.link_url, self.link_text)
             self.is_link = False
             self.link_url = None
             self.link_text = ''
         elif tag == 'p':
             self.is_paragraph = False
 
-    def handle_data(self, data):
+    def add_link(self, link_url, text):
+        """
+        Add a link with the given href and text to the links of the page if
+        it is a candidate.
+        """
+        url = link_url.split('/')[-1].split('#')[-1].strip()
+        title = self.re_html_ext.sub('', urllib.unquote(url)).replace('_', ' ') # not necessarily the exact title!
+
+        if self.check_abbr_triv(text, title):
+            self.links += [(self.index, url, text)]
+
+    def text(self, data):
         if self.is_link:
             self.link_text += data.strip()
 
@@ -132,51 +171,591 @@ class WikiHTMLParser(HTMLParser):
     def tokenize(self, txt):
         return re_token.sub(r' \1', txt).strip()
 
+    def finish_page(self):
+        links = self.links
+        self.links = []
+        self.reset_page()
+
+        return {'index': self.index, 'links': links}
+
+
+class WikiHTMLParser(HTMLParser, WikiLinkHandler):
+    """
+    An HTML parser that extracts links from a Wikipedia page that are
+    candidates for abbreviation--expansion pairs.
+    """
+
+    def __init__(self):
+        HTMLParser.__init__(self)
+        WikiLinkHandler.__init__(self)
+
+    def handle_starttag(self, tag, attrs):
+        self.start_tag(tag, dict(attrs))
+
+    def handle_endtag(self, tag):
+        self.end_tag(tag)
+
+    def handle_data(self, data):
+        self.text(data)
+
     def parse_page(self, index, data):
         self.index = index
 
-        self.feed(data)
-        links = self.links
-
-        self.is_link = False
-        self.is_paragraph = False
-        self.links = []
-        self.forb_depth = 0
+        self.feed(page_text(data))
         self.reset()
 
-        return {'index': index, 'links': links}
+        return self.finish_page()
+
 
+class WikiLinkScanner(WikiLinkHandler):
+    """
+    A faster drop-in replacement for `WikiHTMLParser`. The page is tokenized in
+    a single pass using the same regular expressions as `HTMLParser`, so the
+    extracted links are identical, but without position tracking and handler
+    dispatch, and only the `class`, `id` and `href` attributes are kept.
+    Text is only collected inside links.
+    """
 
-def thread_init():
-    global parser
-    parser = WikiHTMLParser()
+    __slots__ = ()
 
-def process_article(index, data, result_q):
+    cdata_elements = ('script', 'style')
+    kept_attrs = ('class', 'id', 'href')
+
+    re_interesting = htmlparser.interesting_normal
+    re_cdata_end = dict((tag, re.compile(r'</\s*%s\s*>' % tag, re.I)) for tag in cdata_elements)
+
+    decl_parser = HTMLParser() # used to skip the rare <!...> declarations
+
+    def parse_page(self, index, data):
+        self.index = index
+
+        self.scan(page_text(data))
+
+        return self.finish_page()
+
+    def scan(self, data):
+        """
+        Tokenize `data` and feed the tags and text to the handler. Like
+        `HTMLParser.feed` (without `close`), this stops at constructs that are
+        incomplete at the end of the page.
+        """
+        i = 0
+        n = len(data)
+        cdata_end = None
+        while i < n:
+            if cdata_end is not None:
+                match = cdata_end.search(data, i)
+                if not match:
+                    break
+                j = match.start()
+            else:
+                match = self.re_interesting.search(data, i)
+                j = match.start() if match else n
+            if i < j and self.is_link:
+                self.text(data[i:j])
+            i = j
+            if i == n:
+                break
+
+            if data.startswith('<', i):
+                if htmlparser.starttagopen.match(data, i):
+                    (k, tag) = self.scan_starttag(data, i)
+                    if tag in self.cdata_elements:
+                        cdata_end = self.re_cdata_end[tag]
+                elif data.startswith('</', i):
+                    (k, tag) = self.scan_endtag(data, i, cdata_end is not None)
+                    if tag is not None:
+                        cdata_end = None
+                elif data.startswith('<!--', i):
+                    match = markupbase._commentclose.search(data, i+4)
+                    k = match.end() if match else -1
+                elif data.startswith('<?', i):
+                    match = htmlparser.piclose.search(data, i+2)
+                    k = match.end() if match else -1
+                elif data.startswith('<!', i):
+                    self.decl_parser.rawdata = data
+                    k = self.decl_parser.parse_html_declaration(i)
+                elif i + 1 < n:
+                    self.text('<')
+                    k = i + 1
+                else:
+                    break
+                if k < 0:
+                    break
+                i = k
+            elif data.startswith('&#', i):
+                match = htmlparser.charref.match(data, i)
+                if not match:
+                    break
+                i = match.end()
+                if data[i-1] != ';':
+                    i -= 1
+            else:
+                match = htmlparser.entityref.match(data, i)
+                if match:
+                    i = match.end()
+                    if data[i-1] != ';':
+                        i -= 1
+                elif htmlparser.incomplete.match(data, i) or i + 1 == n:
+                    break
+                else:
+                    self.text('&')
+                    i += 1
+
+    def scan_starttag(self, data, i):
+        """
+        Scan a start tag at position `i`. Return the position after the tag
+        (or -1 if it is incomplete) and the name of the tag if it opened an
+        element with CDATA content.
+        """
+        match = htmlparser.locatestarttagend.match(data, i)
+        j = match.end()
+        next = data[j:j+1]
+        if next == '>':
+            endpos = j + 1
+        elif next == '/':
+            if not data.startswith('/>', j):
+                return (-1, None)
+            endpos = j + 2
+        elif next == '' or next in 'abcdefghijklmnopqrstuvwxyz=/ABCDEFGHIJKLMNOPQRSTUVWXYZ':
+            return (-1, None)
+        elif j > i:
+            endpos = j
+        else:
+            endpos = i + 1
+
+        match = htmlparser.tagfind.match(data, i+1)
+        k = match.end()
+        tag = match.group(1).lower()
+
+        attrs = {}
+        while k < endpos:
+            match = htmlparser.attrfind.match(data, k)
+            if not match:
+                break
+            k = match.end()
+            name = match.group(1).lower()
+            if name not in self.kept_attrs:
+                continue
+            (rest, value) = match.group(2, 3)
+            if not rest:
+                value = None
+            elif value[:1] == '\'' == value[-1:] or value[:1] == '"' == value[-1:]:
+                value = value[1:-1]
+            if value and '&' in value:
+                value = self.decl_parser.unescape(value)
+            attrs[name] = value
+
+        end = data[k:endpos].strip()
+        if end != '>' and end != '/>':
+            # not a well-formed tag, HTMLParser treats it as text
+            self.text(data[i:endpos])
+            return (endpos, None)
+        self.start_tag(tag, attrs)
+        if end.endswith('/>'):
+            self.end_tag(tag)
+            return (endpos, None)
+        return (endpos, tag)
+
+    def scan_endtag(self, data, i, in_cdata):
+        """
+        Scan an end tag at position `i`. Return the position after the tag (or
+        -1 if it is incomplete) and the name of the closed element, if any.
+        """
+        gtpos = data.find('>', i+1)
+        if gtpos < 0:
+            return (-1, None)
+        gtpos += 1
+        match = htmlparser.endtagfind.match(data, i)
+        if not match:
+            if in_cdata:
+                self.text(data[i:gtpos])
+                return (gtpos, None)
+            match = htmlparser.tagfind.match(data, i+2)
+            if not match:
+                if data.startswith('</>', i):
+                    return (i+3, None)
+                # bogus comment
+                pos = data.find('>', i+2)
+                return (pos + 1 if pos >= 0 else -1, None)
+            tag = match.group(1).lower()
+            self.end_tag(tag)
+            return (data.find('>', match.end()) + 1, None)
+
+        tag = match.group(1).lower()
+        if in_cdata and tag not in self.cdata_elements:
+            self.text(data[i:gtpos])
+            return (gtpos, None)
+        self.end_tag(tag)
+        return (gtpos, tag)
+
+
+class CompiledLinkScanner(WikiLinkScanner):
+    """
+    `WikiLinkScanner` with the tokenizer compiled (see `_linkscan`). The page
+    is scanned without the GIL, so that worker threads scan pages in
+    parallel, and UTF-8 encoded pages are not decoded; only the links found
+    are decoded and checked in Python. The few pages that
+    the compiled tokenizer leaves to `WikiLinkScanner` are scanned by it.
+    """
+
+    __slots__ = ()
+
+    def parse_page(self, index, data):
+        self.index = index
+
+        links = scan_links(data)
+        if links is None:
+            self.scan(page_text(data))
+        else:
+            for (url, text) in links:
+                self.add_link(url, text)
+
+        return self.finish_page()
+
+
+def page_text(data):
+    """
+    Return the data of a page, which may be a unicode string or UTF-8 encoded
+    bytes or a buffer of them (see `unzim.File.blob_view`), as a unicode
+    string.
+    """
+    if isinstance(data, unicode):
+        return data
+    return codecs.utf_8_decode(data, 'strict', True)[0]
+
+# link extraction engines selectable in `extract_links`
+engines = {
+    'htmlparser': WikiHTMLParser,
+    'scanner': WikiLinkScanner,
+}
+
+# the compiled engine, if the extension is built
+try:
+    from _linkscan import scan_links
+    engines['compiled'] = CompiledLinkScanner
+except ImportError:
+    pass
+
+# the kinds of worker pools selectable in `extract_links`
+worker_kinds = ('processes', 'threads')
+
+# the parser and the ZIM file of a worker; the rest of the worker state is
+# shared by the threads of a thread pool
+local = threading.local()
+
+def thread_init(engine, url_map, zim_path, old_map=None, new_urls=None, aggregate=False):
+    global urls, old_pages, added_urls, aggregate_links
+    init_worker()
+    local.parser = engines[engine]()
+    urls = url_map
+    local.zim_file = unzim.File(zim_path)
+    old_pages = old_map
+    added_urls = new_urls
+    aggregate_links = aggregate
+
+def make_pool(workers, n_threads, initializer, initargs):
+    """
+    Return a pool of `n_threads` worker processes or, if `workers` is
+    'threads', worker threads. The threads share the memory of the main
+    process, so the maps and the article data are neither copied nor
+    pickled, but only the work that releases the GIL (reading blobs from a
+    ZIM file and scanning pages with the `compiled` engine) runs in parallel.
+    Each worker opens its own ZIM file, as zimlib caches clusters without
+    locking.
+    """
+    if workers == 'threads':
+        return ThreadPool(n_threads, initializer, initargs)
+    return multiprocessing.Pool(n_threads, initializer=initializer, initargs=initargs)
+
+def content_hash(data):
+    """
+    Return a 64-bit hash of the data of an article (see `page_text`), as a
+    signed integer for SQLite.
+    """
+    if isinstance(data, unicode):
+        data = data.encode('utf-8')
+    return struct.unpack(b'<q', hashlib.md5(data).digest()[:8])[0]
+
+def resolve_links(links, resolved):
+    """
+    Look up the targets of (index, url, text) links and append the ones that
+    exist to `resolved` as (index, target index, url, text).
+    """
+    for (index, url, text) in links:
+        tgt_index = urls.get(url, zim_file=local.zim_file)
+        if tgt_index is not None:
+            resolved.append((index, tgt_index, url, text))
+
+def count_links(links):
+    """
+    Aggregate (index, target index, url, text) links into (target index, url,
+    text, count) tuples, where `count` is the number of articles with the
+    link.
+    """
+    counts = {}
+    for link in set(links):
+        key = link[1:]
+        counts[key] = counts.get(key, 0) + 1
+    return [link + (n,) for (link, n) in sorted(counts.iteritems())]
+
+def process_batch(batch):
+    """
+    Parse a batch of (index, data) pairs and return the list of resolved links
+    found in all of them (aggregated by `count_links` when aggregating) and
+    the list of (index, content hash) pairs (empty when aggregating, as the
+    hashes are only used by `update_links`).
+    """
     try:
-        result_q.put(parser.parse_page(index, data))
+        links = []
+        hashes = []
+        for (index, data) in batch:
+            resolve_links(local.parser.parse_page(index, data)['links'], links)
+            if not aggregate_links:
+                hashes.append((index, content_hash(data)))
+        if aggregate_links:
+            links = count_links(links)
+        return (links, hashes)
     except:
         print >>sys.stderr, "Error during parsing:", sys.exc_info()
-        result_q.put(None)
         raise
 
-def extract_links(zim_path, db_path, n_threads):
+def process_blob_batch(batch):
     """
-    Extract articles and links from a ZIM dump and store them in a database.
-    To limit the size of the database, only "promising" links are preserved.
+    Read the data for a batch of (index, cluster_id, blob_id) triples from the
+    worker's own copy of the ZIM file and process it like `process_batch`.
     """
+    return process_batch([(index, local.zim_file.blob_view(cluster_id, blob_id))
+                          for (index, cluster_id, blob_id) in batch])
 
-    dump = unzim.File(zim_path).articles()
+# an href attribute, as matched by HTMLParser
+re_href = re.compile(r'href\s*=+\s*(\'[^\']*\'|"[^"]*"|[^>\s]*)', re.IGNORECASE)
+html_unescape = HTMLParser().unescape
 
-    dbconn = sqlite3.connect(db_path)
-    db = dbconn.cursor()
+def links_to_added_url(data):
+    """
+    Return True if the page `data` might contain a link to one of
+    `added_urls`, i.e. if any href attribute in it points there.
+    """
+    for value in re_href.findall(data):
+        if value[:1] in ('"', "'"):
+            value = value[1:-1]
+        if '&' in value:
+            value = html_unescape(value)
+        if value.split('/')[-1].split('#')[-1].strip() in added_urls:
+            return True
+    return False
+
+def find_old_page(index):
+    """
+    Return the index and the content hash of the article in the old database
+    with the same URL as the article `index`, or (None, None).
+    """
+    (new_indices, old_indices, hashes) = old_pages
+    i = bisect_left(new_indices, index)
+    if i < len(new_indices) and new_indices[i] == index:
+        return (old_indices[i], hashes[i])
+    return (None, None)
+
+def update_batch(batch):
+    """
+    Process a batch of (index, data) pairs for `update_links` and return a list
+    of (index, content hash, links, old index) tuples. Only the articles that
+    changed or might link to a new URL are parsed; for the others, `links` is
+    None and their links are to be copied from the old article.
+    """
+    try:
+        pages = []
+        for (index, data) in batch:
+            h = content_hash(data)
+            (old_index, old_hash) = find_old_page(index)
+            if h == old_hash and not links_to_added_url(page_text(data)):
+                pages.append((index, h, None, old_index))
+            else:
+                links = []
+                resolve_links(local.parser.parse_page(index, data)['links'], links)
+                pages.append((index, h, links, old_index))
+        return pages
+    except:
+        print >>sys.stderr, "Error during parsing:", sys.exc_info()
+        raise
+
+def update_blob_batch(batch):
+    """
+    Like `update_batch`, but for a batch of (index, cluster_id, blob_id)
+    triples.
+    """
+    return update_batch([(index, local.zim_file.blob_view(cluster_id, blob_id))
+                         for (index, cluster_id, blob_id) in batch])
 
+def process_redirect_batch(batch):
+    """
+    Check the titles of a batch of redirects, given by their indices, against
+    the titles of their targets, which are looked up in the worker's copy of
+    the ZIM file, and return the (index, target index, abbr, exp) records of
+    the abbreviations found.
+    """
     try:
-        db.execute("""create table article (id integer primary key,
-                                            title text not null unique,
-                                            url text not null unique,
-                                            redirect_id integer,
-                                            linktarget integer)""")
-        db.execute('create index article_redirect_id on article(redirect_id)')
+        abbrevs = []
+        for index in batch:
+            a = local.zim_file.article(index)
+            target = a.redirect_article
+            if target is not None and check_abbr(a.title, target.title):
+                abbrevs.append((index, target.index) + get_abbr(a.title, target.title, index)[1:])
+        return abbrevs
+    except:
+        print >>sys.stderr, "Error while checking redirects:", sys.exc_info()
+        raise
+
+def redirect_batches(redirects, batch_size):
+    """
+    Yield the indices of the redirects in `redirects` in batches of
+    `batch_size`.
+    """
+    for start in xrange(0, len(redirects), batch_size):
+        yield redirects[start:start + batch_size]
+
+def read_articles(chunks, writer, article_table, counts, keep_blob_ids, url_map=None, checkpoint=False,
+                  index_range=None, batch_size=500, redirects=None):
+    """
+    Insert the articles from the `Dirents` chunks of a ZIM dump (see
+    `unzim.scan`) into `article_table` through a `DatabaseWriter`, in batches
+    of `batch_size`, and return a `UrlMap` of the inserted articles (added to
+    `url_map`, if given). If `keep_blob_ids` is True, also return a list of
+    packed (cluster_id, blob_id, index) keys of the articles to be parsed. If
+    `checkpoint` is True, the progress is saved with every commit (the writer
+    must have been created with `checkpoint_sql`).
+
+    If `index_range` is a (first, end) pair, only the articles with indices in
+    that range are inserted (and parsed), but all are added to the map. The
+    indices of the redirects inserted are appended to `redirects`, if given.
+    """
+    article_sql = 'insert into %s (id, title, url, redirect_id, linktarget) values (?,?,?,?,?)' % article_table
+    if url_map is None:
+        url_map = UrlMap()
+    keys = [] # packed (cluster_id, blob_id, index), to sort with little memory
+    rows = []
+    metrics.start('read_articles')
+    for d in chunks:
+        metrics.count('read', len(d))
+        for i in xrange(len(d)):
+            index = d.indices[i]
+            url = d.url(i).split('/')[-1]
+            url_map.add(url, index)
+            if index_range is not None and not index_range[0] <= index < index_range[1]:
+                continue
+            redirect_index = d.redirect_index(i)
+            linktarget = d.is_linktarget(i)
+            rows.append((index, d.title(i), url, redirect_index, linktarget))
+            if len(rows) >= batch_size:
+                writer.insert_each(article_sql, rows, ('articles', index) if checkpoint else None)
+                rows = []
+
+            if redirect_index is not None:
+                counts['redirects'] += 1
+                if redirects is not None:
+                    redirects.append(index)
+            else:
+                counts['articles'] += 1
+                if keep_blob_ids and not linktarget:
+                    keys.append((d.cluster_ids[i] << 64) | (d.blob_ids[i] << 32) | index)
+        metrics.report()
+    writer.insert_each(article_sql, rows, ('redirects', -1) if checkpoint else None)
+    writer.flush()
+
+    url_map.freeze()
+    # the articles with a duplicate URL or title are not in the table
+    for ((index, title, url, redirect_index, linktarget), error) in writer.rejected:
+        print >>sys.stderr, 'Integrity error:', error + ';', 'article', (index, title, url), 'not inserted!'
+        url_map.remove(url, index)
+    del writer.rejected[:]
+    metrics.finish(articles=counts['articles'], redirects=counts['redirects'])
+
+    return (url_map, keys)
+
+def read_blob_keys(chunks):
+    """
+    Return the keys that `read_articles` would return for the articles from
+    the `Dirents` chunks of a ZIM dump, without touching the database.
+    """
+    keys = []
+    for d in chunks:
+        for i in xrange(len(d)):
+            if d.flags[i] == 0: # neither a redirect nor a link target
+                keys.append((d.cluster_ids[i] << 64) | (d.blob_ids[i] << 32) | d.indices[i])
+    return keys
+
+def page_batches(dump, batch_size, copy=True):
+    """
+    Yield batches of (index, data) pairs of the articles from a ZIM dump that
+    are to be parsed. The data is UTF-8 encoded, so that it is neither decoded
+    in the main process nor encoded again to be sent to the workers. If `copy`
+    is True, it is copied from the memoryviews of the articles (see
+    `unzim.File.blob_view`) into strings, which can be pickled for worker
+    processes; worker threads take the views themselves.
+    """
+    batch = []
+    for a in dump:
+        if a.ns == 'A' and a.redirect_index is None: # and not a.linktarget:
+            batch.append((a.index, a.data_view.tobytes() if copy else a.data_view))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+def blob_batches(keys, batch_size):
+    """
+    Yield batches of (index, cluster_id, blob_id) triples from a list of keys
+    returned by `read_articles`. The batches are ordered by cluster and only
+    end at a cluster boundary, so that each cluster gets decompressed by only
+    one worker.
+    """
+    keys.sort()
+    batch = []
+    last_cluster_id = None
+    for key in keys:
+        cluster_id = key >> 64
+        if len(batch) >= batch_size and cluster_id != last_cluster_id:
+            yield batch
+            batch = []
+        batch.append((key & 0xffffffff, cluster_id, (key >> 32) & 0xffffffff))
+        last_cluster_id = cluster_id
+    if batch:
+        yield batch
+
+def track_batches(batches, positions, field):
+    """
+    Yield `batches` and append the `field`-th element of the last item of
+    each batch to `positions`.
+    """
+    for batch in batches:
+        positions.append(batch[-1][field])
+        yield batch
+
+# the page cache size used when bulk loading, in KiB
+bulk_cache_size = 1024 * 1024
+
+def create_tables(db, aggregate=False):
+    """
+    Create the `article` table and the `link` table or, if `aggregate` is
+    True, the `link_count` table, which holds the number of articles that
+    link to each target with each text; without secondary indexes.
+    """
+    db.execute("""create table article (id integer primary key,
+                                        title text not null unique,
+                                        url text not null unique,
+                                        redirect_id integer,
+                                        linktarget integer,
+                                        hash integer)""")
+    if aggregate:
+        db.execute("""create table link_count (tgt_id integer,
+                                               tgt_url text not null,
+                                               text text not null,
+                                               count integer not null,
+                                               foreign key (tgt_id) references article(id),
+                                               unique(tgt_url, text))""")
+    else:
         db.execute("""create table link (article_id integer not null,
                                          tgt_id integer,
                                          tgt_url text not null,
@@ -184,90 +763,740 @@ def extract_links(zim_path, db_path, n_threads):
                                          foreign key (article_id) references article(id),
                                          foreign key (tgt_id) references article(id),
                                          unique(article_id, tgt_url, text))""")
+
+def create_indexes(db, aggregate=False):
+    """
+    Create the secondary indexes on the tables made by `create_tables`.
+    """
+    db.execute('create index article_redirect_id on article(redirect_id)')
+    if aggregate:
+        db.execute('create index link_count_tgt_id on link_count(tgt_id)')
+        db.execute('create index link_count_text on link_count(text)')
+    else:
         db.execute('create index link_tgt_id on link(tgt_id)')
         db.execute('create index link_text on link(text)')
 
-        t = time.time()
+# adds the count of a (target index, url, text, count) row to the `link_count`
+# table; without upsert (before SQLite 3.24), the row is replaced, keeping its rowid
+if sqlite3.sqlite_version_info >= (3, 24, 0):
+    count_sql = """insert into link_count values (?1, ?2, ?3, ?4)
+                   on conflict (tgt_url, text) do update set count = count + excluded.count"""
+else:
+    count_sql = """insert or replace into link_count (rowid, tgt_id, tgt_url, text, count)
+                   select L.rowid, ?1, ?2, ?3, ?4 + coalesce(L.count, 0)
+                   from (select 1) left join link_count L on L.tgt_url = ?2 and L.text = ?3"""
 
-        print >>sys.stderr, "Reading and processing articles"
-        pool = multiprocessing.Pool(n_threads, initializer=thread_init, maxtasksperchild=1000)
-        mgr = multiprocessing.Manager()
-        result_q = mgr.Queue()
+def flush_link_counts(writer, sql, link_counts, checkpoint):
+    """
+    Queue the counts of a (target index, url, text) -> count map to be added
+    to the database with `sql` and clear the map. `checkpoint` is the
+    checkpoint of the last batch counted in it.
+    """
+    writer.insert(sql, [key + (n,) for (key, n) in sorted(link_counts.iteritems())], checkpoint)
+    link_counts.clear()
 
-        max_in_queue = 1000
+def table_exists(db, table):
+    return db.execute("select count(*) from sqlite_master where type='table' and name=?", (table,)).fetchone()[0] > 0
 
-        n_read = 0
-        n_done = 0
-        n_redirs = 0
-        n_links = 0
-        done_reading = False
-        while not done_reading or n_done < n_read:
-            if not done_reading and (n_read - n_done) < max_in_queue:
-                try:
-                    a = dump.next()
-                    if a.ns == 'A':
-                        if a.redirect_index is not None:
-                            n_redirs += 1
-                        try:
-                            db.execute('insert into article values (?,?,?,?,?)', (a.index, a.title, a.long_url.split('/')[-1], a.redirect_index, a.linktarget))
-                        except sqlite3.IntegrityError as e:
-                            print >>sys.stderr, 'Integrity error:', unicode(e) + ';', 'article', (a.index, a.title, a.long_url), 'not inserted!'
-
-                        if a.redirect_index is None: # and not a.linktarget:
-                            pool.apply_async(process_article, args=(a.index, a.data, result_q))
-                            n_read += 1
-
-                            if n_read % 500 == 0:
-                                dbconn.commit()
-                except StopIteration:
-                    done_reading = True
-                    print >>sys.stderr, "Finished reading articles"
-
-            try:
-                while n_done < n_read:
-                    r = result_q.get(False)
-                    db.executemany('insert or ignore into link values (?,null,?,?)', r['links'])
-                    
-                    n_links += db.rowcount
-
-                    n_done += 1
-                    if n_done % 2000 == 0:
-                        dbconn.commit()
-                    if n_done % 2000 == 0:
-                        print >>sys.stderr, n_done, 'done'
-                        print >>sys.stderr, 'speed:', n_done/(time.time()-t), 'per second'
-                        print >>sys.stderr, 'time per article:', (time.time()-t)/n_done
-                        sys.stdout.flush()
-            except Queue.Empty:
-                if done_reading:
-                    time.sleep(0.01)
+def create_checkpoint(db):
+    """
+    Create the table that holds the progress of an extraction: the phase
+    ('articles', 'redirects' or 'links') and the position up to which it is
+    complete (the index of the last article read, redirect checked or article
+    parsed, or the last cluster parsed when reading the clusters directly).
+    """
+    db.execute("""create table extract_checkpoint (id integer primary key check (id = 0),
+                                                   phase text not null,
+                                                   position integer not null)""")
+
+# saves the (phase, position) of an extraction
+checkpoint_sql = 'insert or replace into extract_checkpoint values (0, ?, ?)'
+
+def load_checkpoint(db):
+    """
+    Return the (phase, position) saved in a database, or None if there is no
+    unfinished extraction in it.
+    """
+    if not table_exists(db, 'extract_checkpoint'):
+        return None
+    row = db.execute('select phase, position from extract_checkpoint').fetchone()
+    if row is None: # interrupted before the first commit
+        return ('articles', -1)
+    return row
+
+def set_bulk_pragmas(db, schema):
+    """
+    Switch off journaling and syncing for a database and enlarge its cache.
+    """
+    db.execute('pragma %s.journal_mode = off' % schema)
+    db.execute('pragma %s.synchronous = off' % schema)
+    db.execute('pragma %s.cache_size = %d' % (schema, -bulk_cache_size))
+
+def create_staging_tables(db, staging_path, aggregate=False):
+    """
+    Attach a staging database with unindexed `article` and `link` (or
+    `link_count`) tables and a `redirect_abbrev` table for the abbreviations
+    of the redirects (with the indices of their targets) for bulk loading and
+    switch off journaling and syncing.
+    """
+    if os.path.exists(staging_path):
+        os.remove(staging_path)
+    db.execute('attach database ? as staging', (staging_path,))
+    for schema in ['main', 'staging']:
+        set_bulk_pragmas(db, schema)
+    db.execute("""create table staging.article (id integer,
+                                                title text,
+                                                url text,
+                                                redirect_id integer,
+                                                linktarget integer)""")
+    if aggregate:
+        db.execute("""create table staging.link_count (tgt_id integer,
+                                                       tgt_url text,
+                                                       text text,
+                                                       count integer)""")
+    else:
+        db.execute("""create table staging.link (article_id integer,
+                                                 tgt_id integer,
+                                                 tgt_url text,
+                                                 text text)""")
+    db.execute("""create table staging.hash (id integer,
+                                             hash integer)""")
+    db.execute("""create table staging.redirect_abbrev (article_id integer,
+                                                        tgt_id integer,
+                                                        abbr text,
+                                                        exp text)""")
+
+def build_from_staging(dbconn, staging_paths, aggregate=False, redirects=False):
+    """
+    Fill the final tables from the staging tables in the databases
+    `staging_paths`, dropping duplicates (or adding up the counts of the
+    links if `aggregate` is True), and create the indexes. The staging
+    databases are attached one at a time, so their articles must be in
+    ascending order across the list.
 
+    If `redirects` is True, the abbreviations of the redirects are staged too
+    and go into the `abbrev` table, for `make_abbrevs` to add those of the
+    links.
+    """
+    db = dbconn.cursor()
+    t = time.time()
 
+    print >>sys.stderr, "Building article table"
+    metrics.start('build_articles')
+    create_tables(db, aggregate)
+    n_articles = 0
+    n_staged = 0
+    for path in staging_paths:
+        db.execute('attach database ? as staging', (path,))
+        db.execute("""insert or ignore into article select A.*, H.hash
+                      from staging.article A left join staging.hash H on H.id = A.id
+                      order by A.rowid""")
+        n_articles += db.rowcount
+        n_staged += db.execute('select count(*) from staging.article').fetchone()[0]
         dbconn.commit()
+        db.execute('detach database staging')
 
-        print >>sys.stderr, 'Processed', n_read, 'articles'
-        print >>sys.stderr, n_links, 'links'
-        print >>sys.stderr, n_redirs, 'redirects'
+    metrics.finish(articles=n_articles, staged_articles=n_staged)
+    print >>sys.stderr, 'Inserted', n_articles, 'articles'
+    if n_staged > n_articles:
+        print >>sys.stderr, 'Integrity error:', n_staged - n_articles, 'articles not inserted!'
+    print >>sys.stderr, 'Took', time.time()-t, 's'
+    t = time.time()
+
+    if redirects:
+        print >>sys.stderr
+        print >>sys.stderr, "Building abbrev table"
+        metrics.start('build_abbrevs')
+        create_abbrev_table(db)
+        db.execute('create table abbrev_links_pending (id integer)')
+        n_abbrevs = 0
+        for path in staging_paths:
+            db.execute('attach database ? as staging', (path,))
+            # both the redirect and its target must have been inserted
+            db.execute("""insert or ignore into abbrev select S.article_id, S.abbr, S.exp, 1
+                          from staging.redirect_abbrev S join article A on A.id = S.article_id
+                          join article R on R.id = S.tgt_id
+                          order by S.article_id""")
+            n_abbrevs += db.rowcount
+            dbconn.commit()
+            db.execute('detach database staging')
+        metrics.finish(abbrevs=n_abbrevs)
+        print >>sys.stderr, 'Inserted', n_abbrevs, 'abbrevs of redirects'
         print >>sys.stderr, 'Took', time.time()-t, 's'
         t = time.time()
 
-        print >>sys.stderr
-        print >>sys.stderr, "Resolving links"
-        
-        db.execute('update link set tgt_id = (select id from article where url = link.tgt_url)')
+    print >>sys.stderr
+    print >>sys.stderr, "Building link table"
+
+    # the links are resolved again against the inserted articles: the staged
+    # target of a URL may be a duplicate that was not inserted
+    metrics.start('build_links')
+    n_links = 0
+    for path in staging_paths:
+        db.execute('attach database ? as staging', (path,))
+        if aggregate:
+            db.execute("""insert or replace into link_count (rowid, tgt_id, tgt_url, text, count)
+                          select L.rowid, A.id, S.tgt_url, S.text, S.count + coalesce(L.count, 0)
+                          from (select tgt_url, text, sum(count) as count from staging.link_count
+                                group by tgt_url, text) S
+                          join article A on A.url = S.tgt_url
+                          left join link_count L on L.tgt_url = S.tgt_url and L.text = S.text
+                          order by S.tgt_url, S.text""")
+        else:
+            db.execute("""insert or ignore into link select distinct L.article_id, A.id, L.tgt_url, L.text
+                          from staging.link L join article A on A.url = L.tgt_url
+                          order by L.article_id, L.tgt_url, L.text""")
+            n_links += db.rowcount
         dbconn.commit()
+        db.execute('detach database staging')
+    if aggregate:
+        n_links = db.execute('select count(*) from link_count').fetchone()[0]
+
+    metrics.finish(links=n_links)
+    print >>sys.stderr, 'Inserted', n_links, 'distinct links'
+    print >>sys.stderr, 'Took', time.time()-t, 's'
+    t = time.time()
+
+    print >>sys.stderr
+    print >>sys.stderr, "Creating indexes"
+
+    metrics.start('build_indexes')
+    create_indexes(db, aggregate)
+    dbconn.commit()
+    metrics.finish()
+
+    print >>sys.stderr, 'Took', time.time()-t, 's'
+
+def merge_shards(db_path, shard_paths):
+    """
+    Build a database like `extract_links` from the shard databases made by
+    `extract_links` with `shard`. Return False if the shards are not a
+    complete set.
+    """
+    shards = []
+    for path in shard_paths:
+        with closing(sqlite3.connect(path)) as shard_conn:
+            (number, count) = shard_conn.execute('select number, count from shard').fetchone()
+            aggregate = table_exists(shard_conn, 'link_count')
+            redirects = table_exists(shard_conn, 'redirect_abbrev')
+        shards.append((number, count, path, aggregate, redirects))
+    shards.sort()
+    if [shard[:2] for shard in shards] != [(k, len(shards)) for k in range(1, len(shards) + 1)]:
+        print >>sys.stderr, 'The shards are not a complete set:', ', '.join('%d/%d' % shard[:2] for shard in shards)
+        return False
+    if len(set(shard[3] for shard in shards)) > 1:
+        print >>sys.stderr, 'Some of the shards have aggregated links and some do not'
+        return False
+
+    with closing(sqlite3.connect(db_path)) as dbconn:
+        set_bulk_pragmas(dbconn.cursor(), 'main')
+        # shards made before the redirects were checked during the extraction
+        # leave them to `make_abbrevs`
+        build_from_staging(dbconn, [shard[2] for shard in shards], shards[0][3], all(shard[4] for shard in shards))
+    return True
+
+def imap_bounded(pool, func, batches, n_workers, max_bytes=None, sizeof=None):
+    """
+    Apply `func` to each of `batches` in `pool` (of `n_workers` workers) and
+    yield (batch size, result) pairs in order. Unlike `pool.imap`, `batches`
+    is consumed lazily in the calling thread, with a bounded amount of work in
+    flight: a window of batches and, if `max_bytes` is given, at most that
+    many bytes of batches as measured by `sizeof` (but always at least one
+    batch).
+
+    The window starts at two batches per worker and adapts: it doubles when
+    the workers have finished everything after a batch that is still being
+    processed, and shrinks by one, down to a batch per worker, when they have
+    finished everything before the caller asks for the next result. With a
+    byte budget, only the budget limits its growth; without one (when the
+    batches are small, e.g. the keys of blobs that the workers read
+    themselves), it grows to at most 8 times its initial size.
+
+    The number of items sent (`read`) and received (`done`), the items and
+    bytes in flight, the time spent reading the batches and waiting for the
+    results, the time the workers spent on the batches (`worker`) and the
+    number of times the caller waited for the workers (`worker_stalls`) or the
+    workers for the caller (`writer_stalls`) are added to the metrics.
+    """
+    window = 2 * n_workers
+    min_window = n_workers
+    if max_bytes is None or sizeof is None:
+        max_window = 8 * window
+    else:
+        max_window = None
+    pending = deque() # (batch size, bytes, result)
+    in_flight = 0
+    in_flight_bytes = 0
+    batches = iter(batches)
+    while True:
+        with metrics.timer('read_batch'):
+            batch = next(batches, None)
+        if batch is None:
+            break
+        size = sizeof(batch) if sizeof is not None else 0
+        while pending and (len(pending) >= window or
+                           (max_bytes is not None and in_flight_bytes + size > max_bytes)):
+            (n, n_bytes, result) = pending.popleft()
+            newest_ready = not pending or pending[-1][2].ready()
+            if not result.ready():
+                metrics.count('worker_stalls')
+                if newest_ready:
+                    # the workers are idle behind a slow batch
+                    window = 2 * window if max_window is None else min(max_window, 2 * window)
+            elif newest_ready:
+                # the workers are idle until more results are taken
+                metrics.count('writer_stalls')
+                window = max(min_window, window - 1)
+            in_flight -= n
+            in_flight_bytes -= n_bytes
+            yield (n, get_timed_result(n, result))
+        pending.append((len(batch), size, pool.apply_async(timed_call, (func, batch))))
+        in_flight += len(batch)
+        in_flight_bytes += size
+        metrics.count('read', len(batch))
+        metrics.gauge('in_flight', in_flight)
+        metrics.gauge('in_flight_bytes', in_flight_bytes)
+        metrics.gauge('window', window)
+    while pending:
+        (n, n_bytes, result) = pending.popleft()
+        in_flight -= n
+        in_flight_bytes -= n_bytes
+        metrics.gauge('in_flight', in_flight)
+        metrics.gauge('in_flight_bytes', in_flight_bytes)
+        yield (n, get_timed_result(n, result))
+
+def page_batch_bytes(batch):
+    """
+    Return the size of a batch of (index, data) pairs: the number of bytes
+    of the UTF-8 encoded data.
+    """
+    return sum(len(data) for (index, data) in batch)
+
+def get_timed_result(n, result):
+    """
+    Wait for the result of `timed_call` for a batch of `n` items and return
+    the result of the call.
+    """
+    with metrics.timer('wait'):
+        (seconds, value) = result.get()
+    metrics.add_time('worker', seconds)
+    metrics.count('done', n)
+    return value
+
+def report_pool(n_threads):
+    """
+    Add the utilization of the `n_threads` pool workers to the metrics and
+    report them.
+    """
+    metrics.gauge('worker_utilization', metrics.total_time('worker') / (metrics.elapsed() * n_threads))
+    metrics.report()
+
+def print_stalls():
+    """
+    Print how often the main process waited for the workers and vice versa
+    in the current stage, as counted by `imap_bounded`.
+    """
+    print >>sys.stderr, 'Waited for the workers', metrics.counters.get('worker_stalls', 0), 'times;', \
+        'the workers waited for the main process', metrics.counters.get('writer_stalls', 0), 'times'
 
-        print >>sys.stderr, 'Resolved', db.rowcount, 'links'
+def extract_links(zim_path, db_path, n_threads, batch_size=50, direct_read=False, engine='htmlparser',
+                  bulk_load=False, resume=False, shard=None, max_inflight_mb=256, commit_rows=100000,
+                  commit_seconds=10.0, workers='processes', aggregate=False, redirects_only=False):
+    """
+    Extract articles and links from a ZIM dump and store them in a database.
+    To limit the size of the database, only "promising" links are preserved.
+
+    The articles are read first and their URLs are kept in memory, so that the
+    workers can resolve the link targets and drop the links that lead nowhere.
+    Before the links, the workers check the titles of the redirects against
+    those of their targets and the abbreviations found are put into the
+    `abbrev` table, which `make_abbrevs` completes with those of the links.
+    If `redirects_only` is True, no articles are parsed.
+
+    Articles are sent to the workers in batches of `batch_size`. If
+    `direct_read` is True, the workers read the article data from the ZIM file
+    themselves instead of receiving it from the main process. `engine` is the
+    name of the link extraction engine to use (one of `engines`). `workers`
+    selects a pool of `n_threads` worker processes or threads (see
+    `make_pool`).
+
+    If `bulk_load` is True, the articles and links are first written without
+    any journaling into unindexed staging tables in a separate database file
+    next to `db_path`; the final tables and indexes are built from them at the
+    end.
+
+    Otherwise, the progress is saved in the database with every commit and
+    the checkpoint is removed at the end. If `resume` is True and `db_path`
+    holds an interrupted extraction, it is continued from the last checkpoint
+    (with the same `direct_read` setting); the result is the same as that of
+    an uninterrupted run.
+
+    If `shard` is a (K, N) pair, only the articles in the K-th of N equal
+    ranges of indices are processed, into staging tables like those of
+    `bulk_load` in `db_path` itself; `merge_shards` builds the database from
+    all N shards. The URLs of all articles are still read, so that the links
+    are resolved against the whole dump.
+
+    The article data sent to the workers and not yet processed is limited to
+    about `max_inflight_mb` MiB (see `imap_bounded`), unless `direct_read` is
+    True and the workers read the data themselves. The rows are written by
+    a separate thread (see `DatabaseWriter`), which commits after every
+    `commit_rows` rows or `commit_seconds` seconds.
+
+    If `aggregate` is True, the links are counted instead of stored per
+    article: the `link_count` table holds the number of articles that link to
+    each target URL with each text. The workers count the links of their
+    batches and the counts are merged in memory for up to `commit_rows`
+    distinct links or `commit_seconds` seconds before they are added to the
+    database. Such a database cannot be updated by `update_links`. When
+    resuming, the setting of the interrupted extraction is kept.
+
+    An interrupted extraction started before the redirects were checked here
+    is resumed without checking them; `make_abbrevs` does it then.
+    """
+
+    zim = unzim.File(zim_path)
+
+    dbconn = sqlite3.connect(db_path if shard is None else ':memory:', check_same_thread=False)
+    db = dbconn.cursor()
+
+    try:
+        checkpoint = None
+        if resume:
+            checkpoint = load_checkpoint(db)
+            if checkpoint is None and (table_exists(db, 'link') or table_exists(db, 'link_count')):
+                print >>sys.stderr, 'The extraction into', db_path, 'is already complete'
+                return
+            if checkpoint is not None:
+                aggregate = table_exists(db, 'link_count')
+
+        staged = bulk_load or shard is not None
+        index_range = None
+        if shard is None:
+            staging_path = db_path + '.load'
+        else:
+            staging_path = db_path
+            (number, count) = shard
+            index_range = (len(zim) * (number - 1) // count, len(zim) * number // count)
+        if staged:
+            create_staging_tables(db, staging_path, aggregate)
+            if shard is not None:
+                db.execute('create table staging.shard (number integer, count integer)')
+                db.execute('insert into staging.shard values (?,?)', shard)
+            article_table = 'staging.article'
+            if aggregate:
+                link_sql = 'insert into staging.link_count values (?,?,?,?)'
+            else:
+                link_sql = 'insert into staging.link values (?,?,?,?)'
+            hash_sql = 'insert into staging.hash values (?,?)'
+            redirect_sql = 'insert into staging.redirect_abbrev values (?,?,?,?)'
+        else:
+            if checkpoint is None:
+                create_tables(db, aggregate)
+                create_indexes(db, aggregate)
+                create_abbrev_table(db)
+                db.execute('create table abbrev_links_pending (id integer)')
+                create_checkpoint(db)
+            article_table = 'article'
+            link_sql = count_sql if aggregate else 'insert or ignore into link values (?,?,?,?)'
+            hash_sql = 'update article set hash = ?2 where id = ?1'
+            # the redirect and its target must both be in the article table
+            redirect_sql = """insert or ignore into abbrev select A.id, ?3, ?4, 1 from article A
+                              join article R on R.id = A.redirect_id where A.id = ?1 and R.id = ?2"""
+
+        t = time.time()
+
+        print >>sys.stderr, "Reading articles"
+        counts = {'articles': 0, 'redirects': 0}
+        url_map = UrlMap()
+        keys = []
+        redirects = array('l') # the indices of the redirects to be checked
+        check_redirects = staged or table_exists(db, 'abbrev')
+        (phase, position) = ('articles', -1)
+        if checkpoint is not None:
+            (phase, position) = checkpoint
+            print >>sys.stderr, 'Resuming the', phase, 'phase after position', position
+            for (index, url) in db.execute('select id, url from article'):
+                url_map.add(url, index)
+            (counts['articles'], counts['redirects']) = db.execute(
+                'select count(*) - count(redirect_id), count(redirect_id) from article').fetchone()
+            if direct_read and not redirects_only:
+                keys = read_blob_keys(unzim.scan(zim, end=position + 1 if phase == 'articles' else None))
+            if check_redirects and phase != 'links':
+                redirects.extend(index for (index,) in db.execute(
+                    'select id from article where redirect_id is not null and id > ? order by id',
+                    (position if phase == 'redirects' else -1,)))
+
+        if phase == 'articles':
+            writer = DatabaseWriter(dbconn, commit_rows, commit_seconds, None if staged else checkpoint_sql)
+            writer.start()
+            (url_map, new_keys) = read_articles(unzim.scan(zim, start=position + 1), writer, article_table, counts,
+                                                direct_read and not redirects_only, url_map, checkpoint=not staged,
+                                                index_range=index_range,
+                                                redirects=redirects if check_redirects else None)
+            writer.close()
+            keys.extend(new_keys)
+            del new_keys
+            position = -1
+        else:
+            url_map.freeze()
+
+        print >>sys.stderr, 'Read', counts['articles'], 'articles'
+        print >>sys.stderr, counts['redirects'], 'redirects'
         print >>sys.stderr, 'Took', time.time()-t, 's'
         t = time.time()
 
-        print >>sys.stderr 
-        print >>sys.stderr, "Removing unresolved links"
+        # the URL map is built before the pool, so the workers inherit it;
+        # they always open the ZIM file, to look up the targets of the redirects
+        pool = make_pool(workers, n_threads, thread_init, (engine, url_map, zim_path, None, None, aggregate))
+
+        # the writer is started after the pool, so that the workers are not
+        # forked while it is running
+        writer = DatabaseWriter(dbconn, commit_rows, commit_seconds, None if staged else checkpoint_sql)
+        writer.start()
+
+        if check_redirects and phase != 'links':
+            print >>sys.stderr
+            print >>sys.stderr, "Processing redirects"
+            metrics.start('redirect_abbrevs')
+            n_checked = 0
+            n_abbrevs = 0
+            for (n, abbrevs) in imap_bounded(pool, process_redirect_batch, redirect_batches(redirects, 1000),
+                                             n_threads):
+                n_checked += n
+                writer.insert(redirect_sql, abbrevs, ('redirects', redirects[n_checked - 1]))
+                n_abbrevs += len(abbrevs)
+                metrics.count('abbrevs', len(abbrevs))
+                report_pool(n_threads)
+            metrics.finish(redirects=n_checked, abbrevs=n_abbrevs)
+
+            print >>sys.stderr, 'Checked', n_checked, 'redirects'
+            print >>sys.stderr, n_abbrevs, 'abbrevs found'
+            print >>sys.stderr, 'Took', time.time()-t, 's'
+            t = time.time()
+        if phase != 'links':
+            position = -1
+        del redirects
+
+        print >>sys.stderr
+        print >>sys.stderr, "Processing articles"
+        if redirects_only:
+            batches = []
+            position_field = 0
+            process = process_batch
+            sizeof = None
+        elif direct_read:
+            # the checkpoint is the last cluster, as the keys are parsed in cluster order
+            keys = [key for key in keys if key >> 64 > position]
+            batches = blob_batches(keys, batch_size)
+            position_field = 1
+            process = process_blob_batch
+            sizeof = None
+        else:
+            if index_range is None:
+                dump = zim.articles(position + 1)
+            else:
+                dump = takewhile(lambda a: a.index < index_range[1], zim.articles(index_range[0]))
+            batches = page_batches(dump, batch_size, workers != 'threads')
+            position_field = 0
+            process = process_batch
+            sizeof = page_batch_bytes
+
+        positions = deque() # the position reached with each batch in flight
+        batches = track_batches(batches, positions, position_field)
+
+        metrics.start('extract_links')
+        n_done = 0
+        n_counted = 0
+        # the counts of the links not yet queued for the writer, when aggregating;
+        # the checkpoint is only saved with them
+        link_counts = {}
+        last_flush = time.time()
+        for (n, (links, hashes)) in imap_bounded(pool, process, batches, n_threads,
+                                                 max_inflight_mb * 1024 * 1024, sizeof):
+            position = positions.popleft()
+            if aggregate:
+                for (tgt_index, url, text, count) in links:
+                    key = (tgt_index, url, text)
+                    link_counts[key] = link_counts.get(key, 0) + count
+                    n_counted += count
+                if len(link_counts) >= commit_rows or time.time() - last_flush >= commit_seconds:
+                    flush_link_counts(writer, link_sql, link_counts, ('links', position))
+                    last_flush = time.time()
+                metrics.gauge('link_counts', len(link_counts))
+            else:
+                writer.insert(link_sql, links)
+                writer.insert(hash_sql, hashes, ('links', position))
+            metrics.count('links', len(links))
+
+            n_done += n
+            if n_done // 2000 > (n_done - n) // 2000:
+                print >>sys.stderr, n_done, 'done'
+                print >>sys.stderr, 'speed:', n_done/(time.time()-t), 'per second'
+                print >>sys.stderr, 'time per article:', (time.time()-t)/n_done
+                sys.stdout.flush()
+            report_pool(n_threads)
+
+        pool.close()
+        pool.join()
+        if link_counts:
+            flush_link_counts(writer, link_sql, link_counts, ('links', position))
+        writer.close()
+        n_links = n_counted if aggregate else writer.rowcounts.get(link_sql, 0)
+
+        if not staged:
+            db.execute('drop table extract_checkpoint')
+            dbconn.commit()
+        metrics.finish(articles=n_done, resolved_links=n_links)
+
+        print >>sys.stderr, 'Processed', n_done, 'articles'
+        print >>sys.stderr, n_links, 'resolved links'
+        print_stalls()
+        print >>sys.stderr, 'Took', time.time()-t, 's'
+
+        if shard is not None:
+            print >>sys.stderr, 'Wrote shard %d/%d of articles %d to %d' % (shard + (index_range[0], index_range[1] - 1))
+        elif bulk_load:
+            print >>sys.stderr
+            db.execute('detach database staging')
+            build_from_staging(dbconn, [staging_path], aggregate, True)
+            os.remove(staging_path)
+    finally:
+        dbconn.close()
+
+def read_old_pages(db):
+    """
+    Return the arrays of the indices of the articles in the new database, the
+    indices of the articles with the same URL in the database attached as
+    `old` and the content hashes of the latter, ordered by the new index.
+    """
+    old_pages = (array('L'), array('L'), array('l'))
+    if 'hash' not in [column[1] for column in db.execute('pragma old.table_info(article)')]:
+        print >>sys.stderr, 'The old database has no content hashes; all articles will be parsed'
+        return old_pages
+    for (index, old_index, h) in db.execute("""select N.id, O.id, O.hash from article N join old.article O on O.url = N.url
+                                               where N.redirect_id is null and O.hash is not null
+                                               order by N.id"""):
+        old_pages[0].append(index)
+        old_pages[1].append(old_index)
+        old_pages[2].append(h)
+    return old_pages
+
+def update_links(zim_path, old_path, db_path, n_threads, batch_size=50, direct_read=False, engine='htmlparser',
+                 max_inflight_mb=256, commit_rows=100000, commit_seconds=10.0, workers='processes'):
+    """
+    Extract articles and links from a newer ZIM dump into a new database like
+    `extract_links`, reusing the links from the database at `old_path`.
+
+    The articles are matched to the old ones by URL. An article is only parsed
+    if its content hash differs from the old one or if it might link to a URL
+    that is not in the old database; the links of the other articles are
+    copied. The articles whose abbreviations may differ from the old ones are
+    listed in the `update_dirty` table, for `make_abbrevs`.
+
+    The other arguments are the same as in `extract_links`. Return False if
+    the old database has aggregated links, which cannot be updated.
+    """
+
+    with closing(sqlite3.connect(old_path)) as old_conn:
+        if table_exists(old_conn, 'link_count'):
+            print >>sys.stderr, 'The links in', old_path, 'are aggregated; only a database with the links of each article can be updated'
+            return False
+
+    zim = unzim.File(zim_path)
+
+    dbconn = sqlite3.connect(db_path, check_same_thread=False)
+    db = dbconn.cursor()
+
+    try:
+        create_tables(db)
+        create_indexes(db)
+        db.execute('create table update_dirty (id integer primary key)')
+        db.execute('create temp table update_copied (id integer primary key)')
+
+        t = time.time()
+
+        print >>sys.stderr, "Reading articles"
+        counts = {'articles': 0, 'redirects': 0}
+        writer = DatabaseWriter(dbconn, commit_rows, commit_seconds)
+        writer.start()
+        (url_map, keys) = read_articles(unzim.scan(zim), writer, 'article', counts, direct_read)
+        writer.close()
+
+        db.execute('attach database ? as old', (old_path,))
+        old_pages = read_old_pages(db)
+        added_urls = set(url for (url,) in db.execute('select url from article where url not in (select url from old.article)'))
+
+        print >>sys.stderr, 'Read', counts['articles'], 'articles'
+        print >>sys.stderr, counts['redirects'], 'redirects'
+        print >>sys.stderr, len(added_urls), 'new URLs'
+        print >>sys.stderr, 'Took', time.time()-t, 's'
+        t = time.time()
+
+        print >>sys.stderr
+        print >>sys.stderr, "Processing articles"
+        # the maps are built before the pool, so the workers inherit them
+        pool = make_pool(workers, n_threads, thread_init, (engine, url_map, zim_path, old_pages, added_urls))
+        if direct_read:
+            batches = blob_batches(keys, batch_size)
+            process = update_blob_batch
+            sizeof = None
+        else:
+            batches = page_batches(zim.articles(), batch_size, workers != 'threads')
+            process = update_batch
+            sizeof = page_batch_bytes
+
+        # the links of an unchanged article whose targets still exist
+        copy_sql = """insert or ignore into link select ?, A.id, L.tgt_url, L.text
+                      from old.link L join article A on A.url = L.tgt_url
+                      where L.article_id = ? order by L.rowid"""
+
+        writer = DatabaseWriter(dbconn, commit_rows, commit_seconds)
+        writer.start()
+
+        metrics.start('update_links')
+        n_done = 0
+        n_parsed = 0
+        for (n, pages) in imap_bounded(pool, process, batches, n_threads, max_inflight_mb * 1024 * 1024, sizeof):
+            copied = [(index, old_index) for (index, h, links, old_index) in pages if links is None]
+            links = [link for (index, h, page_links, old_index) in pages if page_links is not None for link in page_links]
+            writer.insert(copy_sql, copied)
+            writer.insert('insert into update_copied values (?)', [(old_index,) for (index, old_index) in copied])
+            writer.insert('insert or ignore into link values (?,?,?,?)', links)
+            writer.insert('insert or ignore into update_dirty values (?)', [(link[1],) for link in links])
+            writer.insert('update article set hash = ?2 where id = ?1', [page[:2] for page in pages])
+            n_parsed += len(pages) - len(copied)
+            metrics.count('parsed', len(pages) - len(copied))
+
+            n_done += n
+            if n_done // 2000 > (n_done - n) // 2000:
+                print >>sys.stderr, n_done, 'done'
+                print >>sys.stderr, 'speed:', n_done/(time.time()-t), 'per second'
+                print >>sys.stderr, 'time per article:', (time.time()-t)/n_done
+                sys.stdout.flush()
+            report_pool(n_threads)
+
+        pool.close()
+        pool.join()
+        writer.close()
 
-        db.execute('delete from link where tgt_id is null')
+        # the targets of the old links that were not copied
+        db.execute("""insert or ignore into update_dirty select A.id from old.link L join article A on A.url = L.tgt_url
+                      where L.article_id not in (select id from update_copied)""")
+        # the new articles and those whose title or redirect target changed
+        db.execute("""insert or ignore into update_dirty select N.id from article N
+                      left join old.article O on O.url = N.url
+                      left join article NT on NT.id = N.redirect_id
+                      left join old.article OT on OT.id = O.redirect_id
+                      where O.id is null or O.title is not N.title or NT.url is not OT.url or NT.title is not OT.title""")
         dbconn.commit()
+        db.execute('detach database old')
+        metrics.finish(articles=n_done, parsed=n_parsed)
 
-        print >>sys.stderr, 'Removed', db.rowcount, 'links'
+        print >>sys.stderr, 'Processed', n_done, 'articles'
+        print >>sys.stderr, n_parsed, 'articles parsed'
+        print_stalls()
         print >>sys.stderr, 'Took', time.time()-t, 's'
     finally:
         dbconn.close()
+    return True
@@ -0,0 +1,211 @@
+"""
+Provides the `metrics` object, which collects counters, gauges and timers for
+the stages of a run and writes them to a file as JSON lines, and functions
+for profiling a run with cProfile in the main process and in the worker
+processes.
+
+Each line of the metrics file is a record of the form
+
+    {"time": ..., "stage": ..., "event": "start" | "progress" | "end",
+     "elapsed": ..., "counters": {...}, "rates": {...}, "gauges": {...},
+     "timers": {NAME: {"count": ..., "total": ..., "max": ...}}}
+
+where `elapsed` is the time since the start of the stage and `rates` are the
+counters divided by it. Unless `metrics.open` is called, nothing is written.
+"""
+
+from __future__ import unicode_literals
+import os
+import sys
+import time
+import json
+import glob
+import shutil
+import tempfile
+import threading
+import cProfile
+import pstats
+from multiprocessing import util
+
+class Timer(object):
+    """
+    A context manager that adds the time spent in it to a timer of `Metrics`.
+    """
+
+    __slots__ = ('metrics', 'name', 'start')
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.time()
+
+    def __exit__(self, *exc_info):
+        self.metrics.add_time(self.name, time.time() - self.start)
+
+
+class Metrics(object):
+    """
+    The counters, gauges and timers of the current stage of a run. They may be
+    updated from several threads.
+    """
+
+    # the minimum time between two progress records, in seconds
+    report_interval = 1.0
+
+    def __init__(self):
+        self.out_f = None
+        self.stage = None
+        self.last_report = 0
+        self.lock = threading.Lock()
+        self.reset()
+
+    def open(self, path):
+        self.out_f = open(path, 'w')
+
+    def close(self):
+        if self.out_f is not None:
+            self.out_f.close()
+            self.out_f = None
+
+    def reset(self):
+        self.start_time = time.time()
+        self.counters = {}
+        self.gauges = {}
+        self.timers = {} # name -> [count, total, max]
+
+    def start(self, stage):
+        """
+        Start a new stage, with all counters, gauges and timers cleared.
+        """
+        self.stage = stage
+        self.reset()
+        self.report('start')
+
+    def finish(self, **fields):
+        """
+        Write the final record of the current stage, with `fields` added.
+        """
+        self.report('end', **fields)
+
+    def count(self, name, n=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def gauge(self, name, value):
+        with self.lock:
+            self.gauges[name] = value
+
+    def add_time(self, name, seconds):
+        with self.lock:
+            timer = self.timers.get(name)
+            if timer is None:
+                timer = self.timers[name] = [0, 0.0, 0.0]
+            timer[0] += 1
+            timer[1] += seconds
+            timer[2] = max(timer[2], seconds)
+
+    def timer(self, name):
+        return Timer(self, name)
+
+    def elapsed(self):
+        return time.time() - self.start_time
+
+    def total_time(self, name):
+        return self.timers.get(name, (0, 0.0))[1]
+
+    def report(self, event='progress', **fields):
+        """
+        Write a record of the current stage. Progress records are written at
+        most once in `report_interval`.
+        """
+        if self.out_f is None:
+            return
+        now = time.time()
+        if event == 'progress' and now - self.last_report < self.report_interval:
+            return
+        self.last_report = now
+        elapsed = now - self.start_time
+        with self.lock:
+            record = {
+                'time': now,
+                'stage': self.stage,
+                'event': event,
+                'elapsed': elapsed,
+                'counters': dict(self.counters),
+                'rates': dict((name, value / elapsed) for (name, value) in self.counters.items() if elapsed > 0),
+                'gauges': dict(self.gauges),
+                'timers': dict((name, {'count': count, 'total': total, 'max': max_time})
+                               for (name, (count, total, max_time)) in self.timers.items()),
+            }
+        record.update(fields)
+        self.out_f.write(json.dumps(record, sort_keys=True) + '\n')
+        self.out_f.flush()
+
+metrics = Metrics()
+
+def timed_call(func, batch):
+    """
+    Call `func` on `batch` and return the time it took and the result; used
+    to measure the work of the pool workers.
+    """
+    t = time.time()
+    result = func(batch)
+    return (time.time() - t, result)
+
+
+# the directory where the profiles of the processes are collected, if profiling
+profile_dir = None
+profiler = None
+main_pid = None
+
+def start_profile():
+    """
+    Start profiling the main process. The worker processes started later
+    profile themselves from `init_worker`.
+    """
+    global profile_dir, profiler, main_pid
+    profile_dir = tempfile.mkdtemp(prefix='wikibrev-profile-')
+    main_pid = os.getpid()
+    profiler = cProfile.Profile()
+    profiler.enable()
+
+def init_worker():
+    """
+    Start profiling a worker process if profiling is on; to be called from the
+    initializer of a pool. The profile is saved when the worker exits.
+    """
+    global profiler
+    if profile_dir is None or os.getpid() == main_pid:
+        return
+    if profiler is not None:
+        profiler.disable() # the copy inherited from the main process
+    profiler = cProfile.Profile()
+    util.Finalize(None, save_worker_profile, exitpriority=10)
+    profiler.enable()
+
+def save_worker_profile():
+    profiler.disable()
+    profiler.dump_stats(os.path.join(profile_dir, 'worker-%d.prof' % os.getpid()))
+
+def stop_profile(path, n_lines=30):
+    """
+    Stop profiling, merge the profiles of the main process and of the workers
+    into a pstats file at `path` and print the `n_lines` functions with the
+    highest cumulative time.
+    """
+    global profile_dir
+    profiler.disable()
+    main_path = os.path.join(profile_dir, 'main.prof')
+    profiler.dump_stats(main_path)
+    worker_paths = glob.glob(os.path.join(profile_dir, 'worker-*.prof'))
+    stats = pstats.Stats(main_path, stream=sys.stderr)
+    for worker_path in worker_paths:
+        stats.add(worker_path)
+    stats.dump_stats(path)
+    print >>sys.stderr
+    print >>sys.stderr, 'Profile of the main process and', len(worker_paths), 'workers saved to', path
+    stats.sort_stats('cumulative').print_stats(n_lines)
+    shutil.rmtree(profile_dir)
+    profile_dir = None
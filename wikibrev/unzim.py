@@ -1,7 +1,36 @@
 """
 This is a simple module for extracting individual articles from an
 OpenZIM archive.
+
+Directories of HTML files and synthetic corpora (see `_pyzim`) are read with
+a pure-Python backend instead, which is also used when the zimlib binding is
+not built.
 """
 
-from _unzim import File, Article
+import _pyzim
+try:
+    import _unzim
+except ImportError:
+    _unzim = None
+
+def File(path):
+    """
+    Open a ZIM file, a directory of HTML files or a synthetic corpus.
+    """
+    if _pyzim.is_corpus(path):
+        return _pyzim.File(path)
+    if _unzim is None:
+        raise ImportError('The _unzim extension is not built; only directories and synthetic corpora can be read')
+    return _unzim.File(path)
 
+def scan(zim, namespace='A', start=0, end=None, chunk_size=65536):
+    """
+    Yield the directory entries of the articles in `namespace` with the
+    indices from `start` to `end` (exclusive; to the last article if None), as
+    `dirents.Dirents` objects of at most `chunk_size` entries each.
+    """
+    end = len(zim) if end is None else min(end, len(zim))
+    while start < end:
+        count = min(chunk_size, end - start)
+        yield zim.scan_dirents(namespace, start, count)
+        start += count
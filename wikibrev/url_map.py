@@ -0,0 +1,126 @@
+"""
+Provides the `UrlMap` class, a compact map from article URLs to article
+indices that is used to resolve link targets in memory, and the `TitleMap`
+class, a compact map from article indices to titles.
+"""
+
+from array import array
+from bisect import bisect_left
+from itertools import izip, islice
+
+class UrlMap(object):
+    """
+    A map from article URLs to indices that only stores a hash of each URL.
+    The (hash, index) pairs are split into buckets by the low bits of the hash
+    and each bucket is kept in two sorted arrays, so an entry takes 16 bytes
+    and a lookup is a bisection within one bucket. As the URLs themselves are
+    not kept, a lookup confirms a matching hash by reading the URL of the
+    article from the ZIM file, if one is given.
+
+    Entries are added with `add`; `freeze` must be called before the first
+    lookup.
+    """
+
+    n_buckets = 256 # a power of 2
+
+    def __init__(self):
+        self.hashes = [array('l') for i in range(self.n_buckets)]
+        self.indices = [array('L') for i in range(self.n_buckets)]
+
+    def add(self, url, index):
+        h = hash(url)
+        b = h & (self.n_buckets - 1)
+        self.hashes[b].append(h)
+        self.indices[b].append(index)
+
+    def freeze(self):
+        """
+        Sort the buckets.
+        """
+        for b in range(self.n_buckets):
+            pairs = sorted(zip(self.hashes[b], self.indices[b]))
+            self.hashes[b] = array('l', [h for (h, index) in pairs])
+            self.indices[b] = array('L', [index for (h, index) in pairs])
+
+    def get(self, url, default=None, zim_file=None):
+        """
+        Return the index of the article with the given URL, or `default` if
+        there is no such article. The URLs of the articles with the same hash
+        are compared with `url` if `zim_file` (the file the articles were read
+        from, see `unzim.File`) is given; otherwise any URL with the hash of an
+        article's URL is taken for it.
+        """
+        h = hash(url)
+        b = h & (self.n_buckets - 1)
+        hashes = self.hashes[b]
+        i = bisect_left(hashes, h)
+        while i < len(hashes) and hashes[i] == h:
+            index = self.indices[b][i]
+            if zim_file is None or zim_file.article(index).url.split('/')[-1] == url:
+                return index
+            i += 1
+        return default
+
+    def duplicates(self):
+        """
+        Return the set of hashes that were added more than once.
+        """
+        dups = set()
+        for hashes in self.hashes:
+            dups.update(h for (h, next_h) in izip(hashes, islice(hashes, 1, None)) if h == next_h)
+        return dups
+
+    def remove(self, url, index):
+        """
+        Remove an entry added with `add`.
+        """
+        h = hash(url)
+        b = h & (self.n_buckets - 1)
+        hashes = self.hashes[b]
+        indices = self.indices[b]
+        i = bisect_left(hashes, h)
+        while i < len(hashes) and hashes[i] == h:
+            if indices[i] == index:
+                del hashes[i]
+                del indices[i]
+                return
+            i += 1
+        raise KeyError(url)
+
+    def __len__(self):
+        return sum(len(hashes) for hashes in self.hashes)
+
+
+class TitleMap(object):
+    """
+    A map from article indices to titles. The titles are kept UTF-8 encoded in
+    a single buffer, so that the map takes little memory and its pages stay
+    shared with the worker processes that inherit it.
+
+    Entries must be added with `add` in the order of increasing index.
+    """
+
+    def __init__(self):
+        self.indices = array('L')
+        self.offsets = array('L', [0])
+        self.data = bytearray()
+
+    def add(self, index, title):
+        if self.indices and index <= self.indices[-1]:
+            raise ValueError('indices must be increasing')
+        self.indices.append(index)
+        self.data.extend(title.encode('utf-8'))
+        self.offsets.append(len(self.data))
+
+    def get(self, index, default=None):
+        """
+        Return the title of the article with the given index, or `default` if
+        there is no such article.
+        """
+        i = bisect_left(self.indices, index)
+        if i < len(self.indices) and self.indices[i] == index:
+            return self.data[self.offsets[i]:self.offsets[i+1]].decode('utf-8')
+        return default
+
+    def __len__(self):
+        return len(self.indices)